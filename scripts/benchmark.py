@@ -0,0 +1,336 @@
+#!/usr/bin/env python3
+"""Benchmark checkpoint storage operations at realistic scale.
+
+Generates a synthetic DCS Missions/Saves directory with multi-MB Foothold
+persistence and CSV files, plus checkpoint repositories of various sizes, then
+times the storage API (save, save all, restore, list, delete). Results are
+printed (or written) as JSON so runs can be compared between releases.
+
+Usage:
+    python scripts/benchmark.py --output benchmark-2.3.0.json
+    python scripts/benchmark.py --scales 10,1000 --lua-mb 2 --repeat 5
+
+Everything is created in a temporary directory which is removed afterwards.
+"""
+
+import argparse
+import asyncio
+import json
+import platform
+import random
+import statistics
+import sys
+import tempfile
+import time
+import zipfile
+from collections.abc import Awaitable, Callable
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any
+
+# Allow running from a source checkout without installing the package
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from foothold_checkpoint import __version__  # noqa: E402
+from foothold_checkpoint.core.config import (  # noqa: E402
+    CampaignConfig,
+    CampaignFileList,
+    CampaignFileType,
+    Config,
+)
+from foothold_checkpoint.core.storage import (  # noqa: E402
+    delete_checkpoint,
+    list_checkpoints,
+    restore_checkpoint,
+    save_all_campaigns,
+    save_checkpoint,
+)
+
+# Fixed epoch for generated checkpoints so runs are reproducible
+BASE_TIME = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+SERVER_NAME = "benchmark"
+
+
+def _write_lua(path: Path, size: int, rng: random.Random) -> None:
+    """Write a pseudo Foothold persistence file of roughly size bytes."""
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("zonePersistance = {\n")
+        written = 0
+        index = 0
+        while written < size:
+            line = (
+                f'  ["Zone-{index}"] = {{ side = {rng.randint(0, 2)}, '
+                f"level = {rng.randint(1, 5)}, x = {rng.uniform(-1e6, 1e6):.3f}, "
+                f"y = {rng.uniform(-1e6, 1e6):.3f}, destroyed = {{}} }},\n"
+            )
+            f.write(line)
+            written += len(line)
+            index += 1
+        f.write("}\n")
+
+
+def _write_csv(path: Path, size: int, rng: random.Random) -> None:
+    """Write a pseudo CTLD/storage CSV file of roughly size bytes."""
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("name,type,x,y,heading,side\n")
+        written = 0
+        index = 0
+        while written < size:
+            line = (
+                f"unit-{index},{rng.choice(['M1A2', 'BTR-80', 'FARP', 'Ural-375'])},"
+                f"{rng.uniform(-1e6, 1e6):.2f},{rng.uniform(-1e6, 1e6):.2f},"
+                f"{rng.randint(0, 359)},{rng.randint(1, 2)}\n"
+            )
+            f.write(line)
+            written += len(line)
+            index += 1
+
+
+def generate_saves_dir(saves_dir: Path, campaigns: int, lua_mb: float, seed: int) -> Config:
+    """Create a synthetic Missions/Saves directory and its configuration.
+
+    Args:
+        saves_dir: Directory to populate.
+        campaigns: Number of campaigns to generate.
+        lua_mb: Size of each persistence file in MiB (CSV files are 1/8 of it).
+        seed: Random seed for reproducible content.
+
+    Returns:
+        Config describing the generated campaigns.
+    """
+    rng = random.Random(seed)
+    saves_dir.mkdir(parents=True, exist_ok=True)
+    lua_size = int(lua_mb * 1024 * 1024)
+    csv_size = lua_size // 8
+
+    campaign_configs = {}
+    for index in range(campaigns):
+        campaign_id = f"bench{index}"
+        prefix = f"foothold_{campaign_id}"
+        _write_lua(saves_dir / f"{prefix}.lua", lua_size, rng)
+        _write_csv(saves_dir / f"{prefix}_CTLD_Save.csv", csv_size, rng)
+        _write_csv(saves_dir / f"{prefix}_CTLD_FARPS.csv", csv_size // 4, rng)
+        _write_csv(saves_dir / f"{prefix}_storage.csv", csv_size, rng)
+        campaign_configs[campaign_id] = CampaignConfig(
+            display_name=f"Benchmark {index}",
+            files=CampaignFileList(
+                persistence=CampaignFileType(files=[f"{prefix}.lua"]),
+                ctld_save=CampaignFileType(files=[f"{prefix}_CTLD_Save.csv"]),
+                ctld_farps=CampaignFileType(files=[f"{prefix}_CTLD_FARPS.csv"]),
+                storage=CampaignFileType(files=[f"{prefix}_storage.csv"], optional=True),
+            ),
+        )
+
+    _write_lua(saves_dir / "Foothold_Ranks.lua", lua_size // 16, rng)
+
+    return Config(checkpoints_dir=saves_dir.parent / "checkpoints", campaigns=campaign_configs)
+
+
+def generate_repository(checkpoints_dir: Path, count: int) -> list[Path]:
+    """Create a repository of small but valid checkpoints.
+
+    The archives are written directly (without hashing real files) so large
+    repositories can be generated quickly; listing and deletion only depend on
+    the number of archives and their metadata.
+
+    Args:
+        checkpoints_dir: Directory to populate.
+        count: Number of checkpoints to create.
+
+    Returns:
+        Paths of the created checkpoints, oldest first.
+    """
+    checkpoints_dir.mkdir(parents=True, exist_ok=True)
+    content = b"-- benchmark\n" * 64
+    paths = []
+    for index in range(count):
+        created_at = BASE_TIME + timedelta(minutes=index)
+        campaign = f"bench{index % 5}"
+        path = checkpoints_dir / f"{campaign}_{created_at:%Y-%m-%d_%H-%M-%S}.zip"
+        metadata = {
+            "campaign_name": campaign,
+            "server_name": SERVER_NAME,
+            "created_at": created_at.isoformat(),
+            "files": {f"foothold_{campaign}.lua": "sha256:" + "0" * 64},
+            "name": None,
+            "comment": None,
+            "is_auto_backup": False,
+        }
+        with zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) as zf:
+            zf.writestr(f"foothold_{campaign}.lua", content)
+            zf.writestr("metadata.json", json.dumps(metadata, indent=2))
+        paths.append(path)
+    return paths
+
+
+async def _time(
+    func: Callable[[int], Awaitable[Any]],
+    repeat: int,
+    setup: Callable[[int], None] | None = None,
+) -> dict[str, Any]:
+    """Time an async operation, excluding optional per-run setup."""
+    samples = []
+    for run in range(repeat):
+        if setup is not None:
+            setup(run)
+        start = time.perf_counter()
+        await func(run)
+        samples.append(time.perf_counter() - start)
+    return {
+        "repeat": repeat,
+        "min_s": round(min(samples), 6),
+        "median_s": round(statistics.median(samples), 6),
+        "mean_s": round(statistics.fmean(samples), 6),
+        "max_s": round(max(samples), 6),
+    }
+
+
+async def run_benchmarks(args: argparse.Namespace, workdir: Path) -> list[dict[str, Any]]:
+    """Run all benchmarks and return their results."""
+    results: list[dict[str, Any]] = []
+
+    def report(name: str, scale: int | None, timing: dict[str, Any]) -> None:
+        results.append({"name": name, "scale": scale, **timing})
+        print(f"  {name:<28} scale={scale!s:<6} median={timing['median_s']:.4f}s", file=sys.stderr)
+
+    saves_dir = workdir / "Saves"
+    config = generate_saves_dir(saves_dir, args.campaigns, args.lua_mb, args.seed)
+    campaign = next(iter(config.campaigns or {}))
+
+    # Save a single campaign
+    save_dir = workdir / "save"
+
+    async def save_one(run: int) -> None:
+        await save_checkpoint(
+            campaign_name=campaign,
+            server_name=SERVER_NAME,
+            source_dir=saves_dir,
+            output_dir=save_dir,
+            config=config,
+            created_at=BASE_TIME + timedelta(hours=run),
+        )
+
+    report("save_checkpoint", None, await _time(save_one, args.repeat))
+
+    # Save all campaigns, sequential and parallel
+    for max_workers in sorted({1, args.workers}):
+        save_all_dir = workdir / f"save_all_{max_workers}"
+
+        async def save_all(
+            run: int, _dir: Path = save_all_dir, _workers: int = max_workers
+        ) -> None:
+            await save_all_campaigns(
+                server_name=SERVER_NAME,
+                source_dir=saves_dir,
+                output_dir=_dir,
+                config=config,
+                created_at=BASE_TIME + timedelta(hours=run),
+                max_workers=_workers,
+            )
+
+        report(f"save_all_campaigns[w={max_workers}]", None, await _time(save_all, args.repeat))
+
+    # Restore the checkpoint saved above
+    checkpoint = sorted(save_dir.glob("*.zip"))[0]
+    restore_dir = workdir / "restore"
+    restore_dir.mkdir()
+
+    async def restore(_run: int) -> None:
+        await restore_checkpoint(
+            checkpoint_path=checkpoint,
+            target_dir=restore_dir,
+            restore_ranks=True,
+            skip_overwrite_check=True,
+            auto_backup=False,
+        )
+
+    report("restore_checkpoint", None, await _time(restore, args.repeat))
+
+    # List and delete in repositories of increasing size
+    for scale in args.scales:
+        repo_dir = workdir / f"repo_{scale}"
+        paths = generate_repository(repo_dir, scale)
+
+        def drop_catalog(_run: int, _dir: Path = repo_dir) -> None:
+            for index_file in _dir.glob(".foothold-*"):
+                index_file.unlink()
+
+        async def list_all(_run: int, _dir: Path = repo_dir) -> None:
+            await list_checkpoints(_dir)
+
+        # Cold: no index yet (first listing after upgrade); warm: index up to date
+        report("list_checkpoints[cold]", scale, await _time(list_all, args.repeat, drop_catalog))
+        report("list_checkpoints[warm]", scale, await _time(list_all, args.repeat))
+
+        to_delete = paths[-min(args.repeat, len(paths)) :]
+        repeat = len(to_delete)
+
+        async def delete(run: int, _paths: list[Path] = to_delete) -> None:
+            await delete_checkpoint(_paths[run], force=True)
+
+        report("delete_checkpoint", scale, await _time(delete, repeat))
+
+    return results
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--scales",
+        type=lambda value: [int(v) for v in value.split(",")],
+        default=[10, 1000, 10000],
+        help="Comma-separated checkpoint repository sizes (default: 10,1000,10000)",
+    )
+    parser.add_argument("--campaigns", type=int, default=4, help="Number of campaigns (default: 4)")
+    parser.add_argument(
+        "--lua-mb",
+        type=float,
+        default=4.0,
+        help="Size of each persistence file in MiB (default: 4)",
+    )
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per benchmark (default: 3)")
+    parser.add_argument(
+        "--workers", type=int, default=4, help="max_workers for parallel save all (default: 4)"
+    )
+    parser.add_argument("--seed", type=int, default=42, help="Random seed (default: 42)")
+    parser.add_argument("--output", "-o", type=Path, help="Write JSON results to this file")
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> dict[str, Any]:
+    """Run the benchmark suite and emit the JSON report."""
+    args = parse_args(argv)
+
+    print(f"Running foothold-checkpoint {__version__} benchmarks...", file=sys.stderr)
+    with tempfile.TemporaryDirectory(prefix="foothold-bench-") as tmpdir:
+        results = asyncio.run(run_benchmarks(args, Path(tmpdir)))
+
+    report = {
+        "version": __version__,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "parameters": {
+            "scales": args.scales,
+            "campaigns": args.campaigns,
+            "lua_mb": args.lua_mb,
+            "repeat": args.repeat,
+            "workers": args.workers,
+            "seed": args.seed,
+        },
+        "results": results,
+    }
+
+    output = json.dumps(report, indent=2)
+    if args.output:
+        args.output.write_text(output + "\n", encoding="utf-8")
+        print(f"Results written to {args.output}", file=sys.stderr)
+    else:
+        print(output)
+    return report
+
+
+if __name__ == "__main__":
+    main()
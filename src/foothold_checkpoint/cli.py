@@ -1,31 +1,119 @@
 """Command-line interface for foothold-checkpoint tool."""
 
-import asyncio
 import signal
 import sys
+from collections.abc import Callable
+from datetime import datetime
 from pathlib import Path
 from types import FrameType
-from typing import Annotated, Any, Optional  # noqa: UP035 - Required for Typer compatibility
+from typing import (  # noqa: UP035 - Required for Typer compatibility
+    TYPE_CHECKING,
+    Annotated,
+    Any,
+    Optional,
+)
 
 import typer
 from rich.console import Console
-from rich.progress import Progress, SpinnerColumn, TaskID, TextColumn
 from rich.prompt import Prompt
 
-from foothold_checkpoint.core.campaign import (
-    detect_campaigns,
-    detect_unknown_files,
-    format_unknown_files_error,
-)
-from foothold_checkpoint.core.checkpoint import create_checkpoint
-from foothold_checkpoint.core.config import load_config
-from foothold_checkpoint.core.storage import (
-    check_restore_conflicts,
-    delete_checkpoint,
-    import_checkpoint,
-    list_checkpoints,
-    restore_checkpoint,
-)
+if TYPE_CHECKING:
+    from rich.progress import Progress, SpinnerColumn, TaskID, TextColumn
+
+    from foothold_checkpoint.core.archive import CheckpointArchive
+    from foothold_checkpoint.core.campaign import (
+        detect_campaigns,
+        detect_unknown_files,
+        format_unknown_files_error,
+    )
+    from foothold_checkpoint.core.checkpoint import create_checkpoint
+    from foothold_checkpoint.core.config import (
+        COMPRESSION_PROFILES,
+        CompressionConfig,
+        load_config,
+    )
+    from foothold_checkpoint.core.daemon import DaemonClient
+    from foothold_checkpoint.core.hashcache import get_hash_cache
+    from foothold_checkpoint.core.retention import prune_checkpoints
+    from foothold_checkpoint.core.scan import campaign_file_filter, scan_directory
+    from foothold_checkpoint.core.storage import (
+        check_restore_conflicts,
+        delete_checkpoint,
+        export_checkpoint,
+        find_unchanged_checkpoint,
+        import_checkpoint,
+        list_checkpoints,
+        restore_checkpoint,
+    )
+    from foothold_checkpoint.core.verify import Throttle, scrub_checkpoints
+
+# Core modules and Rich progress are imported by the commands that use them, so
+# `--help` and quick commands like `list` only load what they need. Each command
+# binds its names with _lazy_import(); module attribute access (e.g., by tests
+# patching this module) imports them on demand.
+_LAZY_IMPORTS: dict[str, str] = {
+    "Progress": "rich.progress",
+    "SpinnerColumn": "rich.progress",
+    "TaskID": "rich.progress",
+    "TextColumn": "rich.progress",
+    "CheckpointArchive": "foothold_checkpoint.core.archive",
+    "detect_campaigns": "foothold_checkpoint.core.campaign",
+    "detect_unknown_files": "foothold_checkpoint.core.campaign",
+    "format_unknown_files_error": "foothold_checkpoint.core.campaign",
+    "create_checkpoint": "foothold_checkpoint.core.checkpoint",
+    "COMPRESSION_PROFILES": "foothold_checkpoint.core.config",
+    "CompressionConfig": "foothold_checkpoint.core.config",
+    "load_config": "foothold_checkpoint.core.config",
+    "get_hash_cache": "foothold_checkpoint.core.hashcache",
+    "prune_checkpoints": "foothold_checkpoint.core.retention",
+    "campaign_file_filter": "foothold_checkpoint.core.scan",
+    "scan_directory": "foothold_checkpoint.core.scan",
+    "check_restore_conflicts": "foothold_checkpoint.core.storage",
+    "delete_checkpoint": "foothold_checkpoint.core.storage",
+    "export_checkpoint": "foothold_checkpoint.core.storage",
+    "find_unchanged_checkpoint": "foothold_checkpoint.core.storage",
+    "import_checkpoint": "foothold_checkpoint.core.storage",
+    "list_checkpoints": "foothold_checkpoint.core.storage",
+    "restore_checkpoint": "foothold_checkpoint.core.storage",
+    "Throttle": "foothold_checkpoint.core.verify",
+    "scrub_checkpoints": "foothold_checkpoint.core.verify",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import a lazily loaded name on first access (PEP 562).
+
+    Args:
+        name: Attribute name.
+
+    Returns:
+        The imported object, also bound in this module's globals.
+
+    Raises:
+        AttributeError: If the name is not a lazily imported name.
+    """
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    # __import__ (unlike importlib.import_module) is reported by -X importtime
+    value = getattr(__import__(module_name, fromlist=[name]), name)
+    globals()[name] = value
+    return value
+
+
+def _lazy_import(*names: str) -> None:
+    """Bind the lazily imported names a command uses.
+
+    Names that are already bound, including test doubles patched onto this
+    module, are left untouched.
+
+    Args:
+        *names: Names from _LAZY_IMPORTS.
+    """
+    for name in names:
+        if name not in globals():
+            __getattr__(name)
+
 
 # Package version
 __version__ = "0.1.0"
@@ -208,6 +296,28 @@ def get_config_path() -> Path | None:
     return _config_path
 
 
+def _daemon_client(config_file: Path, checkpoints_dir: str | Path) -> "DaemonClient | None":
+    """Return a client for the serve daemon of a configuration, if one is running.
+
+    Commands forward their checkpoint operations to the daemon when there is
+    one, and run them in-process otherwise.
+
+    Args:
+        config_file: Configuration file the command uses
+        checkpoints_dir: Checkpoints directory of that configuration
+
+    Returns:
+        A connected DaemonClient, or None
+    """
+    # Without a state file (see daemon_state_path), skip importing the HTTP client
+    if not config_file.with_name(f".{config_file.name}.daemon").exists():
+        return None
+
+    from foothold_checkpoint.core.daemon import connect
+
+    return connect(config_file, checkpoints_dir)
+
+
 def interrupt_handler(_signum: int, _frame: FrameType | None) -> None:
     """Handle interrupt signal (Ctrl+C) gracefully.
 
@@ -345,6 +455,22 @@ def save_command(
             help="Optional comment/description for the checkpoint",
         ),
     ] = None,
+    skip_unchanged: Annotated[
+        bool,
+        typer.Option(
+            "--skip-unchanged",
+            is_flag=True,
+            flag_value=True,
+            help="Skip campaigns whose files did not change since their newest checkpoint",
+        ),
+    ] = False,
+    compression: Annotated[
+        Optional[str],  # noqa: UP007 - Typer requires Optional
+        typer.Option(
+            "--compression",
+            help="Compression profile (default, fast, max); overrides the configuration",
+        ),
+    ] = None,
 ) -> None:
     """Save a campaign checkpoint.
 
@@ -361,9 +487,30 @@ def save_command(
         Save with optional metadata:
         $ foothold-checkpoint save --server prod-1 --campaign syria --name "Mission 5" --comment "Before update"
 
+        Only save campaigns that changed since their last checkpoint:
+        $ foothold-checkpoint save --server prod-1 --all --skip-unchanged
+
+        Archive a checkpoint with maximum compression:
+        $ foothold-checkpoint save --server prod-1 --campaign syria --compression max
+
     Interactive mode (prompts for missing information):
         $ foothold-checkpoint save
     """
+    _lazy_import(
+        "COMPRESSION_PROFILES",
+        "CompressionConfig",
+        "load_config",
+        "scan_directory",
+        "campaign_file_filter",
+        "detect_campaigns",
+        "find_unchanged_checkpoint",
+        "create_checkpoint",
+        "get_hash_cache",
+        "Progress",
+        "SpinnerColumn",
+        "TextColumn",
+        "TaskID",
+    )
     try:
         # Validate conflicting flags
         if campaign is not None and save_all:
@@ -371,6 +518,14 @@ def save_command(
             console.print("Please specify either a campaign name OR use --all, not both")
             raise typer.Exit(1)
 
+        compression_override = None
+        if compression is not None:
+            if compression not in COMPRESSION_PROFILES:
+                console.print(f"[red]Error:[/red] Unknown compression profile '{compression}'")
+                console.print(f"Available profiles: {', '.join(COMPRESSION_PROFILES)}")
+                raise typer.Exit(1)
+            compression_override = CompressionConfig.model_validate(compression)
+
         # Load configuration
         config_file = _config_path if _config_path is not None else Path("config.yaml")
         config = load_config(config_file)
@@ -444,8 +599,9 @@ def save_command(
             raise typer.Exit(1)
 
         # Step 2: Detect campaigns in mission directory
-        campaign_files = [f for f in mission_dir.iterdir() if f.is_file()]
-        campaigns = detect_campaigns([f.name for f in campaign_files], config)
+        # Only configured campaign files are stat'ed; unrelated saves are skipped
+        scanned = scan_directory(mission_dir, campaign_file_filter(config))
+        campaigns = detect_campaigns(list(scanned), config)
 
         if not campaigns:
             console.print(f"[red]Error:[/red] No campaigns detected in {mission_dir}")
@@ -539,6 +695,36 @@ def save_command(
         checkpoints_dir.mkdir(parents=True, exist_ok=True)
 
         created_checkpoints: list[Path] = []
+        daemon = _daemon_client(config_file, config.checkpoints_dir)
+
+        def create(
+            camp_name: str,
+            camp_file_paths: list[Path],
+            progress_callback: Callable[[str, int, int], None] | None,
+        ) -> Path:
+            """Create one checkpoint, in the serve daemon if it is running."""
+            if daemon is not None:
+                # The daemon reports no progress
+                return daemon.create_checkpoint(
+                    campaign_name=camp_name,
+                    server_name=server,
+                    campaign_files=camp_file_paths,
+                    name=checkpoint_name,
+                    comment=checkpoint_comment,
+                    compression=compression,
+                )
+            return create_checkpoint(
+                campaign_name=camp_name,
+                server_name=server,
+                campaign_files=camp_file_paths,
+                output_dir=checkpoints_dir,
+                name=checkpoint_name,
+                comment=checkpoint_comment,
+                progress_callback=progress_callback,
+                storage_backend=config.storage_backend,
+                hash_cache=get_hash_cache(checkpoints_dir),
+                compression=compression_override or config.compression_for(camp_name),
+            )
 
         for camp_name in campaigns_to_save:
             camp_files = campaigns[camp_name]
@@ -547,6 +733,19 @@ def save_command(
             if not _quiet_mode:
                 console.print(f"\n[cyan]Saving checkpoint for campaign:[/cyan] {camp_name}")
 
+            if skip_unchanged:
+                existing = (
+                    daemon.find_unchanged_checkpoint(camp_name, server, camp_file_paths)
+                    if daemon is not None
+                    else find_unchanged_checkpoint(
+                        camp_name, server, camp_file_paths, checkpoints_dir
+                    )
+                )
+                if existing is not None:
+                    if not _quiet_mode:
+                        console.print(f"[dim]No changes since {existing.name}, skipped[/dim]")
+                    continue
+
             # Create progress callback for Rich progress display
             progress_callback = None
             if not _quiet_mode:
@@ -566,15 +765,7 @@ def save_command(
                     progress_callback = update_progress
 
                     try:
-                        checkpoint_path = create_checkpoint(
-                            campaign_name=camp_name,
-                            server_name=server,
-                            campaign_files=camp_file_paths,
-                            output_dir=checkpoints_dir,
-                            name=checkpoint_name,
-                            comment=checkpoint_comment,
-                            progress_callback=progress_callback,
-                        )
+                        checkpoint_path = create(camp_name, camp_file_paths, progress_callback)
                         created_checkpoints.append(checkpoint_path)
                     except FileNotFoundError as e:
                         console.print(f"[red]Error:[/red] {e}")
@@ -582,15 +773,7 @@ def save_command(
             else:
                 # Quiet mode: no progress display
                 try:
-                    checkpoint_path = create_checkpoint(
-                        campaign_name=camp_name,
-                        server_name=server,
-                        campaign_files=camp_file_paths,
-                        output_dir=checkpoints_dir,
-                        name=checkpoint_name,
-                        comment=checkpoint_comment,
-                        progress_callback=None,
-                    )
+                    checkpoint_path = create(camp_name, camp_file_paths, None)
                     created_checkpoints.append(checkpoint_path)
                 except FileNotFoundError as e:
                     console.print(f"[red]Error:[/red] {e}")
@@ -648,6 +831,15 @@ def restore_command(
             help="Automatically create a backup before restoring (enabled by default)",
         ),
     ] = True,
+    differential: Annotated[
+        bool,
+        typer.Option(
+            "--differential",
+            is_flag=True,
+            flag_value=True,
+            help="Only rewrite files whose content differs from the checkpoint",
+        ),
+    ] = False,
 ) -> None:
     """Restore a checkpoint to a target server directory.
 
@@ -670,6 +862,9 @@ def restore_command(
     4. Extracts files to server directory
     5. Excludes Foothold_Ranks.lua by default (use --restore-ranks to include)
 
+    With --differential, files that already hold the checkpoint content are left
+    untouched, so rolling back a single changed file only rewrites that file.
+
     Examples:
 
         # Restore by number (from list command)
@@ -687,9 +882,25 @@ def restore_command(
         # Restore without auto-backup (not recommended)
         $ foothold-checkpoint restore 1 --server test-server --no-auto-backup
 
+        # Only rewrite the files that changed since the checkpoint
+        $ foothold-checkpoint restore 1 --server test-server --differential
+
         # Interactive mode (select checkpoint and server)
         $ foothold-checkpoint restore
     """
+    import asyncio
+
+    _lazy_import(
+        "load_config",
+        "list_checkpoints",
+        "CheckpointArchive",
+        "check_restore_conflicts",
+        "restore_checkpoint",
+        "Progress",
+        "SpinnerColumn",
+        "TextColumn",
+        "TaskID",
+    )
     try:
         # Step 1: Load configuration
         config_file = _config_path if _config_path else Path("config.yaml")
@@ -700,6 +911,7 @@ def restore_command(
             console.print("[red]Error:[/red] No servers configured in config.yaml")
             console.print("The CLI requires 'servers' section in config.yaml")
             raise typer.Exit(1)
+        daemon = _daemon_client(config_file, config.checkpoints_dir)
 
         # Step 2: Get checkpoint file(s)
         checkpoint_paths: list[Path]
@@ -707,7 +919,11 @@ def restore_command(
             # Check if checkpoint_file is a numeric selection (e.g., "1", "1,3", "1-3")
             if is_numeric_selection(checkpoint_file):
                 # Resolve numeric selection by listing checkpoints
-                checkpoints = asyncio.run(list_checkpoints(config.checkpoints_dir))
+                checkpoints = (
+                    daemon.list_checkpoints()
+                    if daemon is not None
+                    else asyncio.run(list_checkpoints(config.checkpoints_dir))
+                )
 
                 if not checkpoints:
                     console.print("[red]Error:[/red] No checkpoints found in checkpoint directory")
@@ -721,7 +937,7 @@ def restore_command(
 
                 # Build list of checkpoint paths from indices
                 checkpoint_paths = [
-                    Path(config.checkpoints_dir) / checkpoints[idx - 1]["filename"]
+                    Path(config.checkpoints_dir) / checkpoints[idx - 1].filename
                     for idx in selected_indices
                 ]
 
@@ -729,7 +945,7 @@ def restore_command(
                 if not _quiet_mode:
                     console.print("[cyan]Selected checkpoint(s):[/cyan]")
                     for idx in selected_indices:
-                        console.print(f"  {idx}. {checkpoints[idx - 1]['filename']}")
+                        console.print(f"  {idx}. {checkpoints[idx - 1].filename}")
             else:
                 # Treat as file path (existing behavior)
                 checkpoint_path = Path(checkpoint_file)
@@ -744,7 +960,11 @@ def restore_command(
                 console.print("[cyan]Available checkpoints:[/cyan]")
 
             # List all checkpoints
-            checkpoints = asyncio.run(list_checkpoints(config.checkpoints_dir))
+            checkpoints = (
+                daemon.list_checkpoints()
+                if daemon is not None
+                else asyncio.run(list_checkpoints(config.checkpoints_dir))
+            )
 
             if not checkpoints:
                 console.print("[red]Error:[/red] No checkpoints found in checkpoint directory")
@@ -755,18 +975,18 @@ def restore_command(
                 for idx, cp in enumerate(checkpoints, start=1):
                     # Build display string with optional name/comment
                     display_parts = [
-                        f"  {idx}. {cp['filename']}",
-                        f"[dim](Campaign: {cp['campaign']}, Server: {cp['server']},",
-                        f"Created: {cp['timestamp']})",
+                        f"  {idx}. {cp.filename}",
+                        f"[dim](Campaign: {cp.campaign}, Server: {cp.server},",
+                        f"Created: {cp.created_at:%Y-%m-%d %H:%M:%S})",
                     ]
 
                     # Add name if present
-                    if cp.get("name"):
-                        display_parts.insert(2, f"[blue]Name: {cp['name']}[/blue],")
+                    if cp.name:
+                        display_parts.insert(2, f"[blue]Name: {cp.name}[/blue],")
 
                     # Add comment if present
-                    if cp.get("comment"):
-                        display_parts.insert(-1, f"[white]Comment: {cp['comment']}[/white],")
+                    if cp.comment:
+                        display_parts.insert(-1, f"[white]Comment: {cp.comment}[/white],")
 
                     console.print(" ".join(display_parts))
 
@@ -784,7 +1004,7 @@ def restore_command(
 
             # Build list of checkpoint paths
             checkpoint_paths = [
-                Path(config.checkpoints_dir) / checkpoints[idx - 1]["filename"]
+                Path(config.checkpoints_dir) / checkpoints[idx - 1].filename
                 for idx in selected_indices
             ]
 
@@ -842,77 +1062,89 @@ def restore_command(
         # Step 4: Restore checkpoint(s) with progress display
         total_restored = 0
 
-        for idx, checkpoint_path in enumerate(checkpoint_paths, 1):
-            if not _quiet_mode and len(checkpoint_paths) > 1:
-                console.print(f"\n[cyan]Restoring checkpoint {idx}/{len(checkpoint_paths)}[/cyan]")
-
-            if not _quiet_mode:
-                console.print(f"[cyan]Checkpoint:[/cyan] {checkpoint_path.name}")
-                console.print(f"[cyan]Target server:[/cyan] {server}")
-                console.print(f"[cyan]Target directory:[/cyan] {target_dir}")
-                console.print(
-                    f"[cyan]Include ranks file:[/cyan] {'Yes' if restore_ranks else 'No'}\n"
+        def restore(
+            archive: CheckpointArchive,
+            progress_callback: Callable[[str, int, int], None] | None,
+        ) -> list[Path]:
+            """Restore one checkpoint, in the serve daemon if it is running.
+
+            Overwrites were confirmed above (or implied by quiet mode).
+            """
+            if daemon is not None:
+                # The daemon reads the archive itself and reports no progress
+                return daemon.restore_checkpoint(
+                    checkpoint_path=archive.path,
+                    target_dir=target_dir,
+                    server_name=server,
+                    restore_ranks=restore_ranks,
+                    auto_backup=auto_backup,
+                    differential=differential,
                 )
-
-                # Check for file conflicts BEFORE opening Progress context
-                existing_files = check_restore_conflicts(
-                    checkpoint_path=checkpoint_path,
+            return asyncio.run(
+                restore_checkpoint(
+                    checkpoint_path=archive,
                     target_dir=target_dir,
                     restore_ranks=restore_ranks,
+                    progress_callback=progress_callback,
+                    config=config,
+                    skip_overwrite_check=True,
+                    server_name=server,
+                    auto_backup=auto_backup,
+                    differential=differential,
                 )
+            )
 
-                # Ask for confirmation if files would be overwritten
-                if existing_files:
-                    confirmation = input(
-                        f"Files will be overwritten ({len(existing_files)} files). Continue? (y/n): "
-                    )
-                    if confirmation.lower() != "y":
-                        console.print("[yellow]Restoration cancelled by user[/yellow]")
-                        raise typer.Exit(1)
-
-                # Progress display with Rich (after confirmation)
-                with Progress(
-                    SpinnerColumn(),
-                    TextColumn("[progress.description]{task.description}"),
-                    console=console,
-                    transient=True,  # Auto-clear spinner when done
-                ) as progress:
-                    task = progress.add_task("Restoring checkpoint...", total=None)
-
-                    def update_progress(
-                        message: str, current: int, total: int, _task: TaskID = task
-                    ) -> None:
-                        """Update progress display with current status."""
-                        progress.update(_task, description=f"{message} ({current}/{total})")
+        for idx, checkpoint_path in enumerate(checkpoint_paths, 1):
+            if not _quiet_mode and len(checkpoint_paths) > 1:
+                console.print(f"\n[cyan]Restoring checkpoint {idx}/{len(checkpoint_paths)}[/cyan]")
 
-                    # Restore with progress callback (skip overwrite check since we already confirmed)
-                    restored_files = asyncio.run(
-                        restore_checkpoint(
-                            checkpoint_path=checkpoint_path,
-                            target_dir=target_dir,
-                            restore_ranks=restore_ranks,
-                            progress_callback=update_progress,
-                            config=config,
-                            skip_overwrite_check=True,
-                            server_name=server,
-                            auto_backup=auto_backup,
-                        )
+            # Conflict check, auto-backup and extraction share one open archive
+            with CheckpointArchive(checkpoint_path) as archive:
+                if not _quiet_mode:
+                    console.print(f"[cyan]Checkpoint:[/cyan] {checkpoint_path.name}")
+                    console.print(f"[cyan]Target server:[/cyan] {server}")
+                    console.print(f"[cyan]Target directory:[/cyan] {target_dir}")
+                    console.print(
+                        f"[cyan]Include ranks file:[/cyan] {'Yes' if restore_ranks else 'No'}\n"
                     )
-            else:
-                # Quiet mode: no progress display, no interactive confirmation
-                # In quiet mode, we assume user wants to overwrite (typical for automation)
-                restored_files = asyncio.run(
-                    restore_checkpoint(
-                        checkpoint_path=checkpoint_path,
+
+                    # Check for file conflicts BEFORE opening Progress context
+                    existing_files = check_restore_conflicts(
+                        checkpoint_path=archive,
                         target_dir=target_dir,
                         restore_ranks=restore_ranks,
-                        progress_callback=None,
-                        config=config,
-                        skip_overwrite_check=True,  # No confirmation in quiet mode
-                        server_name=server,
-                        auto_backup=auto_backup,
                     )
-                )
+
+                    # Ask for confirmation if files would be overwritten
+                    if existing_files:
+                        confirmation = input(
+                            f"Files will be overwritten ({len(existing_files)} files). Continue? (y/n): "
+                        )
+                        if confirmation.lower() != "y":
+                            console.print("[yellow]Restoration cancelled by user[/yellow]")
+                            raise typer.Exit(1)
+
+                    # Progress display with Rich (after confirmation)
+                    with Progress(
+                        SpinnerColumn(),
+                        TextColumn("[progress.description]{task.description}"),
+                        console=console,
+                        transient=True,  # Auto-clear spinner when done
+                    ) as progress:
+                        task = progress.add_task("Restoring checkpoint...", total=None)
+
+                        def update_progress(
+                            message: str, current: int, total: int, _task: TaskID = task
+                        ) -> None:
+                            """Update progress display with current status."""
+                            progress.update(_task, description=f"{message} ({current}/{total})")
+
+                        # Restore with progress callback (skip overwrite check since we already confirmed)
+                        restored_files = restore(archive, update_progress)
+                else:
+                    # Quiet mode: no progress display, no interactive confirmation
+                    # In quiet mode, we assume user wants to overwrite (typical for automation)
+                    restored_files = restore(archive, None)
 
             total_restored += len(restored_files)
 
@@ -921,6 +1153,11 @@ def restore_command(
                 console.print(
                     f"[green]✓ Restored {len(restored_files)} file(s) from {checkpoint_path.name}[/green]"
                 )
+                skipped_files = getattr(restored_files, "skipped", [])
+                if skipped_files:
+                    console.print(
+                        f"[dim]  {len(skipped_files)} file(s) already up to date, not rewritten[/dim]"
+                    )
             else:
                 # In quiet mode, just print the paths
                 for file_path in restored_files:
@@ -961,19 +1198,56 @@ def list_command(
         bool,
         typer.Option("--details", "-d", help="Show detailed information including file lists"),
     ] = False,
+    kind: Annotated[
+        str,
+        typer.Option("--type", "-t", help="Checkpoint type: all, manual or auto"),
+    ] = "all",
+    since: Annotated[
+        Optional[datetime],  # noqa: UP007 - Typer requires Optional
+        typer.Option("--since", help="Only checkpoints created at or after this time (UTC)"),
+    ] = None,
+    until: Annotated[
+        Optional[datetime],  # noqa: UP007 - Typer requires Optional
+        typer.Option("--until", help="Only checkpoints created at or before this time (UTC)"),
+    ] = None,
+    sort: Annotated[
+        str,
+        typer.Option("--sort", help="Sort key: default, timestamp, size, filename or campaign"),
+    ] = "default",
+    descending: Annotated[
+        bool,
+        typer.Option("--reverse", "-r", help="Reverse the sort order"),
+    ] = False,
+    offset: Annotated[
+        int,
+        typer.Option("--offset", help="Number of matching checkpoints to skip", min=0),
+    ] = 0,
+    limit: Annotated[
+        Optional[int],  # noqa: UP007 - Typer requires Optional
+        typer.Option("--limit", "-n", help="Maximum number of checkpoints to show", min=0),
+    ] = None,
 ) -> None:
     """List available checkpoints with optional filters.
 
     Displays all checkpoints in the checkpoints directory, optionally filtered
-    by server and/or campaign name. Shows checkpoint metadata including filename,
-    campaign, server, timestamp, and file size in a formatted table.
+    by server, campaign, type and creation time. Shows checkpoint metadata
+    including filename, campaign, server, timestamp, and file size in a
+    formatted table.
 
-    Use --details to show the list of files contained in each checkpoint.
+    Use --details to show the list of files contained in each checkpoint, and
+    --offset/--limit to page through large checkpoint directories.
 
     Args:
         server: Optional server name to filter checkpoints
         campaign: Optional campaign name to filter checkpoints
         details: If True, show detailed information including file lists
+        kind: Checkpoint type to list ("all", "manual" or "auto")
+        since: Only list checkpoints created at or after this time
+        until: Only list checkpoints created at or before this time
+        sort: Sort key (see CHECKPOINT_SORT_KEYS)
+        descending: If True, reverse the sort order
+        offset: Number of matching checkpoints to skip
+        limit: Maximum number of checkpoints to show
 
     Examples:
         # List all checkpoints
@@ -993,26 +1267,57 @@ def list_command(
 
         # Quiet mode (filenames only)
         foothold-checkpoint --quiet list
+
+        # Ten newest manual checkpoints since February
+        foothold-checkpoint list --type manual --since 2024-02-01 --sort timestamp -r -n 10
     """
+    import asyncio
+
+    _lazy_import("load_config", "list_checkpoints")
     try:
         # Load configuration
         config_file = _config_path if _config_path else Path("config.yaml")
         config = load_config(config_file)
 
         # List checkpoints with filters
-        checkpoints = asyncio.run(
-            list_checkpoints(config.checkpoints_dir, server_filter=server, campaign_filter=campaign)
+        list_options: dict[str, Any] = {
+            "server_filter": server,
+            "campaign_filter": campaign,
+            "kind": kind,
+            "since": since,
+            "until": until,
+            "sort": sort,
+            "descending": descending,
+            "offset": offset,
+            "limit": limit,
+        }
+        daemon = _daemon_client(config_file, config.checkpoints_dir)
+        checkpoints = (
+            daemon.list_checkpoints(**list_options)
+            if daemon is not None
+            else asyncio.run(list_checkpoints(config.checkpoints_dir, **list_options))
         )
+        total = getattr(checkpoints, "total", len(checkpoints))
 
         # Handle empty results
         if not checkpoints:
             if not _quiet_mode:
-                if server or campaign:
-                    filters = []
-                    if server:
-                        filters.append(f"server='{server}'")
-                    if campaign:
-                        filters.append(f"campaign='{campaign}'")
+                filters = []
+                if server:
+                    filters.append(f"server='{server}'")
+                if campaign:
+                    filters.append(f"campaign='{campaign}'")
+                if kind != "all":
+                    filters.append(f"type='{kind}'")
+                if since:
+                    filters.append(f"since={since:%Y-%m-%d %H:%M:%S}")
+                if until:
+                    filters.append(f"until={until:%Y-%m-%d %H:%M:%S}")
+                if total:
+                    console.print(
+                        f"[yellow]No checkpoints past offset {offset} (total: {total})[/yellow]"
+                    )
+                elif filters:
                     console.print(
                         f"[yellow]No checkpoints found matching {' and '.join(filters)}[/yellow]"
                     )
@@ -1022,8 +1327,8 @@ def list_command(
 
         # Quiet mode: just print filenames with numbers
         if _quiet_mode:
-            for idx, cp in enumerate(checkpoints, start=1):
-                print(f"{idx}. {cp['filename']}")
+            for idx, cp in enumerate(checkpoints, start=offset + 1):
+                print(f"{idx}. {cp.filename}")
             return
 
         # Normal mode: display Rich table
@@ -1039,57 +1344,53 @@ def list_command(
         table.add_column("Name", style="blue")
         table.add_column("Comment", style="dim")
 
-        # Add rows for each checkpoint with separator for auto-backups
+        # Add rows for each checkpoint with separator for auto-backups (grouped
+        # only by the default sort)
         prev_was_manual = True
-        for idx, cp in enumerate(checkpoints, start=1):
+        for idx, cp in enumerate(checkpoints, start=offset + 1):
             # Add separator before first auto-backup
-            if cp.get("is_auto_backup") and prev_was_manual:
+            if sort == "default" and cp.is_auto_backup and prev_was_manual:
                 table.add_row(
                     "", "─" * 40 + " AUTO-BACKUPS " + "─" * 40, "", "", "", "", "", "", style="dim"
                 )
                 prev_was_manual = False
 
-            # Format timestamp for human readability (remove microseconds)
-            timestamp_str = cp["timestamp"]
-            # "2024-02-14T10:30:00.123456" -> "2024-02-14 10:30:00"
-            if "." in timestamp_str:
-                timestamp_str = timestamp_str.split(".")[0]
-            timestamp_display = timestamp_str.replace("T", " ")
-
-            # Get optional name and comment
-            name_display = cp.get("name") or ""
-            comment_display = cp.get("comment") or ""
-
             table.add_row(
                 str(idx),
-                cp["filename"],
-                cp["campaign"],
-                cp["server"],
-                timestamp_display,
-                cp["size_human"],
-                name_display,
-                comment_display,
+                cp.filename,
+                cp.campaign,
+                cp.server,
+                f"{cp.created_at:%Y-%m-%d %H:%M:%S}",
+                cp.size_human,
+                cp.name or "",
+                cp.comment or "",
             )
 
         console.print(table)
-        console.print(f"\n[cyan]Total:[/cyan] {len(checkpoints)} checkpoint(s)")
+        if len(checkpoints) < total:
+            console.print(
+                f"\n[cyan]Showing:[/cyan] {offset + 1}-{offset + len(checkpoints)} "
+                f"of {total} checkpoint(s)"
+            )
+        else:
+            console.print(f"\n[cyan]Total:[/cyan] {total} checkpoint(s)")
 
         # Show detailed file lists if --details flag is set
         if details:
             console.print("\n[bold cyan]Checkpoint Details:[/bold cyan]\n")
 
-            for idx, cp in enumerate(checkpoints, start=1):
+            for idx, cp in enumerate(checkpoints, start=offset + 1):
                 # Header for each checkpoint
-                console.print(f"[bold]{idx}. {cp['filename']}[/bold]")
+                console.print(f"[bold]{idx}. {cp.filename}[/bold]")
 
                 # Show metadata
-                if cp.get("name"):
-                    console.print(f"   [blue]Name:[/blue] {cp['name']}")
-                if cp.get("comment"):
-                    console.print(f"   [dim]Comment:[/dim] {cp['comment']}")
+                if cp.name:
+                    console.print(f"   [blue]Name:[/blue] {cp.name}")
+                if cp.comment:
+                    console.print(f"   [dim]Comment:[/dim] {cp.comment}")
 
                 # Show files contained in checkpoint
-                files = cp.get("files", [])
+                files = cp.files
                 if files:
                     console.print(f"   [cyan]Files ({len(files)}):[/cyan]")
                     for file in sorted(files):
@@ -1160,6 +1461,9 @@ def delete_command(
         # Quiet mode (automatic force, no prompts)
         foothold-checkpoint --quiet delete 1
     """
+    import asyncio
+
+    _lazy_import("load_config", "list_checkpoints", "delete_checkpoint")
     import json
     import zipfile
 
@@ -1177,13 +1481,18 @@ def delete_command(
             console.print("[red]Error:[/red] No campaigns configured in config.yaml")
             console.print("The CLI requires 'campaigns' section or 'campaigns_file' in config.yaml")
             raise typer.Exit(1)
+        daemon = _daemon_client(config_file, config.checkpoints_dir)
 
         # Step 1: Get checkpoint file (from argument or interactive selection)
         if checkpoint_file:
             # Check if checkpoint_file is a numeric selection (e.g., "1", "1,3", "1-3")
             if is_numeric_selection(checkpoint_file):
                 # Resolve numeric selection by listing checkpoints
-                checkpoints = asyncio.run(list_checkpoints(config.checkpoints_dir))
+                checkpoints = (
+                    daemon.list_checkpoints()
+                    if daemon is not None
+                    else asyncio.run(list_checkpoints(config.checkpoints_dir))
+                )
 
                 if not checkpoints:
                     console.print("[yellow]No checkpoints found[/yellow]")
@@ -1197,7 +1506,7 @@ def delete_command(
 
                 # Build list of checkpoint paths from indices
                 checkpoint_paths = [
-                    Path(config.checkpoints_dir) / checkpoints[idx - 1]["filename"]
+                    Path(config.checkpoints_dir) / checkpoints[idx - 1].filename
                     for idx in selected_indices
                 ]
 
@@ -1205,13 +1514,17 @@ def delete_command(
                 if not _quiet_mode:
                     console.print("[cyan]Selected checkpoint(s) for deletion:[/cyan]")
                     for idx in selected_indices:
-                        console.print(f"  {idx}. {checkpoints[idx - 1]['filename']}")
+                        console.print(f"  {idx}. {checkpoints[idx - 1].filename}")
             else:
                 # Treat as filename (existing behavior)
                 checkpoint_paths = [Path(config.checkpoints_dir) / checkpoint_file]
         else:
             # Interactive mode: list checkpoints and prompt for selection
-            checkpoints = asyncio.run(list_checkpoints(config.checkpoints_dir))
+            checkpoints = (
+                daemon.list_checkpoints()
+                if daemon is not None
+                else asyncio.run(list_checkpoints(config.checkpoints_dir))
+            )
 
             if not checkpoints:
                 console.print("[yellow]No checkpoints found[/yellow]")
@@ -1221,23 +1534,23 @@ def delete_command(
             if not _quiet_mode:
                 console.print("\n[cyan]Available checkpoints:[/cyan]")
                 for idx, cp in enumerate(checkpoints, 1):
-                    timestamp = cp["timestamp"].replace("T", " ")
+                    timestamp = f"{cp.created_at:%Y-%m-%d %H:%M:%S}"
 
                     # Build display string with optional name/comment
                     display_parts = [
-                        f"  {idx}. [white]{cp['filename']}[/white] -",
-                        f"[cyan]{cp['campaign']}[/cyan] on",
-                        f"[green]{cp['server']}[/green]",
+                        f"  {idx}. [white]{cp.filename}[/white] -",
+                        f"[cyan]{cp.campaign}[/cyan] on",
+                        f"[green]{cp.server}[/green]",
                         f"[yellow]({timestamp})[/yellow]",
                     ]
 
                     # Add name if present
-                    if cp.get("name"):
-                        display_parts.insert(-1, f"[blue]'{cp['name']}'[/blue]")
+                    if cp.name:
+                        display_parts.insert(-1, f"[blue]'{cp.name}'[/blue]")
 
                     # Add comment if present
-                    if cp.get("comment"):
-                        display_parts.append(f"[dim]- {cp['comment']}[/dim]")
+                    if cp.comment:
+                        display_parts.append(f"[dim]- {cp.comment}[/dim]")
 
                     console.print(" ".join(display_parts))
 
@@ -1255,7 +1568,7 @@ def delete_command(
 
             # Build list of checkpoint paths
             checkpoint_paths = [
-                Path(config.checkpoints_dir) / checkpoints[idx - 1]["filename"]
+                Path(config.checkpoints_dir) / checkpoints[idx - 1].filename
                 for idx in selected_indices
             ]
 
@@ -1279,8 +1592,12 @@ def delete_command(
 
             if use_force:
                 # Force mode: no confirmation needed
-                result = asyncio.run(
-                    delete_checkpoint(checkpoint_path, force=True, confirm_callback=None)
+                result = (
+                    daemon.delete_checkpoint(checkpoint_path)
+                    if daemon is not None
+                    else asyncio.run(
+                        delete_checkpoint(checkpoint_path, force=True, confirm_callback=None)
+                    )
                 )
                 if result:
                     deleted_count += 1
@@ -1411,6 +1728,17 @@ def import_command(
         # Quiet mode (no prompts, auto-confirms)
         foothold-checkpoint --quiet import /backup --server prod-1 --campaign afghan
     """
+    import asyncio
+
+    _lazy_import(
+        "load_config",
+        "scan_directory",
+        "campaign_file_filter",
+        "detect_unknown_files",
+        "format_unknown_files_error",
+        "detect_campaigns",
+        "import_checkpoint",
+    )
     try:
         # Load configuration
         config_file = _config_path if _config_path else Path("config.yaml")
@@ -1440,8 +1768,9 @@ def import_command(
             raise typer.Exit(1)
 
         # Step 2: Detect campaigns in source directory
-        all_files = list(source_dir.iterdir())
-        filenames = [f.name for f in all_files if f.is_file()]
+        filenames = list(
+            scan_directory(source_dir, campaign_file_filter(config, include_foothold_like=True))
+        )
 
         # Check for unknown files
         unknown_files = detect_unknown_files(filenames, config)
@@ -1572,18 +1901,29 @@ def import_command(
                 return
 
         # Step 6: Perform import
-        result = asyncio.run(
-            import_checkpoint(
+        daemon = _daemon_client(config_file, config.checkpoints_dir)
+        result: Path | tuple[Path, list[str]]
+        if daemon is not None:
+            result = daemon.import_checkpoint(
                 source_dir=source_dir,
                 campaign_name=campaign_name,
                 server_name=server_name,
-                output_dir=config.checkpoints_dir,
-                config=config,
                 name=name,
                 comment=comment,
-                return_warnings=True,
             )
-        )
+        else:
+            result = asyncio.run(
+                import_checkpoint(
+                    source_dir=source_dir,
+                    campaign_name=campaign_name,
+                    server_name=server_name,
+                    output_dir=config.checkpoints_dir,
+                    config=config,
+                    name=name,
+                    comment=comment,
+                    return_warnings=True,
+                )
+            )
 
         # Handle result (could be path or tuple with warnings)
         if isinstance(result, tuple):
@@ -1619,6 +1959,384 @@ def import_command(
         raise typer.Exit(1) from e
 
 
+@app.command("export")
+def export_command(
+    checkpoint_file: Annotated[
+        str,
+        typer.Argument(help="Checkpoint to export: filename or number from the list"),
+    ],
+    output: Annotated[
+        Optional[Path],  # noqa: UP007 - Typer requires Optional
+        typer.Option(
+            "--output",
+            "-o",
+            help="Destination file or directory (default: current directory)",
+        ),
+    ] = None,
+    force: Annotated[
+        bool,
+        typer.Option("--force", "-f", help="Overwrite the destination if it exists"),
+    ] = False,
+) -> None:
+    """Export a checkpoint as a portable self-contained ZIP file.
+
+    Checkpoints created with the 'dedup' storage backend only contain a manifest;
+    their files live in the shared blob store of the checkpoints directory. Export
+    materializes them into a classic ZIP that can be copied to another machine or
+    imported anywhere. Classic checkpoints are simply copied.
+
+    Args:
+        checkpoint_file: Checkpoint filename or number from the list
+        output: Destination file or directory
+        force: If True, overwrite an existing destination file
+
+    Examples:
+        # Export the first checkpoint to the current directory
+        foothold-checkpoint export 1
+
+        # Export to a specific file
+        foothold-checkpoint export afghanistan_2024-02-14_10-30-00.zip -o D:\\transfer\\afghan.zip
+    """
+    import asyncio
+
+    _lazy_import("load_config", "list_checkpoints", "export_checkpoint")
+    try:
+        # Load configuration
+        config_file = _config_path if _config_path else Path("config.yaml")
+        config = load_config(config_file)
+        checkpoints_dir = Path(config.checkpoints_dir)
+
+        # Resolve checkpoint from number or filename
+        if checkpoint_file.isdigit():
+            checkpoints = asyncio.run(list_checkpoints(checkpoints_dir))
+            index = int(checkpoint_file)
+            if not 1 <= index <= len(checkpoints):
+                console.print(
+                    f"[red]Error:[/red] Invalid checkpoint number {index} "
+                    f"(1-{len(checkpoints)} available)"
+                )
+                raise typer.Exit(1)
+            checkpoint_path = checkpoints_dir / checkpoints[index - 1].filename
+        else:
+            checkpoint_path = checkpoints_dir / checkpoint_file
+
+        exported_path = asyncio.run(
+            export_checkpoint(checkpoint_path, output or Path.cwd(), overwrite=force)
+        )
+
+        if _quiet_mode:
+            print(exported_path)
+        else:
+            console.print(
+                f"[green]✓ Success![/green] Exported checkpoint to [cyan]{exported_path}[/cyan]"
+            )
+
+    except typer.Exit:
+        raise
+    except (FileNotFoundError, FileExistsError, ValueError) as e:
+        console.print(f"[red]Error:[/red] {e}")
+        raise typer.Exit(1) from e
+    except Exception as e:
+        console.print(f"[red]Error:[/red] {e}")
+        raise typer.Exit(1) from e
+
+
+@app.command("prune")
+def prune_command(
+    server: Annotated[
+        Optional[str],  # noqa: UP007 - Typer requires Optional
+        typer.Option("--server", "-s", help="Only prune checkpoints of this server"),
+    ] = None,
+    campaign: Annotated[
+        Optional[str],  # noqa: UP007 - Typer requires Optional
+        typer.Option("--campaign", "-c", help="Only prune checkpoints of this campaign"),
+    ] = None,
+    dry_run: Annotated[
+        bool,
+        typer.Option("--dry-run", "-n", help="Show what would be deleted without deleting"),
+    ] = False,
+    force: Annotated[
+        bool,
+        typer.Option("--force", "-f", help="Delete without confirmation"),
+    ] = False,
+) -> None:
+    """Delete old checkpoints according to the retention policy.
+
+    Applies the 'retention' section of the configuration: rules are evaluated per
+    campaign and server, with separate rules for automatic backups. Checkpoints
+    that are not kept by any rule are deleted in one batch.
+
+    Args:
+        server: Optional server filter
+        campaign: Optional campaign filter
+        dry_run: If True, only list the checkpoints that would be deleted
+        force: If True, delete without confirmation
+
+    Examples:
+        # Preview what the retention policy would delete
+        foothold-checkpoint prune --dry-run
+
+        # Prune one campaign without confirmation
+        foothold-checkpoint prune --campaign syria --force
+    """
+    import asyncio
+
+    _lazy_import("load_config", "prune_checkpoints")
+    try:
+        # Load configuration
+        config_file = _config_path if _config_path else Path("config.yaml")
+        config = load_config(config_file)
+
+        if config.retention is None:
+            console.print("[red]Error:[/red] No retention policy configured")
+            console.print("Add a 'retention' section to config.yaml to use prune")
+            raise typer.Exit(1)
+
+        checkpoints_dir = Path(config.checkpoints_dir)
+        plan = asyncio.run(
+            prune_checkpoints(
+                checkpoints_dir,
+                config.retention,
+                dry_run=True,
+                server_filter=server,
+                campaign_filter=campaign,
+            )
+        )
+
+        if not plan.deleted:
+            if not _quiet_mode:
+                console.print("[green]Nothing to prune[/green]")
+            return
+
+        if not _quiet_mode:
+            console.print(
+                f"[cyan]{len(plan.deleted)} checkpoint(s) to delete "
+                f"({plan.bytes_freed_human}), {plan.kept} kept:[/cyan]"
+            )
+            for path in plan.deleted:
+                console.print(f"  - {path.name}")
+
+        if dry_run:
+            return
+
+        # Quiet mode acts like force mode (no prompts)
+        if not (force or _quiet_mode):
+            response = Prompt.ask(
+                "\n[yellow]Delete these checkpoints?[/yellow]", choices=["y", "n"], default="n"
+            )
+            if response.lower() != "y":
+                console.print("[yellow]Prune cancelled[/yellow]")
+                return
+
+        result = asyncio.run(
+            prune_checkpoints(
+                checkpoints_dir,
+                config.retention,
+                server_filter=server,
+                campaign_filter=campaign,
+            )
+        )
+
+        if _quiet_mode:
+            for path in result.deleted:
+                print(path.name)
+        else:
+            console.print(
+                f"\n[green]✓ Success![/green] Deleted {len(result.deleted)} checkpoint(s), "
+                f"freed {result.bytes_freed_human}"
+            )
+        for filename, error in result.errors.items():
+            console.print(f"[red]Error:[/red] Cannot delete {filename}: {error}")
+        if result.errors:
+            raise typer.Exit(1)
+
+    except typer.Exit:
+        raise
+    except (FileNotFoundError, ValueError) as e:
+        console.print(f"[red]Error:[/red] {e}")
+        raise typer.Exit(1) from e
+    except Exception as e:
+        console.print(f"[red]Error:[/red] {e}")
+        raise typer.Exit(1) from e
+
+
+@app.command("verify")
+def verify_command(
+    force: Annotated[
+        bool,
+        typer.Option("--force", "-f", help="Verify every checkpoint, even if already verified"),
+    ] = False,
+    max_rate: Annotated[
+        Optional[float],  # noqa: UP007 - Typer requires Optional
+        typer.Option("--max-rate", help="Maximum read rate in MB/s (default: unlimited)"),
+    ] = None,
+    cpu_share: Annotated[
+        Optional[float],  # noqa: UP007 - Typer requires Optional
+        typer.Option("--cpu-share", help="Maximum fraction of a CPU core per worker, e.g. 0.25"),
+    ] = None,
+    parallel: Annotated[
+        Optional[int],  # noqa: UP007 - Typer requires Optional
+        typer.Option(
+            "--parallel",
+            "-p",
+            help="Number of checkpoints verified at the same time (1 when throttled)",
+        ),
+    ] = None,
+    json_output: Annotated[
+        bool,
+        typer.Option("--json", help="Print the health report as JSON"),
+    ] = False,
+) -> None:
+    """Verify checkpoint integrity against the recorded checksums.
+
+    Every campaign file of every checkpoint is checked against the SHA-256
+    checksum stored in its metadata. The result of each archive is recorded in
+    .foothold-verify.json, so reruns only verify new or modified checkpoints
+    (use --force to verify everything again). Exits with code 1 if any
+    checkpoint is corrupted.
+
+    Args:
+        force: If True, verify already verified checkpoints again
+        max_rate: Optional read rate limit in MB/s
+        cpu_share: Optional CPU share limit per worker (0 < x <= 1)
+        parallel: Number of checkpoints verified at the same time (forced to 1
+            with --max-rate or --cpu-share, so a throttled scrub holds a single
+            I/O worker)
+        json_output: If True, print the machine-readable health report
+
+    Examples:
+        # Verify new and modified checkpoints
+        foothold-checkpoint verify
+
+        # Gentle full scrub next to a running server
+        foothold-checkpoint verify --force --max-rate 5 --cpu-share 0.25 --parallel 1
+
+        # Health report for monitoring
+        foothold-checkpoint verify --json
+    """
+    import asyncio
+    import json
+
+    _lazy_import("load_config", "Throttle", "scrub_checkpoints")
+
+    try:
+        # Load configuration
+        config_file = _config_path if _config_path else Path("config.yaml")
+        config = load_config(config_file)
+
+        if parallel is None:
+            from foothold_checkpoint.core.verify import DEFAULT_PARALLEL_CHECKPOINTS
+
+            parallel = DEFAULT_PARALLEL_CHECKPOINTS
+        if parallel < 1:
+            raise ValueError(f"--parallel must be at least 1, got {parallel}")
+        throttle = None
+        if max_rate is not None or cpu_share is not None:
+            throttle = Throttle(
+                max_bytes_per_second=max_rate * 1024 * 1024 if max_rate is not None else None,
+                cpu_share=cpu_share,
+            )
+            # Throttled workers sleep in the shared I/O pool; keep it free for saves
+            parallel = 1
+
+        if json_output or _quiet_mode:
+            report = asyncio.run(
+                scrub_checkpoints(config.checkpoints_dir, throttle, force, parallel)
+            )
+        else:
+            with console.status("Verifying checkpoints..."):
+                report = asyncio.run(
+                    scrub_checkpoints(config.checkpoints_dir, throttle, force, parallel)
+                )
+
+        if json_output:
+            print(json.dumps(report.to_dict(), indent=2))
+        elif _quiet_mode:
+            for filename in report.errors:
+                print(filename)
+        else:
+            console.print(
+                f"[cyan]{len(report.records)} checkpoint(s): {len(report.verified)} verified, "
+                f"{len(report.skipped)} unchanged since last verification[/cyan]"
+            )
+            for filename, error in report.errors.items():
+                console.print(f"[red]✗ {filename}:[/red] {error}")
+            if report.healthy:
+                console.print("[green]✓ All checkpoints are intact[/green]")
+
+        if not report.healthy:
+            raise typer.Exit(1)
+
+    except typer.Exit:
+        raise
+    except (FileNotFoundError, ValueError) as e:
+        console.print(f"[red]Error:[/red] {e}")
+        raise typer.Exit(1) from e
+    except Exception as e:
+        console.print(f"[red]Error:[/red] {e}")
+        raise typer.Exit(1) from e
+
+
+@app.command("serve")
+def serve_command(
+    port: Annotated[
+        int,
+        typer.Option("--port", help="TCP port on 127.0.0.1 (default: any free port)"),
+    ] = 0,
+) -> None:
+    """Run a local daemon that keeps the configuration and caches warm.
+
+    While the daemon runs, the save, restore, list, delete and import commands
+    using the same configuration file forward their checkpoint operations to
+    it instead of loading everything again; they run in-process as usual when
+    it is not running. Prompts and output stay in the command. The daemon only
+    listens on 127.0.0.1 and is announced, with an access token, in a hidden
+    .<config>.daemon file next to the configuration. Stop it with Ctrl+C.
+
+    Args:
+        port: TCP port to listen on (0 for any free port)
+
+    Examples:
+        # Start the daemon in its own terminal (or as a service)
+        foothold-checkpoint serve
+
+        # Later commands are served by the daemon
+        foothold-checkpoint list
+    """
+    from foothold_checkpoint.core.daemon import CheckpointDaemon, connect
+
+    try:
+        config_file = _config_path if _config_path else Path("config.yaml")
+        if connect(config_file) is not None:
+            console.print(f"[red]Error:[/red] A daemon is already running for {config_file}")
+            raise typer.Exit(1)
+
+        daemon = CheckpointDaemon(config_file, port=port)
+    except typer.Exit:
+        raise
+    except Exception as e:
+        console.print(f"[red]Error:[/red] {e}")
+        raise typer.Exit(1) from e
+
+    def stop(_signum: int, _frame: FrameType | None) -> None:
+        raise SystemExit(0)
+
+    signal.signal(signal.SIGINT, stop)
+    signal.signal(signal.SIGTERM, stop)
+
+    host, bound_port = daemon.address
+    if not _quiet_mode:
+        console.print(
+            f"[green]Checkpoint daemon listening on {host}:{bound_port}[/green] "
+            f"[dim](Ctrl+C to stop)[/dim]"
+        )
+    try:
+        daemon.serve_forever()
+    finally:
+        if not _quiet_mode:
+            console.print("[yellow]Checkpoint daemon stopped[/yellow]")
+
+
 def main() -> None:
     """Entry point for the CLI application.
 
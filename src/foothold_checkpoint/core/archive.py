@@ -0,0 +1,197 @@
+"""Open-once checkpoint archive reader.
+
+A restore used to open the same checkpoint ZIP several times: to validate it,
+to read the campaign name for hooks, for the pre-restore auto-backup, for the
+overwrite check and for the extraction itself, each time parsing the central
+directory and ``metadata.json`` again. CheckpointArchive parses both once and
+is accepted by the storage functions in place of a path, so an operation
+opens the file exactly once.
+
+The archive is opened lazily on first access, so creating a CheckpointArchive
+costs nothing until it is actually read.
+
+Example:
+    >>> with CheckpointArchive(Path("checkpoints/syria_2024-02-14_10-30-00.zip")) as archive:
+    ...     conflicts = check_restore_conflicts(archive, target_dir)
+    ...     restored = await restore_checkpoint(archive, target_dir, config=config)
+"""
+
+import json
+import threading
+import zipfile
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from typing import IO, Any, cast
+
+from .blobstore import BlobStore
+from .checkpoint import checkpoint_members
+
+
+class CheckpointArchive:
+    """Checkpoint ZIP with its central directory and metadata parsed once.
+
+    Deduplicated checkpoints (storage_backend "dedup") are transparently read
+    from the blob store of the archive's directory.
+
+    Attributes:
+        path: Path of the checkpoint ZIP file
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        """Initialize the archive without opening it.
+
+        Args:
+            path: Path of the checkpoint ZIP file.
+        """
+        self.path = Path(path)
+        self._zf: zipfile.ZipFile | None = None
+        self._metadata: dict[str, Any] | None = None
+        self._lock = threading.Lock()
+
+    def __enter__(self) -> "CheckpointArchive":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close the underlying ZIP file (the archive can be reopened later)."""
+        with self._lock:
+            if self._zf is not None:
+                self._zf.close()
+                self._zf = None
+
+    @property
+    def zip_file(self) -> zipfile.ZipFile:
+        """Underlying ZIP file, opened on first access.
+
+        Raises:
+            FileNotFoundError: If the checkpoint file does not exist.
+            ValueError: If the file is not a valid ZIP archive.
+        """
+        with self._lock:
+            if self._zf is None:
+                if not self.path.exists():
+                    raise FileNotFoundError("Checkpoint file not found")
+                try:
+                    self._zf = zipfile.ZipFile(self.path, "r")
+                except zipfile.BadZipFile as e:
+                    raise ValueError("Invalid checkpoint file (not a valid ZIP archive)") from e
+            return self._zf
+
+    def validate(self) -> None:
+        """Open the archive now, so a missing or invalid file fails early.
+
+        Raises:
+            FileNotFoundError: If the checkpoint file does not exist.
+            ValueError: If the file is not a valid ZIP archive.
+        """
+        self.zip_file  # noqa: B018 - opening is the point
+
+    @property
+    def names(self) -> list[str]:
+        """Names of all ZIP members, including metadata.json."""
+        return self.zip_file.namelist()
+
+    @property
+    def has_metadata(self) -> bool:
+        """Whether the archive contains metadata.json."""
+        return "metadata.json" in self.zip_file.NameToInfo
+
+    @property
+    def metadata(self) -> dict[str, Any]:
+        """Parsed metadata.json, read once.
+
+        Raises:
+            ValueError: If metadata.json is missing or is not valid JSON.
+        """
+        if self._metadata is None:
+            if not self.has_metadata:
+                raise ValueError("Invalid checkpoint (missing metadata)")
+            try:
+                self._metadata = json.loads(self.zip_file.read("metadata.json").decode("utf-8"))
+            except json.JSONDecodeError as e:
+                raise ValueError(f"Invalid metadata JSON: {e}") from e
+        return self._metadata
+
+    @property
+    def campaign_name(self) -> str | None:
+        """Campaign name from the metadata, or None for archives without metadata."""
+        return self.metadata.get("campaign_name") if self.has_metadata else None
+
+    @property
+    def is_dedup(self) -> bool:
+        """Whether file contents live in the blob store."""
+        return self.has_metadata and self.metadata.get("storage_backend") == "dedup"
+
+    @property
+    def members(self) -> list[str]:
+        """Campaign files contained in the checkpoint (see checkpoint_members)."""
+        return checkpoint_members(self.names, self.metadata if self.has_metadata else None)
+
+    @property
+    def checksums(self) -> dict[str, str]:
+        """Checksum of each campaign file recorded in the metadata."""
+        return dict(self.metadata.get("files", {})) if self.has_metadata else {}
+
+    @property
+    def sizes(self) -> dict[str, int]:
+        """Uncompressed size of each file stored in the ZIP (empty for dedup manifests)."""
+        return {
+            info.filename: info.file_size
+            for info in self.zip_file.infolist()
+            if info.filename != "metadata.json" and not info.is_dir()
+        }
+
+    def open(self, member: str, mode: str = "r", private: bool = False) -> IO[bytes]:
+        """Open a campaign file for streaming its content.
+
+        Members opened from the shared ZIP handle share its file position lock,
+        and ZipFile's handle reference counting is not thread-safe. Workers
+        reading members concurrently should therefore use ``private=True``,
+        which reads the member through its own file handle.
+
+        Args:
+            member: Name of the campaign file.
+            mode: Only "r" is supported.
+            private: Whether to read through a dedicated file handle.
+
+        Returns:
+            Binary file object yielding the uncompressed content.
+
+        Raises:
+            KeyError: If the member is not in a classic checkpoint.
+            FileNotFoundError: If the blob of a deduplicated checkpoint is missing.
+        """
+        if mode != "r":
+            raise ValueError(f"Unsupported mode: {mode}")
+        if self.is_dedup:
+            blob = BlobStore(self.path.parent).open(self.checksums.get(member, ""))
+            return cast(IO[bytes], blob)
+        if private:
+            self.validate()
+            # The member keeps the file open after the ZipFile itself is closed
+            with zipfile.ZipFile(self.path, "r") as zf:
+                return zf.open(member, "r")
+        return self.zip_file.open(member, "r")
+
+
+@contextmanager
+def open_archive(source: "str | Path | CheckpointArchive") -> Iterator[CheckpointArchive]:
+    """Use an existing CheckpointArchive, or open (and close) one for a path.
+
+    Lets storage functions accept either a path or an archive shared by the
+    caller; an archive passed in is left open for the caller to reuse.
+
+    Args:
+        source: Checkpoint path or already created archive.
+
+    Yields:
+        CheckpointArchive for the checkpoint.
+    """
+    if isinstance(source, CheckpointArchive):
+        yield source
+        return
+    with CheckpointArchive(source) as archive:
+        yield archive
@@ -0,0 +1,195 @@
+"""Content-addressed blob store for deduplicated checkpoints.
+
+With the ``dedup`` storage backend, campaign files are stored once under
+``checkpoints_dir/.blobs/`` keyed by their SHA-256 checksum, and each checkpoint
+ZIP only contains its ``metadata.json`` manifest. Consecutive checkpoints that
+share identical files (ranks, CTLD FARPs, storage CSVs) therefore share storage.
+
+Blobs are gzip-compressed and written atomically (temporary file + rename), so
+a crash never leaves a truncated blob under its final name. The checksum in the
+blob name is the checksum of the *uncompressed* content, i.e. the same value
+recorded in ``CheckpointMetadata.files``.
+
+Example:
+    >>> store = BlobStore(Path("C:/checkpoints"))
+    >>> checksum = store.put_file(Path("Foothold_Ranks.lua"))
+    >>> with store.open(checksum) as f:
+    ...     data = f.read()
+"""
+
+import gzip
+import hashlib
+import logging
+import os
+import stat
+import tempfile
+import time
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+# Directory (relative to checkpoints_dir) holding the blobs
+BLOBS_DIRNAME = ".blobs"
+
+# Chunk size used when streaming files into the store
+_CHUNK_SIZE = 1024 * 1024
+
+# Blobs written or reused more recently than this are never garbage collected,
+# so a save running concurrently with a delete cannot lose its blobs
+GC_GRACE_SECONDS = 600
+
+
+def _strip_prefix(checksum: str) -> str:
+    """Return the hex digest of a checksum, with or without the sha256: prefix."""
+    return checksum[7:] if checksum.startswith("sha256:") else checksum
+
+
+class BlobStore:
+    """Deduplicating file store keyed by SHA-256 checksum.
+
+    Attributes:
+        root: Directory containing the blobs (``checkpoints_dir/.blobs``)
+    """
+
+    def __init__(self, checkpoints_dir: str | Path) -> None:
+        """Initialize the blob store of a checkpoints directory.
+
+        Args:
+            checkpoints_dir: Directory containing the checkpoints.
+        """
+        self.root = Path(checkpoints_dir) / BLOBS_DIRNAME
+
+    def blob_path(self, checksum: str) -> Path:
+        """Return the path of the blob for a checksum.
+
+        Args:
+            checksum: Checksum in the format "sha256:hexdigest" (prefix optional).
+
+        Returns:
+            Path of the blob file (which may not exist).
+        """
+        digest = _strip_prefix(checksum)
+        return self.root / digest[:2] / digest
+
+    def has(self, checksum: str) -> bool:
+        """Check whether a blob is present in the store."""
+        return self.blob_path(checksum).is_file()
+
+    def put_file(self, file_path: Path, compresslevel: int = 6) -> str:
+        """Store a file and return its checksum.
+
+        The file is read once: it is hashed and compressed in the same pass. If a
+        blob with the same checksum already exists, the new copy is discarded.
+
+        Args:
+            file_path: Path to the file to store.
+            compresslevel: gzip compression level (0-9).
+
+        Returns:
+            Checksum of the file content in the format "sha256:hexdigest".
+
+        Raises:
+            FileNotFoundError: If the file does not exist.
+            OSError: If the blob cannot be written (e.g., disk full).
+        """
+        self.root.mkdir(parents=True, exist_ok=True)
+        fd, temp_name = tempfile.mkstemp(prefix=".blob-", suffix=".tmp", dir=self.root)
+        temp_path = Path(temp_name)
+        sha256_hash = hashlib.sha256()
+
+        try:
+            with (
+                os.fdopen(fd, "wb") as raw,
+                gzip.GzipFile(
+                    filename="", fileobj=raw, mode="wb", compresslevel=compresslevel, mtime=0
+                ) as out,
+                open(file_path, "rb") as src,
+            ):
+                while chunk := src.read(_CHUNK_SIZE):
+                    sha256_hash.update(chunk)
+                    out.write(chunk)
+
+            checksum = f"sha256:{sha256_hash.hexdigest()}"
+            blob_path = self.blob_path(checksum)
+            if blob_path.is_file():
+                temp_path.unlink()
+                # Refresh mtime so garbage collection keeps the reused blob
+                os.utime(blob_path)
+            else:
+                blob_path.parent.mkdir(exist_ok=True)
+                os.replace(temp_path, blob_path)
+        except BaseException:
+            temp_path.unlink(missing_ok=True)
+            raise
+
+        return checksum
+
+    def open(self, checksum: str, mode: str = "r") -> gzip.GzipFile:
+        """Open a blob for reading its uncompressed content.
+
+        The signature mirrors ``zipfile.ZipFile.open`` so restore code can read
+        members from a ZIP archive or from the blob store interchangeably.
+
+        Args:
+            checksum: Checksum of the blob ("sha256:" prefix optional).
+            mode: Only "r" is supported.
+
+        Returns:
+            Binary file object yielding the uncompressed content.
+
+        Raises:
+            FileNotFoundError: If the blob is missing from the store.
+        """
+        if mode != "r":
+            raise ValueError(f"Unsupported mode: {mode}")
+        return gzip.GzipFile(self.blob_path(checksum), "rb")
+
+    def collect_garbage(self, referenced: set[str], grace_seconds: float | None = None) -> int:
+        """Delete blobs that are not referenced by any checkpoint.
+
+        Args:
+            referenced: Checksums still referenced by checkpoint manifests
+                ("sha256:" prefix optional).
+            grace_seconds: Blobs written or reused within this delay are kept,
+                as they may belong to a checkpoint being created. Defaults to
+                GC_GRACE_SECONDS.
+
+        Returns:
+            Number of blobs deleted.
+        """
+        return self.sweep(referenced, grace_seconds)[0]
+
+    def sweep(self, referenced: set[str], grace_seconds: float | None = None) -> tuple[int, int]:
+        """Delete unreferenced blobs like collect_garbage, also reporting their size.
+
+        Args:
+            referenced: Checksums still referenced by checkpoint manifests.
+            grace_seconds: See collect_garbage.
+
+        Returns:
+            tuple: Number of blobs deleted and their total size in bytes.
+        """
+        if not self.root.is_dir():
+            return 0, 0
+
+        keep = {_strip_prefix(checksum) for checksum in referenced}
+        if grace_seconds is None:
+            grace_seconds = GC_GRACE_SECONDS
+        cutoff = time.time() - grace_seconds
+        removed = 0
+        freed = 0
+        for blob_path in self.root.glob("*/*"):
+            if blob_path.name in keep:
+                continue
+            try:
+                stat_result = blob_path.stat()
+                if not stat.S_ISREG(stat_result.st_mode) or stat_result.st_mtime > cutoff:
+                    continue
+                blob_path.unlink()
+                removed += 1
+                freed += stat_result.st_size
+            except FileNotFoundError:
+                continue
+            except OSError as e:
+                logger.warning(f"Cannot remove unreferenced blob {blob_path.name}: {e}")
+        return removed, freed
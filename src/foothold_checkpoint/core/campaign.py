@@ -2,13 +2,14 @@
 
 import re
 from collections import defaultdict
-from collections.abc import Sequence
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass
 from pathlib import Path
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     # Use relative import for DCSSB compatibility
-    from .config import Config
+    from .config import CampaignConfig, Config
 
 
 # Pattern to detect foothold-like files (used for unknown file detection)
@@ -18,6 +19,12 @@ _FOOTHOLD_LIKE_PATTERN = re.compile(
     re.IGNORECASE,
 )
 
+# File types of a campaign, in configuration order
+CAMPAIGN_FILE_TYPES = ("persistence", "ctld_save", "ctld_farps", "storage")
+
+# Known non-campaign files that are never reported as unknown (lowercase)
+_KNOWN_NON_CAMPAIGN_FILES = frozenset({"foothold_ranks.lua", "foothold.status"})
+
 
 def is_shared_file(filename: str | Path) -> bool:
     """Check if a filename is the shared Foothold_Ranks.lua file.
@@ -47,6 +54,156 @@ def is_shared_file(filename: str | Path) -> bool:
     return filename_str.lower() == "foothold_ranks.lua"
 
 
+@dataclass(frozen=True)
+class CampaignFile:
+    """Configured campaign file, as found in a CampaignIndex.
+
+    Attributes:
+        campaign: Campaign ID the file belongs to
+        file_type: File type ("persistence", "ctld_save", "ctld_farps" or "storage")
+        canonical_name: Current name of the file (first name listed for its type)
+    """
+
+    campaign: str
+    file_type: str
+    canonical_name: str
+
+
+class CampaignIndex:
+    """Immutable lookup tables compiled from campaign definitions.
+
+    Detection, unknown-file checks, canonical-name lookups during restore and
+    import validation all need to know which campaign and file type a file
+    name belongs to. The index answers these in O(1), case-insensitively, and
+    is built once per Config (see Config.campaign_index) instead of walking
+    the campaign file lists on every call.
+
+    Attributes:
+        campaigns: Campaign definitions the index was built from
+        file_to_campaign: Configured file names mapped to their campaign ID
+
+    Example:
+        >>> index = config.campaign_index
+        >>> index.lookup("FOOTHOLD_SYRIA_OLD.lua")
+        CampaignFile(campaign='syria', file_type='persistence', canonical_name='foothold_syria.lua')
+    """
+
+    __slots__ = ("campaigns", "file_to_campaign", "_files", "_campaign_files", "_required")
+
+    def __init__(self, campaigns: "Mapping[str, CampaignConfig] | None") -> None:
+        """Compile the lookup tables.
+
+        Args:
+            campaigns: Campaign definitions by campaign ID (None for none).
+        """
+        self.campaigns = campaigns
+        file_to_campaign: dict[str, str] = {}
+        files: dict[str, CampaignFile] = {}
+        campaign_files: dict[str, dict[str, CampaignFile]] = {}
+        required: dict[str, dict[str, tuple[CampaignFile, frozenset[str]]]] = {}
+
+        for campaign_id, campaign_config in (campaigns or {}).items():
+            by_name = campaign_files.setdefault(campaign_id, {})
+            required_types = required.setdefault(campaign_id, {})
+            for file_type_name in CAMPAIGN_FILE_TYPES:
+                file_type = getattr(campaign_config.files, file_type_name)
+                if not file_type.files:
+                    continue
+                canonical = CampaignFile(campaign_id, file_type_name, str(file_type.files[0]))
+                for filename in file_type.files:
+                    file_to_campaign[filename] = campaign_id
+                    files[filename.lower()] = canonical
+                    by_name.setdefault(filename.lower(), canonical)
+                if not file_type.optional:
+                    accepted = frozenset(f.lower() for f in file_type.files)
+                    required_types[file_type_name] = (canonical, accepted)
+
+        self.file_to_campaign: Mapping[str, str] = file_to_campaign
+        self._files = files
+        self._campaign_files = campaign_files
+        self._required = required
+
+    def lookup(self, filename: str | Path) -> CampaignFile | None:
+        """Find the configured campaign file matching a file name (case-insensitive).
+
+        Args:
+            filename: File name (or path) to look up.
+
+        Returns:
+            The matching CampaignFile, or None if the name is not configured.
+        """
+        return self._files.get(_basename(filename).lower())
+
+    def canonical_name(self, filename: str, campaign: str) -> str:
+        """Return the current name of a campaign file that may have been renamed.
+
+        Args:
+            filename: File name, possibly an older accepted name.
+            campaign: Campaign ID the file belongs to.
+
+        Returns:
+            The first configured name of the file's type, or ``filename``
+            itself if it is not configured for that campaign.
+        """
+        match = self._campaign_files.get(campaign, {}).get(filename.lower())
+        return match.canonical_name if match else filename
+
+    def required_types(self, campaign: str) -> Mapping[str, frozenset[str]]:
+        """Return the required (non-optional) file types of a campaign.
+
+        Args:
+            campaign: Campaign ID.
+
+        Returns:
+            Mapping of file type to its accepted file names (lowercase);
+            empty for unknown campaigns.
+        """
+        return {
+            file_type: accepted
+            for file_type, (_, accepted) in self._required.get(campaign, {}).items()
+        }
+
+    def missing_required_types(self, campaign: str, filenames: Sequence[str]) -> list[CampaignFile]:
+        """List the required file types of a campaign with no file among ``filenames``.
+
+        Args:
+            campaign: Campaign ID.
+            filenames: File names present (matched case-insensitively).
+
+        Returns:
+            The canonical file of each missing type, in configuration order.
+        """
+        present = {name.lower() for name in filenames}
+        return [
+            canonical
+            for canonical, accepted in self._required.get(campaign, {}).values()
+            if accepted.isdisjoint(present)
+        ]
+
+    def is_known(self, filename: str | Path) -> bool:
+        """Whether a file name is a configured campaign file or a known shared file."""
+        name = _basename(filename).lower()
+        return name in self._files or name in _KNOWN_NON_CAMPAIGN_FILES
+
+    @staticmethod
+    def is_foothold_like(filename: str | Path) -> bool:
+        """Whether a file name looks like a Foothold file (starts with "foothold")."""
+        return _FOOTHOLD_LIKE_PATTERN.match(_basename(filename)) is not None
+
+    def is_unknown(self, filename: str | Path) -> bool:
+        """Whether a file looks like a Foothold file but is not configured.
+
+        Hidden files are never reported as unknown.
+        """
+        name = _basename(filename)
+        return not name.startswith(".") and self.is_foothold_like(name) and not self.is_known(name)
+
+
+def _basename(filename: str | Path) -> str:
+    """Return the file name part of a name or path."""
+    return filename.name if isinstance(filename, Path) else Path(filename).name
+
+
 def build_file_to_campaign_map(config: "Config") -> dict[str, str]:
     """Build a reverse lookup map from file names to campaign IDs.
 
@@ -68,20 +225,7 @@ def build_file_to_campaign_map(config: "Config") -> dict[str, str]:
         >>> file_map["FootHold_CA_v0.2.lua"]
         'ca'
     """
-    file_to_campaign: dict[str, str] = {}
-
-    if config.campaigns is None:
-        return file_to_campaign
-
-    for campaign_id, campaign_config in config.campaigns.items():
-        # Iterate through all file types in the campaign
-        for file_type_name in ["persistence", "ctld_save", "ctld_farps", "storage"]:
-            file_type = getattr(campaign_config.files, file_type_name)
-            # Add all files from this type to the map
-            for filename in file_type.files:
-                file_to_campaign[filename] = campaign_id
-
-    return file_to_campaign
+    return dict(config.campaign_index.file_to_campaign)
 
 
 def group_campaign_files(filenames: Sequence[str | Path], config: "Config") -> dict[str, list[str]]:
@@ -89,6 +233,7 @@ def group_campaign_files(filenames: Sequence[str | Path], config: "Config") -> d
 
     Takes a list of filenames and groups them by campaign based on explicit
     file lists in the configuration. Files not in configuration are ignored.
+    File names are matched case-insensitively and returned as given.
 
     Args:
         filenames: List of filenames (strings or Path objects) to group.
@@ -111,8 +256,7 @@ def group_campaign_files(filenames: Sequence[str | Path], config: "Config") -> d
             'ca': ['FootHold_CA_v0.2.lua']
         }
     """
-    # Build reverse lookup map
-    file_to_campaign = build_file_to_campaign_map(config)
+    index = config.campaign_index
 
     # Group files by campaign
     groups: dict[str, list[str]] = defaultdict(list)
@@ -123,12 +267,12 @@ def group_campaign_files(filenames: Sequence[str | Path], config: "Config") -> d
             continue
 
         # Extract just the filename (not full path)
-        filename_str = filename.name if isinstance(filename, Path) else Path(filename).name
+        filename_str = _basename(filename)
 
         # Look up which campaign this file belongs to
-        if filename_str in file_to_campaign:
-            campaign_id = file_to_campaign[filename_str]
-            groups[campaign_id].append(filename_str)
+        match = index.lookup(filename_str)
+        if match is not None:
+            groups[match.campaign].append(filename_str)
 
     # Convert defaultdict back to regular dict
     return dict(groups)
@@ -158,31 +302,8 @@ def detect_unknown_files(filenames: Sequence[str | Path], config: "Config") -> l
         ... ], config)
         ['foothold_newmap.lua']
     """
-    # Build set of all known file names
-    file_to_campaign = build_file_to_campaign_map(config)
-    known_files = set(file_to_campaign.keys())
-
-    # Also include shared files as known
-    known_files.add("Foothold_Ranks.lua")
-    known_files.add("foothold_ranks.lua")  # case variation
-    # Add foothold.status as known non-campaign file
-    known_files.add("foothold.status")
-
-    unknown: list[str] = []
-
-    for filename in filenames:
-        # Extract just the filename (not full path)
-        filename_str = filename.name if isinstance(filename, Path) else Path(filename).name
-
-        # Skip hidden files
-        if filename_str.startswith("."):
-            continue
-
-        # Check if it looks like a foothold file but isn't configured
-        if _FOOTHOLD_LIKE_PATTERN.match(filename_str) and filename_str not in known_files:
-            unknown.append(filename_str)
-
-    return unknown
+    index = config.campaign_index
+    return [_basename(filename) for filename in filenames if index.is_unknown(filename)]
 
 
 def detect_campaigns(filenames: Sequence[str | Path], config: "Config") -> dict[str, list[str]]:
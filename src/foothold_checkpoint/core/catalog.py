@@ -0,0 +1,400 @@
+"""Persistent checkpoint catalog index.
+
+This module maintains a sidecar index of the checkpoints stored in a checkpoints
+directory so that listing operations do not have to open every ZIP archive.
+
+The catalog is an append-only JSON-lines file (``.foothold-catalog.jsonl``) stored
+next to the checkpoints. Each record is keyed by the checkpoint filename and
+remembers the archive size and modification time it was built from. On every
+refresh the directory is scanned with ``stat()`` only; an archive is opened again
+only when it is new or its size/mtime changed since it was indexed.
+
+The catalog is a cache: it is always revalidated against the file system, so a
+missing, stale or corrupted catalog file only costs a rescan, never wrong results.
+
+Example:
+    >>> catalog = get_catalog(Path("C:/checkpoints"))
+    >>> for entry in catalog.refresh():
+    ...     if entry.metadata is not None:
+    ...         print(entry.filename, entry.metadata["campaign_name"])
+"""
+
+import json
+import logging
+import os
+import threading
+import zipfile
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+# Name of the sidecar index file stored in the checkpoints directory
+CATALOG_FILENAME = ".foothold-catalog.jsonl"
+
+# Bump when the record layout changes; older catalogs are discarded and rebuilt
+CATALOG_VERSION = 1
+
+# Rewrite the catalog when it holds more superseded lines than this (and more
+# superseded lines than live entries)
+_COMPACT_THRESHOLD = 64
+
+
+@dataclass
+class CatalogEntry:
+    """Cached information about one checkpoint archive.
+
+    Attributes:
+        filename: Checkpoint filename (relative to the checkpoints directory)
+        size: Archive size in bytes when it was indexed
+        mtime_ns: Archive modification time (nanoseconds) when it was indexed
+        metadata: Parsed metadata.json content, or None if the archive is not a
+            valid checkpoint (corrupted ZIP, missing or invalid metadata)
+        members: Names of the campaign files stored in the archive
+    """
+
+    filename: str
+    size: int
+    mtime_ns: int
+    metadata: dict[str, Any] | None
+    members: list[str] = field(default_factory=list)
+
+    def matches(self, stat_result: os.stat_result) -> bool:
+        """Check whether this entry is still valid for the given stat result."""
+        return self.size == stat_result.st_size and self.mtime_ns == stat_result.st_mtime_ns
+
+    def to_record(self) -> dict[str, Any]:
+        """Serialize the entry to a catalog record."""
+        return {
+            "filename": self.filename,
+            "size": self.size,
+            "mtime_ns": self.mtime_ns,
+            "metadata": self.metadata,
+            "members": self.members,
+        }
+
+
+def read_checkpoint_entry(checkpoint_path: Path, stat_result: os.stat_result) -> CatalogEntry:
+    """Open a checkpoint archive and build its catalog entry.
+
+    This is the slow path of the catalog. The metadata copy in the archive
+    comment is read first (see read_metadata_comment); archives without it
+    have their ZIP central directory parsed and metadata.json read. Invalid
+    checkpoints produce an entry with ``metadata=None`` so they are not
+    reopened until they change on disk.
+
+    Args:
+        checkpoint_path: Path to the checkpoint ZIP file.
+        stat_result: Stat result of the archive, used as the cache key.
+
+    Returns:
+        CatalogEntry for the archive.
+    """
+    from .checkpoint import checkpoint_members, read_metadata_comment
+
+    metadata: dict[str, Any] | None = None
+    members: list[str] = []
+
+    # Fast path: metadata mirrored in the archive comment (a few KB read from
+    # the end of the file); its files are exactly the campaign files
+    try:
+        metadata = read_metadata_comment(checkpoint_path)
+    except OSError:
+        metadata = None
+    if metadata is not None:
+        return CatalogEntry(
+            filename=checkpoint_path.name,
+            size=stat_result.st_size,
+            mtime_ns=stat_result.st_mtime_ns,
+            metadata=metadata,
+            members=list(metadata.get("files", {})),
+        )
+
+    try:
+        with zipfile.ZipFile(checkpoint_path, "r") as zf:
+            names = zf.namelist()
+            if "metadata.json" in names:
+                loaded = json.loads(zf.read("metadata.json").decode("utf-8"))
+                if isinstance(loaded, dict):
+                    metadata = loaded
+                    members = checkpoint_members(names, metadata)
+    except (zipfile.BadZipFile, json.JSONDecodeError, UnicodeDecodeError, KeyError, OSError):
+        metadata = None
+
+    return CatalogEntry(
+        filename=checkpoint_path.name,
+        size=stat_result.st_size,
+        mtime_ns=stat_result.st_mtime_ns,
+        metadata=metadata,
+        members=members,
+    )
+
+
+class CheckpointCatalog:
+    """Incrementally revalidated index of the checkpoints in a directory.
+
+    Use :func:`get_catalog` to obtain a shared instance per directory so that
+    long-running processes (such as the DCSServerBot plugin) keep the index in
+    memory between calls.
+
+    Attributes:
+        checkpoints_dir: Directory containing the checkpoint ZIP files
+        catalog_path: Path of the sidecar JSON-lines file
+    """
+
+    def __init__(self, checkpoints_dir: str | Path) -> None:
+        """Initialize the catalog for a checkpoints directory.
+
+        Args:
+            checkpoints_dir: Directory containing the checkpoint ZIP files.
+        """
+        self.checkpoints_dir = Path(checkpoints_dir)
+        self.catalog_path = self.checkpoints_dir / CATALOG_FILENAME
+        self._entries: dict[str, CatalogEntry] = {}
+        self._line_count = 0
+        self._file_signature: tuple[int, int] | None = None
+        self._lock = threading.RLock()
+
+    def refresh(self) -> list[CatalogEntry]:
+        """Revalidate the catalog against the checkpoints directory.
+
+        Scans the directory with ``stat()`` only. Archives that are new or whose
+        size/mtime changed are opened and re-indexed; entries for archives that
+        no longer exist are dropped.
+
+        Returns:
+            List of catalog entries for all ``*.zip`` files in the directory,
+            including invalid checkpoints (``metadata is None``).
+
+        Raises:
+            FileNotFoundError: If the checkpoints directory does not exist.
+        """
+        with self._lock:
+            self._load_if_changed()
+
+            seen: set[str] = set()
+            updated: list[CatalogEntry] = []
+
+            with os.scandir(self.checkpoints_dir) as it:
+                for dir_entry in it:
+                    if not dir_entry.name.endswith(".zip"):
+                        continue
+                    try:
+                        if not dir_entry.is_file():
+                            continue
+                        stat_result = dir_entry.stat()
+                    except OSError:
+                        continue
+
+                    seen.add(dir_entry.name)
+                    cached = self._entries.get(dir_entry.name)
+                    if cached is not None and cached.matches(stat_result):
+                        continue
+
+                    entry = read_checkpoint_entry(Path(dir_entry.path), stat_result)
+                    self._entries[entry.filename] = entry
+                    updated.append(entry)
+
+            removed = [name for name in self._entries if name not in seen]
+            for name in removed:
+                del self._entries[name]
+
+            if updated or removed:
+                self._append(
+                    [entry.to_record() for entry in updated]
+                    + [{"filename": name, "deleted": True} for name in removed]
+                )
+            self._compact_if_needed()
+
+            return list(self._entries.values())
+
+    def get(self, filename: str) -> CatalogEntry | None:
+        """Return the cached entry for a checkpoint filename, if any.
+
+        The entry is not revalidated; call :meth:`refresh` first when freshness
+        matters.
+        """
+        with self._lock:
+            return self._entries.get(filename)
+
+    def record(
+        self,
+        checkpoint_path: str | Path,
+        metadata: dict[str, Any] | None = None,
+        members: list[str] | None = None,
+    ) -> CatalogEntry | None:
+        """Add or update the entry for a checkpoint that was just written.
+
+        When metadata and members are provided (e.g. by create_checkpoint), the
+        archive is not reopened; only its stat data is read.
+
+        Args:
+            checkpoint_path: Path to the checkpoint ZIP file.
+            metadata: Metadata dict written to the archive, if already known.
+            members: Campaign file names stored in the archive, if already known.
+
+        Returns:
+            The recorded entry, or None if the archive could not be stat'ed.
+        """
+        checkpoint_path = Path(checkpoint_path)
+        try:
+            stat_result = checkpoint_path.stat()
+        except OSError:
+            return None
+
+        if metadata is None:
+            entry = read_checkpoint_entry(checkpoint_path, stat_result)
+        else:
+            entry = CatalogEntry(
+                filename=checkpoint_path.name,
+                size=stat_result.st_size,
+                mtime_ns=stat_result.st_mtime_ns,
+                metadata=metadata,
+                members=list(members or []),
+            )
+
+        with self._lock:
+            self._load_if_changed()
+            self._entries[entry.filename] = entry
+            self._append([entry.to_record()])
+        return entry
+
+    def forget(self, filename: str) -> None:
+        """Remove the entry for a deleted checkpoint.
+
+        Args:
+            filename: Checkpoint filename (relative to the checkpoints directory).
+        """
+        with self._lock:
+            self._load_if_changed()
+            if self._entries.pop(filename, None) is not None:
+                self._append([{"filename": filename, "deleted": True}])
+
+    def _stat_catalog(self) -> tuple[int, int] | None:
+        """Return (size, mtime_ns) of the catalog file, or None if missing."""
+        try:
+            stat_result = self.catalog_path.stat()
+        except OSError:
+            return None
+        return (stat_result.st_size, stat_result.st_mtime_ns)
+
+    def _load_if_changed(self) -> None:
+        """Reload the catalog file if another process modified it."""
+        signature = self._stat_catalog()
+        if signature is not None and signature == self._file_signature:
+            return
+
+        self._entries = {}
+        self._line_count = 0
+        self._file_signature = signature
+        if signature is None:
+            return
+
+        try:
+            with open(self.catalog_path, encoding="utf-8") as f:
+                lines = f.readlines()
+        except OSError as e:
+            logger.debug(f"Cannot read checkpoint catalog {self.catalog_path}: {e}")
+            return
+
+        if not lines or _parse_header(lines[0]) != CATALOG_VERSION:
+            # Unknown layout - ignore it, it is rewritten on next compaction
+            self._line_count = len(lines) + _COMPACT_THRESHOLD
+            return
+
+        for line in lines[1:]:
+            try:
+                record = json.loads(line)
+                filename = record["filename"]
+                if record.get("deleted"):
+                    self._entries.pop(filename, None)
+                else:
+                    self._entries[filename] = CatalogEntry(
+                        filename=filename,
+                        size=int(record["size"]),
+                        mtime_ns=int(record["mtime_ns"]),
+                        metadata=record.get("metadata"),
+                        members=list(record.get("members") or []),
+                    )
+            except (json.JSONDecodeError, KeyError, TypeError, ValueError):
+                # Partially written or corrupted line - the archive is rescanned
+                continue
+        self._line_count = len(lines) - 1
+
+    def _append(self, records: list[dict[str, Any]]) -> None:
+        """Append records to the catalog file (best effort)."""
+        if not records:
+            return
+        try:
+            new_file = self._stat_catalog() is None
+            with open(self.catalog_path, "a", encoding="utf-8") as f:
+                if new_file:
+                    f.write(json.dumps({"catalog_version": CATALOG_VERSION}) + "\n")
+                f.write("".join(_dump_record(record) for record in records))
+        except OSError as e:
+            logger.debug(f"Cannot update checkpoint catalog {self.catalog_path}: {e}")
+            return
+        self._line_count += len(records)
+        self._file_signature = self._stat_catalog()
+
+    def _compact_if_needed(self) -> None:
+        """Rewrite the catalog without superseded lines when it grew too large."""
+        stale_lines = self._line_count - len(self._entries)
+        if stale_lines <= _COMPACT_THRESHOLD or stale_lines <= len(self._entries):
+            return
+
+        tmp_path = self.catalog_path.with_name(f"{CATALOG_FILENAME}.{os.getpid()}.tmp")
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                f.write(json.dumps({"catalog_version": CATALOG_VERSION}) + "\n")
+                f.write("".join(_dump_record(e.to_record()) for e in self._entries.values()))
+            os.replace(tmp_path, self.catalog_path)
+        except OSError as e:
+            logger.debug(f"Cannot compact checkpoint catalog {self.catalog_path}: {e}")
+            tmp_path.unlink(missing_ok=True)
+            return
+        self._line_count = len(self._entries)
+        self._file_signature = self._stat_catalog()
+
+
+def _dump_record(record: dict[str, Any]) -> str:
+    """Serialize a catalog record to a single JSON line."""
+    return json.dumps(record, ensure_ascii=False, separators=(",", ":")) + "\n"
+
+
+def _parse_header(line: str) -> int | None:
+    """Return the catalog version from the header line, or None if invalid."""
+    try:
+        header = json.loads(line)
+    except json.JSONDecodeError:
+        return None
+    if not isinstance(header, dict):
+        return None
+    version = header.get("catalog_version")
+    return version if isinstance(version, int) else None
+
+
+_catalogs: dict[Path, CheckpointCatalog] = {}
+_catalogs_lock = threading.Lock()
+
+
+def get_catalog(checkpoints_dir: str | Path) -> CheckpointCatalog:
+    """Return the shared catalog instance for a checkpoints directory.
+
+    Instances are cached per resolved directory so the index stays in memory
+    for the lifetime of the process.
+
+    Args:
+        checkpoints_dir: Directory containing the checkpoint ZIP files.
+
+    Returns:
+        CheckpointCatalog for the directory.
+    """
+    key = Path(checkpoints_dir).resolve()
+    with _catalogs_lock:
+        catalog = _catalogs.get(key)
+        if catalog is None:
+            catalog = CheckpointCatalog(key)
+            _catalogs[key] = catalog
+        return catalog
@@ -2,14 +2,45 @@
 
 import hashlib
 import json
+import os
+import sys
+import time
 import zipfile
 from collections.abc import Callable, Sequence
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import cast
+from typing import TYPE_CHECKING, Any, Literal, cast
 
 from pydantic import BaseModel, Field, field_validator
 
+from .blobstore import BlobStore
+from .catalog import get_catalog
+
+if TYPE_CHECKING:
+    from .config import CompressionConfig
+    from .hashcache import HashCache
+
+# Read size used when hashing files
+_HASH_CHUNK_SIZE = 1024 * 1024
+
+# Prefix of the compact metadata copy stored in the ZIP archive comment
+METADATA_COMMENT_PREFIX = b"foothold-checkpoint-metadata:"
+
+# Size of the end of central directory record without its comment
+_EOCD_SIZE = 22
+_EOCD_SIGNATURE = b"PK\x05\x06"
+
+# Bytes read from the end of an archive to find a metadata comment in one read
+_COMMENT_READ_SIZE = 4096
+
+# ZIP compression method for each CompressionConfig method
+_ZIP_COMPRESSION = {
+    "stored": zipfile.ZIP_STORED,
+    "deflated": zipfile.ZIP_DEFLATED,
+    "bzip2": zipfile.ZIP_BZIP2,
+    "lzma": zipfile.ZIP_LZMA,
+}
+
 
 class CheckpointMetadata(BaseModel):
     """Metadata for a Foothold campaign checkpoint.
@@ -24,6 +55,11 @@ class CheckpointMetadata(BaseModel):
         files: Dictionary mapping filenames to their SHA-256 checksums
         name: Optional user-provided name for the checkpoint
         comment: Optional user-provided comment/description
+        is_auto_backup: Whether this checkpoint is an automatic pre-restore backup
+        storage_backend: "zip" if file contents are stored in the checkpoint ZIP,
+            "dedup" if the ZIP is a manifest and contents live in the blob store
+        compression: ZIP compression method used for the checkpoint files
+        compression_level: Compression level, or None for the library default
 
     Examples:
         >>> from datetime import datetime, timezone
@@ -65,6 +101,16 @@ class CheckpointMetadata(BaseModel):
         False,
         description="Whether this checkpoint is an automatic backup created before a restore operation",
     )
+    storage_backend: Literal["zip", "dedup"] = Field(
+        "zip",
+        description="Where file contents are stored: in the checkpoint ZIP ('zip') or in the shared blob store ('dedup')",
+    )
+    compression: Literal["stored", "deflated", "bzip2", "lzma"] = Field(
+        "deflated", description="ZIP compression method used for the checkpoint files"
+    )
+    compression_level: int | None = Field(
+        None, description="Compression level (1-9), or None for the library default"
+    )
 
     model_config = {"frozen": True}
 
@@ -94,7 +140,7 @@ class CheckpointMetadata(BaseModel):
 def compute_file_checksum(file_path: str | Path) -> str:
     """Compute SHA-256 checksum for a file.
 
-    Reads the file in chunks to efficiently handle large files without
+    Reads the file in 1 MiB chunks to efficiently handle large files without
     loading the entire content into memory.
 
     Args:
@@ -129,10 +175,8 @@ def compute_file_checksum(file_path: str | Path) -> str:
 
     # Compute SHA-256 checksum by reading in chunks
     sha256_hash = hashlib.sha256()
-    chunk_size = 8192  # 8 KB chunks
-
     with open(path, "rb") as f:
-        while chunk := f.read(chunk_size):
+        while chunk := f.read(_HASH_CHUNK_SIZE):
             sha256_hash.update(chunk)
 
     # Return checksum in format "sha256:hexdigest"
@@ -251,6 +295,135 @@ def generate_checkpoint_filename(campaign_name: str, created_at: datetime | None
     return filename
 
 
+def checkpoint_members(names: Sequence[str], metadata: dict[str, Any] | None) -> list[str]:
+    """Return the campaign file names of a checkpoint.
+
+    For classic checkpoints these are the ZIP members (excluding metadata.json
+    and directories); for deduplicated checkpoints the ZIP is a manifest and the
+    files are those listed in the metadata.
+
+    Args:
+        names: Names of the ZIP members (``ZipFile.namelist()``).
+        metadata: Parsed metadata.json content, if available.
+
+    Returns:
+        List of campaign file names stored in the checkpoint.
+    """
+    if metadata and metadata.get("storage_backend") == "dedup":
+        return list(metadata.get("files", {}))
+    return [name for name in names if name != "metadata.json" and not name.endswith("/")]
+
+
+def write_metadata_member(zf: zipfile.ZipFile, metadata: dict[str, Any]) -> None:
+    """Write metadata.json to a ZIP archive open for writing.
+
+    metadata.json is written uncompressed, and a compact copy is mirrored in the
+    archive comment at the very end of the file, where read_metadata_comment
+    finds it without parsing the central directory.
+
+    Args:
+        zf: ZIP archive open for writing.
+        metadata: Checkpoint metadata (JSON-compatible).
+    """
+    zf.writestr(
+        "metadata.json",
+        json.dumps(metadata, indent=2, ensure_ascii=False),
+        compress_type=zipfile.ZIP_STORED,
+    )
+    compact = METADATA_COMMENT_PREFIX + json.dumps(
+        metadata, separators=(",", ":"), ensure_ascii=False
+    ).encode("utf-8")
+    # ZIP comments are limited to 65535 bytes; huge metadata is only in metadata.json
+    if len(compact) <= 0xFFFF:
+        zf.comment = compact
+
+
+def _find_comment(tail: bytes) -> bytes | None:
+    """Return the archive comment if tail contains the whole EOCD record."""
+    position = tail.rfind(_EOCD_SIGNATURE)
+    while position >= 0:
+        header = tail[position : position + _EOCD_SIZE]
+        if len(header) == _EOCD_SIZE:
+            comment_length = int.from_bytes(header[20:22], "little")
+            if position + _EOCD_SIZE + comment_length == len(tail):
+                return tail[position + _EOCD_SIZE :]
+        position = tail.rfind(_EOCD_SIGNATURE, 0, position)
+    return None
+
+
+def read_metadata_comment(checkpoint_path: str | Path) -> dict[str, Any] | None:
+    """Read the metadata copy stored in a checkpoint's ZIP comment.
+
+    Only the end of the file is read (one read of a few KB, or two for very
+    large metadata), so this is much cheaper than opening the archive,
+    especially on network storage. Archives created before the comment was
+    introduced return None and must be read with zipfile.
+
+    Args:
+        checkpoint_path: Path to the checkpoint ZIP file.
+
+    Returns:
+        Parsed metadata, or None if the archive has no metadata comment.
+
+    Raises:
+        OSError: If the file cannot be read.
+    """
+    with open(checkpoint_path, "rb") as f:
+        file_size = f.seek(0, os.SEEK_END)
+        comment = None
+        for read_size in (_COMMENT_READ_SIZE, _EOCD_SIZE + 0xFFFF):
+            read_size = min(read_size, file_size)
+            f.seek(file_size - read_size)
+            comment = _find_comment(f.read(read_size))
+            if comment is not None or read_size == file_size:
+                break
+
+    if comment is None or not comment.startswith(METADATA_COMMENT_PREFIX):
+        return None
+    try:
+        metadata = json.loads(comment[len(METADATA_COMMENT_PREFIX) :].decode("utf-8"))
+    except (UnicodeDecodeError, json.JSONDecodeError):
+        return None
+    return metadata if isinstance(metadata, dict) else None
+
+
+def _write_zip_member(zf: zipfile.ZipFile, file_path: Path) -> tuple[str, os.stat_result]:
+    """Add a file to an open ZIP archive, computing its checksum on the way.
+
+    The file is read once and each chunk is fed to both the SHA-256 hasher and
+    the ZIP compressor, so the stored content always matches its checksum even
+    if the file is rewritten while the checkpoint is being created.
+
+    Args:
+        zf: ZIP archive open for writing; its compression settings are used.
+        file_path: File to add, stored under its name only.
+
+    Returns:
+        tuple: Checksum in the format "sha256:hexdigest" and the stat() of the
+        file taken when it was opened.
+    """
+    sha256_hash = hashlib.sha256()
+    with open(file_path, "rb") as src:
+        stat_result = os.fstat(src.fileno())
+        info = zipfile.ZipInfo(file_path.name, time.localtime(stat_result.st_mtime)[:6])
+        info.external_attr = (stat_result.st_mode & 0xFFFF) << 16
+        info.file_size = stat_result.st_size
+        info.compress_type = zf.compression
+        # ZipFile.open(info, "w") compresses at the level of the ZipInfo, not
+        # the ZipFile's compresslevel (only applied to members opened by name)
+        if sys.version_info >= (3, 13):
+            info.compress_level = zf.compresslevel
+        else:
+            # Python < 3.13 only has the private attribute, which ZipFile.open(name)
+            # and ZipFile.write() set the same way
+            info._compresslevel = zf.compresslevel  # type: ignore[attr-defined]
+        with zf.open(info, "w") as dest:
+            while chunk := src.read(_HASH_CHUNK_SIZE):
+                sha256_hash.update(chunk)
+                dest.write(chunk)
+    return f"sha256:{sha256_hash.hexdigest()}", stat_result
+
+
 def create_checkpoint(
     campaign_name: str,
     server_name: str,
@@ -261,6 +434,9 @@ def create_checkpoint(
     comment: str | None = None,
     is_auto_backup: bool = False,
     progress_callback: Callable[[str, int, int], None] | None = None,
+    storage_backend: str = "zip",
+    hash_cache: "HashCache | None" = None,
+    compression: "CompressionConfig | None" = None,
 ) -> Path:
     """Create a checkpoint ZIP archive with campaign files and metadata.
 
@@ -269,6 +445,10 @@ def create_checkpoint(
     - metadata.json with checksums and metadata
     - Foothold_Ranks.lua if included in campaign_files
 
+    With storage_backend="dedup", file contents are written once to the shared
+    blob store of output_dir (see BlobStore) and the ZIP only contains
+    metadata.json, acting as a manifest.
+
     Args:
         campaign_name: Name of the campaign (e.g., "afghanistan").
         server_name: Name of the server (e.g., "production-1").
@@ -280,12 +460,23 @@ def create_checkpoint(
         progress_callback: Optional callback for progress tracking.
                           Called with (message, current, total) during creation.
                           Example: callback("Computing checksums", 1, 3)
+        storage_backend: "zip" (default) for a self-contained ZIP, or "dedup" to
+            store file contents in the deduplicating blob store.
+        hash_cache: Optional persistent checksum cache (see get_hash_cache). Each
+            file is read once to both hash and compress it; the checksums are
+            recorded in the cache so later unchanged-campaign checks (see
+            find_unchanged_checkpoint) do not have to read the files.
+        compression: Optional compression settings. Defaults to DEFLATED at the
+            zlib default level. With the dedup backend, blobs are always gzip
+            files: "stored" disables compression, "deflated" uses the given
+            level and "bzip2"/"lzma" use the highest gzip level.
 
     Returns:
         Path: Path to the created ZIP file.
 
     Raises:
         FileNotFoundError: If any source file doesn't exist.
+        ValueError: If storage_backend is unknown.
 
     Examples:
         >>> from pathlib import Path
@@ -319,53 +510,82 @@ def create_checkpoint(
         if not file_path.exists():
             raise FileNotFoundError(f"Source file not found: {file_path}")
 
-    # Compute checksums for all files
+    if storage_backend not in ("zip", "dedup"):
+        raise ValueError(f"Unknown storage backend: {storage_backend}. Expected 'zip' or 'dedup'")
+
+    # Create output directory if it doesn't exist
+    output_dir.mkdir(parents=True, exist_ok=True)
+
     files_checksums: dict[str, str] = {}
     total_files = len(campaign_files)
 
-    for index, file_path in enumerate(campaign_files, start=1):
-        # Report progress if callback provided
-        if progress_callback:
-            progress_callback(f"Computing checksum for {file_path.name}", index, total_files)
-
-        checksum = compute_file_checksum(file_path)
-        # Store with just the filename (not full path)
-        files_checksums[file_path.name] = checksum
-
-    # Create metadata object
-    metadata = CheckpointMetadata(
-        campaign_name=campaign_name,
-        server_name=server_name,
-        created_at=created_at,
-        files=files_checksums,
-        name=name,
-        comment=comment,
-        is_auto_backup=is_auto_backup,
-    )
+    method = compression.method if compression is not None else "deflated"
+    level = compression.level if compression is not None else None
+
+    # In dedup mode, contents go to the blob store instead of the ZIP
+    store = BlobStore(output_dir) if storage_backend == "dedup" else None
+    blob_level = {"stored": 0, "deflated": level or 6}.get(method, 9)
 
-    # Generate ZIP filename
     zip_filename = generate_checkpoint_filename(campaign_name, created_at)
+    zip_path = output_dir / zip_filename
+    # Written under a temporary name so a failed save never leaves a partial checkpoint
+    tmp_path = output_dir / f".{zip_filename}.tmp"
 
-    # Create output directory if it doesn't exist
-    output_dir.mkdir(parents=True, exist_ok=True)
+    try:
+        with zipfile.ZipFile(tmp_path, "w", _ZIP_COMPRESSION[method], compresslevel=level) as zf:
+            for index, file_path in enumerate(campaign_files, start=1):
+                if store is not None:
+                    # Hash and store the content in one pass; identical files are stored once
+                    if progress_callback:
+                        progress_callback(f"Storing {file_path.name}", index, total_files)
+                    files_checksums[file_path.name] = store.put_file(
+                        file_path, compresslevel=blob_level
+                    )
+                    continue
+
+                if progress_callback:
+                    progress_callback(
+                        f"Computing checksum for {file_path.name}", index, total_files
+                    )
+
+                # Hash and compress in one read (stored with just the filename)
+                checksum, stat_result = _write_zip_member(zf, file_path)
+                files_checksums[file_path.name] = checksum
+                if hash_cache is not None:
+                    hash_cache.remember(file_path, stat_result, checksum)
+
+            metadata = CheckpointMetadata(
+                campaign_name=campaign_name,
+                server_name=server_name,
+                created_at=created_at,
+                files=files_checksums,
+                name=name,
+                comment=comment,
+                is_auto_backup=is_auto_backup,
+                storage_backend=cast(Literal["zip", "dedup"], storage_backend),
+                compression=method,
+                compression_level=level,
+            )
 
-    # Full path to ZIP file
-    zip_path = output_dir / zip_filename
+            if progress_callback:
+                progress_callback("Creating ZIP archive", total_files, total_files)
+
+            # metadata.json comes last, once every checksum is known; it is stored
+            # uncompressed and mirrored in the archive comment for fast listings
+            metadata_json = metadata.model_dump(mode="json")
+            write_metadata_member(zf, metadata_json)
 
-    # Report progress for ZIP creation
-    if progress_callback:
-        progress_callback("Creating ZIP archive", total_files, total_files)
-
-    # Create ZIP archive
-    with zipfile.ZipFile(zip_path, "w", zipfile.ZIP_DEFLATED) as zf:
-        # Add all campaign files
-        for file_path in campaign_files:
-            # Add file with just its name (not full path)
-            zf.write(file_path, arcname=file_path.name)
-
-        # Create and add metadata.json
-        metadata_json = metadata.model_dump(mode="json")
-        metadata_str = json.dumps(metadata_json, indent=2, ensure_ascii=False)
-        zf.writestr("metadata.json", metadata_str)
+        os.replace(tmp_path, zip_path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+    if hash_cache is not None:
+        hash_cache.save()
+
+    # Index the new checkpoint so listings do not have to reopen it
+    get_catalog(output_dir).record(
+        zip_path, metadata=metadata_json, members=[f.name for f in campaign_files]
+    )
 
     return zip_path
@@ -1,25 +1,55 @@
 """Configuration management with Pydantic validation."""
 
+import functools
 import os
+from collections.abc import Callable
 from pathlib import Path
-from typing import Any
+from typing import IO, Any, Literal, cast
 
-# Use ruamel.yaml for compatibility with DCSServerBot
-try:
-    # Try ruamel.yaml first (DCSServerBot standard)
-    from ruamel.yaml import YAML
+from pydantic import BaseModel, Field, PrivateAttr, field_validator, model_validator
 
-    _yaml = YAML()
-    _yaml.preserve_quotes = True
-    _yaml.default_flow_style = False
-    YAML_BACKEND = "ruamel"
-except ImportError:
-    # Fallback to PyYAML (standalone CLI mode)
-    import yaml as _pyyaml
+from .campaign import CampaignIndex
 
-    YAML_BACKEND = "pyyaml"
 
-from pydantic import BaseModel, Field, field_validator, model_validator
+class _CacheSlot:
+    """Mutable cell holding a value derived from a frozen model.
+
+    Slots always compare equal, so cached values never affect model equality.
+    """
+
+    __slots__ = ("value",)
+
+    def __init__(self) -> None:
+        self.value: Any = None
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, _CacheSlot)
+
+    def __hash__(self) -> int:
+        return 0
+
+
+@functools.cache
+def _yaml_loader() -> Callable[[IO[str]], Any]:
+    """Return the YAML load function, importing the YAML backend on first use.
+
+    ruamel.yaml is used when available for compatibility with DCSServerBot,
+    PyYAML otherwise (standalone CLI mode). The import is deferred because a
+    configuration served from the config cache needs no YAML parsing at all.
+    """
+    try:
+        # Try ruamel.yaml first (DCSServerBot standard)
+        from ruamel.yaml import YAML
+
+        yaml = YAML()
+        yaml.preserve_quotes = True
+        yaml.default_flow_style = False
+        return cast(Callable[[IO[str]], Any], yaml.load)
+    except ImportError:
+        # Fallback to PyYAML (standalone CLI mode)
+        import yaml as pyyaml
+
+        return cast(Callable[[IO[str]], Any], pyyaml.safe_load)
 
 
 def expand_path(path: Path) -> Path:
@@ -57,6 +87,44 @@ DEFAULT_CONFIG_TEMPLATE = """# Foothold Checkpoint Tool - Configuration
 # Directory where checkpoints are stored
 checkpoints_dir: ~/.foothold-checkpoints
 
+# Checkpoint storage backend (optional, default: zip)
+# - zip:   each checkpoint is a self-contained ZIP file
+# - dedup: identical files are stored once in checkpoints_dir/.blobs and
+#          checkpoints are small manifests (use 'export' to get a portable ZIP)
+# storage_backend: zip
+
+# Checkpoint compression (optional, default: deflated at the zlib default level)
+# Either a profile name (default, fast, max) or a method with an optional level:
+# - method: stored | deflated | bzip2 | lzma
+# - level:  1-9 (deflated and bzip2 only)
+# Archives using bzip2 or lzma may need 7-Zip to be opened outside this tool.
+# compression:
+#   method: deflated
+#   level: 6
+#
+# Compression for automatic backups taken before a restore (default: fast)
+# auto_backup_compression: fast
+#
+# How automatic backups are taken before a restore (default: checkpoint)
+# - checkpoint: a normal checkpoint is written before restoring
+# - snapshot:   campaign files are cloned (reflink, hardlink or copy) into
+#               checkpoints_dir/.snapshots in milliseconds and compressed into
+#               a normal checkpoint in the background after the restore
+# auto_backup_mode: checkpoint
+
+# Retention policy used by the 'prune' command (optional, nothing is pruned by default)
+# Rules apply per campaign and server; automatic backups have their own rules.
+# A checkpoint is kept if any keep_* rule selects it; max_total_bytes then caps
+# the total size of each kind (the newest checkpoint of each campaign is always kept).
+# retention:
+#   checkpoints:
+#     keep_last: 10       # newest N checkpoints
+#     keep_daily: 7       # newest checkpoint of each of the last 7 days with checkpoints
+#     keep_weekly: 4      # newest checkpoint of each of the last 4 weeks with checkpoints
+#   auto_backups:
+#     keep_last: 3
+#     max_total_bytes: 500000000
+
 # DCS servers configuration
 servers:
   production-1:
@@ -158,6 +226,134 @@ campaigns:
 """
 
 
+# Named compression settings usable wherever a compression setting is accepted
+COMPRESSION_PROFILES: dict[str, dict[str, Any]] = {
+    "default": {"method": "deflated"},
+    "fast": {"method": "deflated", "level": 1},
+    "max": {"method": "lzma"},
+}
+
+
+class CompressionConfig(BaseModel):
+    """Compression settings for checkpoint archives.
+
+    Can also be given as a profile name from COMPRESSION_PROFILES ("default",
+    "fast" or "max").
+
+    Attributes:
+        method: ZIP compression method (stored, deflated, bzip2, lzma)
+        level: Optional compression level 1-9 (deflated and bzip2 only)
+
+    Examples:
+        >>> CompressionConfig(method="deflated", level=1)
+        >>> CompressionConfig.model_validate("max")
+    """
+
+    method: Literal["stored", "deflated", "bzip2", "lzma"] = Field(
+        default="deflated", description="ZIP compression method"
+    )
+    level: int | None = Field(
+        default=None,
+        ge=1,
+        le=9,
+        description="Compression level 1-9 (deflated and bzip2 only). Defaults to the library default.",
+    )
+
+    model_config = {"frozen": True}
+
+    @model_validator(mode="before")
+    @classmethod
+    def resolve_profile(cls, value: Any) -> Any:
+        """Expand a profile name into its settings."""
+        if isinstance(value, str):
+            if value not in COMPRESSION_PROFILES:
+                raise ValueError(
+                    f"Unknown compression profile '{value}'. "
+                    f"Expected one of: {', '.join(COMPRESSION_PROFILES)}"
+                )
+            return COMPRESSION_PROFILES[value]
+        return value
+
+    @model_validator(mode="after")
+    def validate_level(self) -> "CompressionConfig":
+        """Validate that a level is only set for methods supporting it."""
+        if self.level is not None and self.method not in ("deflated", "bzip2"):
+            raise ValueError(f"Compression method '{self.method}' does not support a level")
+        return self
+
+
+class RetentionRule(BaseModel):
+    """Retention rule for one kind of checkpoint (manual or automatic backup).
+
+    Rules are evaluated per campaign and server. A checkpoint is kept if any of
+    the keep_* options selects it. A rule without any keep_* option keeps all
+    checkpoints. max_total_bytes then caps the total size of the kept
+    checkpoints of this kind, dropping the oldest first but always keeping the
+    newest checkpoint of each campaign and server.
+
+    Attributes:
+        keep_last: Keep the newest N checkpoints
+        keep_hourly: Keep the newest checkpoint of each of the last N hours with checkpoints
+        keep_daily: Keep the newest checkpoint of each of the last N days with checkpoints
+        keep_weekly: Keep the newest checkpoint of each of the last N ISO weeks with checkpoints
+        max_total_bytes: Maximum total size of the kept checkpoints of this kind
+
+    Examples:
+        >>> RetentionRule(keep_last=10, keep_daily=7)
+        >>> RetentionRule(keep_last=3, max_total_bytes=500_000_000)
+    """
+
+    keep_last: int | None = Field(default=None, ge=0, description="Keep the newest N checkpoints")
+    keep_hourly: int | None = Field(
+        default=None, ge=0, description="Keep the newest checkpoint of each of the last N hours"
+    )
+    keep_daily: int | None = Field(
+        default=None, ge=0, description="Keep the newest checkpoint of each of the last N days"
+    )
+    keep_weekly: int | None = Field(
+        default=None, ge=0, description="Keep the newest checkpoint of each of the last N weeks"
+    )
+    max_total_bytes: int | None = Field(
+        default=None, ge=0, description="Maximum total size in bytes of the kept checkpoints"
+    )
+
+    model_config = {"frozen": True}
+
+    @property
+    def keeps_all(self) -> bool:
+        """Whether no keep_* option is set (every checkpoint is kept)."""
+        return (
+            self.keep_last is None
+            and self.keep_hourly is None
+            and self.keep_daily is None
+            and self.keep_weekly is None
+        )
+
+
+class RetentionPolicy(BaseModel):
+    """Retention policy applied by the prune operation.
+
+    Attributes:
+        checkpoints: Rule for manual checkpoints
+        auto_backups: Rule for automatic pre-restore backups
+
+    Examples:
+        >>> RetentionPolicy(
+        ...     checkpoints=RetentionRule(keep_last=10, keep_daily=7),
+        ...     auto_backups=RetentionRule(keep_last=3),
+        ... )
+    """
+
+    checkpoints: RetentionRule = Field(
+        default_factory=RetentionRule, description="Rule for manual checkpoints"
+    )
+    auto_backups: RetentionRule = Field(
+        default_factory=RetentionRule, description="Rule for automatic pre-restore backups"
+    )
+
+    model_config = {"frozen": True}
+
+
 class CampaignFileType(BaseModel):
     """Configuration for a specific file type in a campaign.
 
@@ -234,6 +430,7 @@ class CampaignConfig(BaseModel):
     Attributes:
         display_name: User-friendly name for display in UI/messages
         files: File lists organized by file type
+        compression: Optional compression override for this campaign's checkpoints
 
     Examples:
         >>> config = CampaignConfig(
@@ -252,6 +449,10 @@ class CampaignConfig(BaseModel):
         description="User-friendly name for display in UI/messages (e.g., 'Caucasus', 'Germany Modern')",
     )
     files: CampaignFileList = Field(..., description="File lists organized by file type")
+    compression: CompressionConfig | None = Field(
+        default=None,
+        description="Compression override for this campaign's checkpoints (profile name or method/level).",
+    )
 
     model_config = {"frozen": True}
 
@@ -291,6 +492,11 @@ class Config(BaseModel):
         servers: Map of server names to ServerConfig
         campaigns: Map of campaign IDs to CampaignConfig with display names and file lists
         campaigns_file: Optional path to external campaigns.yaml file (DRY configuration for CLI+plugin)
+        storage_backend: How checkpoint contents are stored ("zip" or "dedup")
+        compression: Default compression for checkpoint archives
+        auto_backup_compression: Compression for pre-restore automatic backups
+        auto_backup_mode: How pre-restore automatic backups are taken ("checkpoint" or "snapshot")
+        retention: Optional retention policy used to prune old checkpoints
     """
 
     checkpoints_dir: Path = Field(
@@ -309,9 +515,31 @@ class Config(BaseModel):
         default=None,
         description="Path to external campaigns.yaml file containing campaign definitions. Enables DRY configuration shared between CLI and plugin.",
     )
+    storage_backend: Literal["zip", "dedup"] = Field(
+        default="zip",
+        description="Checkpoint storage backend. 'zip' stores self-contained ZIP files; 'dedup' stores each unique file once in a content-addressed blob store under checkpoints_dir/.blobs and writes small manifest ZIPs.",
+    )
+    compression: CompressionConfig = Field(
+        default_factory=CompressionConfig,
+        description="Default compression for checkpoint archives (profile name or method/level). Campaigns can override it.",
+    )
+    auto_backup_compression: CompressionConfig = Field(
+        default_factory=lambda: CompressionConfig.model_validate("fast"),
+        description="Compression for automatic backups taken before a restore. Defaults to the 'fast' profile to keep restores responsive.",
+    )
+    auto_backup_mode: Literal["checkpoint", "snapshot"] = Field(
+        default="checkpoint",
+        description="How automatic backups are taken before a restore. 'checkpoint' writes a normal checkpoint first; 'snapshot' clones the campaign files (reflink, hardlink or copy) under checkpoints_dir/.snapshots and compresses them into a checkpoint in the background.",
+    )
+    retention: RetentionPolicy | None = Field(
+        default=None,
+        description="Retention policy used to prune old checkpoints. Nothing is pruned when not set.",
+    )
 
     model_config = {"frozen": True}
 
+    _campaign_index: _CacheSlot = PrivateAttr(default_factory=_CacheSlot)
+
     @field_validator("checkpoints_dir", mode="before")
     @classmethod
     def expand_checkpoints_dir(cls, value: Any) -> Path:
@@ -346,6 +574,39 @@ class Config(BaseModel):
             )
         return self
 
+    @property
+    def campaign_index(self) -> CampaignIndex:
+        """Lookup tables compiled from the campaign definitions, built once.
+
+        The index is rebuilt only if ``campaigns`` was replaced (e.g., by
+        ``model_copy``).
+        """
+        index: CampaignIndex | None = self._campaign_index.value
+        if index is None or index.campaigns is not self.campaigns:
+            index = CampaignIndex(self.campaigns)
+            self._campaign_index.value = index
+        return index
+
+    def compression_for(
+        self, campaign_name: str, is_auto_backup: bool = False
+    ) -> CompressionConfig:
+        """Return the compression settings to use for a campaign checkpoint.
+
+        Args:
+            campaign_name: Campaign ID (case-insensitive).
+            is_auto_backup: Whether the checkpoint is a pre-restore auto-backup.
+
+        Returns:
+            auto_backup_compression for auto-backups, otherwise the campaign's
+            compression override if set, otherwise the global compression.
+        """
+        if is_auto_backup:
+            return self.auto_backup_compression
+        for campaign_id, campaign in (self.campaigns or {}).items():
+            if campaign_id.lower() == campaign_name.lower() and campaign.compression:
+                return campaign.compression
+        return self.compression
+
 
 def load_campaigns(campaigns_file: Path) -> dict[str, CampaignConfig]:
     """Load campaign definitions from external YAML file.
@@ -373,11 +634,7 @@ def load_campaigns(campaigns_file: Path) -> dict[str, CampaignConfig]:
         )
 
     with open(campaigns_file, encoding="utf-8") as f:
-        campaigns_file_data: dict[str, Any]
-        if YAML_BACKEND == "ruamel":  # noqa: SIM108
-            campaigns_file_data = _yaml.load(f)
-        else:
-            campaigns_file_data = _pyyaml.safe_load(f)
+        campaigns_file_data: dict[str, Any] = _yaml_loader()(f)
 
     campaigns_data = campaigns_file_data.get("campaigns", {})
     if not campaigns_data:
@@ -424,16 +681,19 @@ def load_campaigns(campaigns_file: Path) -> dict[str, CampaignConfig]:
         campaigns[campaign_id] = CampaignConfig(
             display_name=campaign_config.get("display_name", campaign_id),
             files=CampaignFileList(**file_types),
+            compression=campaign_config.get("compression"),
         )
 
     return campaigns
 
 
-def load_config(path: Path) -> Config:
+def load_config(path: Path, use_cache: bool = True) -> Config:
     """Load configuration from YAML file.
 
     Args:
         path: Path to the YAML configuration file
+        use_cache: Reuse the validated configuration cached next to the file
+            while the YAML sources are unchanged (see configcache)
 
     Returns:
         Config: Validated configuration object
@@ -446,12 +706,50 @@ def load_config(path: Path) -> Config:
     if not path.exists():
         raise FileNotFoundError(f"Configuration file not found: {path}")
 
+    if use_cache:
+        from .configcache import read_config_cache, write_config_cache
+
+        cached = read_config_cache(path)
+        if cached is not None:
+            return cached
+
+    config, sources = _parse_config(path)
+    if use_cache:
+        write_config_cache(path, config, sources)
+    return config
+
+
+def load_config_with_sources(path: Path) -> tuple[Config, list[Path]]:
+    """Load configuration from YAML file, bypassing the cache.
+
+    Used by long-running processes that reload the configuration when one of
+    its YAML files changes.
+
+    Args:
+        path: Path to the YAML configuration file
+
+    Returns:
+        The validated configuration and the YAML files it was read from
+        (the configuration file and its campaigns file, if any).
+
+    Raises:
+        FileNotFoundError: If the configuration file doesn't exist
+        yaml.YAMLError: If the YAML syntax is invalid
+        ValidationError: If the configuration doesn't match the schema
+    """
+    if not path.exists():
+        raise FileNotFoundError(f"Configuration file not found: {path}")
+    return _parse_config(path)
+
+
+def _parse_config(path: Path) -> tuple[Config, list[Path]]:
+    """Parse and validate a YAML configuration file (see load_config).
+
+    Returns:
+        The validated configuration and the YAML files it was read from.
+    """
     with open(path, encoding="utf-8") as f:
-        config_file_data: dict[str, Any]
-        if YAML_BACKEND == "ruamel":  # noqa: SIM108
-            config_file_data = _yaml.load(f)
-        else:
-            config_file_data = _pyyaml.safe_load(f)
+        config_file_data: dict[str, Any] = _yaml_loader()(f)
 
     # Parse servers section - convert dict to ServerConfig objects (optional for plugin mode)
     servers_data = config_file_data.get("servers", {})
@@ -466,6 +764,12 @@ def load_config(path: Path) -> Config:
     campaigns: dict[str, CampaignConfig] | None = None
     campaigns_file: Path | None = None
 
+    if campaigns_file_raw and config_file_data.get("campaigns"):
+        raise ValueError(
+            "Cannot specify both 'campaigns' and 'campaigns_file'. "
+            "Use campaigns_file to reference external campaigns.yaml (recommended for v2.0+), "
+            "or define campaigns inline (legacy v1.x format)."
+        )
     if campaigns_file_raw:
         # Load campaigns from external file
         campaigns_file = (
@@ -519,6 +823,7 @@ def load_config(path: Path) -> Config:
             campaigns_inline[campaign_id] = CampaignConfig(
                 display_name=campaign_config.get("display_name", campaign_id),
                 files=CampaignFileList(**file_types),
+                compression=campaign_config.get("compression"),
             )
         campaigns = campaigns_inline
 
@@ -531,13 +836,24 @@ def load_config(path: Path) -> Config:
     )
 
     # Create Config object with validated data
-    # Pydantic will validate required fields and raise ValidationError if missing
-    return Config(
+    # Pydantic will validate required fields and raise ValidationError if missing.
+    # Campaigns loaded from campaigns_file are passed instead of the reference,
+    # as Config accepts only one of them (both in the YAML is rejected above).
+    config = Config(
         checkpoints_dir=checkpoints_dir,
         servers=servers,
         campaigns=campaigns,
-        campaigns_file=campaigns_file,
+        storage_backend=config_file_data.get("storage_backend", "zip"),
+        compression=CompressionConfig.model_validate(
+            config_file_data.get("compression") or "default"
+        ),
+        auto_backup_compression=CompressionConfig.model_validate(
+            config_file_data.get("auto_backup_compression") or "fast"
+        ),
+        auto_backup_mode=config_file_data.get("auto_backup_mode", "checkpoint"),
+        retention=config_file_data.get("retention"),
     )
+    return config, [path] if campaigns_file is None else [path, campaigns_file]
 
 
 def create_default_config(path: Path) -> None:
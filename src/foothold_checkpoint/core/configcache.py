@@ -0,0 +1,161 @@
+"""Compiled configuration cache.
+
+Loading the configuration parses ``config.yaml`` and ``campaigns.yaml`` with
+ruamel.yaml (or PyYAML) and validates every campaign definition with pydantic,
+which dominates the runtime of quick CLI commands once a few hundred campaigns
+are configured. This module stores the validated configuration as JSON next to
+the YAML file (``.config.yaml.cache`` for ``config.yaml``) and reuses it as
+long as the YAML sources are unchanged.
+
+The cache is keyed by the size and modification time of every source file
+(the configuration, the campaigns file and this package's config module), the
+pydantic version, and the values of the environment variables and home
+directory the configuration paths were expanded with. Any difference, or an
+unreadable cache file, simply falls back to loading the YAML again. Sources
+modified within the last two seconds are not cached, so a quick edit that
+keeps the same size and mtime tick cannot go unnoticed.
+
+The cache only holds data: the model is dumped with ``model_dump(mode="json")``
+and validated again when read, so a crafted cache file cannot run code. Cache
+files owned by another user are ignored.
+
+load_config uses the cache by default; ``load_config(path, use_cache=False)``
+always parses the YAML.
+
+Example:
+    >>> config = load_config(Path("config.yaml"))  # parses and caches
+    >>> config = load_config(Path("config.yaml"))  # served from .config.yaml.cache
+"""
+
+import json
+import logging
+import os
+import re
+import time
+from collections.abc import Iterable
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import pydantic
+
+if TYPE_CHECKING:
+    from .config import Config
+
+logger = logging.getLogger(__name__)
+
+# Bump when the cache layout changes; older caches are ignored
+CONFIG_CACHE_VERSION = 2
+
+# Sources modified this recently are not cached (see hashcache._RACY_WINDOW_NS)
+_RACY_WINDOW_NS = 2_000_000_000
+
+# Environment variable references expanded by config.expand_path ($VAR, ${VAR}, %VAR%)
+_ENV_REFERENCE_PATTERN = re.compile(r"\$\{?(\w+)\}?|%(\w+)%")
+
+
+def config_cache_path(config_path: Path) -> Path:
+    """Return the cache file used for a configuration file.
+
+    Args:
+        config_path: Path to the YAML configuration file.
+
+    Returns:
+        Hidden ``.<name>.cache`` file in the same directory.
+    """
+    return config_path.with_name(f".{config_path.name}.cache")
+
+
+def read_config_cache(config_path: Path) -> "Config | None":
+    """Return the cached configuration if its sources are unchanged.
+
+    Args:
+        config_path: Path to the YAML configuration file.
+
+    Returns:
+        The cached Config, or None if there is no valid, up-to-date cache.
+    """
+    from .config import Config
+
+    cache_path = config_cache_path(config_path)
+    try:
+        with open(cache_path, encoding="utf-8") as f:
+            if hasattr(os, "getuid") and os.fstat(f.fileno()).st_uid != os.getuid():
+                logger.debug(f"Ignoring config cache {cache_path} owned by another user")
+                return None
+            data = json.load(f)
+        if (
+            data["version"] != CONFIG_CACHE_VERSION
+            or data["config_path"] != str(config_path.resolve())
+            or data["environment"] != _environment(data["environment"])
+            or any(
+                _signature(Path(p)) != (tuple(s) if s is not None else None)
+                for p, s in data["sources"].items()
+            )
+        ):
+            return None
+        return Config.model_validate(data["config"])
+    except FileNotFoundError:
+        return None
+    except Exception as e:  # noqa: BLE001 - any unreadable cache means a reload
+        logger.debug(f"Ignoring invalid config cache {cache_path}: {e}")
+        return None
+
+
+def write_config_cache(config_path: Path, config: "Config", sources: list[Path]) -> None:
+    """Store a freshly loaded configuration (best effort, atomic).
+
+    Args:
+        config_path: Path to the YAML configuration file it was loaded from.
+        config: Validated configuration.
+        sources: YAML files the configuration was read from (including
+            config_path).
+    """
+    cache_path = config_cache_path(config_path)
+    tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+    try:
+        signatures = {str(source): _signature(source) for source in sources}
+        now = time.time_ns()
+        if any(
+            signature is None or now - signature[1] <= _RACY_WINDOW_NS
+            for signature in signatures.values()
+        ):
+            return
+        # Cached models are only valid for the model definitions they were built with
+        models_file = Path(__file__).with_name("config.py")
+        signatures[str(models_file)] = _signature(models_file)
+        names = {
+            name
+            for match in _ENV_REFERENCE_PATTERN.finditer(config_path.read_text(encoding="utf-8"))
+            for name in match.groups()
+            if name
+        }
+        data = {
+            "version": CONFIG_CACHE_VERSION,
+            "config_path": str(config_path.resolve()),
+            "environment": _environment(names),
+            "sources": signatures,
+            "config": config.model_dump(mode="json"),
+        }
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+        os.replace(tmp_path, cache_path)
+    except (OSError, TypeError, ValueError) as e:
+        logger.debug(f"Cannot write config cache {cache_path}: {e}")
+        tmp_path.unlink(missing_ok=True)
+
+
+def _signature(path: Path) -> tuple[int, int] | None:
+    """Return the (size, mtime_ns) of a file, or None if it is missing."""
+    try:
+        stat_result = path.stat()
+    except OSError:
+        return None
+    return (stat_result.st_size, stat_result.st_mtime_ns)
+
+
+def _environment(names: Iterable[str]) -> dict[str, str | None]:
+    """Return the current values of environment variables, home directory and pydantic version."""
+    values: dict[str, str | None] = {name: os.environ.get(name) for name in names}
+    values["~"] = os.path.expanduser("~")
+    values["pydantic"] = pydantic.VERSION
+    return values
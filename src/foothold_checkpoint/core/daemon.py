@@ -0,0 +1,656 @@
+"""Local checkpoint daemon and its client.
+
+Every CLI invocation starts cold: it loads the configuration, refreshes the
+checkpoint catalog and the checksum cache from disk and builds the campaign
+index before doing any work. ``foothold-checkpoint serve`` runs a long-lived
+CheckpointDaemon that keeps the validated configuration (with its compiled
+campaign index), the checkpoint catalog and the checksum cache in memory, and
+executes list, save, restore, delete and import operations for CLI clients.
+
+The daemon listens on 127.0.0.1 (an ephemeral port by default) and announces
+itself in a state file next to the configuration (``.config.yaml.daemon`` for
+``config.yaml``) holding its address, process id and a random token that
+clients must send with every request. connect() returns a DaemonClient if the
+daemon of a configuration answers, or None, in which case the CLI runs the
+operation in-process. Prompts, conflict checks and output stay in the CLI;
+only the operations themselves are forwarded.
+
+Requests are JSON objects POSTed over HTTP, each handled in its own thread.
+Checkpoint operations are serialized on one lock, so the daemon never runs
+two of them concurrently, while pings are answered right away: a CLI started
+during a long save or restore finds the daemon and queues its operation
+instead of falling back to running it in-process. The configuration is
+reloaded when one of its YAML files changes.
+
+Example:
+    >>> daemon = CheckpointDaemon(Path("config.yaml"))
+    >>> daemon.serve_forever()  # in the `serve` process
+    >>> client = connect(Path("config.yaml"))  # in a CLI process
+    >>> checkpoints = client.list_checkpoints() if client else ...
+"""
+
+import asyncio
+import hmac
+import json
+import logging
+import os
+import secrets
+import threading
+from collections.abc import Callable, Sequence
+from datetime import datetime
+from http.client import HTTPConnection, HTTPException
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .config import Config
+    from .storage import CheckpointList, RestoreResult
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_HOST = "127.0.0.1"
+
+# How long connect() waits for the daemon to answer before running in-process
+CONNECT_TIMEOUT = 1.0
+
+# Header carrying the token from the state file
+TOKEN_HEADER = "X-Foothold-Token"
+
+# Exceptions re-raised by the client with their original type; anything else
+# raised in the daemon becomes a DaemonError
+_REMOTE_EXCEPTIONS: dict[str, type[Exception]] = {
+    exc.__name__: exc
+    for exc in (
+        FileExistsError,
+        FileNotFoundError,
+        KeyError,
+        NotADirectoryError,
+        OSError,
+        PermissionError,
+        ValueError,
+    )
+}
+
+
+class DaemonError(Exception):
+    """Raised by DaemonClient when the daemon cannot complete a request."""
+
+
+def daemon_state_path(config_path: Path) -> Path:
+    """Return the state file announcing the daemon of a configuration file.
+
+    Args:
+        config_path: Path to the YAML configuration file.
+
+    Returns:
+        Hidden ``.<name>.daemon`` file in the same directory.
+    """
+    return config_path.with_name(f".{config_path.name}.daemon")
+
+
+class CheckpointDaemon:
+    """Long-running process executing checkpoint operations for CLI clients.
+
+    Attributes:
+        config_path: Configuration file the daemon serves
+        token: Secret clients must send with every request
+    """
+
+    def __init__(self, config_path: Path, host: str = DEFAULT_HOST, port: int = 0) -> None:
+        """Load the configuration and bind the server socket.
+
+        Args:
+            config_path: Path to the YAML configuration file.
+            host: Interface to listen on (keep the loopback default).
+            port: TCP port, or 0 for an ephemeral port.
+
+        Raises:
+            FileNotFoundError: If the configuration file doesn't exist.
+            ValidationError: If the configuration is invalid.
+            OSError: If the port cannot be bound.
+        """
+        self.config_path = config_path
+        self.token = secrets.token_urlsafe(32)
+        self._config: Config | None = None
+        self._sources: dict[Path, tuple[int, int] | None] = {}
+        # Held while a checkpoint operation runs; pings do not take it
+        self._operation_lock = threading.Lock()
+        self._config_lock = threading.Lock()
+        self.config()
+        self._server = _DaemonServer((host, port), self)
+
+    @property
+    def address(self) -> tuple[str, int]:
+        """(host, port) the daemon listens on."""
+        host, port = self._server.server_address[:2]
+        return (str(host), int(port))
+
+    def config(self) -> "Config":
+        """Return the configuration, reloading it if a YAML source changed.
+
+        Returns:
+            The current validated configuration.
+        """
+        with self._config_lock:
+            if self._config is None or any(
+                _signature(path) != signature for path, signature in self._sources.items()
+            ):
+                from .config import load_config_with_sources
+
+                config, sources = load_config_with_sources(self.config_path)
+                self._config = config
+                self._sources = {path: _signature(path) for path in sources}
+                logger.info(f"Loaded configuration from {self.config_path}")
+            return self._config
+
+    def handle(self, method: str, params: dict[str, Any]) -> Any:
+        """Execute one client request.
+
+        Operations wait for the one in progress, if any; "ping" is answered
+        immediately.
+
+        Args:
+            method: Operation name (see DaemonClient).
+            params: JSON parameters of the operation.
+
+        Returns:
+            JSON-compatible result of the operation.
+
+        Raises:
+            ValueError: If the method is unknown.
+        """
+        handler = _METHODS.get(method)
+        if handler is None:
+            raise ValueError(f"Unknown daemon method: {method}")
+        if method == "ping":
+            return handler(self, **params)
+        with self._operation_lock:
+            return handler(self, **params)
+
+    def serve_forever(self) -> None:
+        """Announce the daemon in its state file and serve until shut down.
+
+        The state file is removed when the server stops, including on
+        KeyboardInterrupt or SystemExit.
+        """
+        state_path = daemon_state_path(self.config_path)
+        host, port = self.address
+        state = {"host": host, "port": port, "pid": os.getpid(), "token": self.token}
+        tmp_path = state_path.with_name(f"{state_path.name}.{os.getpid()}.tmp")
+        # Owner-only permissions: the token grants access to the daemon
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(state, f)
+        os.replace(tmp_path, state_path)
+        logger.info(f"Checkpoint daemon listening on {host}:{port}")
+        try:
+            self._server.serve_forever()
+        finally:
+            self._server.server_close()
+            # Leave the file alone if another daemon replaced it meanwhile
+            if _read_state(state_path).get("token") == self.token:
+                state_path.unlink(missing_ok=True)
+
+    def shutdown(self) -> None:
+        """Stop serve_forever (from another thread)."""
+        self._server.shutdown()
+
+    # Operations. Paths and datetimes travel as strings; every operation
+    # runs against the daemon's configuration.
+
+    def _ping(self) -> dict[str, Any]:
+        return {
+            "pid": os.getpid(),
+            "checkpoints_dir": str(Path(self.config().checkpoints_dir).resolve()),
+        }
+
+    def _list(
+        self,
+        server_filter: str | None = None,
+        campaign_filter: str | None = None,
+        kind: str = "all",
+        since: str | None = None,
+        until: str | None = None,
+        sort: str = "default",
+        descending: bool = False,
+        offset: int = 0,
+        limit: int | None = None,
+    ) -> dict[str, Any]:
+        from .storage import list_checkpoints
+
+        checkpoints = asyncio.run(
+            list_checkpoints(
+                self.config().checkpoints_dir,
+                server_filter=server_filter,
+                campaign_filter=campaign_filter,
+                kind=kind,
+                since=datetime.fromisoformat(since) if since else None,
+                until=datetime.fromisoformat(until) if until else None,
+                sort=sort,
+                descending=descending,
+                offset=offset,
+                limit=limit,
+            )
+        )
+        return {
+            "total": checkpoints.total,
+            "checkpoints": [checkpoint.to_dict() for checkpoint in checkpoints],
+        }
+
+    def _find_unchanged(
+        self, campaign_name: str, server_name: str, campaign_files: list[str]
+    ) -> str | None:
+        from .storage import find_unchanged_checkpoint
+
+        existing = find_unchanged_checkpoint(
+            campaign_name,
+            server_name,
+            [Path(f) for f in campaign_files],
+            self.config().checkpoints_dir,
+        )
+        return str(existing) if existing is not None else None
+
+    def _create(
+        self,
+        campaign_name: str,
+        server_name: str,
+        campaign_files: list[str],
+        name: str | None = None,
+        comment: str | None = None,
+        compression: str | None = None,
+    ) -> str:
+        from .checkpoint import create_checkpoint
+        from .config import CompressionConfig
+        from .hashcache import get_hash_cache
+
+        config = self.config()
+        checkpoints_dir = Path(config.checkpoints_dir)
+        checkpoints_dir.mkdir(parents=True, exist_ok=True)
+        checkpoint_path = create_checkpoint(
+            campaign_name=campaign_name,
+            server_name=server_name,
+            campaign_files=[Path(f) for f in campaign_files],
+            output_dir=checkpoints_dir,
+            name=name,
+            comment=comment,
+            storage_backend=config.storage_backend,
+            hash_cache=get_hash_cache(checkpoints_dir),
+            compression=(
+                CompressionConfig.model_validate(compression)
+                if compression
+                else config.compression_for(campaign_name)
+            ),
+        )
+        return str(checkpoint_path)
+
+    def _restore(
+        self,
+        checkpoint_path: str,
+        target_dir: str,
+        server_name: str,
+        restore_ranks: bool = False,
+        auto_backup: bool = True,
+        differential: bool = False,
+    ) -> dict[str, list[str]]:
+        from .storage import restore_checkpoint
+
+        # Conflicts were checked and confirmed by the client
+        restored = asyncio.run(
+            restore_checkpoint(
+                checkpoint_path=checkpoint_path,
+                target_dir=target_dir,
+                restore_ranks=restore_ranks,
+                config=self.config(),
+                skip_overwrite_check=True,
+                server_name=server_name,
+                auto_backup=auto_backup,
+                differential=differential,
+            )
+        )
+        return {
+            "restored": [str(path) for path in restored],
+            "skipped": [str(path) for path in restored.skipped],
+        }
+
+    def _delete(self, checkpoint_path: str) -> dict | None:
+        from .storage import delete_checkpoint
+
+        # Confirmation, if any, happened in the client
+        return asyncio.run(delete_checkpoint(checkpoint_path, force=True))
+
+    def _import(
+        self,
+        source_dir: str,
+        campaign_name: str,
+        server_name: str,
+        name: str | None = None,
+        comment: str | None = None,
+    ) -> dict[str, Any]:
+        from .storage import import_checkpoint
+
+        config = self.config()
+        result = asyncio.run(
+            import_checkpoint(
+                source_dir=source_dir,
+                campaign_name=campaign_name,
+                server_name=server_name,
+                output_dir=config.checkpoints_dir,
+                config=config,
+                name=name,
+                comment=comment,
+                return_warnings=True,
+            )
+        )
+        checkpoint_path, warnings = result if isinstance(result, tuple) else (result, [])
+        return {"path": str(checkpoint_path), "warnings": warnings}
+
+
+_METHODS: dict[str, Callable[..., Any]] = {
+    "ping": CheckpointDaemon._ping,
+    "list": CheckpointDaemon._list,
+    "find_unchanged": CheckpointDaemon._find_unchanged,
+    "create": CheckpointDaemon._create,
+    "restore": CheckpointDaemon._restore,
+    "delete": CheckpointDaemon._delete,
+    "import": CheckpointDaemon._import,
+}
+
+
+class _DaemonServer(ThreadingHTTPServer):
+    """HTTP server dispatching requests to a CheckpointDaemon, one thread each."""
+
+    # Requests still running at shutdown do not keep the process alive
+    daemon_threads = True
+
+    def __init__(self, address: tuple[str, int], daemon: CheckpointDaemon) -> None:
+        self.checkpoint_daemon = daemon
+        super().__init__(address, _RequestHandler)
+
+
+class _RequestHandler(BaseHTTPRequestHandler):
+    """Handle ``POST /`` requests of the form {"method": ..., "params": {...}}."""
+
+    server: _DaemonServer
+
+    def do_POST(self) -> None:  # noqa: N802 - http.server naming
+        daemon = self.server.checkpoint_daemon
+        if not hmac.compare_digest(self.headers.get(TOKEN_HEADER, ""), daemon.token):
+            self._reply(403, {"error": {"type": "PermissionError", "message": "Invalid token"}})
+            return
+        try:
+            request = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))))
+            method, params = request["method"], request.get("params", {})
+        except (ValueError, KeyError, TypeError) as e:
+            self._reply(400, {"error": {"type": "ValueError", "message": f"Bad request: {e}"}})
+            return
+        try:
+            response = {"result": daemon.handle(method, params)}
+        except Exception as e:  # noqa: BLE001 - reported to the client
+            logger.debug(f"Daemon request {method} failed: {e}")
+            response = {"error": {"type": type(e).__name__, "message": str(e)}}
+        self._reply(200, response)
+
+    def _reply(self, status: int, body: dict[str, Any]) -> None:
+        payload = json.dumps(body).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, format: str, *args: Any) -> None:  # noqa: A002 - base signature
+        logger.debug(f"{self.address_string()} - {format % args}")
+
+
+class DaemonClient:
+    """Client forwarding checkpoint operations to a running CheckpointDaemon.
+
+    Methods mirror the storage functions the CLI calls, minus the arguments
+    the daemon takes from its own configuration (checkpoints directory,
+    storage backend, checksum cache) and the progress callbacks. Paths are
+    sent as absolute paths.
+    """
+
+    def __init__(self, host: str, port: int, token: str) -> None:
+        """Initialize the client.
+
+        Args:
+            host: Daemon host.
+            port: Daemon port.
+            token: Token from the daemon's state file.
+        """
+        self.host = host
+        self.port = port
+        self.token = token
+
+    def call(self, method: str, timeout: float | None = None, **params: Any) -> Any:
+        """Execute an operation in the daemon.
+
+        Args:
+            method: Operation name.
+            timeout: Socket timeout in seconds (None waits for long operations).
+            **params: JSON-compatible parameters of the operation.
+
+        Returns:
+            JSON result of the operation.
+
+        Raises:
+            DaemonError: If the daemon is unreachable or the operation failed
+                with an unexpected error.
+            OSError: Or another standard exception raised by the operation.
+        """
+        body = json.dumps({"method": method, "params": params})
+        connection = HTTPConnection(self.host, self.port, timeout=timeout)
+        try:
+            connection.request(
+                "POST",
+                "/",
+                body=body,
+                headers={"Content-Type": "application/json", TOKEN_HEADER: self.token},
+            )
+            response = json.loads(connection.getresponse().read())
+        except (OSError, HTTPException, ValueError) as e:
+            raise DaemonError(f"Checkpoint daemon request failed: {e}") from e
+        finally:
+            connection.close()
+
+        error = response.get("error")
+        if error is not None:
+            exc_type = _REMOTE_EXCEPTIONS.get(error["type"], DaemonError)
+            raise exc_type(error["message"])
+        return response.get("result")
+
+    def list_checkpoints(
+        self,
+        server_filter: str | None = None,
+        campaign_filter: str | None = None,
+        kind: str = "all",
+        since: datetime | None = None,
+        until: datetime | None = None,
+        sort: str = "default",
+        descending: bool = False,
+        offset: int = 0,
+        limit: int | None = None,
+    ) -> "CheckpointList":
+        """List checkpoints (see storage.list_checkpoints)."""
+        from .storage import CheckpointInfo, CheckpointList
+
+        result = self.call(
+            "list",
+            server_filter=server_filter,
+            campaign_filter=campaign_filter,
+            kind=kind,
+            since=since.isoformat() if since else None,
+            until=until.isoformat() if until else None,
+            sort=sort,
+            descending=descending,
+            offset=offset,
+            limit=limit,
+        )
+        return CheckpointList(
+            [CheckpointInfo.from_dict(data) for data in result["checkpoints"]],
+            total=result["total"],
+        )
+
+    def find_unchanged_checkpoint(
+        self, campaign_name: str, server_name: str, campaign_files: Sequence[Path]
+    ) -> Path | None:
+        """Find a checkpoint identical to the current files (see storage.find_unchanged_checkpoint).
+
+        Returns:
+            Path of the matching checkpoint, or None.
+        """
+        existing = self.call(
+            "find_unchanged",
+            campaign_name=campaign_name,
+            server_name=server_name,
+            campaign_files=_resolved(campaign_files),
+        )
+        return None if existing is None else Path(existing)
+
+    def create_checkpoint(
+        self,
+        campaign_name: str,
+        server_name: str,
+        campaign_files: Sequence[Path],
+        name: str | None = None,
+        comment: str | None = None,
+        compression: str | None = None,
+    ) -> Path:
+        """Create a checkpoint (see checkpoint.create_checkpoint).
+
+        Args:
+            campaign_name: Campaign name.
+            server_name: Server name.
+            campaign_files: Campaign files to archive.
+            name: Optional checkpoint name.
+            comment: Optional checkpoint comment.
+            compression: Compression profile name, or None for the configured
+                compression.
+
+        Returns:
+            Path of the created checkpoint.
+        """
+        return Path(
+            self.call(
+                "create",
+                campaign_name=campaign_name,
+                server_name=server_name,
+                campaign_files=_resolved(campaign_files),
+                name=name,
+                comment=comment,
+                compression=compression,
+            )
+        )
+
+    def restore_checkpoint(
+        self,
+        checkpoint_path: Path,
+        target_dir: Path,
+        server_name: str,
+        restore_ranks: bool = False,
+        auto_backup: bool = True,
+        differential: bool = False,
+    ) -> "RestoreResult":
+        """Restore a checkpoint without overwrite check (see storage.restore_checkpoint)."""
+        from .storage import RestoreResult
+
+        result = self.call(
+            "restore",
+            checkpoint_path=str(Path(checkpoint_path).resolve()),
+            target_dir=str(Path(target_dir).resolve()),
+            server_name=server_name,
+            restore_ranks=restore_ranks,
+            auto_backup=auto_backup,
+            differential=differential,
+        )
+        return RestoreResult(
+            [Path(p) for p in result["restored"]], [Path(p) for p in result["skipped"]]
+        )
+
+    def delete_checkpoint(self, checkpoint_path: Path) -> dict | None:
+        """Delete a checkpoint without confirmation (see storage.delete_checkpoint)."""
+        result: dict | None = self.call(
+            "delete", checkpoint_path=str(Path(checkpoint_path).resolve())
+        )
+        return result
+
+    def import_checkpoint(
+        self,
+        source_dir: Path,
+        campaign_name: str,
+        server_name: str,
+        name: str | None = None,
+        comment: str | None = None,
+    ) -> tuple[Path, list[str]]:
+        """Import campaign files as a checkpoint (see storage.import_checkpoint).
+
+        Returns:
+            Path of the created checkpoint and the import warnings.
+        """
+        result = self.call(
+            "import",
+            source_dir=str(Path(source_dir).resolve()),
+            campaign_name=campaign_name,
+            server_name=server_name,
+            name=name,
+            comment=comment,
+        )
+        return Path(result["path"]), result["warnings"]
+
+
+def connect(config_path: Path, checkpoints_dir: str | Path | None = None) -> DaemonClient | None:
+    """Return a client for the daemon serving a configuration file, if it is running.
+
+    Args:
+        config_path: Path to the YAML configuration file.
+        checkpoints_dir: Checkpoints directory the caller works on. A daemon
+            using another directory (e.g., a relative path resolved from
+            another working directory) is ignored.
+
+    Returns:
+        A DaemonClient if the daemon answered, None if there is no state file,
+        the daemon does not respond (stale state file) or it uses another
+        checkpoints directory.
+    """
+    state = _read_state(daemon_state_path(config_path))
+    try:
+        client = DaemonClient(str(state["host"]), int(state["port"]), str(state["token"]))
+    except (KeyError, TypeError, ValueError):
+        return None
+    try:
+        info = client.call("ping", timeout=CONNECT_TIMEOUT)
+    except (DaemonError, OSError) as e:
+        logger.debug(f"Checkpoint daemon of {config_path} is not responding: {e}")
+        return None
+    if checkpoints_dir is not None and info["checkpoints_dir"] != str(
+        Path(checkpoints_dir).resolve()
+    ):
+        logger.debug(f"Checkpoint daemon of {config_path} uses {info['checkpoints_dir']}")
+        return None
+    return client
+
+
+def _resolved(paths: Sequence[Path]) -> list[str]:
+    """Return absolute path strings, as the daemon may run in another directory."""
+    return [str(Path(path).resolve()) for path in paths]
+
+
+def _read_state(state_path: Path) -> dict[str, Any]:
+    """Return the content of a daemon state file, or {} if it is missing or invalid."""
+    try:
+        with open(state_path, encoding="utf-8") as f:
+            state = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return state if isinstance(state, dict) else {}
+
+
+def _signature(path: Path) -> tuple[int, int] | None:
+    """Return the (size, mtime_ns) of a file, or None if it is missing."""
+    try:
+        stat_result = path.stat()
+    except OSError:
+        return None
+    return (stat_result.st_size, stat_result.st_mtime_ns)
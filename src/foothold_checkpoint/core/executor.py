@@ -0,0 +1,186 @@
+"""Bounded executor for blocking checkpoint I/O.
+
+The storage API is async so it can be awaited from the DCSServerBot event loop,
+but hashing, compression and ZIP extraction are blocking operations. This module
+provides a shared, bounded thread pool used by the storage functions to run that
+work off the event loop, so a large save or restore does not stall every other
+Discord interaction running in the same process.
+
+The pool is created lazily. Its size can be changed with :func:`configure_executor`
+(the plugin uses the ``io_workers`` setting); the CLI simply uses the default.
+
+Example:
+    >>> configure_executor(max_workers=2)
+    >>> checksum = await run_blocking(compute_file_checksum, Path("foothold_syria.lua"))
+"""
+
+import asyncio
+import functools
+import logging
+import os
+import threading
+from collections.abc import Callable, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Default pool size: enough to overlap I/O for a few servers without
+# competing with DCS itself for CPU time
+DEFAULT_MAX_WORKERS = min(4, os.cpu_count() or 1)
+
+
+class JobCancelled(Exception):
+    """Raised by a job of run_blocking_all that stopped because another one failed."""
+
+
+_executor: ThreadPoolExecutor | None = None
+_max_workers = DEFAULT_MAX_WORKERS
+_lock = threading.Lock()
+
+
+def configure_executor(max_workers: int) -> None:
+    """Set the size of the shared I/O pool.
+
+    If a pool with a different size is already running, it is shut down (running
+    tasks finish normally) and a new one is created on next use.
+
+    Args:
+        max_workers: Maximum number of worker threads (at least 1).
+
+    Raises:
+        ValueError: If max_workers is lower than 1.
+    """
+    global _executor, _max_workers
+
+    if max_workers < 1:
+        raise ValueError(f"max_workers must be at least 1, got {max_workers}")
+
+    with _lock:
+        if max_workers == _max_workers:
+            return
+        _max_workers = max_workers
+        old_executor, _executor = _executor, None
+
+    if old_executor is not None:
+        old_executor.shutdown(wait=False)
+    logger.debug(f"Checkpoint I/O pool configured with {max_workers} workers")
+
+
+def get_executor() -> ThreadPoolExecutor:
+    """Return the shared I/O pool, creating it if needed.
+
+    Returns:
+        ThreadPoolExecutor bounded to the configured number of workers.
+    """
+    global _executor
+
+    with _lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=_max_workers, thread_name_prefix="foothold-io"
+            )
+        return _executor
+
+
+def shutdown_executor(wait: bool = True) -> None:
+    """Shut down the shared I/O pool.
+
+    A new pool is created on next use, so this is safe to call when the plugin
+    is unloaded.
+
+    Args:
+        wait: If True, wait for running tasks to finish.
+    """
+    global _executor
+
+    with _lock:
+        old_executor, _executor = _executor, None
+
+    if old_executor is not None:
+        old_executor.shutdown(wait=wait)
+
+
+async def run_blocking(func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """Run a blocking function in the shared I/O pool and await its result.
+
+    Args:
+        func: Blocking callable to run.
+        *args: Positional arguments for func.
+        **kwargs: Keyword arguments for func.
+
+    Returns:
+        The value returned by func.
+
+    Raises:
+        Exception: Any exception raised by func is propagated unchanged.
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(get_executor(), functools.partial(func, *args, **kwargs))
+
+
+async def run_blocking_all(
+    funcs: Sequence[Callable[[threading.Event], T]],
+    discard: Callable[[T], None] | None = None,
+) -> list[T]:
+    """Run blocking jobs concurrently in the shared I/O pool, failing fast.
+
+    Each job receives a cancellation event, set as soon as any job fails; long
+    jobs should check it periodically and raise JobCancelled. The first failure
+    is raised once every job has stopped, so no job keeps running (or leaves
+    files behind) after the call returns.
+
+    Args:
+        funcs: Blocking callables taking the cancellation event.
+        discard: Optional cleanup called with the result of each job that
+            succeeded when another one failed (e.g. to remove a temporary file).
+
+    Returns:
+        Results of the jobs, in the order of funcs.
+
+    Raises:
+        Exception: The first exception raised by a job.
+    """
+    loop = asyncio.get_running_loop()
+    executor = get_executor()
+    cancelled = threading.Event()
+    futures = [loop.run_in_executor(executor, func, cancelled) for func in funcs]
+
+    try:
+        return list(await asyncio.gather(*futures))
+    except BaseException:
+        cancelled.set()
+        results = await asyncio.gather(*futures, return_exceptions=True)
+        if discard is not None:
+            for result in results:
+                if not isinstance(result, BaseException):
+                    discard(result)
+        raise
+
+
+def threadsafe_callback(
+    callback: Callable[..., None] | None,
+) -> Callable[..., None] | None:
+    """Wrap a callback so calls from worker threads run on the event loop thread.
+
+    Progress callbacks and hook schedulers use the event loop (e.g.
+    ``asyncio.create_task``), so they must not be invoked directly from the pool.
+    Must be called from a coroutine running on the target loop.
+
+    Args:
+        callback: Callback to wrap, or None.
+
+    Returns:
+        Wrapped callback, or None if callback is None.
+    """
+    if callback is None:
+        return None
+
+    loop = asyncio.get_running_loop()
+
+    def wrapper(*args: Any) -> None:
+        loop.call_soon_threadsafe(callback, *args)
+
+    return wrapper
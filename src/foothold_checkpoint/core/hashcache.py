@@ -0,0 +1,187 @@
+"""Persistent file checksum cache.
+
+Hashing campaign files is the dominant cost of a save when nothing changed.
+This module remembers the SHA-256 checksum of each source file together with
+the ``stat()`` data it was computed from, keyed by absolute path, size,
+modification time and inode, so a file is hashed again only when it changed or
+was replaced. The cache is shared by checkpoint creation, import and the
+auto-backup taken before a restore.
+
+The cache is stored as JSON (``.foothold-hashcache.json``) in the checkpoints
+directory and holds at most HASH_CACHE_MAX_ENTRIES files, evicting the least
+recently used ones. Like the checkpoint catalog it is purely an optimization: a
+missing or corrupted cache file only costs a rehash.
+
+Example:
+    >>> cache = get_hash_cache(Path("C:/checkpoints"))
+    >>> checksum = cache.checksum(Path("C:/DCS/Missions/Saves/foothold_syria.lua"))
+    >>> cache.save()
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from .checkpoint import compute_file_checksum
+
+if TYPE_CHECKING:
+    from .scan import ScannedFile
+
+logger = logging.getLogger(__name__)
+
+# Name of the cache file stored in the checkpoints directory
+HASH_CACHE_FILENAME = ".foothold-hashcache.json"
+
+# Bump when the entry layout changes; older caches are discarded
+HASH_CACHE_VERSION = 2
+
+# Maximum number of files remembered; least recently used entries are evicted
+HASH_CACHE_MAX_ENTRIES = 4096
+
+# Files modified this recently are not cached: a second write within the same
+# mtime tick and with the same size would otherwise go unnoticed
+_RACY_WINDOW_NS = 2_000_000_000
+
+
+class HashCache:
+    """Map of file path and stat data to SHA-256 checksum.
+
+    Attributes:
+        cache_path: Path of the JSON cache file
+    """
+
+    def __init__(self, checkpoints_dir: str | Path) -> None:
+        """Initialize the cache stored in a checkpoints directory.
+
+        Args:
+            checkpoints_dir: Directory containing the checkpoints.
+        """
+        self.cache_path = Path(checkpoints_dir) / HASH_CACHE_FILENAME
+        self._entries: OrderedDict[str, tuple[int, int, int, str]] = OrderedDict()
+        self._loaded = False
+        self._dirty = False
+        self._lock = threading.RLock()
+
+    def checksum(self, file_path: Path, scanned: "ScannedFile | None" = None) -> str:
+        """Return the checksum of a file, hashing it only if it changed.
+
+        Args:
+            file_path: Path to the file.
+            scanned: Stat data of the file from a directory scan, reused
+                instead of calling stat() again.
+
+        Returns:
+            Checksum in the format "sha256:hexdigest".
+
+        Raises:
+            FileNotFoundError: If the file does not exist.
+        """
+        key = str(Path(file_path).resolve())
+        if scanned is not None:
+            signature = scanned.signature
+        else:
+            stat_result = os.stat(key)
+            signature = (stat_result.st_size, stat_result.st_mtime_ns, stat_result.st_ino)
+
+        with self._lock:
+            self._load()
+            cached = self._entries.get(key)
+            if cached is not None and cached[:3] == signature:
+                self._entries.move_to_end(key)
+                return cached[3]
+
+        checksum = compute_file_checksum(file_path)
+        self._store(key, signature, checksum)
+        return checksum
+
+    def remember(self, file_path: str | Path, stat_result: os.stat_result, checksum: str) -> None:
+        """Record a checksum computed elsewhere (e.g., while writing an archive).
+
+        Args:
+            file_path: Path to the file.
+            stat_result: stat() of the file taken before its content was read.
+            checksum: Checksum of that content in the format "sha256:hexdigest".
+        """
+        self._store(
+            str(Path(file_path).resolve()),
+            (stat_result.st_size, stat_result.st_mtime_ns, stat_result.st_ino),
+            checksum,
+        )
+
+    def _store(self, key: str, signature: tuple[int, int, int], checksum: str) -> None:
+        """Record the checksum of a file version, unless it was modified too recently."""
+        if time.time_ns() - signature[1] <= _RACY_WINDOW_NS:
+            return
+
+        with self._lock:
+            self._load()
+            self._entries[key] = (*signature, checksum)
+            self._entries.move_to_end(key)
+            while len(self._entries) > HASH_CACHE_MAX_ENTRIES:
+                self._entries.popitem(last=False)
+            self._dirty = True
+
+    def save(self) -> None:
+        """Write the cache file if it changed (best effort, atomic)."""
+        with self._lock:
+            if not self._dirty:
+                return
+            data = {
+                "version": HASH_CACHE_VERSION,
+                "entries": {key: list(value) for key, value in self._entries.items()},
+            }
+            tmp_path = self.cache_path.with_name(f"{HASH_CACHE_FILENAME}.{os.getpid()}.tmp")
+            try:
+                self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+                tmp_path.write_text(json.dumps(data), encoding="utf-8")
+                os.replace(tmp_path, self.cache_path)
+            except OSError as e:
+                logger.debug(f"Cannot write hash cache {self.cache_path}: {e}")
+                tmp_path.unlink(missing_ok=True)
+                return
+            self._dirty = False
+
+    def _load(self) -> None:
+        """Load the cache file on first use."""
+        if self._loaded:
+            return
+        self._loaded = True
+
+        try:
+            data = json.loads(self.cache_path.read_text(encoding="utf-8"))
+            if data.get("version") != HASH_CACHE_VERSION:
+                return
+            for key, (size, mtime_ns, inode, checksum) in data["entries"].items():
+                self._entries[key] = (int(size), int(mtime_ns), int(inode), str(checksum))
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError, KeyError, TypeError, AttributeError) as e:
+            logger.debug(f"Ignoring invalid hash cache {self.cache_path}: {e}")
+            self._entries.clear()
+
+
+_caches: dict[Path, HashCache] = {}
+_caches_lock = threading.Lock()
+
+
+def get_hash_cache(checkpoints_dir: str | Path) -> HashCache:
+    """Return the shared hash cache for a checkpoints directory.
+
+    Args:
+        checkpoints_dir: Directory containing the checkpoints.
+
+    Returns:
+        HashCache for the directory.
+    """
+    key = Path(checkpoints_dir).resolve()
+    with _caches_lock:
+        cache = _caches.get(key)
+        if cache is None:
+            cache = HashCache(key)
+            _caches[key] = cache
+        return cache
@@ -0,0 +1,327 @@
+"""Checkpoint retention and pruning.
+
+Evaluates a RetentionPolicy over the checkpoints of a directory and deletes the
+checkpoints it does not keep. Evaluation works on the checkpoint catalog, so a
+prune only stats the archives (and opens those that are new or changed since
+they were indexed) instead of reading every ZIP file.
+
+Rules are applied per campaign and server, separately for manual checkpoints
+and automatic pre-restore backups (see RetentionRule for the semantics).
+
+Example:
+    >>> policy = RetentionPolicy(checkpoints=RetentionRule(keep_last=10))
+    >>> result = await prune_checkpoints(Path("C:/checkpoints"), policy, dry_run=True)
+    >>> print(f"Would free {result.bytes_freed} bytes")
+"""
+
+import logging
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from .catalog import CatalogEntry
+
+if TYPE_CHECKING:
+    from .config import RetentionPolicy, RetentionRule
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class PrunePlan:
+    """Outcome of evaluating a retention policy.
+
+    Attributes:
+        keep: Entries kept by the policy (including invalid checkpoints, which
+            are never pruned)
+        delete: Entries selected for deletion, oldest first
+    """
+
+    keep: list[CatalogEntry] = field(default_factory=list)
+    delete: list[CatalogEntry] = field(default_factory=list)
+
+    @property
+    def bytes_freed(self) -> int:
+        """Total size of the checkpoint archives selected for deletion.
+
+        For the dedup backend this is the size of the manifests only; see
+        prune_checkpoints for the blobs released with them.
+        """
+        return sum(entry.size for entry in self.delete)
+
+
+@dataclass
+class PruneResult:
+    """Result of a prune operation.
+
+    Attributes:
+        deleted: Paths of the deleted checkpoints (or that would be deleted in
+            dry-run mode)
+        kept: Number of checkpoints kept
+        bytes_freed: Total size in bytes of the deleted checkpoint archives and
+            of the blobs of the dedup backend released with them
+        dry_run: Whether nothing was actually deleted
+        errors: Map of checkpoint filename to error message for failed deletions
+    """
+
+    deleted: list[Path] = field(default_factory=list)
+    kept: int = 0
+    bytes_freed: int = 0
+    dry_run: bool = False
+    errors: dict[str, str] = field(default_factory=dict)
+
+    @property
+    def bytes_freed_human(self) -> str:
+        """Human-readable size of the deleted checkpoints (e.g., "1.2 MB")."""
+        from .storage import _format_file_size
+
+        return _format_file_size(self.bytes_freed)
+
+
+def _created_at(metadata: dict[str, Any]) -> datetime:
+    """Parse the created_at timestamp of checkpoint metadata as aware UTC."""
+    value = str(metadata.get("created_at", ""))
+    try:
+        created_at = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        return datetime.min.replace(tzinfo=timezone.utc)
+    if created_at.tzinfo is None:
+        created_at = created_at.replace(tzinfo=timezone.utc)
+    return created_at.astimezone(timezone.utc)
+
+
+def _select(entries: list[tuple[datetime, CatalogEntry]], rule: "RetentionRule") -> set[str]:
+    """Return the filenames kept by a rule's keep_* options (entries newest first)."""
+    if rule.keeps_all:
+        return {entry.filename for _, entry in entries}
+
+    kept: set[str] = set()
+    if rule.keep_last:
+        kept.update(entry.filename for _, entry in entries[: rule.keep_last])
+
+    buckets = [
+        (rule.keep_hourly, lambda ts: (ts.year, ts.month, ts.day, ts.hour)),
+        (rule.keep_daily, lambda ts: (ts.year, ts.month, ts.day)),
+        (rule.keep_weekly, lambda ts: tuple(ts.isocalendar())[:2]),
+    ]
+    for count, bucket_of in buckets:
+        if not count:
+            continue
+        seen: set[tuple[int, ...]] = set()
+        for created_at, entry in entries:
+            bucket = bucket_of(created_at)
+            if bucket in seen:
+                continue
+            seen.add(bucket)
+            kept.add(entry.filename)
+            if len(seen) >= count:
+                break
+    return kept
+
+
+def plan_prune(
+    entries: Iterable[CatalogEntry],
+    policy: "RetentionPolicy",
+    server_filter: str | None = None,
+    campaign_filter: str | None = None,
+) -> PrunePlan:
+    """Evaluate a retention policy over catalog entries.
+
+    Single pass to group the entries by kind, server and campaign, then one
+    sort per group. Invalid checkpoints (no metadata) and checkpoints outside
+    the filters are always kept.
+
+    Args:
+        entries: Catalog entries of a checkpoints directory.
+        policy: Retention policy to apply.
+        server_filter: Only prune checkpoints of this server.
+        campaign_filter: Only prune checkpoints of this campaign (case-insensitive).
+
+    Returns:
+        PrunePlan with the entries to keep and to delete.
+    """
+    plan = PrunePlan()
+    groups: dict[tuple[bool, str, str], list[tuple[datetime, CatalogEntry]]] = {}
+
+    for entry in entries:
+        metadata = entry.metadata
+        if metadata is None:
+            plan.keep.append(entry)
+            continue
+        server = str(metadata.get("server_name", ""))
+        campaign = str(metadata.get("campaign_name", "")).lower()
+        if (server_filter and server != server_filter) or (
+            campaign_filter and campaign != campaign_filter.lower()
+        ):
+            plan.keep.append(entry)
+            continue
+        is_auto_backup = bool(
+            metadata.get("is_auto_backup", entry.filename.startswith("auto-backup-"))
+        )
+        groups.setdefault((is_auto_backup, server, campaign), []).append(
+            (_created_at(metadata), entry)
+        )
+
+    for is_auto_backup in (False, True):
+        rule = policy.auto_backups if is_auto_backup else policy.checkpoints
+        kept: list[tuple[datetime, CatalogEntry]] = []
+        newest: set[str] = set()
+
+        for (auto, _, _), group in groups.items():
+            if auto != is_auto_backup:
+                continue
+            group.sort(key=lambda item: (item[0], item[1].filename), reverse=True)
+            newest.add(group[0][1].filename)
+            selected = _select(group, rule)
+            for item in group:
+                if item[1].filename in selected:
+                    kept.append(item)
+                else:
+                    plan.delete.append(item[1])
+
+        if rule.max_total_bytes is not None:
+            # Newest checkpoint of each group first, then the others newest first
+            kept.sort(key=lambda item: (item[1].filename in newest, item[0]), reverse=True)
+            total = 0
+            over_budget = False
+            within_budget = []
+            for item in kept:
+                size = item[1].size
+                if item[1].filename in newest or (
+                    not over_budget and total + size <= rule.max_total_bytes
+                ):
+                    within_budget.append(item)
+                    total += size
+                else:
+                    # Once over budget, every older checkpoint goes too
+                    over_budget = True
+                    plan.delete.append(item[1])
+            kept = within_budget
+
+        plan.keep.extend(entry for _, entry in kept)
+
+    plan.delete.sort(
+        key=lambda entry: (_created_at(entry.metadata or {}), entry.filename),
+    )
+    return plan
+
+
+async def prune_checkpoints(
+    checkpoints_dir: str | Path,
+    policy: "RetentionPolicy",
+    dry_run: bool = False,
+    server_filter: str | None = None,
+    campaign_filter: str | None = None,
+) -> PruneResult:
+    """Delete the checkpoints not kept by a retention policy.
+
+    Checkpoints are deleted in bulk: the catalog is updated for each deleted
+    file and unreferenced blobs of the dedup backend are collected once at the
+    end, instead of once per checkpoint as delete_checkpoint does.
+
+    Args:
+        checkpoints_dir: Directory containing the checkpoints.
+        policy: Retention policy to apply.
+        dry_run: If True, only report what would be deleted.
+        server_filter: Only prune checkpoints of this server.
+        campaign_filter: Only prune checkpoints of this campaign (case-insensitive).
+
+    Returns:
+        PruneResult with the deleted checkpoints and the bytes freed. Files that
+        cannot be deleted are reported in errors and do not stop the prune.
+
+    Raises:
+        FileNotFoundError: If checkpoints_dir does not exist.
+
+    Example:
+        >>> result = await prune_checkpoints(config.checkpoints_dir, config.retention)
+        >>> print(f"Deleted {len(result.deleted)} checkpoints, freed {result.bytes_freed} bytes")
+    """
+    from .catalog import get_catalog
+    from .executor import run_blocking
+
+    checkpoints_dir = Path(checkpoints_dir)
+    if not checkpoints_dir.is_dir():
+        raise FileNotFoundError(f"Checkpoint directory not found: {checkpoints_dir}")
+
+    catalog = get_catalog(checkpoints_dir)
+    entries = await run_blocking(catalog.refresh)
+    plan = plan_prune(entries, policy, server_filter, campaign_filter)
+
+    result = PruneResult(kept=len(plan.keep), dry_run=dry_run)
+    if dry_run:
+        result.deleted = [checkpoints_dir / entry.filename for entry in plan.delete]
+        result.bytes_freed = plan.bytes_freed + await run_blocking(
+            _releasable_blob_bytes, checkpoints_dir, entries, plan
+        )
+        return result
+
+    await run_blocking(_delete_entries, checkpoints_dir, plan, result)
+    logger.info(
+        f"Pruned {len(result.deleted)} checkpoints from {checkpoints_dir} "
+        f"({result.bytes_freed} bytes freed)"
+    )
+    return result
+
+
+def _dedup_checksums(entries: Iterable[CatalogEntry]) -> set[str]:
+    """Return the blob checksums referenced by the dedup checkpoints of entries."""
+    return {
+        checksum
+        for entry in entries
+        if entry.metadata and entry.metadata.get("storage_backend") == "dedup"
+        for checksum in entry.metadata.get("files", {}).values()
+    }
+
+
+def _releasable_blob_bytes(
+    checkpoints_dir: Path, entries: list[CatalogEntry], plan: PrunePlan
+) -> int:
+    """Size of the blobs only referenced by the checkpoints the plan deletes."""
+    from .blobstore import BlobStore
+
+    deleted = {entry.filename for entry in plan.delete}
+    released = _dedup_checksums(plan.delete) - _dedup_checksums(
+        entry for entry in entries if entry.filename not in deleted
+    )
+    store = BlobStore(checkpoints_dir)
+    total = 0
+    for checksum in released:
+        try:
+            total += store.blob_path(checksum).stat().st_size
+        except OSError:
+            continue
+    return total
+
+
+def _delete_entries(checkpoints_dir: Path, plan: PrunePlan, result: PruneResult) -> None:
+    """Delete the planned checkpoints and release unreferenced blobs."""
+    from .blobstore import BlobStore
+    from .catalog import get_catalog
+
+    catalog = get_catalog(checkpoints_dir)
+    deleted_dedup = False
+
+    for entry in plan.delete:
+        path = checkpoints_dir / entry.filename
+        try:
+            path.unlink()
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            logger.warning(f"Cannot delete checkpoint {entry.filename}: {e}")
+            result.errors[entry.filename] = str(e)
+            result.kept += 1
+            continue
+        catalog.forget(entry.filename)
+        result.deleted.append(path)
+        result.bytes_freed += entry.size
+        if entry.metadata and entry.metadata.get("storage_backend") == "dedup":
+            deleted_dedup = True
+
+    if deleted_dedup:
+        referenced = _dedup_checksums(catalog.refresh())
+        _, blob_bytes = BlobStore(checkpoints_dir).sweep(referenced)
+        result.bytes_freed += blob_bytes
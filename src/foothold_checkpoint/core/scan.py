@@ -0,0 +1,126 @@
+"""Single-pass source directory scanning.
+
+DCS ``Missions/Saves`` folders usually hold thousands of files unrelated to
+Foothold. Listing them with ``Path.iterdir()`` and then calling ``is_file()``
+and ``stat()`` on each entry costs several system calls per file on every
+save. scan_directory walks the directory once with ``os.scandir``, whose
+entries already carry the file type (and, on Windows, the size and
+modification time), and only stats the entries accepted by a name filter.
+
+The resulting ScannedFile records are shared by campaign detection,
+unknown-file detection and the checksum cache, which reuses their stat data
+instead of calling ``stat()`` again.
+
+Example:
+    >>> scanned = scan_directory(saves_dir, campaign_file_filter(config))
+    >>> grouped = detect_campaigns(list(scanned), config)
+    >>> checksum = get_hash_cache(checkpoints_dir).checksum(
+    ...     scanned["foothold_syria.lua"].path, scanned["foothold_syria.lua"]
+    ... )
+"""
+
+import os
+from collections.abc import Callable
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from .campaign import is_shared_file
+
+if TYPE_CHECKING:
+    from .config import Config
+
+
+@dataclass(frozen=True)
+class ScannedFile:
+    """Regular file found by scan_directory, with its stat data.
+
+    Attributes:
+        name: File name
+        path: Full path of the file
+        size: File size in bytes
+        mtime_ns: Modification time in nanoseconds
+        inode: Inode (file index on Windows), used to detect replaced files
+    """
+
+    name: str
+    path: Path
+    size: int
+    mtime_ns: int
+    inode: int
+
+    @property
+    def signature(self) -> tuple[int, int, int]:
+        """(size, mtime_ns, inode) tuple identifying this version of the file."""
+        return (self.size, self.mtime_ns, self.inode)
+
+
+def scan_directory(
+    directory: str | Path, include: Callable[[str], bool] | None = None
+) -> dict[str, ScannedFile]:
+    """List the regular files of a directory in one pass.
+
+    Entries rejected by ``include`` are skipped before any ``stat()`` call,
+    so unrelated files only cost their directory entry.
+
+    Args:
+        directory: Directory to scan (not recursive).
+        include: Optional predicate on file names; only accepted files are
+            stat'ed and returned.
+
+    Returns:
+        Dictionary mapping file names to ScannedFile records, in directory
+        order.
+
+    Raises:
+        FileNotFoundError: If the directory does not exist.
+        NotADirectoryError: If the path is not a directory.
+        PermissionError: If the directory cannot be read.
+    """
+    directory = Path(directory)
+    scanned: dict[str, ScannedFile] = {}
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if include is not None and not include(entry.name):
+                continue
+            try:
+                if not entry.is_file():
+                    continue
+                stat_result = entry.stat()
+                # DirEntry.stat() has no inode on Windows; inode() fetches it
+                inode = stat_result.st_ino or entry.inode()
+            except OSError:
+                # Removed or unreadable since the directory was listed
+                continue
+            scanned[entry.name] = ScannedFile(
+                name=entry.name,
+                path=directory / entry.name,
+                size=stat_result.st_size,
+                mtime_ns=stat_result.st_mtime_ns,
+                inode=inode,
+            )
+    return scanned
+
+
+def campaign_file_filter(
+    config: "Config", include_foothold_like: bool = False
+) -> Callable[[str], bool]:
+    """Build a scan_directory filter accepting the files a campaign operation needs.
+
+    Args:
+        config: Configuration object containing campaign definitions.
+        include_foothold_like: Also accept every file whose name starts with
+            "foothold", as needed by unknown-file detection.
+
+    Returns:
+        Predicate accepting configured campaign files and the shared ranks
+        file (and foothold-like names if requested).
+    """
+    index = config.campaign_index
+
+    def include(name: str) -> bool:
+        if index.lookup(name) is not None or is_shared_file(name):
+            return True
+        return include_foothold_like and index.is_foothold_like(name)
+
+    return include
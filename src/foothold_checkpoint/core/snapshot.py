@@ -0,0 +1,263 @@
+"""Fast pre-restore snapshots.
+
+A pre-restore auto-backup normally runs a full save: every campaign file is
+hashed, compressed and written to a ZIP before the restore can start. With
+``auto_backup_mode: snapshot`` the campaign files are instead cloned into
+``checkpoints_dir/.snapshots/<snapshot>/``, which takes milliseconds, and the
+snapshot is compressed into a normal auto-backup checkpoint in the background
+once the restore is done.
+
+Files are cloned with the cheapest safe method available:
+
+- reflink (``FICLONE``) on copy-on-write filesystems (Btrfs, XFS, ...);
+- a hardlink for files the restore is about to replace: restore writes a new
+  file and renames it over the target, so the old content stays intact under
+  the snapshot's link;
+- a plain copy otherwise.
+
+A snapshot directory only gets its final name once it is complete, so a crash
+never leaves a partial snapshot behind; pending snapshots are compacted by the
+next compaction run (see compact_pending_snapshots).
+
+Example:
+    >>> snapshot_dir = create_snapshot(
+    ...     "syria", "server", files, Path("C:/checkpoints"), created_at, "auto-backup-..."
+    ... )
+    >>> checkpoint = compact_snapshot(snapshot_dir, config)
+"""
+
+import json
+import logging
+import os
+import shutil
+import sys
+import tempfile
+import threading
+from collections.abc import Collection, Sequence
+from concurrent.futures import Future
+from datetime import datetime
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from .checkpoint import create_checkpoint, generate_checkpoint_filename
+
+if TYPE_CHECKING:
+    from .config import Config
+
+logger = logging.getLogger(__name__)
+
+# Directory (relative to checkpoints_dir) holding pending snapshots
+SNAPSHOTS_DIRNAME = ".snapshots"
+
+# Name of the snapshot manifest (checkpoint parameters) in a snapshot directory
+SNAPSHOT_MANIFEST = "snapshot.json"
+
+# ioctl request number of FICLONE on Linux (_IOW(0x94, 9, int))
+_FICLONE = 0x40049409
+
+# Serializes compactions so a snapshot is never compacted twice
+_compaction_lock = threading.Lock()
+
+
+def _reflink(source: Path, target: Path) -> bool:
+    """Clone a file with FICLONE, returning False if unsupported."""
+    if not sys.platform.startswith("linux"):
+        return False
+
+    import fcntl
+
+    try:
+        with open(source, "rb") as src, open(target, "wb") as dst:
+            fcntl.ioctl(dst.fileno(), _FICLONE, src.fileno())
+    except OSError:
+        target.unlink(missing_ok=True)
+        return False
+    shutil.copystat(source, target)
+    return True
+
+
+def clone_file(source: Path, target: Path, allow_hardlink: bool = False) -> str:
+    """Capture a file under a new path as cheaply as possible.
+
+    Args:
+        source: File to capture.
+        target: Path of the clone (must not exist).
+        allow_hardlink: Whether a hardlink is acceptable, i.e. the source will
+            be replaced (renamed over) rather than modified in place.
+
+    Returns:
+        Method used: "reflink", "hardlink" or "copy".
+
+    Raises:
+        OSError: If the file cannot be captured at all.
+    """
+    if _reflink(source, target):
+        return "reflink"
+    if allow_hardlink:
+        try:
+            os.link(source, target)
+            return "hardlink"
+        except OSError:
+            pass
+    shutil.copy2(source, target)
+    return "copy"
+
+
+def create_snapshot(
+    campaign_name: str,
+    server_name: str,
+    campaign_files: Sequence[Path],
+    checkpoints_dir: Path,
+    created_at: datetime,
+    name: str | None = None,
+    comment: str | None = None,
+    replaced: Collection[str] = (),
+) -> Path:
+    """Capture campaign files into a pending snapshot.
+
+    Args:
+        campaign_name: Name of the campaign.
+        server_name: Name of the server the files come from.
+        campaign_files: Files to capture.
+        checkpoints_dir: Directory containing the checkpoints.
+        created_at: Timestamp of the auto-backup checkpoint to create.
+        name: Optional checkpoint name.
+        comment: Optional checkpoint comment.
+        replaced: Names of the files the restore will replace, which may be
+            hardlinked instead of copied.
+
+    Returns:
+        Path of the snapshot directory.
+
+    Raises:
+        OSError: If the snapshot cannot be written.
+    """
+    snapshots_dir = checkpoints_dir / SNAPSHOTS_DIRNAME
+    snapshots_dir.mkdir(parents=True, exist_ok=True)
+    snapshot_dir = (
+        snapshots_dir / Path(generate_checkpoint_filename(campaign_name, created_at)).stem
+    )
+
+    # Built under a temporary name and renamed once complete
+    temp_dir = Path(tempfile.mkdtemp(prefix=".tmp-", dir=snapshots_dir))
+    try:
+        methods = [
+            clone_file(f, temp_dir / f.name, allow_hardlink=f.name in replaced)
+            for f in campaign_files
+        ]
+        manifest = {
+            "campaign_name": campaign_name,
+            "server_name": server_name,
+            "created_at": created_at.isoformat(),
+            "name": name,
+            "comment": comment,
+            "files": [f.name for f in campaign_files],
+        }
+        (temp_dir / SNAPSHOT_MANIFEST).write_text(json.dumps(manifest, indent=2), encoding="utf-8")
+        os.rename(temp_dir, snapshot_dir)
+    except BaseException:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+        raise
+
+    logger.info(f"Snapshot {snapshot_dir.name} created ({', '.join(sorted(set(methods)))})")
+    return snapshot_dir
+
+
+def compact_snapshot(snapshot_dir: Path, config: "Config") -> Path:
+    """Turn a snapshot into a normal auto-backup checkpoint and remove it.
+
+    Args:
+        snapshot_dir: Snapshot directory created by create_snapshot.
+        config: Configuration (storage backend and auto-backup compression).
+
+    Returns:
+        Path to the created checkpoint ZIP file.
+
+    Raises:
+        ValueError: If the snapshot manifest is invalid.
+        OSError: If the checkpoint cannot be written.
+    """
+    checkpoints_dir = snapshot_dir.parent.parent
+    try:
+        manifest = json.loads((snapshot_dir / SNAPSHOT_MANIFEST).read_text(encoding="utf-8"))
+        campaign_name = manifest["campaign_name"]
+        server_name = manifest["server_name"]
+        created_at = datetime.fromisoformat(manifest["created_at"])
+        files = [snapshot_dir / filename for filename in manifest["files"]]
+    except (KeyError, TypeError, ValueError) as e:
+        raise ValueError(f"Invalid snapshot {snapshot_dir.name}: {e}") from e
+
+    checkpoint_path = create_checkpoint(
+        campaign_name=campaign_name,
+        server_name=server_name,
+        campaign_files=files,
+        output_dir=checkpoints_dir,
+        created_at=created_at,
+        name=manifest.get("name"),
+        comment=manifest.get("comment"),
+        is_auto_backup=True,
+        storage_backend=config.storage_backend,
+        compression=config.compression_for(campaign_name, is_auto_backup=True),
+    )
+    shutil.rmtree(snapshot_dir, ignore_errors=True)
+    return checkpoint_path
+
+
+def pending_snapshots(checkpoints_dir: Path) -> list[Path]:
+    """Return the complete snapshots waiting to be compacted.
+
+    Args:
+        checkpoints_dir: Directory containing the checkpoints.
+
+    Returns:
+        Snapshot directories sorted by name.
+    """
+    snapshots_dir = checkpoints_dir / SNAPSHOTS_DIRNAME
+    if not snapshots_dir.is_dir():
+        return []
+    return sorted(
+        path
+        for path in snapshots_dir.iterdir()
+        if not path.name.startswith(".") and (path / SNAPSHOT_MANIFEST).is_file()
+    )
+
+
+def compact_pending_snapshots(checkpoints_dir: Path, config: "Config") -> list[Path]:
+    """Compact every pending snapshot of a checkpoints directory.
+
+    A snapshot that cannot be compacted is logged and left in place for the
+    next run.
+
+    Args:
+        checkpoints_dir: Directory containing the checkpoints.
+        config: Configuration (storage backend and auto-backup compression).
+
+    Returns:
+        Paths of the created checkpoints.
+    """
+    created = []
+    with _compaction_lock:
+        for snapshot_dir in pending_snapshots(checkpoints_dir):
+            try:
+                created.append(compact_snapshot(snapshot_dir, config))
+            except (OSError, ValueError) as e:
+                logger.error(f"Failed to compact snapshot {snapshot_dir.name}: {e}")
+    return created
+
+
+def schedule_compaction(checkpoints_dir: Path, config: "Config") -> "Future[list[Path]]":
+    """Compact pending snapshots in the background I/O pool.
+
+    The pool's worker threads are joined at interpreter exit, so a CLI restore
+    still gets its backup compacted before the process ends.
+
+    Args:
+        checkpoints_dir: Directory containing the checkpoints.
+        config: Configuration (storage backend and auto-backup compression).
+
+    Returns:
+        Future resolving to the paths of the created checkpoints.
+    """
+    from .executor import get_executor
+
+    return get_executor().submit(compact_pending_snapshots, checkpoints_dir, config)
@@ -4,7 +4,9 @@ This module provides functions for saving, restoring, listing, and deleting
 Foothold campaign checkpoints with integrity verification.
 """
 
-from collections.abc import Callable
+import logging
+import os
+from collections.abc import AsyncIterator, Callable, Mapping, Sequence
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, cast
@@ -12,10 +14,265 @@ from typing import TYPE_CHECKING, Any, cast
 # Use relative imports for DCSSB compatibility (package structure is flattened)
 from .campaign import detect_campaigns
 from .checkpoint import create_checkpoint
+from .scan import ScannedFile, campaign_file_filter, scan_directory
 
 if TYPE_CHECKING:
-    from .config import Config
+    import threading
+    from concurrent.futures import Executor, Future
+
+    from .archive import CheckpointArchive
+    from .catalog import CatalogEntry
+    from .config import CompressionConfig, Config
     from .events import EventHooks
+    from .hashcache import HashCache
+
+logger = logging.getLogger(__name__)
+
+# Chunk size used when streaming checkpoint members to disk during restore
+_RESTORE_CHUNK_SIZE = 1024 * 1024
+
+# Sort keys accepted by list_checkpoints and iter_checkpoints
+CHECKPOINT_SORT_KEYS = ("default", "timestamp", "size", "filename", "campaign")
+
+# Checkpoint types accepted by list_checkpoints and iter_checkpoints
+CHECKPOINT_KINDS = ("all", "manual", "auto")
+
+
+class RestoreResult(list[Path]):
+    """Files written by restore_checkpoint.
+
+    Behaves as the plain list of restored file paths, and additionally reports
+    the files a differential restore left untouched.
+
+    Attributes:
+        skipped: Target files that already had the checkpoint content and were
+            not rewritten (always empty unless differential=True)
+    """
+
+    def __init__(
+        self, restored: list[Path] | None = None, skipped: list[Path] | None = None
+    ) -> None:
+        """Initialize the result.
+
+        Args:
+            restored: Files written by the restore.
+            skipped: Files left untouched because they already were up to date.
+        """
+        super().__init__(restored or [])
+        self.skipped: list[Path] = skipped or []
+
+
+def parse_checkpoint_timestamp(timestamp: str) -> datetime:
+    """Parse a metadata ``created_at`` value into a timezone-aware datetime.
+
+    Accepts the ISO format written by create_checkpoint as well as a trailing
+    "Z"; naive values are taken as UTC.
+
+    Args:
+        timestamp: ISO timestamp string.
+
+    Returns:
+        Timezone-aware datetime.
+
+    Raises:
+        ValueError: If the timestamp is not a valid ISO timestamp.
+    """
+    if timestamp.endswith("Z"):
+        timestamp = timestamp[:-1] + "+00:00"
+    parsed = datetime.fromisoformat(timestamp)
+    return parsed if parsed.tzinfo is not None else parsed.replace(tzinfo=timezone.utc)
+
+
+class CheckpointInfo:
+    """Listing record for one checkpoint, as returned by list_checkpoints.
+
+    A slotted object with the creation time parsed once. The file list is
+    not copied per record: it is read from the catalog entry on access.
+
+    Item access (``info["filename"]``, ``info.get("name")``) is supported
+    for code written against the dictionaries list_checkpoints used to
+    return, including the derived ``timestamp`` and ``size_human`` keys.
+
+    Attributes:
+        filename: Name of the checkpoint file
+        campaign: Campaign name
+        server: Server name
+        created_at: Creation time (timezone-aware)
+        size_bytes: Archive size in bytes
+        name: Optional user-provided name
+        comment: Optional user-provided comment
+        is_auto_backup: Whether the checkpoint is an auto-backup
+    """
+
+    __slots__ = (
+        "filename",
+        "campaign",
+        "server",
+        "created_at",
+        "size_bytes",
+        "name",
+        "comment",
+        "is_auto_backup",
+        "_files",
+    )
+
+    # Keys accepted by item access and produced by to_dict
+    _KEYS = frozenset(
+        (
+            "filename",
+            "campaign",
+            "server",
+            "created_at",
+            "timestamp",
+            "size_bytes",
+            "size_human",
+            "name",
+            "comment",
+            "files",
+            "is_auto_backup",
+        )
+    )
+
+    def __init__(
+        self,
+        filename: str,
+        campaign: str,
+        server: str,
+        created_at: datetime,
+        size_bytes: int = 0,
+        name: str | None = None,
+        comment: str | None = None,
+        is_auto_backup: bool = False,
+        files: Sequence[str] = (),
+    ) -> None:
+        """Initialize the record.
+
+        Args:
+            filename: Name of the checkpoint file.
+            campaign: Campaign name.
+            server: Server name.
+            created_at: Creation time.
+            size_bytes: Archive size in bytes.
+            name: Optional user-provided name.
+            comment: Optional user-provided comment.
+            is_auto_backup: Whether the checkpoint is an auto-backup.
+            files: Campaign files in the checkpoint; kept by reference and
+                copied only when the files property is read.
+        """
+        self.filename = filename
+        self.campaign = campaign
+        self.server = server
+        self.created_at = created_at
+        self.size_bytes = size_bytes
+        self.name = name
+        self.comment = comment
+        self.is_auto_backup = is_auto_backup
+        self._files = files
+
+    @property
+    def files(self) -> list[str]:
+        """Campaign files contained in the checkpoint."""
+        return list(self._files)
+
+    @property
+    def timestamp(self) -> str:
+        """Creation time as an ISO timestamp string."""
+        return self.created_at.isoformat()
+
+    @property
+    def size_human(self) -> str:
+        """Human-readable archive size (e.g., "1.2 MB")."""
+        return _format_file_size(self.size_bytes)
+
+    def __getitem__(self, key: str) -> Any:
+        if key not in self._KEYS:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._KEYS
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Return the value of a key, or default for unknown keys."""
+        return getattr(self, key) if key in self._KEYS else default
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, CheckpointInfo):
+            return NotImplemented
+        return self.to_dict() == other.to_dict()
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"CheckpointInfo({self.filename!r}, campaign={self.campaign!r})"
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serialize the record to a JSON-compatible dictionary.
+
+        Returns:
+            Dictionary with the keys of the former list_checkpoints dicts.
+        """
+        return {
+            "filename": self.filename,
+            "campaign": self.campaign,
+            "server": self.server,
+            "timestamp": self.timestamp,
+            "size_bytes": self.size_bytes,
+            "size_human": self.size_human,
+            "name": self.name,
+            "comment": self.comment,
+            "files": self.files,
+            "is_auto_backup": self.is_auto_backup,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "CheckpointInfo":
+        """Build a record from a dictionary produced by to_dict.
+
+        Args:
+            data: Dictionary with at least filename, campaign, server and
+                timestamp.
+
+        Returns:
+            CheckpointInfo with the dictionary's values.
+
+        Raises:
+            KeyError: If a required key is missing.
+            ValueError: If the timestamp is invalid.
+        """
+        return cls(
+            filename=data["filename"],
+            campaign=data["campaign"],
+            server=data["server"],
+            created_at=parse_checkpoint_timestamp(data["timestamp"]),
+            size_bytes=data.get("size_bytes", 0),
+            name=data.get("name"),
+            comment=data.get("comment"),
+            is_auto_backup=data.get("is_auto_backup", False),
+            files=data.get("files", ()),
+        )
+
+
+class CheckpointList(list[CheckpointInfo]):
+    """Page of checkpoints returned by list_checkpoints.
+
+    Behaves as the plain list of CheckpointInfo records, and additionally
+    reports how many checkpoints matched the filters before the page was cut.
+
+    Attributes:
+        total: Number of checkpoints matching the filters, ignoring offset and
+            limit
+    """
+
+    def __init__(self, checkpoints: list[CheckpointInfo] | None = None, total: int = 0) -> None:
+        """Initialize the result.
+
+        Args:
+            checkpoints: Checkpoints of the requested page.
+            total: Number of checkpoints matching the filters.
+        """
+        super().__init__(checkpoints or [])
+        self.total = total
 
 
 async def save_checkpoint(
@@ -30,6 +287,8 @@ async def save_checkpoint(
     is_auto_backup: bool = False,
     progress_callback: Callable[[str, int, int], None] | None = None,
     hooks: "EventHooks | None" = None,
+    skip_unchanged: bool = False,
+    compression: "CompressionConfig | None" = None,
 ) -> Path:
     """Save a checkpoint for a single campaign.
 
@@ -59,9 +318,17 @@ async def save_checkpoint(
             Example: callback("Computing checksums", 1, 3)
         hooks: Optional event hooks for operation notifications. Used by plugin
             for Discord notifications. Set to None for CLI mode.
+        skip_unchanged: If True and no campaign file changed since the newest
+            checkpoint of this campaign and server, no new checkpoint is created
+            and the path of that existing checkpoint is returned. Unchanged files
+            are detected from cached stat data without rehashing them.
+        compression: Optional compression override (e.g., the "max" profile for
+            archival checkpoints). Defaults to config.compression_for(), which
+            uses auto_backup_compression for auto-backups.
 
     Returns:
-        Path to the created checkpoint ZIP file.
+        Path to the created checkpoint ZIP file, or to the existing checkpoint
+        when skip_unchanged is True and nothing changed.
 
     Raises:
         ValueError: If no campaign files are found for the specified campaign name.
@@ -113,9 +380,9 @@ async def save_checkpoint(
                 f"Expected a directory containing campaign files."
             )
 
-        # Test readability by attempting to list directory
+        # Scan the source directory once; this also checks that it is readable
         try:
-            list(source_dir.iterdir())
+            grouped, scanned = _scan_source_campaigns(source_dir, config)
         except PermissionError as e:
             raise PermissionError(
                 f"Source directory '{source_dir}' is not readable. "
@@ -131,69 +398,23 @@ async def save_checkpoint(
 
         output_dir.mkdir(parents=True, exist_ok=True)
 
-        # Find all files in source directory
-        all_files = list(source_dir.glob("*"))
-        filenames = [f.name for f in all_files if f.is_file()]
-
-        # Group files by campaign and find matching files
-        grouped = detect_campaigns(filenames, config)
-
-        # Find campaign files (case-insensitive match)
-        campaign_files_names = None
-        for camp_name, files in grouped.items():
-            if camp_name.lower() == campaign_name.lower():
-                campaign_files_names = files
-                break
-
-        if not campaign_files_names:
-            raise ValueError(
-                f"No campaign files found for campaign '{campaign_name}' in {source_dir}. "
-                f"Available campaigns: {', '.join(grouped.keys()) if grouped else 'none'}"
-            )
-
-        # Build full paths for campaign files
-        campaign_files = [source_dir / fname for fname in campaign_files_names]
-
-        # Add Foothold_Ranks.lua if it exists
-        ranks_file = source_dir / "Foothold_Ranks.lua"
-        if ranks_file.exists():
-            campaign_files.append(ranks_file)
-
-        # Wrap progress callback to also trigger on_save_progress hook
-        def combined_progress_callback(message: str, current: int, total: int) -> None:
-            # Call original callback if provided
-            if progress_callback:
-                progress_callback(message, current, total)
-
-            # Trigger on_save_progress hook (sync wrapper for async hook)
-            if hooks and hooks.on_save_progress:
-                import asyncio
-
-                asyncio.create_task(
-                    safe_invoke_hook(
-                        hooks.on_save_progress, current, total, hook_name="on_save_progress"
-                    )
-                )
-
-        # Create the checkpoint using low-level function
-        checkpoint_path = create_checkpoint(
+        checkpoint_path, _ = await _save_campaign_checkpoint(
             campaign_name=campaign_name,
             server_name=server_name,
-            campaign_files=campaign_files,
+            source_dir=source_dir,
             output_dir=output_dir,
+            grouped=grouped,
+            scanned=scanned,
             created_at=created_at,
             name=name,
             comment=comment,
             is_auto_backup=is_auto_backup,
-            progress_callback=combined_progress_callback,
+            progress_callback=progress_callback,
+            hooks=hooks,
+            storage_backend=config.storage_backend,
+            skip_unchanged=skip_unchanged,
+            compression=compression or config.compression_for(campaign_name, is_auto_backup),
         )
-
-        # Trigger on_save_complete hook
-        if hooks:
-            await safe_invoke_hook(
-                hooks.on_save_complete, checkpoint_path, hook_name="on_save_complete"
-            )
-
         return checkpoint_path
 
     except Exception as e:
@@ -214,6 +435,8 @@ async def save_all_campaigns(
     progress_callback: Callable[[str, int, int], None] | None = None,
     hooks: "EventHooks | None" = None,
     continue_on_error: bool = True,
+    max_workers: int = 1,
+    skip_unchanged: bool = False,
 ) -> dict[str, Path]:
     """Save checkpoints for all detected campaigns in source directory.
 
@@ -221,6 +444,17 @@ async def save_all_campaigns(
     and creates a separate checkpoint for each one. If continue_on_error is True,
     failures on individual campaigns do not stop processing of other campaigns.
 
+    The source directory is scanned and grouped only once for the whole batch.
+    With max_workers > 1, the per-campaign checksum and ZIP work runs concurrently
+    in a thread pool (hashing and compression release the GIL). Progress callbacks
+    and hooks are still invoked from the event loop thread.
+
+    With continue_on_error=False, the result matches the sequential case: the
+    error of the first failing campaign in batch order is raised, checkpoints
+    of the campaigns before it are kept, and campaigns after it are skipped if
+    not started yet. Those already being saved are awaited (their worker
+    threads cannot be cancelled) and the checkpoints they created are deleted.
+
     Args:
         server_name: Name of the server where checkpoints are created.
         source_dir: Path to the directory containing campaign files.
@@ -235,6 +469,11 @@ async def save_all_campaigns(
         hooks: Optional event hooks for operation notifications.
         continue_on_error: If True, continue saving other campaigns when one fails.
             If False, raise error immediately on first failure.
+        max_workers: Number of campaigns saved concurrently. Defaults to 1
+            (sequential).
+        skip_unchanged: If True, campaigns whose files did not change since their
+            newest checkpoint are not saved again; their existing checkpoint path
+            is returned instead.
 
     Returns:
         Dictionary mapping campaign names (lowercase, normalized) to their
@@ -243,6 +482,7 @@ async def save_all_campaigns(
     Raises:
         FileNotFoundError: If source_dir does not exist.
         PermissionError: If source_dir is not readable or output_dir not writable.
+        ValueError: If max_workers is lower than 1.
         Exception: If continue_on_error=False and any campaign save fails.
 
     Examples:
@@ -251,72 +491,483 @@ async def save_all_campaigns(
         ...     source_dir=Path("C:/DCS/Server/Missions/Saves"),
         ...     output_dir=Path("C:/checkpoints"),
         ...     config=config,
-        ...     name="Daily backup"
+        ...     name="Daily backup",
+        ...     max_workers=4,
         ... )
         >>> for campaign, path in results.items():
         ...     print(f"{campaign}: {path.name}")
         afghanistan: afghanistan_2024-02-14_10-30-00.zip
         syria: syria_2024-02-14_10-30-00.zip
     """
+    import asyncio
+    from concurrent.futures import ThreadPoolExecutor
+
+    from .events import safe_invoke_hook
+
+    if max_workers < 1:
+        raise ValueError(f"max_workers must be at least 1, got {max_workers}")
+
     source_dir = Path(source_dir)
     output_dir = Path(output_dir)
 
-    # Find all files in source directory
-    all_files = list(source_dir.glob("*"))
-    filenames = [f.name for f in all_files if f.is_file()]
-
-    # Group files by campaign
-    grouped = detect_campaigns(filenames, config)
+    # Scan the source directory and group files by campaign once for the whole batch
+    grouped, scanned = _scan_source_campaigns(source_dir, config)
 
     if not grouped:
         return {}
 
+    # All checkpoints of the batch share the same timestamp
+    if created_at is None:
+        created_at = datetime.now(timezone.utc)
+
+    total_campaigns = len(grouped)
+    # Limit how many campaigns are in flight so hooks and progress follow the pool
+    slots = asyncio.Semaphore(max_workers)
+    # Batch position of the first failing campaign; with continue_on_error=False,
+    # campaigns after it are not saved, as in the sequential case
+    failed_idx: int | None = None
+
+    async def save_one(
+        idx: int, campaign_name: str, executor: "Executor | None"
+    ) -> tuple[Path, bool] | None:
+        nonlocal failed_idx
+        async with slots:
+            if not continue_on_error and failed_idx is not None and idx > failed_idx:
+                return None
+            try:
+                if hooks:
+                    await safe_invoke_hook(
+                        hooks.on_save_start, campaign_name, hook_name="on_save_start"
+                    )
+
+                if progress_callback:
+                    progress_callback(
+                        f"Saving campaign {idx}/{total_campaigns}: {campaign_name}",
+                        idx,
+                        total_campaigns,
+                    )
+
+                return await _save_campaign_checkpoint(
+                    campaign_name=campaign_name,
+                    server_name=server_name,
+                    source_dir=source_dir,
+                    output_dir=output_dir,
+                    grouped=grouped,
+                    scanned=scanned,
+                    created_at=created_at,
+                    name=name,
+                    comment=comment,
+                    progress_callback=progress_callback,
+                    hooks=hooks,
+                    executor=executor,
+                    storage_backend=config.storage_backend,
+                    skip_unchanged=skip_unchanged,
+                    compression=config.compression_for(campaign_name),
+                )
+            except Exception as e:
+                if failed_idx is None or idx < failed_idx:
+                    failed_idx = idx
+                # Trigger on_error hook
+                if hooks:
+                    await safe_invoke_hook(hooks.on_error, e, hook_name="on_error")
+                raise
+
     # Create checkpoints for each campaign
     results: dict[str, Path] = {}
-    total_campaigns = len(grouped)
 
-    for idx, (campaign_name, _) in enumerate(grouped.items(), start=1):
-        try:
+    if max_workers == 1:
+        for idx, campaign_name in enumerate(grouped, start=1):
+            try:
+                saved = await save_one(idx, campaign_name, None)
+            except Exception:
+                if not continue_on_error:
+                    raise
+                # Failed campaigns are omitted from the results
+                continue
+            if saved is not None:
+                results[campaign_name] = saved[0]
+        return results
+
+    with ThreadPoolExecutor(
+        max_workers=max_workers, thread_name_prefix="foothold-save"
+    ) as executor:
+        # Tasks are never cancelled: a cancelled task would not stop its worker
+        # thread, which would still write its checkpoint
+        outcomes = await asyncio.gather(
+            *(
+                save_one(idx, campaign_name, executor)
+                for idx, campaign_name in enumerate(grouped, start=1)
+            ),
+            return_exceptions=True,
+        )
+
+    if failed_idx is not None and not continue_on_error:
+        # Campaigns after the failing one were not saved sequentially: remove
+        # the checkpoints they created while the batch was being aborted
+        for idx, (campaign_name, outcome) in enumerate(zip(grouped, outcomes, strict=True), 1):
+            if idx <= failed_idx or not isinstance(outcome, tuple) or not outcome[1]:
+                continue
+            checkpoint_path = outcome[0]
+            logger.warning(
+                f"Deleting checkpoint {checkpoint_path.name} of campaign "
+                f"'{campaign_name}', saved after the batch failed"
+            )
+            try:
+                await delete_checkpoint(checkpoint_path, force=True)
+            except (OSError, ValueError) as e:
+                logger.error(f"Cannot delete checkpoint {checkpoint_path.name}: {e}")
+        raise cast(BaseException, outcomes[failed_idx - 1])
+
+    for campaign_name, outcome in zip(grouped, outcomes, strict=True):
+        if isinstance(outcome, tuple):
+            results[campaign_name] = outcome[0]
+
+    return results
+
+
+def _scan_source_campaigns(
+    source_dir: Path, config: "Config"
+) -> tuple[dict[str, list[str]], dict[str, ScannedFile]]:
+    """Scan a source directory once and group its files by campaign.
+
+    Only configured campaign files and Foothold_Ranks.lua are stat'ed; the
+    other files of the directory are skipped by name.
+
+    Args:
+        source_dir: Directory containing campaign files.
+        config: Configuration object containing campaign definitions.
+
+    Returns:
+        Tuple of the campaign files grouped by campaign (see detect_campaigns)
+        and the scanned files by name, whose stat data is reused for checksums.
+    """
+    scanned = scan_directory(source_dir, campaign_file_filter(config))
+    return detect_campaigns(list(scanned), config), scanned
+
+
+def _campaign_source_files(
+    campaign_name: str,
+    source_dir: Path,
+    grouped: dict[str, list[str]],
+    scanned: Mapping[str, ScannedFile] | None = None,
+) -> list[Path]:
+    """Return the files of a campaign in a grouped directory scan, plus the ranks file.
+
+    Args:
+        campaign_name: Name of the campaign (case-insensitive match).
+        source_dir: Directory containing the campaign files.
+        grouped: Campaign files grouped by campaign (from _scan_source_campaigns).
+        scanned: Files found by the same scan; used to check for the ranks
+            file without another stat().
+
+    Returns:
+        Paths of the campaign files, followed by Foothold_Ranks.lua if it exists.
+
+    Raises:
+        ValueError: If no campaign files are found for the campaign.
+    """
+    # Find campaign files (case-insensitive match)
+    campaign_files_names = None
+    for camp_name, files in grouped.items():
+        if camp_name.lower() == campaign_name.lower():
+            campaign_files_names = files
+            break
+
+    if not campaign_files_names:
+        raise ValueError(
+            f"No campaign files found for campaign '{campaign_name}' in {source_dir}. "
+            f"Available campaigns: {', '.join(grouped.keys()) if grouped else 'none'}"
+        )
+
+    # Build full paths for campaign files
+    campaign_files = [source_dir / fname for fname in campaign_files_names]
+
+    # Add Foothold_Ranks.lua if it exists
+    ranks_file = source_dir / "Foothold_Ranks.lua"
+    if ranks_file.name in scanned if scanned is not None else ranks_file.exists():
+        campaign_files.append(ranks_file)
+
+    return campaign_files
+
+
+async def _save_campaign_checkpoint(
+    campaign_name: str,
+    server_name: str,
+    source_dir: Path,
+    output_dir: Path,
+    grouped: dict[str, list[str]],
+    scanned: Mapping[str, ScannedFile] | None = None,
+    created_at: datetime | None = None,
+    name: str | None = None,
+    comment: str | None = None,
+    is_auto_backup: bool = False,
+    progress_callback: Callable[[str, int, int], None] | None = None,
+    hooks: "EventHooks | None" = None,
+    executor: "Executor | None" = None,
+    storage_backend: str = "zip",
+    skip_unchanged: bool = False,
+    compression: "CompressionConfig | None" = None,
+) -> tuple[Path, bool]:
+    """Create a checkpoint for one campaign from an already grouped directory scan.
+
+    Shared by save_checkpoint and save_all_campaigns so that a batch save scans the
+    source directory and groups campaign files only once.
+
+    Args:
+        campaign_name: Name of the campaign to save (case-insensitive match).
+        server_name: Name of the server where checkpoint is created.
+        source_dir: Directory containing the campaign files.
+        output_dir: Directory where the checkpoint ZIP will be saved.
+        grouped: Campaign files grouped by campaign (from _scan_source_campaigns).
+        scanned: Files found by the same scan, whose stat data is reused when
+            checking for unchanged files.
+        created_at: Optional checkpoint timestamp.
+        name: Optional user-provided name for the checkpoint.
+        comment: Optional user-provided comment for the checkpoint.
+        is_auto_backup: Whether this checkpoint is an automatic backup.
+        progress_callback: Optional progress callback, always invoked from the
+            event loop thread.
+        hooks: Optional event hooks for operation notifications.
+        executor: Optional executor running the checksum/ZIP work. If None, the
+            shared I/O pool from the executor module is used.
+        storage_backend: Checkpoint storage backend ("zip" or "dedup").
+        skip_unchanged: If True, return the newest existing checkpoint instead of
+            creating a new one when no campaign file changed since.
+        compression: Compression settings for the checkpoint archive.
+
+    Returns:
+        Path to the created checkpoint ZIP file (or the existing unchanged one),
+        and whether it was created by this call.
+
+    Raises:
+        ValueError: If no campaign files are found for the campaign.
+        OSError: If checkpoint creation fails (disk full, etc.).
+    """
+    import asyncio
+    import functools
+
+    from .events import safe_invoke_hook
+    from .executor import get_executor, run_blocking, threadsafe_callback
+    from .hashcache import get_hash_cache
+
+    campaign_files = _campaign_source_files(campaign_name, source_dir, grouped, scanned)
+
+    # Incremental save: nothing to do if the newest checkpoint already has these files
+    if skip_unchanged:
+        unchanged_path = await run_blocking(
+            find_unchanged_checkpoint,
+            campaign_name,
+            server_name,
+            campaign_files,
+            output_dir,
+            scanned,
+        )
+        if unchanged_path is not None:
+            logger.info(f"No changes for campaign '{campaign_name}' since {unchanged_path.name}")
             if progress_callback:
-                progress_callback(
-                    f"Saving campaign {idx}/{total_campaigns}: {campaign_name}",
-                    idx,
-                    total_campaigns,
+                progress_callback(f"No changes since {unchanged_path.name}, skipped", 1, 1)
+            return unchanged_path, False
+
+    # Wrap progress callback to also trigger on_save_progress hook
+    def combined_progress_callback(message: str, current: int, total: int) -> None:
+        # Call original callback if provided
+        if progress_callback:
+            progress_callback(message, current, total)
+
+        # Trigger on_save_progress hook (sync wrapper for async hook)
+        if hooks and hooks.on_save_progress:
+            asyncio.create_task(
+                safe_invoke_hook(
+                    hooks.on_save_progress, current, total, hook_name="on_save_progress"
                 )
+            )
 
-            checkpoint_path = await save_checkpoint(
-                campaign_name=campaign_name,
-                server_name=server_name,
-                source_dir=source_dir,
-                output_dir=output_dir,
-                config=config,
-                created_at=created_at,
-                name=name,
-                comment=comment,
-                progress_callback=progress_callback,
-                hooks=hooks,
+    # Run checksum and ZIP work off the event loop; progress is forwarded to the loop
+    checkpoint_path = await asyncio.get_running_loop().run_in_executor(
+        executor or get_executor(),
+        functools.partial(
+            create_checkpoint,
+            campaign_name=campaign_name,
+            server_name=server_name,
+            campaign_files=campaign_files,
+            output_dir=output_dir,
+            created_at=created_at,
+            name=name,
+            comment=comment,
+            is_auto_backup=is_auto_backup,
+            progress_callback=threadsafe_callback(combined_progress_callback),
+            storage_backend=storage_backend,
+            hash_cache=get_hash_cache(output_dir),
+            compression=compression,
+        ),
+    )
+
+    # Trigger on_save_complete hook
+    if hooks:
+        await safe_invoke_hook(
+            hooks.on_save_complete, checkpoint_path, hook_name="on_save_complete"
+        )
+
+    return checkpoint_path, True
+
+
+def find_unchanged_checkpoint(
+    campaign_name: str,
+    server_name: str,
+    campaign_files: list[Path],
+    checkpoints_dir: str | Path,
+    scanned: Mapping[str, ScannedFile] | None = None,
+) -> Path | None:
+    """Find the newest checkpoint whose files match the current campaign files.
+
+    Compares the current files against the ``files`` checksums recorded in the
+    newest manual checkpoint of the same campaign and server. Checksums come
+    from the persistent hash cache, so unchanged files are only stat'ed, not
+    hashed. Automatic backups are ignored: retention prunes them under their
+    own rule, so they must not stand in for a manual save.
+
+    Args:
+        campaign_name: Campaign name (case-insensitive match).
+        server_name: Server name the checkpoint was created on.
+        campaign_files: Current campaign files (including Foothold_Ranks.lua if
+            it would be saved).
+        checkpoints_dir: Directory containing the checkpoints.
+        scanned: Optional scan_directory result for the source directory,
+            whose stat data is reused by the hash cache.
+
+    Returns:
+        Path to the newest manual checkpoint if it holds exactly the current
+        files, or None if there is no such checkpoint or any file changed.
+
+    Example:
+        >>> existing = find_unchanged_checkpoint(
+        ...     "afghanistan", "production-1", files, Path("C:/checkpoints")
+        ... )
+        >>> if existing:
+        ...     print(f"No change since {existing.name}")
+    """
+    from .catalog import get_catalog
+    from .hashcache import get_hash_cache
+
+    checkpoints_dir = Path(checkpoints_dir)
+    if not checkpoints_dir.is_dir():
+        return None
+
+    newest: tuple[str, str, dict[str, str]] | None = None
+    for entry in get_catalog(checkpoints_dir).refresh():
+        metadata = entry.metadata
+        if (
+            metadata
+            and str(metadata.get("campaign_name", "")).lower() == campaign_name.lower()
+            and metadata.get("server_name") == server_name
+            and not metadata.get("is_auto_backup", False)
+        ):
+            created_at = str(metadata.get("created_at", ""))
+            if newest is None or created_at > newest[0]:
+                newest = (created_at, entry.filename, metadata.get("files", {}))
+
+    if newest is None:
+        return None
+
+    _, newest_filename, expected_files = newest
+    if {f.name for f in campaign_files} != set(expected_files):
+        return None
+
+    cache = get_hash_cache(checkpoints_dir)
+    try:
+        unchanged = all(
+            cache.checksum(f, _scanned_file(scanned, f)) == expected_files[f.name]
+            for f in campaign_files
+        )
+    finally:
+        cache.save()
+
+    return checkpoints_dir / newest_filename if unchanged else None
+
+
+def _scanned_file(scanned: Mapping[str, ScannedFile] | None, path: Path) -> ScannedFile | None:
+    """Return the scan record of a file, if the scan covered that exact path."""
+    if scanned is None:
+        return None
+    record = scanned.get(path.name)
+    return record if record is not None and record.path == path else None
+
+
+def find_matching_checkpoint(
+    campaign_name: str,
+    campaign_files: list[Path],
+    checkpoints_dir: str | Path,
+    scanned: Mapping[str, ScannedFile] | None = None,
+) -> Path | None:
+    """Find the newest checkpoint holding exactly the given campaign files.
+
+    Unlike find_unchanged_checkpoint, every checkpoint of the campaign is
+    considered (any server, manual or auto-backup), not just the newest one.
+    Current files are only hashed if a checkpoint with the same file names
+    exists, and checksums come from the persistent hash cache.
+
+    Args:
+        campaign_name: Campaign name (case-insensitive match).
+        campaign_files: Current campaign files (including Foothold_Ranks.lua if
+            it would be saved).
+        checkpoints_dir: Directory containing the checkpoints.
+        scanned: Optional scan_directory result for the source directory,
+            whose stat data is reused by the hash cache.
+
+    Returns:
+        Path to the newest checkpoint whose recorded checksums match the
+        current files, or None if there is none.
+
+    Example:
+        >>> existing = find_matching_checkpoint("afghanistan", files, Path("C:/checkpoints"))
+        >>> if existing:
+        ...     print(f"Current state already saved in {existing.name}")
+    """
+    from .catalog import get_catalog
+    from .hashcache import get_hash_cache
+
+    checkpoints_dir = Path(checkpoints_dir)
+    if not campaign_files or not checkpoints_dir.is_dir():
+        return None
+
+    names = {f.name for f in campaign_files}
+    candidates: list[tuple[str, str, dict[str, str]]] = []
+    for entry in get_catalog(checkpoints_dir).refresh():
+        metadata = entry.metadata
+        if (
+            metadata
+            and str(metadata.get("campaign_name", "")).lower() == campaign_name.lower()
+            and set(metadata.get("files", {})) == names
+        ):
+            candidates.append(
+                (str(metadata.get("created_at", "")), entry.filename, metadata["files"])
             )
 
-            results[campaign_name] = checkpoint_path
+    if not candidates:
+        return None
 
-        except Exception:
-            if not continue_on_error:
-                raise
-            # Log error but continue (in production, would use proper logging)
-            # For now, silently skip failed campaigns
+    cache = get_hash_cache(checkpoints_dir)
+    try:
+        current = {f.name: cache.checksum(f, _scanned_file(scanned, f)) for f in campaign_files}
+    finally:
+        cache.save()
 
-    return results
+    matches = [
+        (created_at, filename) for created_at, filename, files in candidates if files == current
+    ]
+    return checkpoints_dir / max(matches)[1] if matches else None
 
 
 def check_restore_conflicts(
-    checkpoint_path: str | Path,
+    checkpoint_path: "str | Path | CheckpointArchive",
     target_dir: str | Path,
     restore_ranks: bool = False,
 ) -> list[str]:
     """Check which files would be overwritten during restoration.
 
     Args:
-        checkpoint_path: Path to the checkpoint ZIP file.
+        checkpoint_path: Path to the checkpoint ZIP file, or an open
+            CheckpointArchive to reuse.
         target_dir: Path to the directory where files would be extracted.
         restore_ranks: If True, include Foothold_Ranks.lua in check.
 
@@ -327,49 +978,32 @@ def check_restore_conflicts(
         FileNotFoundError: If checkpoint_path or target_dir doesn't exist.
         ValueError: If checkpoint is not a valid ZIP or metadata is missing.
     """
-    import zipfile
+    from .archive import open_archive
 
-    checkpoint_path = Path(checkpoint_path)
     target_dir = Path(target_dir)
 
-    # Validate checkpoint file exists
-    if not checkpoint_path.exists():
-        raise FileNotFoundError("Checkpoint file not found")
+    with open_archive(checkpoint_path) as archive:
+        # Validate checkpoint exists and is a valid ZIP
+        archive.validate()
 
-    # Validate checkpoint is a valid ZIP
-    if not zipfile.is_zipfile(checkpoint_path):
-        raise ValueError("Invalid checkpoint file (not a valid ZIP archive)")
-
-    # Validate target directory exists
-    if not target_dir.exists():
-        raise FileNotFoundError("Target directory does not exist")
+        # Validate target directory exists
+        if not target_dir.exists():
+            raise FileNotFoundError("Target directory does not exist")
 
-    # Open ZIP and get file list
-    with zipfile.ZipFile(checkpoint_path, "r") as zf:
-        # Get list of files that would be restored
-        all_files_in_zip = [
-            name for name in zf.namelist() if name != "metadata.json" and not name.endswith("/")
+        # Files that would be restored (from the manifest for dedup checkpoints),
+        # without Foothold_Ranks.lua unless requested
+        files_to_restore = [
+            filename
+            for filename in archive.members
+            if filename != "Foothold_Ranks.lua" or restore_ranks
         ]
 
-        # Filter out Foothold_Ranks.lua if not requested
-        files_to_restore = []
-        for filename in all_files_in_zip:
-            if filename == "Foothold_Ranks.lua" and not restore_ranks:
-                continue
-            files_to_restore.append(filename)
-
         # Check which files already exist
-        existing_files = []
-        for filename in files_to_restore:
-            target_file = target_dir / filename
-            if target_file.exists():
-                existing_files.append(filename)
-
-        return existing_files
+        return [filename for filename in files_to_restore if (target_dir / filename).exists()]
 
 
 async def create_auto_backup(
-    checkpoint_path: Path,
+    checkpoint_path: "Path | CheckpointArchive",
     target_dir: Path,
     server_name: str,
     checkpoints_dir: Path,
@@ -382,8 +1016,19 @@ async def create_auto_backup(
     Creates a timestamped checkpoint of the current state before performing
     a restore operation. This provides a safety net to revert changes if needed.
 
+    No backup is written when the current campaign files are identical to an
+    existing checkpoint (e.g. restoring twice in a row, or right after a save):
+    that checkpoint already is the safety net and its path is returned instead.
+
+    With config.auto_backup_mode "snapshot", the campaign files are only cloned
+    into a pending snapshot (see the snapshot module) and the snapshot
+    directory is returned. The auto-backup ZIP is only written when the
+    snapshot is compacted: restore_checkpoint schedules that once the restore
+    is done, and compact_pending_snapshots picks up any snapshot left behind.
+
     Args:
-        checkpoint_path: Path to the checkpoint that will be restored (used to extract campaign name).
+        checkpoint_path: Path to the checkpoint that will be restored (used to extract
+            campaign name), or an open CheckpointArchive to reuse.
         target_dir: Directory containing current campaign files to backup.
         server_name: Name of the server (used in metadata).
         checkpoints_dir: Directory where the auto-backup checkpoint will be saved.
@@ -392,7 +1037,9 @@ async def create_auto_backup(
         hooks: Optional event hooks for operation notifications.
 
     Returns:
-        Path to the created auto-backup checkpoint, or None if backup failed.
+        Path to the created auto-backup checkpoint (or to the existing checkpoint
+        already holding the current state, or to the pending snapshot directory
+        in snapshot mode), or None if backup failed.
 
     Raises:
         ValueError: If checkpoint metadata is invalid or campaign files not found.
@@ -407,31 +1054,57 @@ async def create_auto_backup(
         ...     config=config
         ... )
     """
-    import json
-    import zipfile
+    from .archive import open_archive
+    from .executor import run_blocking
 
     # Read metadata from the checkpoint to get campaign name
-    try:
-        with zipfile.ZipFile(checkpoint_path, "r") as zf:
-            if "metadata.json" not in zf.namelist():
-                raise ValueError("Invalid checkpoint (missing metadata)")
-
-            metadata_json = zf.read("metadata.json").decode("utf-8")
-            metadata = json.loads(metadata_json)
-            campaign_name = metadata.get("campaign_name")
+    with open_archive(checkpoint_path) as archive:
+        try:
+            campaign_name = archive.metadata.get("campaign_name")
+        except ValueError as e:
+            raise ValueError(f"Failed to read checkpoint metadata: {e}") from e
+        checkpoint_stem = archive.path.stem
+        restored_names = archive.members
 
-            if not campaign_name:
-                raise ValueError("Campaign name not found in checkpoint metadata")
+    if not campaign_name:
+        raise ValueError("Campaign name not found in checkpoint metadata")
 
-    except (zipfile.BadZipFile, json.JSONDecodeError, KeyError) as e:
-        raise ValueError(f"Failed to read checkpoint metadata: {e}") from e
+    # Don't duplicate a checkpoint that already holds the current state
+    grouped, scanned = _scan_source_campaigns(target_dir, config)
+    try:
+        current_files = _campaign_source_files(campaign_name, target_dir, grouped, scanned)
+    except ValueError:
+        # No campaign files found - this is OK, nothing to backup
+        return None
+    existing = await run_blocking(
+        find_matching_checkpoint, campaign_name, current_files, checkpoints_dir, scanned
+    )
+    if existing is not None:
+        logger.info(f"Current state of '{campaign_name}' already saved in {existing.name}")
+        if progress_callback:
+            progress_callback(f"Current state already saved in {existing.name}", 1, 1)
+        return existing
 
     # Generate auto-backup name with UTC timestamp
     timestamp = datetime.now(timezone.utc)
     backup_name = f"auto-backup-{timestamp.strftime('%Y%m%d-%H%M%S')}"
 
     # Generate descriptive comment
-    backup_comment = f"Automatic backup before restoring {checkpoint_path.stem}"
+    backup_comment = f"Automatic backup before restoring {checkpoint_stem}"
+
+    if config.auto_backup_mode == "snapshot":
+        return await _create_snapshot_backup(
+            campaign_name=campaign_name,
+            server_name=server_name,
+            campaign_files=current_files,
+            checkpoints_dir=checkpoints_dir,
+            created_at=timestamp,
+            name=backup_name,
+            comment=backup_comment,
+            replaced={
+                config.campaign_index.canonical_name(f, campaign_name) for f in restored_names
+            },
+        )
 
     # Create the backup checkpoint
     try:
@@ -457,50 +1130,229 @@ async def create_auto_backup(
         raise
 
 
-def _get_canonical_filename(filename: str, campaign_name: str, config: "Config") -> str:
-    """Get canonical (current) filename for a file that may have evolved names.
+async def _create_snapshot_backup(
+    campaign_name: str,
+    server_name: str,
+    campaign_files: list[Path],
+    checkpoints_dir: Path,
+    created_at: datetime,
+    name: str,
+    comment: str,
+    replaced: set[str],
+) -> Path:
+    """Snapshot the current campaign files for a later compaction.
+
+    Args:
+        campaign_name: Campaign being restored.
+        server_name: Name of the server (used in metadata).
+        campaign_files: Current campaign files to back up.
+        checkpoints_dir: Directory where the auto-backup checkpoint will be saved.
+        created_at: Timestamp of the auto-backup.
+        name: Name of the auto-backup.
+        comment: Comment of the auto-backup.
+        replaced: Names of the files the restore replaces (safe to hardlink).
+
+    Returns:
+        Path of the snapshot directory. The auto-backup checkpoint does not
+        exist until the snapshot is compacted (see _compact_after_restore).
+    """
+    from .executor import run_blocking
+    from .snapshot import create_snapshot
+
+    # Foothold_Ranks.lua is rewritten in place by the mission, never hardlink it
+    replaced = replaced - {"Foothold_Ranks.lua"}
+
+    return await run_blocking(
+        create_snapshot,
+        campaign_name,
+        server_name,
+        campaign_files,
+        checkpoints_dir,
+        created_at,
+        name,
+        comment,
+        replaced,
+    )
+
+
+def _compact_after_restore(
+    snapshot_dir: Path, config: "Config", hooks: "EventHooks | None" = None
+) -> None:
+    """Compact a pending auto-backup snapshot in the background.
+
+    Called once the restore has replaced the campaign files (or failed), so
+    compression does not compete with the restore for the I/O pool. The
+    on_backup_complete hook is invoked on the event loop with the auto-backup
+    checkpoint once it has been written.
+
+    Args:
+        snapshot_dir: Snapshot created for the auto-backup.
+        config: Configuration (checkpoints directory, backend and compression).
+        hooks: Optional event hooks for operation notifications.
+    """
+    import asyncio
+
+    from .events import safe_invoke_hook
+    from .snapshot import schedule_compaction
+
+    future = schedule_compaction(Path(config.checkpoints_dir), config)
+    if hooks is None or hooks.on_backup_complete is None:
+        return
+    on_backup_complete = hooks.on_backup_complete
+    loop = asyncio.get_running_loop()
+
+    def notify(backup_path: Path) -> None:
+        asyncio.create_task(
+            safe_invoke_hook(on_backup_complete, backup_path, hook_name="on_backup_complete")
+        )
+
+    def compacted(done: "Future[list[Path]]") -> None:
+        if done.cancelled() or done.exception() is not None:
+            return
+        for backup_path in done.result():
+            if backup_path.stem != snapshot_dir.name:
+                continue
+            try:
+                loop.call_soon_threadsafe(notify, backup_path)
+            except RuntimeError:
+                # The event loop is gone (e.g. a CLI run that already returned)
+                logger.debug(
+                    f"Auto-backup {backup_path.name} compacted after the event loop closed"
+                )
+
+    future.add_done_callback(compacted)
+
+
+def _stage_checkpoint_member(
+    archive: "CheckpointArchive",
+    member: str,
+    target_file: Path,
+    cancelled: "threading.Event | None" = None,
+    private: bool = False,
+) -> tuple[Path, str]:
+    """Decompress a checkpoint member into a temporary file next to its target.
+
+    The member is streamed in chunks and hashed on the fly, so it is decompressed
+    only once and never held in memory as a whole. The temporary file lives in the
+    target directory so it can later be moved into place with an atomic rename.
+
+    Args:
+        archive: Checkpoint archive (deduplicated checkpoints are read from
+            the blob store).
+        member: Name of the campaign file to extract.
+        target_file: Final path of the restored file.
+        cancelled: Optional event telling the staging to stop early (set when
+            another member of the same restore failed).
+        private: Whether to read through a dedicated file handle, for members
+            staged concurrently (see CheckpointArchive.open).
+
+    Returns:
+        Tuple of (temporary file path, SHA-256 hex digest of the member content).
+
+    Raises:
+        OSError: If the temporary file cannot be written (e.g., disk full).
+        JobCancelled: If cancelled was set before the member was fully staged.
+    """
+    import hashlib
+    import tempfile
+
+    from .executor import JobCancelled
+
+    sha256_hash = hashlib.sha256()
+    fd, temp_name = tempfile.mkstemp(
+        prefix=f".{target_file.name}.", suffix=".restore-tmp", dir=target_file.parent
+    )
+    temp_file = Path(temp_name)
+    try:
+        with os.fdopen(fd, "wb") as out, archive.open(member, "r", private) as src:
+            while chunk := src.read(_RESTORE_CHUNK_SIZE):
+                if cancelled is not None and cancelled.is_set():
+                    raise JobCancelled(f"Staging of {member} cancelled")
+                sha256_hash.update(chunk)
+                out.write(chunk)
+    except BaseException:
+        temp_file.unlink(missing_ok=True)
+        raise
+
+    return temp_file, sha256_hash.hexdigest()
+
+
+def _stage_verified_member(
+    archive: "CheckpointArchive",
+    filename: str,
+    target_file: Path,
+    expected_checksum: str | None,
+    private: bool,
+    cancelled: "threading.Event",
+) -> tuple[str, Path, Path]:
+    """Stage a checkpoint member and verify it against its recorded checksum.
 
-    When a campaign's files have been renamed over time, the config lists
-    multiple accepted names for the same file (old and new). This function
-    returns the first name in the list (the canonical/current name) if the
-    given filename matches any name in the list.
+    Runs in a worker of the I/O pool; the temporary file is removed if the
+    checksum does not match.
 
     Args:
-        filename: Original filename from checkpoint (may be old name)
-        campaign_name: Campaign ID to look up in config
-        config: Configuration object with campaign definitions
+        archive: Checkpoint being restored.
+        filename: Name of the campaign file in the checkpoint.
+        target_file: Final path of the restored file.
+        expected_checksum: Checksum recorded in the metadata, or None.
+        private: Whether to read through a dedicated file handle.
+        cancelled: Event set when another member of the restore failed.
 
     Returns:
-        Canonical filename (first in list) if found, otherwise original filename
+        Tuple of (filename, temporary file path, target file path).
 
-    Examples:
-        >>> # Config has: persistence.files = ["new.lua", "old.lua"]
-        >>> _get_canonical_filename("old.lua", "campaign", config)
-        "new.lua"  # Returns canonical name
-        >>> _get_canonical_filename("new.lua", "campaign", config)
-        "new.lua"  # Already canonical
-        >>> _get_canonical_filename("unknown.lua", "campaign", config)
-        "unknown.lua"  # Not in config, return as-is
+    Raises:
+        ValueError: If the checksum does not match, or if the blob of a
+            deduplicated checkpoint is missing.
+        OSError: If the temporary file cannot be written (e.g., disk full).
     """
-    # Check if campaigns dict is available and campaign exists in config
-    if config.campaigns is None or campaign_name not in config.campaigns:
-        return filename
+    # Deduplicated checkpoints are read from the blob store
+    try:
+        temp_file, computed_checksum = _stage_checkpoint_member(
+            archive, filename, target_file, cancelled, private
+        )
+    except FileNotFoundError as e:
+        if not archive.is_dedup:
+            raise
+        raise ValueError(f"Checkpoint data missing from blob store for file {filename}") from e
+
+    # Compare with metadata checksum (without the 'sha256:' prefix)
+    if expected_checksum:
+        expected_checksum = expected_checksum.removeprefix("sha256:")
+        if computed_checksum != expected_checksum:
+            temp_file.unlink(missing_ok=True)
+            raise ValueError(
+                f"Checksum mismatch for file {filename}: "
+                f"expected {expected_checksum}, got {computed_checksum}"
+            )
 
-    campaign = config.campaigns[campaign_name]
+    return filename, temp_file, target_file
 
-    # Check each file type list
-    for file_type_name in ["persistence", "ctld_save", "ctld_farps", "storage"]:
-        file_type = getattr(campaign.files, file_type_name)
-        if filename in file_type.files and file_type.files:
-            # Return first name (canonical/current)
-            return str(file_type.files[0])
 
-    # File not found in any list - return original name
-    return filename
+def _has_checksum(
+    file_path: Path, expected_checksum: str | None, hash_cache: "HashCache | None"
+) -> bool:
+    """Check whether a file exists with the checksum recorded in metadata.
+
+    Args:
+        file_path: File to check.
+        expected_checksum: Recorded checksum ("sha256:hexdigest" or bare hex
+            digest), or None if the metadata has none.
+        hash_cache: Optional hash cache (the file is hashed directly otherwise).
+
+    Returns:
+        True if the file exists and its content has the expected checksum.
+    """
+    from .checkpoint import compute_file_checksum
+
+    if not expected_checksum or not file_path.is_file():
+        return False
+    checksum = hash_cache.checksum(file_path) if hash_cache else compute_file_checksum(file_path)
+    return checksum.removeprefix("sha256:") == expected_checksum.removeprefix("sha256:")
 
 
 async def restore_checkpoint(
-    checkpoint_path: str | Path,
+    checkpoint_path: "str | Path | CheckpointArchive",
     target_dir: str | Path,
     restore_ranks: bool = False,
     progress_callback: Callable[[str, int, int], None] | None = None,
@@ -509,19 +1361,32 @@ async def restore_checkpoint(
     server_name: str | None = None,
     auto_backup: bool = True,
     hooks: "EventHooks | None" = None,
-) -> list[Path]:
+    differential: bool = False,
+) -> RestoreResult:
     """Restore a checkpoint to a target directory.
 
     Extracts campaign files from a checkpoint ZIP archive to the specified
     target directory after verifying file integrity with SHA-256 checksums.
     By default, excludes Foothold_Ranks.lua unless explicitly requested.
 
+    Each file is decompressed once, streamed into a temporary file next to its
+    target while being hashed, and atomically renamed into place only after all
+    checksums have been verified. Existing files are never left half-written.
+
     Before restoring, automatically creates a backup checkpoint of the current
     state (if auto_backup=True and server_name is provided). This provides a
     safety net to revert changes if needed.
 
+    With differential=True, target files whose current checksum already matches
+    the checksum recorded in the checkpoint metadata are neither decompressed nor
+    rewritten. Current checksums come from the hash cache of config.checkpoints_dir,
+    so files unchanged since they were last hashed (e.g. by the auto-backup) are
+    only stat'ed.
+
     Args:
-        checkpoint_path: Path to the checkpoint ZIP file to restore.
+        checkpoint_path: Path to the checkpoint ZIP file to restore, or an open
+            CheckpointArchive to reuse. The checkpoint is opened and its metadata
+            parsed once for the whole operation, including the auto-backup.
         target_dir: Path to the directory where files will be extracted.
         restore_ranks: If True, restore Foothold_Ranks.lua. If False (default),
             exclude ranks file from restoration.
@@ -540,9 +1405,13 @@ async def restore_checkpoint(
             checkpoint before restoring (default: True). The backup is saved with
             a timestamped name (auto-backup-YYYYMMDD-HHMMSS).
         hooks: Optional event hooks for operation notifications.
+        differential: If True, only rewrite the files whose content differs from
+            the checkpoint (default: False).
 
     Returns:
-        List of Path objects for the restored files (with potentially renamed paths).
+        RestoreResult: list of Path objects for the restored files (with
+        potentially renamed paths), whose ``skipped`` attribute lists the files
+        left untouched by a differential restore.
 
     Raises:
         FileNotFoundError: If checkpoint_path doesn't exist or target_dir doesn't exist.
@@ -552,37 +1421,32 @@ async def restore_checkpoint(
         RuntimeError: If user cancels overwrite confirmation.
         OSError: If restoration fails (e.g., disk full) or auto-backup creation fails.
     """
-    import json
-    import zipfile
+    import functools
 
+    from .archive import CheckpointArchive
     from .events import safe_invoke_hook
+    from .executor import run_blocking, run_blocking_all
+
+    # Open the checkpoint once for the whole restore (unless the caller shares one)
+    if isinstance(checkpoint_path, CheckpointArchive):
+        archive, owns_archive = checkpoint_path, False
+    else:
+        archive, owns_archive = CheckpointArchive(checkpoint_path), True
+    # Snapshot auto-backup to compact once the restore is done (snapshot mode)
+    pending_snapshot: Path | None = None
 
     try:
-        checkpoint_path = Path(checkpoint_path)
+        checkpoint_path = archive.path
         target_dir = Path(target_dir)
 
-        # Validate checkpoint file exists FIRST
-        if not checkpoint_path.exists():
-            raise FileNotFoundError("Checkpoint file not found")
-
-        # Validate checkpoint is a valid ZIP BEFORE trying to open it
-        if not zipfile.is_zipfile(checkpoint_path):
-            raise ValueError("Invalid checkpoint file (not a valid ZIP archive)")
+        # Validate checkpoint exists and is a valid ZIP FIRST
+        archive.validate()
 
         # Read metadata to get campaign name for hook
-        try:
-            with zipfile.ZipFile(checkpoint_path, "r") as zf:
-                if "metadata.json" in zf.namelist():
-                    metadata_json = zf.read("metadata.json").decode("utf-8")
-                    try:
-                        metadata = json.loads(metadata_json)
-                    except json.JSONDecodeError as e:
-                        raise ValueError(f"Invalid metadata JSON: {e}") from e
-                    campaign_name_for_hook = metadata.get("campaign_name", "unknown")
-                else:
-                    campaign_name_for_hook = "unknown"
-        except zipfile.BadZipFile as e:
-            raise ValueError(f"Invalid checkpoint file (not a valid ZIP archive): {e}") from e
+        if archive.has_metadata:
+            campaign_name_for_hook = archive.metadata.get("campaign_name", "unknown")
+        else:
+            campaign_name_for_hook = "unknown"
 
         # Trigger on_restore_start hook
         if hooks:
@@ -618,7 +1482,7 @@ async def restore_checkpoint(
 
             try:
                 backup_path = await create_auto_backup(
-                    checkpoint_path=checkpoint_path,
+                    checkpoint_path=archive,
                     target_dir=target_dir,
                     server_name=server_name,
                     checkpoints_dir=config.checkpoints_dir,
@@ -626,9 +1490,19 @@ async def restore_checkpoint(
                     progress_callback=progress_callback,
                     hooks=hooks,
                 )
-                if backup_path:
+                if backup_path and backup_path.is_dir():
+                    # Snapshot mode: the hook fires once the snapshot is compacted
+                    pending_snapshot = backup_path
+                    if progress_callback:
+                        progress_callback(
+                            f"Auto-backup: snapshot {backup_path.name}, "
+                            "compressed after the restore",
+                            1,
+                            1,
+                        )
+                elif backup_path:
                     if progress_callback:
-                        progress_callback(f"Auto-backup created: {backup_path.name}", 1, 1)
+                        progress_callback(f"Auto-backup: {backup_path.name}", 1, 1)
                     # Trigger on_backup_complete hook
                     if hooks:
                         await safe_invoke_hook(
@@ -642,64 +1516,82 @@ async def restore_checkpoint(
                 # Auto-backup failure is critical - don't proceed with restore
                 raise OSError(f"Failed to create automatic backup: {e}") from e
 
-        # Open ZIP and read metadata
-        with zipfile.ZipFile(checkpoint_path, "r") as zf:
-            # Check metadata.json exists
-            if "metadata.json" not in zf.namelist():
-                raise ValueError("Invalid checkpoint (missing metadata)")
+        # Metadata is parsed once per archive (missing metadata raises)
+        metadata = archive.metadata
 
-            # Read and parse metadata.json
-            try:
-                metadata_json = zf.read("metadata.json").decode("utf-8")
-                metadata = json.loads(metadata_json)
-            except json.JSONDecodeError as e:
-                raise ValueError(f"Invalid metadata JSON: {e}") from e
-
-            # Get list of files to restore
-            all_files_in_zip = [
-                name for name in zf.namelist() if name != "metadata.json" and not name.endswith("/")
-            ]
+        # Get list of files to restore (from the manifest for dedup checkpoints)
+        all_files_in_zip = archive.members
 
-            # Filter out Foothold_Ranks.lua if not requested
-            files_to_restore = []
-            for filename in all_files_in_zip:
-                if filename == "Foothold_Ranks.lua" and not restore_ranks:
-                    continue
-                files_to_restore.append(filename)
+        # Filter out Foothold_Ranks.lua if not requested
+        files_to_restore = []
+        for filename in all_files_in_zip:
+            if filename == "Foothold_Ranks.lua" and not restore_ranks:
+                continue
+            files_to_restore.append(filename)
+
+        if not files_to_restore:
+            return RestoreResult()
+
+        file_checksums = archive.checksums
 
-            if not files_to_restore:
-                return []
+        # Get campaign_name from metadata for file renaming
+        campaign_name = metadata.get("campaign_name") if config else None
 
-            # Verify checksums before extraction (silently - progress during extraction only)
-            # This avoids spinner/progress interference with confirmation prompts
-            file_checksums = metadata.get("files", {})
+        # Differential restore: current checksums of the targets, cached by stat data
+        hash_cache = None
+        if differential and config is not None:
+            from .hashcache import get_hash_cache
 
-            for _, filename in enumerate(files_to_restore, start=1):
-                # Extract file to temp location for checksum verification
-                file_data = zf.read(filename)
+            hash_cache = get_hash_cache(config.checkpoints_dir)
 
-                # Compute checksum of extracted data
-                import hashlib
+        # Decompress each file once into a temporary file next to its target while
+        # hashing it, so nothing is overwritten until every checksum is verified.
+        # Done silently - progress during extraction only - to avoid spinner/progress
+        # interference with confirmation prompts.
+        staged_files: list[tuple[str, Path, Path]] = []
+        restored_files: list[Path] = []
+        skipped_files: list[Path] = []
+        try:
+            to_stage: list[tuple[str, Path]] = []
+            for filename in files_to_restore:
+                # Determine target filename (with potential renaming if config provided)
+                target_filename = filename
+                if config and campaign_name:
+                    # Check if file should be renamed to canonical name
+                    target_filename = config.campaign_index.canonical_name(filename, campaign_name)
 
-                computed_checksum = hashlib.sha256(file_data).hexdigest()
+                target_file = target_dir / target_filename
 
-                # Compare with metadata checksum
-                expected_checksum = file_checksums.get(filename)
-                if expected_checksum:
-                    # Remove 'sha256:' prefix if present
-                    if expected_checksum.startswith("sha256:"):
-                        expected_checksum = expected_checksum[7:]  # len("sha256:") = 7
+                if differential and await run_blocking(
+                    _has_checksum, target_file, file_checksums.get(filename), hash_cache
+                ):
+                    skipped_files.append(target_file)
+                    continue
 
-                    if computed_checksum != expected_checksum:
-                        raise ValueError(
-                            f"Checksum mismatch for file {filename}: "
-                            f"expected {expected_checksum}, got {computed_checksum}"
-                        )
+                to_stage.append((filename, target_file))
+
+            # Members are decompressed and hashed concurrently in the I/O pool, off
+            # the event loop, each through its own file handle (a single member
+            # reuses the shared one); the first checksum mismatch stops the others
+            stage_jobs = [
+                functools.partial(
+                    _stage_verified_member,
+                    archive,
+                    filename,
+                    target_file,
+                    file_checksums.get(filename),
+                    len(to_stage) > 1,
+                )
+                for filename, target_file in to_stage
+            ]
+            staged_files = await run_blocking_all(
+                stage_jobs, discard=lambda staged: staged[1].unlink(missing_ok=True)
+            )
 
             # Check for existing files and prompt for confirmation (unless skipped)
             if not skip_overwrite_check:
                 existing_files = []
-                for filename in files_to_restore:
+                for filename, _, _ in staged_files:
                     target_file = target_dir / filename
                     if target_file.exists():
                         existing_files.append(filename)
@@ -707,46 +1599,42 @@ async def restore_checkpoint(
                 if existing_files:
                     # Prompt for confirmation
                     confirmation = input(
-                        f"Files will be overwritten ({len(existing_files)} files). Continue? (y/n): "
+                        f"Files will be overwritten ({len(existing_files)} files). "
+                        "Continue? (y/n): "
                     )
                     if confirmation.lower() != "y":
                         raise RuntimeError("Restoration cancelled by user")
 
-            # Extract files (with progress updates)
+            # Move verified files into place (with progress updates)
             if progress_callback:
-                progress_callback("Extracting files", 0, len(files_to_restore))
-
-            restored_files: list[Path] = []
-
-            # Get campaign_name from metadata for file renaming
-            campaign_name = metadata.get("campaign_name") if config else None
+                progress_callback("Extracting files", 0, len(staged_files))
+                if skipped_files:
+                    progress_callback(
+                        f"{len(skipped_files)} file(s) already up to date", 0, len(staged_files)
+                    )
 
-            for idx, filename in enumerate(files_to_restore, start=1):
+            for idx, (filename, temp_file, target_file) in enumerate(staged_files, start=1):
                 if progress_callback:
-                    progress_callback(f"Extracting {filename}", idx, len(files_to_restore))
+                    progress_callback(f"Extracting {filename}", idx, len(staged_files))
 
                 # Trigger on_restore_progress hook
                 if hooks:
                     await safe_invoke_hook(
                         hooks.on_restore_progress,
                         idx,
-                        len(files_to_restore),
+                        len(staged_files),
                         hook_name="on_restore_progress",
                     )
 
-                file_data = zf.read(filename)
-
-                # Determine target filename (with potential renaming if config provided)
-                target_filename = filename
-                if config and campaign_name:
-                    # Check if file should be renamed to canonical name
-                    target_filename = _get_canonical_filename(filename, campaign_name, config)
-
-                target_file = target_dir / target_filename
-
-                # Write file
-                target_file.write_bytes(file_data)
+                # Atomic rename: the target is either the old file or the verified one
+                os.replace(temp_file, target_file)
                 restored_files.append(target_file)
+        finally:
+            # Remove temporary files left behind by a failed or cancelled restore
+            for _, temp_file, _ in staged_files[len(restored_files) :]:
+                temp_file.unlink(missing_ok=True)
+            if hash_cache is not None:
+                hash_cache.save()
 
         # Trigger on_restore_complete hook
         if hooks:
@@ -755,148 +1643,338 @@ async def restore_checkpoint(
                 hooks.on_restore_complete, restored_file_names, hook_name="on_restore_complete"
             )
 
-        return restored_files
+        if skipped_files:
+            logger.info(
+                f"Differential restore of {checkpoint_path.name}: {len(restored_files)} file(s) "
+                f"written, {len(skipped_files)} already up to date"
+            )
+        return RestoreResult(restored_files, skipped_files)
 
     except Exception as e:
         # Trigger on_error hook
         if hooks:
             await safe_invoke_hook(hooks.on_error, e, hook_name="on_error")
         raise
+    finally:
+        if owns_archive:
+            archive.close()
+        if pending_snapshot is not None and config is not None:
+            _compact_after_restore(pending_snapshot, config, hooks)
+
+
+def _as_utc(value: datetime) -> datetime:
+    """Return a timezone-aware datetime, treating naive values as UTC."""
+    return value if value.tzinfo is not None else value.replace(tzinfo=timezone.utc)
+
+
+def checkpoint_matches(
+    campaign: str,
+    server: str,
+    created_at: datetime,
+    is_auto_backup: bool,
+    server_filter: str | None = None,
+    campaign_filter: str | None = None,
+    kind: str = "all",
+    since: datetime | None = None,
+    until: datetime | None = None,
+) -> bool:
+    """Check a checkpoint against the filters of list_checkpoints.
+
+    Shared by the catalog-level selection and by callers that already hold
+    CheckpointInfo records (such as the plugin's checkpoint selector).
+
+    Args:
+        campaign: Campaign name of the checkpoint.
+        server: Server name of the checkpoint.
+        created_at: Creation time of the checkpoint (timezone-aware).
+        is_auto_backup: Whether the checkpoint is an auto-backup.
+        server_filter: Server name to match (case-insensitive).
+        campaign_filter: Campaign name to match (case-insensitive).
+        kind: "all", "manual" or "auto".
+        since: Only match checkpoints created at or after this time (naive
+            values are taken as UTC).
+        until: Only match checkpoints created at or before this time.
+
+    Returns:
+        True if the checkpoint passes every filter.
+    """
+    if kind == "manual" and is_auto_backup:
+        return False
+    if kind == "auto" and not is_auto_backup:
+        return False
+    if server_filter and server.lower() != server_filter.lower():
+        return False
+    if campaign_filter and campaign.lower() != campaign_filter.lower():
+        return False
+    if since is not None and created_at < _as_utc(since):
+        return False
+    return until is None or created_at <= _as_utc(until)
+
+
+# Catalog entry with the fields list_checkpoints filters and sorts on:
+# (entry, campaign, server, created_at, is_auto_backup)
+_CheckpointRow = tuple["CatalogEntry", str, str, datetime, bool]
+
+_SORT_KEYS: dict[str, Callable[[_CheckpointRow], Any]] = {
+    # Manual checkpoints first, auto-backups last, each chronologically
+    "default": lambda row: (row[4], row[3]),
+    "timestamp": lambda row: row[3],
+    "size": lambda row: row[0].size,
+    "filename": lambda row: row[0].filename,
+    "campaign": lambda row: (row[1].lower(), row[3]),
+}
+
+
+def _select_checkpoints(
+    checkpoint_dir: Path,
+    server_filter: str | None,
+    campaign_filter: str | None,
+    kind: str,
+    since: datetime | None,
+    until: datetime | None,
+    sort: str,
+    descending: bool,
+    offset: int,
+    limit: int | None,
+) -> tuple[list[_CheckpointRow], int]:
+    """Filter, sort and page the catalog entries of a checkpoints directory.
+
+    Filters run on the cached catalog metadata, and only the requested page
+    is ordered (a bounded heap selection when a limit is given), so callers
+    build records for the page alone.
+
+    Returns:
+        Tuple of (rows of the requested page, number of matching checkpoints).
+
+    Raises:
+        FileNotFoundError: If checkpoint directory doesn't exist.
+        ValueError: If kind, sort, offset or limit is invalid.
+    """
+    import heapq
+
+    from .catalog import get_catalog
+
+    if kind not in CHECKPOINT_KINDS:
+        raise ValueError(
+            f"Invalid checkpoint type '{kind}' (expected one of: {', '.join(CHECKPOINT_KINDS)})"
+        )
+    if sort not in _SORT_KEYS:
+        raise ValueError(
+            f"Invalid sort key '{sort}' (expected one of: {', '.join(CHECKPOINT_SORT_KEYS)})"
+        )
+    if offset < 0 or (limit is not None and limit < 0):
+        raise ValueError("Offset and limit must not be negative")
+    if not checkpoint_dir.exists():
+        raise FileNotFoundError(f"Checkpoint directory not found: {checkpoint_dir}")
+
+    rows: list[_CheckpointRow] = []
+    # Revalidate the catalog with stat() only; ZIPs are opened only when new or changed
+    for entry in get_catalog(checkpoint_dir).refresh():
+        metadata = entry.metadata
+        if metadata is None:
+            # Skip corrupted or invalid checkpoint files
+            continue
+
+        # Extract required fields (using Pydantic field names)
+        campaign = metadata.get("campaign_name")
+        server = metadata.get("server_name")
+        timestamp = metadata.get("created_at")
+        if not campaign or not server or not timestamp:
+            # Skip if missing required fields
+            continue
+        try:
+            created_at = parse_checkpoint_timestamp(timestamp)
+        except (TypeError, ValueError):
+            continue
+
+        # Check metadata first, fallback to filename for old checkpoints
+        is_auto_backup = bool(
+            metadata.get("is_auto_backup", entry.filename.startswith("auto-backup-"))
+        )
+        if checkpoint_matches(
+            campaign,
+            server,
+            created_at,
+            is_auto_backup,
+            server_filter=server_filter,
+            campaign_filter=campaign_filter,
+            kind=kind,
+            since=since,
+            until=until,
+        ):
+            rows.append((entry, campaign, server, created_at, is_auto_backup))
+
+    key = _SORT_KEYS[sort]
+    if limit is None:
+        page = sorted(rows, key=key, reverse=descending)[offset:]
+    else:
+        select = heapq.nlargest if descending else heapq.nsmallest
+        page = select(offset + limit, rows, key=key)[offset:]
+    return page, len(rows)
+
+
+def _checkpoint_record(row: _CheckpointRow) -> CheckpointInfo:
+    """Build the CheckpointInfo returned by list_checkpoints."""
+    entry, campaign, server, created_at, is_auto_backup = row
+    metadata = entry.metadata or {}
+    return CheckpointInfo(
+        filename=entry.filename,
+        campaign=campaign,
+        server=server,
+        created_at=created_at,
+        size_bytes=entry.size,
+        name=metadata.get("name"),
+        comment=metadata.get("comment"),
+        is_auto_backup=is_auto_backup,
+        files=entry.members,
+    )
+
+
+async def iter_checkpoints(
+    checkpoint_dir: str | Path,
+    server_filter: str | None = None,
+    campaign_filter: str | None = None,
+    kind: str = "all",
+    since: datetime | None = None,
+    until: datetime | None = None,
+    sort: str = "default",
+    descending: bool = False,
+    offset: int = 0,
+    limit: int | None = None,
+) -> AsyncIterator[CheckpointInfo]:
+    """Stream the checkpoints of a directory, filtered, sorted and paged.
+
+    Filtering, sorting and paging are pushed down to the checkpoint catalog:
+    only the records of the requested page are built, so browsing page N
+    of a large repository costs the stat() scan of the catalog plus the page
+    itself. Use list_checkpoints when the number of matching checkpoints is
+    also needed.
+
+    Args:
+        checkpoint_dir: Path to the directory containing checkpoint files.
+        server_filter: Optional server name to filter checkpoints.
+        campaign_filter: Optional campaign name to filter checkpoints.
+        kind: "all", "manual" (no auto-backups) or "auto" (auto-backups only).
+        since: Only include checkpoints created at or after this time (naive
+            values are taken as UTC).
+        until: Only include checkpoints created at or before this time.
+        sort: One of CHECKPOINT_SORT_KEYS. "default" lists manual checkpoints
+            first and auto-backups last, each chronologically.
+        descending: Reverse the sort order.
+        offset: Number of matching checkpoints to skip.
+        limit: Maximum number of checkpoints to yield (None for all).
+
+    Yields:
+        CheckpointInfo records of the requested page.
+
+    Raises:
+        FileNotFoundError: If checkpoint directory doesn't exist.
+        ValueError: If kind, sort, offset or limit is invalid.
+
+    Example:
+        >>> async for cp in iter_checkpoints(
+        ...     "/path/to/checkpoints", kind="manual", sort="timestamp", descending=True, limit=20
+        ... ):
+        ...     print(cp.filename)
+    """
+    from .executor import run_blocking
+
+    rows, _ = await run_blocking(
+        _select_checkpoints,
+        Path(checkpoint_dir),
+        server_filter,
+        campaign_filter,
+        kind,
+        since,
+        until,
+        sort,
+        descending,
+        offset,
+        limit,
+    )
+    for row in rows:
+        yield _checkpoint_record(row)
 
 
 async def list_checkpoints(
     checkpoint_dir: str | Path,
     server_filter: str | None = None,
     campaign_filter: str | None = None,
-) -> list[dict]:
+    kind: str = "all",
+    since: datetime | None = None,
+    until: datetime | None = None,
+    sort: str = "default",
+    descending: bool = False,
+    offset: int = 0,
+    limit: int | None = None,
+) -> CheckpointList:
     """List all checkpoints in the checkpoint directory.
 
     Scans the checkpoint directory for valid checkpoint ZIP files and returns
-    their metadata. Optionally filters by server and/or campaign name.
+    their metadata. Optionally filters, sorts and pages the results (see
+    iter_checkpoints).
 
     Args:
         checkpoint_dir: Path to the directory containing checkpoint files.
         server_filter: Optional server name to filter checkpoints.
         campaign_filter: Optional campaign name to filter checkpoints.
+        kind: "all", "manual" (no auto-backups) or "auto" (auto-backups only).
+        since: Only include checkpoints created at or after this time.
+        until: Only include checkpoints created at or before this time.
+        sort: One of CHECKPOINT_SORT_KEYS.
+        descending: Reverse the sort order.
+        offset: Number of matching checkpoints to skip.
+        limit: Maximum number of checkpoints to return (None for all).
 
     Returns:
-        List of dictionaries containing checkpoint metadata. Each dictionary has:
-        - filename: Name of the checkpoint file (str)
-        - campaign: Campaign name (str)
-        - server: Server name (str)
-        - timestamp: ISO timestamp string (str)
-        - size_bytes: File size in bytes (int)
-        - size_human: Human-readable file size (str, e.g., "1.2 MB")
-        - name: Optional user-provided name (str | None)
-        - comment: Optional user-provided comment (str | None)
-
-        List is grouped (manual checkpoints first, auto-backups last) and sorted
-        within each group chronologically (oldest first, newest last).
+        CheckpointList of CheckpointInfo records, whose ``total`` attribute
+        is the number of matching checkpoints before offset and limit.
+
+        With the default sort, the list is grouped (manual checkpoints first,
+        auto-backups last) and sorted within each group chronologically
+        (oldest first, newest last).
 
     Raises:
         FileNotFoundError: If checkpoint directory doesn't exist.
+        ValueError: If kind, sort, offset or limit is invalid.
 
     Examples:
         >>> # List all checkpoints
         >>> checkpoints = await list_checkpoints("/path/to/checkpoints")
         >>> for cp in checkpoints:
-        ...     print(f"{cp['filename']}: {cp['campaign']} on {cp['server']}")
+        ...     print(f"{cp.filename}: {cp.campaign} on {cp.server}")
 
         >>> # Filter by server
         >>> checkpoints = await list_checkpoints("/path/to/checkpoints", server_filter="prod-1")
 
-        >>> # Filter by both server and campaign
-        >>> checkpoints = await list_checkpoints(
+        >>> # Second page of 20 manual checkpoints of a campaign, newest first
+        >>> page = await list_checkpoints(
         ...     "/path/to/checkpoints",
-        ...     server_filter="prod-1",
-        ...     campaign_filter="afghanistan"
+        ...     campaign_filter="afghanistan",
+        ...     kind="manual",
+        ...     sort="timestamp",
+        ...     descending=True,
+        ...     offset=20,
+        ...     limit=20,
         ... )
+        >>> print(f"{len(page)} of {page.total}")
     """
-    import json
-    import zipfile
-
-    checkpoint_dir = Path(checkpoint_dir)
-
-    # Validate checkpoint directory
-    if not checkpoint_dir.exists():
-        raise FileNotFoundError(f"Checkpoint directory not found: {checkpoint_dir}")
-
-    checkpoints = []
-
-    # Scan for ZIP files in checkpoint directory
-    for checkpoint_path in checkpoint_dir.glob("*.zip"):
-        try:
-            # Read metadata without extracting entire ZIP
-            with zipfile.ZipFile(checkpoint_path, "r") as zf:
-                # Check if metadata.json exists
-                if "metadata.json" not in zf.namelist():
-                    continue
-
-                # Read and parse metadata
-                metadata_bytes = zf.read("metadata.json")
-                metadata = json.loads(metadata_bytes.decode("utf-8"))
-
-                # Extract required fields (using Pydantic field names)
-                campaign = metadata.get("campaign_name")
-                server = metadata.get("server_name")
-                timestamp = metadata.get("created_at")
-
-                if not all([campaign, server, timestamp]):
-                    # Skip if missing required fields
-                    continue
-
-                # Apply filters (case-insensitive)
-                if server_filter and server.lower() != server_filter.lower():
-                    continue
-                if campaign_filter and campaign.lower() != campaign_filter.lower():
-                    continue
-
-                # Calculate file size
-                size_bytes = checkpoint_path.stat().st_size
-                size_human = _format_file_size(size_bytes)
-
-                # Get list of files in the checkpoint (excluding metadata.json)
-                files_in_checkpoint = [
-                    name
-                    for name in zf.namelist()
-                    if name != "metadata.json" and not name.endswith("/")
-                ]
-
-                # Build checkpoint info dictionary
-                checkpoint_info = {
-                    "filename": checkpoint_path.name,
-                    "campaign": campaign,
-                    "server": server,
-                    "timestamp": timestamp,
-                    "size_bytes": size_bytes,
-                    "size_human": size_human,
-                    "name": metadata.get("name"),
-                    "comment": metadata.get("comment"),
-                    "files": files_in_checkpoint,  # List of files in checkpoint
-                    # Check metadata first, fallback to filename for old checkpoints
-                    "is_auto_backup": metadata.get(
-                        "is_auto_backup", checkpoint_path.name.startswith("auto-backup-")
-                    ),
-                }
-
-                checkpoints.append(checkpoint_info)
-
-        except (zipfile.BadZipFile, json.JSONDecodeError, KeyError, OSError):
-            # Skip corrupted or invalid checkpoint files
-            continue
-
-    # Separate manual and auto-backup checkpoints
-    manual_checkpoints = [cp for cp in checkpoints if not cp["is_auto_backup"]]
-    auto_checkpoints = [cp for cp in checkpoints if cp["is_auto_backup"]]
-
-    # Sort each group by timestamp (oldest first = most recent last)
-    manual_checkpoints.sort(key=lambda cp: cp["timestamp"], reverse=False)
-    auto_checkpoints.sort(key=lambda cp: cp["timestamp"], reverse=False)
-
-    # Combine: manual first, then auto-backups
-    checkpoints = manual_checkpoints + auto_checkpoints
-
-    return checkpoints
+    from .executor import run_blocking
+
+    rows, total = await run_blocking(
+        _select_checkpoints,
+        Path(checkpoint_dir),
+        server_filter,
+        campaign_filter,
+        kind,
+        since,
+        until,
+        sort,
+        descending,
+        offset,
+        limit,
+    )
+    return CheckpointList([_checkpoint_record(row) for row in rows], total)
 
 
 async def delete_checkpoint(
@@ -942,6 +2020,8 @@ async def delete_checkpoint(
     import zipfile
     from zipfile import BadZipFile
 
+    from .blobstore import BlobStore
+    from .catalog import get_catalog
     from .events import safe_invoke_hook
 
     try:
@@ -1007,6 +2087,20 @@ async def delete_checkpoint(
             # Re-raise as-is for other OS errors (file in use, disk errors, etc.)
             raise
 
+        # Keep the checkpoint catalog in sync
+        catalog = get_catalog(checkpoint_path.parent)
+        catalog.forget(checkpoint_path.name)
+
+        # Release blobs no longer referenced by any deduplicated checkpoint
+        if metadata.get("storage_backend") == "dedup":
+            referenced = {
+                checksum
+                for entry in catalog.refresh()
+                if entry.metadata and entry.metadata.get("storage_backend") == "dedup"
+                for checksum in entry.metadata.get("files", {}).values()
+            }
+            BlobStore(checkpoint_path.parent).collect_garbage(referenced)
+
         # Trigger on_delete_complete hook
         if hooks:
             await safe_invoke_hook(
@@ -1022,6 +2116,129 @@ async def delete_checkpoint(
         raise
 
 
+async def export_checkpoint(
+    checkpoint_path: "str | Path | CheckpointArchive",
+    output_path: str | Path,
+    overwrite: bool = False,
+) -> Path:
+    """Export a checkpoint as a classic self-contained ZIP file.
+
+    Deduplicated checkpoints (storage_backend "dedup") are manifests whose file
+    contents live in the blob store; exporting materializes them into a portable
+    ZIP that can be copied to another machine or imported with any storage
+    backend. Classic checkpoints are copied as-is.
+
+    Args:
+        checkpoint_path: Path to the checkpoint ZIP file to export, or an open
+            CheckpointArchive to reuse.
+        output_path: Destination file, or existing directory (the checkpoint
+            filename is kept).
+        overwrite: If True, replace an existing destination file.
+
+    Returns:
+        Path to the exported ZIP file.
+
+    Raises:
+        FileNotFoundError: If the checkpoint does not exist.
+        FileExistsError: If the destination exists and overwrite is False.
+        ValueError: If the checkpoint is invalid, blob data is missing, or a
+            checksum does not match.
+        OSError: If the export cannot be written (e.g., disk full).
+
+    Example:
+        >>> exported = await export_checkpoint(
+        ...     "C:/checkpoints/afghanistan_2024-02-14_10-30-00.zip", "D:/transfer"
+        ... )
+    """
+    import shutil
+
+    from .archive import open_archive
+    from .executor import run_blocking
+
+    with open_archive(checkpoint_path) as archive:
+        checkpoint_path = archive.path
+        output_path = Path(output_path)
+
+        if not checkpoint_path.exists():
+            raise FileNotFoundError(f"Checkpoint file not found: {checkpoint_path.name}")
+
+        if output_path.is_dir():
+            output_path = output_path / checkpoint_path.name
+
+        if output_path.exists() and not overwrite:
+            raise FileExistsError(f"Export destination already exists: {output_path}")
+
+        metadata = archive.metadata
+
+    if metadata.get("storage_backend") != "dedup":
+        await run_blocking(shutil.copyfile, checkpoint_path, output_path)
+        return output_path
+
+    await run_blocking(_materialize_checkpoint, checkpoint_path.parent, metadata, output_path)
+    return output_path
+
+
+def _materialize_checkpoint(checkpoints_dir: Path, metadata: dict, output_path: Path) -> None:
+    """Write a self-contained ZIP for a deduplicated checkpoint manifest.
+
+    Contents are streamed from the blob store and verified against the manifest
+    checksums. The ZIP is written to a temporary file and renamed into place.
+
+    Args:
+        checkpoints_dir: Directory containing the manifest and its blob store.
+        metadata: Parsed metadata.json of the manifest.
+        output_path: Destination ZIP file.
+
+    Raises:
+        ValueError: If a blob is missing or its checksum does not match.
+        OSError: If the ZIP cannot be written.
+    """
+    import hashlib
+    import tempfile
+    import zipfile
+
+    from .blobstore import BlobStore
+    from .checkpoint import write_metadata_member
+
+    store = BlobStore(checkpoints_dir)
+    fd, temp_name = tempfile.mkstemp(
+        prefix=f".{output_path.name}.", suffix=".tmp", dir=output_path.parent
+    )
+    os.close(fd)
+    temp_path = Path(temp_name)
+
+    try:
+        with zipfile.ZipFile(temp_path, "w", zipfile.ZIP_DEFLATED) as zf:
+            for filename, checksum in metadata.get("files", {}).items():
+                sha256_hash = hashlib.sha256()
+                try:
+                    with store.open(checksum) as src, zf.open(filename, "w") as dst:
+                        while chunk := src.read(_RESTORE_CHUNK_SIZE):
+                            sha256_hash.update(chunk)
+                            dst.write(chunk)
+                except FileNotFoundError as e:
+                    raise ValueError(
+                        f"Checkpoint data missing from blob store for file {filename}"
+                    ) from e
+
+                if f"sha256:{sha256_hash.hexdigest()}" != checksum:
+                    raise ValueError(f"Checksum mismatch for file {filename} in blob store")
+
+            # Exported checkpoints are classic self-contained ZIPs
+            exported_metadata = {
+                **metadata,
+                "storage_backend": "zip",
+                "compression": "deflated",
+                "compression_level": None,
+            }
+            write_metadata_member(zf, exported_metadata)
+
+        os.replace(temp_path, output_path)
+    except BaseException:
+        temp_path.unlink(missing_ok=True)
+        raise
+
+
 def _format_file_size(size_bytes: int) -> str:
     """Format file size in human-readable format.
 
@@ -1124,14 +2341,9 @@ async def import_checkpoint(
     # Create output directory if it doesn't exist
     output_dir.mkdir(parents=True, exist_ok=True)
 
-    # Scan for campaign files matching the campaign name
-    all_files = list(source_dir.iterdir())
-    filenames = [f.name for f in all_files if f.is_file()]
-
-    # Use campaign module to detect and group files
-    from .campaign import detect_campaigns
-
-    grouped = detect_campaigns(filenames, config)
+    # Scan for campaign files, skipping unrelated files by name
+    scanned = scan_directory(source_dir, campaign_file_filter(config))
+    grouped = detect_campaigns(list(scanned), config)
 
     # Check if specified campaign exists
     if campaign_name not in grouped:
@@ -1157,7 +2369,7 @@ async def import_checkpoint(
 
     # Also check for Foothold_Ranks.lua (shared file)
     ranks_file = source_dir / "Foothold_Ranks.lua"
-    if ranks_file.is_file():
+    if ranks_file.name in scanned:
         campaign_files.append(ranks_file)
 
     if not campaign_files:
@@ -1166,51 +2378,35 @@ async def import_checkpoint(
     # Check for expected files from config and generate warnings for missing required files
     warnings = []
 
-    # Get campaign config to check for missing required files
-    campaign_config = config.campaigns.get(campaign_name) if config.campaigns else None
-    if campaign_config:
-        campaign_files_names_lower = [f.lower() for f in campaign_files_names]
-
-        # Check each file type in the config
-        for file_type_name in ["persistence", "ctld_save", "ctld_farps", "storage"]:
-            file_type = getattr(campaign_config.files, file_type_name, None)
-            if file_type and not file_type.optional:
-                # Check if any file from this type is present
-                configured_files = file_type.files
-                if configured_files:
-                    found = any(
-                        configured_file.lower() in campaign_files_names_lower
-                        for configured_file in configured_files
-                    )
-                    if not found:
-                        # Get friendly name for file type
-                        type_descriptions = {
-                            "persistence": "Campaign script file",
-                            "ctld_save": "CTLD Save data",
-                            "ctld_farps": "CTLD FARPS data",
-                            "storage": "Storage data file",
-                        }
-                        desc = type_descriptions.get(file_type_name, file_type_name)
-                        # Show the first configured filename as example
-                        example = (
-                            configured_files[0]
-                            if configured_files
-                            else f"(no {file_type_name} configured)"
-                        )
-                        warnings.append(f"{desc} not found: {example}")
+    # Warn about required file types with none of their accepted names present
+    type_descriptions = {
+        "persistence": "Campaign script file",
+        "ctld_save": "CTLD Save data",
+        "ctld_farps": "CTLD FARPS data",
+        "storage": "Storage data file",
+    }
+    for missing in config.campaign_index.missing_required_types(
+        campaign_name, campaign_files_names
+    ):
+        # Show the canonical filename as example
+        desc = type_descriptions[missing.file_type]
+        warnings.append(f"{desc} not found: {missing.canonical_name}")
 
     # Check for ranks file (always optional but good to warn)
-    if not ranks_file.exists():
+    if ranks_file.name not in scanned:
         warnings.append("Shared ranks file not found: Foothold_Ranks.lua")
 
-    # Use create_checkpoint to build the checkpoint
+    # Use create_checkpoint to build the checkpoint (off the event loop)
     from .checkpoint import create_checkpoint
+    from .executor import run_blocking
+    from .hashcache import get_hash_cache
 
     # Set default timestamp to current time
     if created_at is None:
         created_at = datetime.now(timezone.utc)
 
-    checkpoint_path = create_checkpoint(
+    checkpoint_path = await run_blocking(
+        create_checkpoint,
         campaign_name=campaign_name,
         server_name=server_name,
         campaign_files=campaign_files,
@@ -1218,6 +2414,9 @@ async def import_checkpoint(
         created_at=created_at,
         name=name,
         comment=comment,
+        storage_backend=config.storage_backend,
+        hash_cache=get_hash_cache(output_dir),
+        compression=config.compression_for(campaign_name),
     )
 
     if return_warnings:
@@ -1235,6 +2434,4 @@ def _is_writable(path: Path) -> bool:
     Returns:
         True if writable, False otherwise.
     """
-    import os
-
     return os.access(path, os.W_OK)
@@ -0,0 +1,509 @@
+"""Checkpoint integrity verification.
+
+Verifies that every campaign file of a checkpoint still has the SHA-256
+checksum recorded in its metadata. Decompression (zlib) and hashing both
+release the GIL, so members are verified concurrently in the shared I/O pool,
+each worker reading through its own file handle, and the first mismatch stops
+the other workers of the same checkpoint. A batch of checkpoints (e.g. the
+whole repository) is verified in parallel as well.
+
+scrub_checkpoints verifies a whole checkpoints directory incrementally: the
+size and modification time of each verified archive are recorded in
+``.foothold-verify.json``, so a rerun only verifies new or modified archives.
+A Throttle limits the read bandwidth and CPU share of the verification so a
+scrub can run continuously next to live DCS servers.
+
+Example:
+    >>> await verify_checkpoint(Path("checkpoints/syria_2024-02-14_10-30-00.zip"))
+    >>> report = await verify_checkpoints(sorted(Path("checkpoints").glob("*.zip")))
+    >>> broken = {path: error for path, error in report.items() if error}
+    >>> health = await scrub_checkpoints(Path("checkpoints"), Throttle(cpu_share=0.25))
+    >>> print(json.dumps(health.to_dict(), indent=2))
+"""
+
+import asyncio
+import functools
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+from .archive import CheckpointArchive
+from .executor import JobCancelled, run_blocking, run_blocking_all
+
+logger = logging.getLogger(__name__)
+
+# Chunk size used when hashing checkpoint members
+_VERIFY_CHUNK_SIZE = 1024 * 1024
+
+# Default number of checkpoints verified at the same time by verify_checkpoints
+DEFAULT_PARALLEL_CHECKPOINTS = 4
+
+# Name of the verification state file stored in the checkpoints directory
+VERIFY_STATE_FILENAME = ".foothold-verify.json"
+
+# Bump when the record layout changes; older states are discarded
+VERIFY_STATE_VERSION = 1
+
+
+class Throttle:
+    """Limits the read bandwidth and CPU share of verification workers.
+
+    Workers report each chunk they processed with consume(), which sleeps
+    long enough to honour both limits. The bandwidth limit is shared by all
+    workers; the CPU share applies to each worker.
+
+    Attributes:
+        max_bytes_per_second: Maximum checkpoint data read per second, or None
+        cpu_share: Maximum fraction of a CPU core used by a worker (0 < x <= 1),
+            or None
+    """
+
+    def __init__(
+        self, max_bytes_per_second: float | None = None, cpu_share: float | None = None
+    ) -> None:
+        """Initialize the throttle.
+
+        Args:
+            max_bytes_per_second: Maximum bytes read per second (None: unlimited).
+            cpu_share: Maximum fraction of a CPU core per worker (None: unlimited).
+
+        Raises:
+            ValueError: If a limit is out of range.
+        """
+        if max_bytes_per_second is not None and max_bytes_per_second <= 0:
+            raise ValueError(f"max_bytes_per_second must be positive, got {max_bytes_per_second}")
+        if cpu_share is not None and not 0 < cpu_share <= 1:
+            raise ValueError(f"cpu_share must be in (0, 1], got {cpu_share}")
+        self.max_bytes_per_second = max_bytes_per_second
+        self.cpu_share = cpu_share
+        self._available_at = 0.0
+        self._lock = threading.Lock()
+
+    def consume(self, nbytes: int, busy_seconds: float) -> None:
+        """Account for a processed chunk and sleep as needed.
+
+        Args:
+            nbytes: Number of bytes read.
+            busy_seconds: Time spent processing the chunk.
+        """
+        delay = 0.0
+        if self.cpu_share is not None:
+            delay = busy_seconds * (1 / self.cpu_share - 1)
+        if self.max_bytes_per_second is not None:
+            with self._lock:
+                now = time.monotonic()
+                self._available_at = max(self._available_at, now) + (
+                    nbytes / self.max_bytes_per_second
+                )
+                delay = max(delay, self._available_at - now)
+        if delay > 0:
+            time.sleep(delay)
+
+
+def _verify_member(
+    archive: CheckpointArchive,
+    member: str,
+    expected_checksum: str,
+    cancelled: threading.Event | None = None,
+    throttle: Throttle | None = None,
+) -> None:
+    """Hash one checkpoint member and compare it with its recorded checksum.
+
+    Args:
+        archive: Checkpoint being verified.
+        member: Name of the campaign file.
+        expected_checksum: Checksum recorded in the metadata.
+        cancelled: Optional event set when another member of the checkpoint failed.
+        throttle: Optional bandwidth and CPU limits.
+
+    Raises:
+        ValueError: If the checksum does not match, or if the blob of a
+            deduplicated checkpoint is missing.
+        JobCancelled: If cancelled was set before the member was fully read.
+    """
+    sha256_hash = hashlib.sha256()
+    try:
+        with archive.open(member, "r", private=True) as src:
+            started = time.perf_counter()
+            while chunk := src.read(_VERIFY_CHUNK_SIZE):
+                if cancelled is not None and cancelled.is_set():
+                    raise JobCancelled(f"Verification of {member} cancelled")
+                sha256_hash.update(chunk)
+                if throttle is not None:
+                    throttle.consume(len(chunk), time.perf_counter() - started)
+                    started = time.perf_counter()
+    except FileNotFoundError as e:
+        if not archive.is_dedup:
+            raise
+        raise ValueError(f"Checkpoint data missing from blob store for file {member}") from e
+
+    computed_checksum = sha256_hash.hexdigest()
+    expected_checksum = expected_checksum.removeprefix("sha256:")
+    if computed_checksum != expected_checksum:
+        raise ValueError(
+            f"Checksum mismatch for file {member}: "
+            f"expected {expected_checksum}, got {computed_checksum}"
+        )
+
+
+def _expected_checksums(archive: CheckpointArchive) -> dict[str, str]:
+    """Read the files to verify and check they are all present.
+
+    Args:
+        archive: Checkpoint being verified.
+
+    Returns:
+        Recorded checksum of each campaign file.
+
+    Raises:
+        FileNotFoundError: If the checkpoint file does not exist.
+        ValueError: If the checkpoint is invalid, or if a file has no recorded
+            checksum or is missing from the archive.
+    """
+    members = archive.members
+    checksums = archive.checksums
+    for member in members:
+        if member not in checksums:
+            raise ValueError(f"No checksum recorded for file {member}")
+    for filename in checksums:
+        if filename not in members:
+            raise ValueError(f"File {filename} missing from checkpoint")
+    return checksums
+
+
+def _verify_members_sequentially(
+    archive: CheckpointArchive, checksums: dict[str, str], throttle: Throttle
+) -> None:
+    """Verify the members of a checkpoint one after another (throttled mode)."""
+    for member, checksum in checksums.items():
+        _verify_member(archive, member, checksum, throttle=throttle)
+
+
+async def verify_checkpoint(
+    checkpoint_path: "str | Path | CheckpointArchive", throttle: Throttle | None = None
+) -> None:
+    """Verify every campaign file of a checkpoint against its metadata.
+
+    Members are verified concurrently, except when a throttle is given: a
+    throttled (background) verification then uses a single pool worker so it
+    never holds more of the shared pool than needed.
+
+    Args:
+        checkpoint_path: Path to the checkpoint ZIP file, or an open
+            CheckpointArchive to reuse.
+        throttle: Optional bandwidth and CPU limits.
+
+    Raises:
+        FileNotFoundError: If the checkpoint file does not exist.
+        ValueError: If the checkpoint is invalid or a file does not match its
+            recorded checksum (the first mismatch found).
+    """
+    if isinstance(checkpoint_path, CheckpointArchive):
+        archive, owns_archive = checkpoint_path, False
+    else:
+        archive, owns_archive = CheckpointArchive(checkpoint_path), True
+
+    try:
+        checksums = await run_blocking(_expected_checksums, archive)
+        if throttle is not None:
+            await run_blocking(_verify_members_sequentially, archive, checksums, throttle)
+            return
+        await run_blocking_all(
+            [
+                functools.partial(_verify_member, archive, member, checksum)
+                for member, checksum in checksums.items()
+            ]
+        )
+    finally:
+        if owns_archive:
+            archive.close()
+
+
+async def verify_checkpoints(
+    checkpoint_paths: Sequence[str | Path],
+    max_parallel: int = DEFAULT_PARALLEL_CHECKPOINTS,
+    throttle: Throttle | None = None,
+) -> dict[Path, str | None]:
+    """Verify a batch of checkpoints in parallel.
+
+    Unlike verify_checkpoint, a failing checkpoint does not stop the others:
+    every checkpoint gets a result.
+
+    A throttled verification sleeps inside its pool worker, so with a throttle
+    the checkpoints are verified one at a time (max_parallel is ignored) and
+    the scrub never holds more than one worker of the pool shared with saves
+    and restores.
+
+    Args:
+        checkpoint_paths: Checkpoints to verify.
+        max_parallel: Maximum number of checkpoints verified at the same time
+            (their members share the bounded I/O pool). Forced to 1 when a
+            throttle is given.
+        throttle: Optional bandwidth and CPU limits shared by all checkpoints.
+
+    Returns:
+        Dictionary mapping each checkpoint path to None if it is intact, or to
+        the error message describing the problem.
+
+    Raises:
+        ValueError: If max_parallel is lower than 1.
+    """
+    if max_parallel < 1:
+        raise ValueError(f"max_parallel must be at least 1, got {max_parallel}")
+    if throttle is not None:
+        max_parallel = 1
+
+    semaphore = asyncio.Semaphore(max_parallel)
+
+    async def verify_one(path: Path) -> str | None:
+        async with semaphore:
+            try:
+                await verify_checkpoint(path, throttle)
+            except (OSError, ValueError) as e:
+                logger.warning(f"Checkpoint {path.name} failed verification: {e}")
+                return str(e)
+            return None
+
+    paths = [Path(p) for p in checkpoint_paths]
+    results = await asyncio.gather(*(verify_one(path) for path in paths))
+    return dict(zip(paths, results, strict=True))
+
+
+@dataclass
+class VerificationRecord:
+    """Last verification of one checkpoint archive.
+
+    Attributes:
+        size: Archive size in bytes when it was verified
+        mtime_ns: Archive modification time (nanoseconds) when it was verified
+        verified_at: ISO 8601 UTC timestamp of the verification
+        error: Error message if the archive failed verification, else None
+    """
+
+    size: int
+    mtime_ns: int
+    verified_at: str
+    error: str | None = None
+
+    @property
+    def ok(self) -> bool:
+        """Whether the archive passed verification."""
+        return self.error is None
+
+    def matches(self, stat_result: os.stat_result) -> bool:
+        """Check whether the archive is unchanged since this verification."""
+        return self.size == stat_result.st_size and self.mtime_ns == stat_result.st_mtime_ns
+
+
+class VerificationState:
+    """Persisted verification records of a checkpoints directory.
+
+    Like the catalog and the hash cache, the state is purely an optimization:
+    a missing or corrupted file only means every archive is verified again.
+
+    Attributes:
+        state_path: Path of the JSON state file
+        records: Map of checkpoint filename to its last verification
+    """
+
+    def __init__(self, checkpoints_dir: str | Path) -> None:
+        """Load the state stored in a checkpoints directory.
+
+        Args:
+            checkpoints_dir: Directory containing the checkpoints.
+        """
+        self.state_path = Path(checkpoints_dir) / VERIFY_STATE_FILENAME
+        self.records: dict[str, VerificationRecord] = {}
+
+        try:
+            data = json.loads(self.state_path.read_text(encoding="utf-8"))
+            if data.get("version") == VERIFY_STATE_VERSION:
+                for filename, record in data["records"].items():
+                    self.records[filename] = VerificationRecord(**record)
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError, KeyError, TypeError, AttributeError) as e:
+            logger.debug(f"Ignoring invalid verification state {self.state_path}: {e}")
+            self.records.clear()
+
+    def save(self) -> None:
+        """Write the state file (best effort, atomic)."""
+        data = {
+            "version": VERIFY_STATE_VERSION,
+            "records": {
+                filename: {
+                    "size": record.size,
+                    "mtime_ns": record.mtime_ns,
+                    "verified_at": record.verified_at,
+                    "error": record.error,
+                }
+                for filename, record in sorted(self.records.items())
+            },
+        }
+        tmp_path = self.state_path.with_name(f"{VERIFY_STATE_FILENAME}.{os.getpid()}.tmp")
+        try:
+            tmp_path.write_text(json.dumps(data, indent=2), encoding="utf-8")
+            os.replace(tmp_path, self.state_path)
+        except OSError as e:
+            logger.warning(f"Cannot write verification state {self.state_path}: {e}")
+            tmp_path.unlink(missing_ok=True)
+
+
+@dataclass
+class VerifyReport:
+    """Health report of a checkpoints directory.
+
+    Attributes:
+        checkpoints_dir: Directory that was scrubbed
+        records: Last verification of every archive in the directory
+        verified: Filenames verified during this run
+        skipped: Filenames unchanged since their last verification
+    """
+
+    checkpoints_dir: Path
+    records: dict[str, VerificationRecord] = field(default_factory=dict)
+    verified: list[str] = field(default_factory=list)
+    skipped: list[str] = field(default_factory=list)
+
+    @property
+    def errors(self) -> dict[str, str]:
+        """Map of filename to error message for every unhealthy archive."""
+        return {
+            filename: record.error
+            for filename, record in sorted(self.records.items())
+            if record.error is not None
+        }
+
+    @property
+    def healthy(self) -> bool:
+        """Whether every archive passed its last verification."""
+        return not self.errors
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serialize the report to a JSON-compatible dictionary."""
+        return {
+            "checkpoints_dir": str(self.checkpoints_dir),
+            "healthy": self.healthy,
+            "total": len(self.records),
+            "verified": len(self.verified),
+            "skipped": len(self.skipped),
+            "failed": len(self.errors),
+            "checkpoints": [
+                {
+                    "filename": filename,
+                    "status": "ok" if record.ok else "failed",
+                    "size": record.size,
+                    "verified_at": record.verified_at,
+                    "error": record.error,
+                }
+                for filename, record in sorted(self.records.items())
+            ],
+        }
+
+
+def _stat_archives(checkpoints_dir: Path) -> dict[str, os.stat_result]:
+    """Stat every checkpoint archive of a directory.
+
+    Archives deleted while the directory is listed (e.g., by a concurrent
+    prune) are skipped.
+    """
+    archives: dict[str, os.stat_result] = {}
+    with os.scandir(checkpoints_dir) as entries:
+        for entry in entries:
+            if not entry.name.endswith(".zip"):
+                continue
+            try:
+                if entry.is_file():
+                    archives[entry.name] = entry.stat()
+            except OSError:
+                continue
+    return archives
+
+
+async def scrub_checkpoints(
+    checkpoints_dir: str | Path,
+    throttle: Throttle | None = None,
+    force: bool = False,
+    max_parallel: int = DEFAULT_PARALLEL_CHECKPOINTS,
+) -> VerifyReport:
+    """Verify the checkpoints of a directory that changed since their last check.
+
+    Archives whose size and modification time match their last verification
+    are skipped (their previous result is kept in the report); records of
+    deleted archives are dropped.
+
+    Args:
+        checkpoints_dir: Directory containing the checkpoints.
+        throttle: Optional bandwidth and CPU limits for background scrubs.
+        force: If True, verify every archive again.
+        max_parallel: Maximum number of checkpoints verified at the same time
+            (forced to 1 when a throttle is given, see verify_checkpoints).
+
+    Returns:
+        VerifyReport covering every archive of the directory.
+
+    Raises:
+        FileNotFoundError: If checkpoints_dir does not exist.
+
+    Example:
+        >>> report = await scrub_checkpoints(config.checkpoints_dir)
+        >>> for filename, error in report.errors.items():
+        ...     print(f"{filename}: {error}")
+    """
+    checkpoints_dir = Path(checkpoints_dir)
+    if not checkpoints_dir.is_dir():
+        raise FileNotFoundError(f"Checkpoint directory not found: {checkpoints_dir}")
+    if throttle is not None:
+        max_parallel = 1
+
+    archives = await run_blocking(_stat_archives, checkpoints_dir)
+    state = await run_blocking(VerificationState, checkpoints_dir)
+    report = VerifyReport(checkpoints_dir=checkpoints_dir)
+
+    to_verify = []
+    for filename, stat_result in sorted(archives.items()):
+        record = state.records.get(filename)
+        if record is not None and record.matches(stat_result) and not force:
+            report.records[filename] = record
+            report.skipped.append(filename)
+        else:
+            to_verify.append(filename)
+
+    # Verified in batches, saving the state after each one so an interrupted
+    # scrub resumes where it stopped
+    for start in range(0, len(to_verify), max_parallel):
+        batch = to_verify[start : start + max_parallel]
+        results = await verify_checkpoints(
+            [checkpoints_dir / filename for filename in batch], max_parallel, throttle
+        )
+        verified_at = datetime.now(timezone.utc).isoformat()
+        for path, error in results.items():
+            stat_result = archives[path.name]
+            report.records[path.name] = VerificationRecord(
+                size=stat_result.st_size,
+                mtime_ns=stat_result.st_mtime_ns,
+                verified_at=verified_at,
+                error=error,
+            )
+            report.verified.append(path.name)
+        state.records = dict(report.records)
+        await run_blocking(state.save)
+
+    # Forget archives that were deleted since the last scrub
+    if not to_verify and state.records.keys() != report.records.keys():
+        state.records = dict(report.records)
+        await run_blocking(state.save)
+
+    if report.errors:
+        logger.warning(
+            f"{len(report.errors)} checkpoint(s) failed verification in {checkpoints_dir}"
+        )
+    return report
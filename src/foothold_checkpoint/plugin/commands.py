@@ -10,19 +10,25 @@ from typing import Any
 import discord
 from core import Plugin
 from discord import app_commands
+from discord.ext import tasks
 from services.bot import DCSServerBot
 
 # When packaged for DCSSB, structure is flat: foothold-checkpoint/commands.py imports foothold-checkpoint/core/
 # So imports are always .core.* (relative to package root)
 from .core.campaign import detect_campaigns
-from .core.config import CampaignConfig, Config, load_campaigns
+from .core.config import CampaignConfig, CompressionConfig, Config, load_campaigns
 from .core.events import EventHooks
+from .core.executor import configure_executor, shutdown_executor
+from .core.retention import prune_checkpoints
+from .core.scan import campaign_file_filter, scan_directory
+from .core.snapshot import pending_snapshots, schedule_compaction
 from .core.storage import (
     delete_checkpoint,
     list_checkpoints,
     restore_checkpoint,
     save_checkpoint,
 )
+from .core.verify import Throttle, scrub_checkpoints
 from .formatters import (
     format_checkpoint_details_embed,
     format_delete_success_embed,
@@ -73,6 +79,8 @@ class FootholdCheckpoint(Plugin[FootholdEventListener]):
         super().__init__(bot, listener, name=name)
         self.campaigns: dict[str, CampaignConfig] = {}
         self.core_config: Config | None = None
+        self.campaign_config: Config | None = None
+        self.verify_throttle: Throttle | None = None
 
     async def cog_load(self) -> None:
         """Called when the cog is loaded.
@@ -111,8 +119,59 @@ class FootholdCheckpoint(Plugin[FootholdEventListener]):
                 checkpoints_dir=checkpoints_dir,
                 servers=None,
                 campaigns_file=campaigns_file,
+                storage_backend=config_dict.get("storage_backend", "zip"),
+                compression=CompressionConfig.model_validate(
+                    config_dict.get("compression") or "default"
+                ),
+                auto_backup_compression=CompressionConfig.model_validate(
+                    config_dict.get("auto_backup_compression") or "fast"
+                ),
+                retention=config_dict.get("retention"),
+                auto_backup_mode=config_dict.get("auto_backup_mode", "checkpoint"),
             )
 
+            # Config with the campaigns loaded, shared by every save/restore so that
+            # its campaign index is compiled only once
+            self.campaign_config = Config(
+                checkpoints_dir=checkpoints_dir,
+                servers=None,
+                campaigns=self.campaigns,
+                storage_backend=self.core_config.storage_backend,
+                compression=self.core_config.compression,
+                auto_backup_compression=self.core_config.auto_backup_compression,
+                retention=self.core_config.retention,
+                auto_backup_mode=self.core_config.auto_backup_mode,
+            )
+
+            # Bound the thread pool running blocking checkpoint I/O off the event loop
+            io_workers = config_dict.get("io_workers")
+            if io_workers is not None:
+                configure_executor(int(io_workers))
+
+            # Compact snapshot auto-backups left pending by a previous run
+            if pending_snapshots(self.core_config.checkpoints_dir):
+                schedule_compaction(self.core_config.checkpoints_dir, self.campaign_config)
+
+            # Periodically delete old checkpoints when a retention policy is configured
+            if self.core_config.retention is not None:
+                self.prune_task.change_interval(
+                    hours=float(config_dict.get("prune_interval_hours", 24))
+                )
+                self.prune_task.start()
+
+            # Periodically verify new and modified checkpoints, throttled to stay
+            # out of the way of the DCS servers
+            verify_interval = config_dict.get("verify_interval_hours")
+            if verify_interval is not None:
+                self.verify_throttle = Throttle(
+                    max_bytes_per_second=float(config_dict.get("verify_max_rate_mb", 5))
+                    * 1024
+                    * 1024,
+                    cpu_share=float(config_dict.get("verify_cpu_share", 0.25)),
+                )
+                self.verify_task.change_interval(hours=float(verify_interval))
+                self.verify_task.start()
+
             self.log.info(
                 f"Loaded configuration with {len(self.campaigns)} campaigns from {campaigns_file}"
             )
@@ -127,8 +186,52 @@ class FootholdCheckpoint(Plugin[FootholdEventListener]):
         Cleanup resources and log unload event.
         """
         await super().cog_unload()
+        self.prune_task.cancel()
+        self.verify_task.cancel()
         self.campaigns = {}
         self.core_config = None
+        self.campaign_config = None
+        # Let running file operations finish in the background
+        shutdown_executor(wait=False)
+
+    @tasks.loop(hours=24)
+    async def prune_task(self) -> None:
+        """Apply the retention policy to the checkpoints directory."""
+        if self.core_config is None or self.core_config.retention is None:
+            return
+
+        try:
+            result = await prune_checkpoints(
+                self.core_config.checkpoints_dir, self.core_config.retention
+            )
+            if result.deleted:
+                self.log.info(
+                    f"Pruned {len(result.deleted)} checkpoint(s), freed {result.bytes_freed_human}"
+                )
+            for filename, error in result.errors.items():
+                self.log.warning(f"Cannot prune checkpoint {filename}: {error}")
+        except Exception as e:
+            self.log.error(f"Failed to prune checkpoints: {e}", exc_info=True)
+
+    @tasks.loop(hours=24)
+    async def verify_task(self) -> None:
+        """Verify the checkpoints added or modified since the last verification."""
+        if self.core_config is None:
+            return
+
+        try:
+            report = await scrub_checkpoints(
+                self.core_config.checkpoints_dir, self.verify_throttle, max_parallel=1
+            )
+            if report.verified:
+                self.log.info(
+                    f"Verified {len(report.verified)} checkpoint(s), "
+                    f"{len(report.errors)} corrupted in total"
+                )
+            for filename, error in report.errors.items():
+                self.log.warning(f"Checkpoint {filename} failed verification: {error}")
+        except Exception as e:
+            self.log.error(f"Failed to verify checkpoints: {e}", exc_info=True)
 
     def _get_config(self) -> dict[str, Any]:
         """Get plugin configuration (wrapper for self.locals).
@@ -233,23 +336,16 @@ class FootholdCheckpoint(Plugin[FootholdEventListener]):
                 )
                 return
 
-            # Detect campaigns by listing files in the directory
-            campaign_files = [f.name for f in missions_saves_dir.iterdir() if f.is_file()]
-            self.log.debug(f"Found {len(campaign_files)} files in {missions_saves_dir}")
-            self.log.debug(f"Files: {campaign_files[:10]}")
-            self.log.debug(f"Config campaigns: {list(self.campaigns.keys())}")
-
-            # Build a minimal config object with campaigns for detection
+            # Detect campaigns from the campaign files of the directory (others are skipped)
             # (self.core_config has campaigns_file but not campaigns loaded)
-            from .core.config import Config
-
-            temp_config = Config(
-                checkpoints_dir=self.core_config.checkpoints_dir,
-                campaigns=self.campaigns,
-                servers=None,
+            campaign_files = list(
+                scan_directory(missions_saves_dir, campaign_file_filter(self.campaign_config))
             )
+            self.log.debug(f"Found {len(campaign_files)} campaign files in {missions_saves_dir}")
+            self.log.debug(f"Files: {campaign_files[:10]}")
+            self.log.debug(f"Config campaigns: {list(self.campaigns.keys())}")
 
-            detected_campaigns = detect_campaigns(campaign_files, temp_config)
+            detected_campaigns = detect_campaigns(campaign_files, self.campaign_config)
             self.log.debug(f"Detected campaigns: {list(detected_campaigns.keys())}")
 
             if not detected_campaigns:
@@ -344,13 +440,6 @@ class FootholdCheckpoint(Plugin[FootholdEventListener]):
         results = []
         errors = []
 
-        # Build temp config with campaigns loaded (for save_checkpoint's detect_campaigns call)
-        from .core.config import Config
-
-        temp_config = Config(
-            checkpoints_dir=self.core_config.checkpoints_dir, campaigns=self.campaigns, servers=None
-        )
-
         for camp in campaigns_to_save:
             try:
                 # Get campaign config
@@ -382,13 +471,13 @@ class FootholdCheckpoint(Plugin[FootholdEventListener]):
 
                 hooks = EventHooks(on_save_progress=on_progress)
 
-                # Execute save with temp_config that has campaigns loaded
+                # Execute save with the config that has campaigns loaded
                 checkpoint_path = await save_checkpoint(
                     campaign_name=camp,
                     server_name=server_name,
                     source_dir=source_dir,
                     output_dir=checkpoints_dir,
-                    config=temp_config,
+                    config=self.campaign_config,
                     name=name,
                     comment=comment,
                     hooks=hooks,
@@ -538,8 +627,8 @@ class FootholdCheckpoint(Plugin[FootholdEventListener]):
 
         # Use selected checkpoint
         selected = view.selected_checkpoint
-        checkpoint = selected["filename"]
-        campaign = selected.get("campaign", "unknown")
+        checkpoint = selected.filename
+        campaign = selected.campaign
 
         # Show confirmation dialog with full checkpoint details
         confirm_view = CheckpointRestoreConfirm(selected, server, auto_backup)
@@ -611,20 +700,11 @@ class FootholdCheckpoint(Plugin[FootholdEventListener]):
 
             hooks = EventHooks(on_restore_progress=on_progress)
 
-            # Build temp config with campaigns loaded (for create_auto_backup's detect_campaigns call)
-            from .core.config import Config
-
-            temp_config = Config(
-                checkpoints_dir=self.core_config.checkpoints_dir,
-                campaigns=self.campaigns,
-                servers=None,
-            )
-
             # Execute restore with skip_overwrite_check=True since we already confirmed via UI
             await restore_checkpoint(
                 checkpoint_path=checkpoint_path,
                 target_dir=target_dir,
-                config=temp_config,  # Use temp_config with campaigns loaded
+                config=self.campaign_config,  # Config with campaigns loaded
                 server_name=server_name,
                 auto_backup=auto_backup,
                 hooks=hooks,
@@ -803,9 +883,9 @@ class FootholdCheckpoint(Plugin[FootholdEventListener]):
             return
 
         # Use selected checkpoint from browser
-        selected_checkpoint_dict = checkpoints_list[view.current_index]
-        checkpoint = selected_checkpoint_dict["filename"]
-        campaign = selected_checkpoint_dict.get("campaign", "unknown")
+        selected_checkpoint = checkpoints_list[view.current_index]
+        checkpoint = selected_checkpoint.filename
+        campaign = selected_checkpoint.campaign
 
         # Store the browser state for potential restoration on cancel
         browser_checkpoints = checkpoints_list
@@ -842,14 +922,14 @@ class FootholdCheckpoint(Plugin[FootholdEventListener]):
             )
 
         confirm_view = CheckpointDeleteConfirm(
-            selected_checkpoint_dict,
+            selected_checkpoint,
             restore_browser_func=restore_browser,
         )
 
         # Use detailed embed formatter
         from .formatters import format_checkpoint_details_embed
 
-        details_embed = format_checkpoint_details_embed(selected_checkpoint_dict)
+        details_embed = format_checkpoint_details_embed(selected_checkpoint)
         details_embed.title = "⚠️ Confirm Deletion"
         details_embed.color = discord.Color.orange()
         details_embed.add_field(
@@ -1,13 +1,14 @@
 """Rich formatting functions for Discord embeds."""
 
 from datetime import datetime
-from typing import Any
 
 import discord
 
+from .core.storage import CheckpointInfo
+
 
 def format_checkpoint_list_embed(
-    checkpoints: list[dict[str, Any]],
+    checkpoints: list[CheckpointInfo],
     campaign_filter: str | None = None,
     page: int = 1,
     per_page: int = 5,  # Reduced from 10 for Discord embed size limits
@@ -18,7 +19,7 @@ def format_checkpoint_list_embed(
     Uses horizontal separators between checkpoints for better readability.
 
     Args:
-        checkpoints: List of checkpoint metadata dicts
+        checkpoints: List of CheckpointInfo records
         campaign_filter: Optional campaign name filter for title
         page: Current page number (1-indexed)
         per_page: Number of checkpoints per page (reduced to 5 for embed limits)
@@ -43,9 +44,9 @@ def format_checkpoint_list_embed(
     )
 
     # Group by campaign for cleaner display
-    campaigns: dict[str, list[dict[str, Any]]] = {}
+    campaigns: dict[str, list[CheckpointInfo]] = {}
     for cp in page_checkpoints:
-        campaign = cp["campaign"]
+        campaign = cp.campaign
         if campaign not in campaigns:
             campaigns[campaign] = []
         campaigns[campaign].append(cp)
@@ -61,20 +62,16 @@ def format_checkpoint_list_embed(
                 lines.append("─" * 45)
 
             # Line 1: Filename
-            filename = cp["filename"]
+            filename = cp.filename
             if len(filename) > 43:
                 filename = filename[:40] + "..."
             lines.append(filename)
 
             # Line 2: Date, Time, Size (aligned columns)
-            timestamp_str = cp["timestamp"]
-            if "." in timestamp_str:
-                timestamp_str = timestamp_str.split(".")[0]
-            # "2024-02-14T10:30:00" -> "02-14" and "10:30"
-            date_part = timestamp_str[5:10] if len(timestamp_str) > 10 else ""
-            time_part = timestamp_str[11:16] if len(timestamp_str) > 16 else ""
+            date_part = f"{cp.created_at:%m-%d}"
+            time_part = f"{cp.created_at:%H:%M}"
 
-            size_str = cp["size_human"]
+            size_str = cp.size_human
 
             # Format: "DATE      TIME     SIZE"
             details_line = f"{date_part:<10}{time_part:<9}{size_str:>8}"
@@ -109,51 +106,47 @@ def format_checkpoint_list_embed(
     return embed
 
 
-def format_checkpoint_details_embed(checkpoint: dict[str, Any]) -> discord.Embed:
+def format_checkpoint_details_embed(checkpoint: CheckpointInfo) -> discord.Embed:
     """Format detailed checkpoint information as an embed.
 
     Args:
-        checkpoint: Checkpoint metadata dict
+        checkpoint: Checkpoint record
 
     Returns:
         Discord embed with checkpoint details
     """
-    # Parse timestamp
-    timestamp_str = checkpoint["timestamp"]
-    if "." in timestamp_str:
-        timestamp_str = timestamp_str.split(".")[0]
-
     # Build description with fixed-width padding to ensure consistent embed width
     # Use invisible braille character repeated to force minimum width
-    description = checkpoint.get("comment") or "_No description_"
+    description = checkpoint.comment or "_No description_"
     # Add invisible padding line to force consistent width (approximately 80 chars wide)
     width_padding = "⠀" * 80
     description_with_padding = f"{description}\n{width_padding}"
 
     # Create embed
     embed = discord.Embed(
-        title=f"📦 {checkpoint.get('name') or checkpoint['filename']}",
+        title=f"📦 {checkpoint.name or checkpoint.filename}",
         description=description_with_padding,
         color=discord.Color.green(),
-        timestamp=datetime.fromisoformat(timestamp_str),
+        timestamp=checkpoint.created_at,
     )
 
     # Add fields
-    embed.add_field(name="📁 Campaign", value=checkpoint["campaign"], inline=True)
-    embed.add_field(name="🖥️ Server", value=checkpoint["server"], inline=True)
-    embed.add_field(name="💾 Size", value=checkpoint["size_human"], inline=True)
-    embed.add_field(name="📄 Filename", value=f"`{checkpoint['filename']}`", inline=False)
+    embed.add_field(name="📁 Campaign", value=checkpoint.campaign, inline=True)
+    embed.add_field(name="🖥️ Server", value=checkpoint.server, inline=True)
+    embed.add_field(name="💾 Size", value=checkpoint.size_human, inline=True)
+    embed.add_field(name="📄 Filename", value=f"`{checkpoint.filename}`", inline=False)
 
     # Add file list if available - always include this field for consistent embed height
-    if "files" in checkpoint and checkpoint["files"]:
+    files = checkpoint.files
+    if files:
         # Limit to 10 files for consistent display
-        files_to_show = checkpoint["files"][:10]
+        files_to_show = files[:10]
         files_text = "\n".join([f"• `{f}`" for f in files_to_show])
-        if len(checkpoint["files"]) > 10:
-            files_text += f"\n_...and {len(checkpoint['files']) - 10} more_"
+        if len(files) > 10:
+            files_text += f"\n_...and {len(files) - 10} more_"
         # Pad with empty lines to ensure consistent height (10 lines total)
         line_count = len(files_to_show)
-        if line_count < 10 and len(checkpoint["files"]) <= 10:
+        if line_count < 10 and len(files) <= 10:
             files_text += "\n⠀" * (10 - line_count)  # Invisible character for spacing
     else:
         # No files - show placeholder with padding to maintain height
@@ -1,7 +1,7 @@
 """Pydantic models for DCSServerBot plugin configuration."""
 
 from pathlib import Path
-from typing import Any
+from typing import Any, Literal
 
 from pydantic import BaseModel, Field, field_validator
 
@@ -47,6 +47,48 @@ class PluginConfig(BaseModel):
         ..., description="Path to campaigns.yaml defining all campaign settings"
     )
     checkpoints_dir: Path = Field(..., description="Directory where checkpoints are stored")
+    io_workers: int | None = Field(
+        default=None,
+        ge=1,
+        description="Number of worker threads used for checkpoint file operations",
+    )
+    retention: dict[str, Any] | None = Field(
+        default=None,
+        description="Retention policy (see core RetentionPolicy) applied periodically",
+    )
+    prune_interval_hours: float = Field(
+        default=24.0, gt=0, description="Hours between two applications of the retention policy"
+    )
+    verify_interval_hours: float | None = Field(
+        default=None,
+        gt=0,
+        description="Hours between two background verifications (disabled if not set)",
+    )
+    verify_max_rate_mb: float = Field(
+        default=5.0, gt=0, description="Maximum read rate of background verification in MB/s"
+    )
+    verify_cpu_share: float = Field(
+        default=0.25,
+        gt=0,
+        le=1,
+        description="Maximum fraction of a CPU core used by background verification",
+    )
+    storage_backend: Literal["zip", "dedup"] = Field(
+        default="zip",
+        description="How checkpoint contents are stored: self-contained ZIPs or a deduplicating blob store",
+    )
+    compression: str | dict[str, Any] | None = Field(
+        default=None,
+        description="Compression of checkpoint archives: profile name or method/level (see core CompressionConfig)",
+    )
+    auto_backup_compression: str | dict[str, Any] | None = Field(
+        default=None,
+        description="Compression of pre-restore automatic backups (default: the 'fast' profile)",
+    )
+    auto_backup_mode: Literal["checkpoint", "snapshot"] = Field(
+        default="checkpoint",
+        description="How automatic backups are taken before a restore (see core Config)",
+    )
     permissions: PermissionsConfig = Field(
         default_factory=PermissionsConfig, description="Role-based permission configuration"
     )
@@ -75,6 +117,16 @@ class PluginConfig(BaseModel):
         return {
             "campaigns_file": str(self.campaigns_file),
             "checkpoints_dir": str(self.checkpoints_dir),
+            "io_workers": self.io_workers,
+            "retention": self.retention,
+            "prune_interval_hours": self.prune_interval_hours,
+            "verify_interval_hours": self.verify_interval_hours,
+            "verify_max_rate_mb": self.verify_max_rate_mb,
+            "verify_cpu_share": self.verify_cpu_share,
+            "storage_backend": self.storage_backend,
+            "compression": self.compression,
+            "auto_backup_compression": self.auto_backup_compression,
+            "auto_backup_mode": self.auto_backup_mode,
             "permissions": {
                 "save": self.permissions.save,
                 "restore": self.permissions.restore,
@@ -5,6 +5,8 @@ from typing import Any
 import discord
 from discord import ui
 
+from .core.storage import CheckpointInfo
+
 
 class CheckpointMetadataModal(ui.Modal, title="Checkpoint Metadata"):
     """Modal for entering optional checkpoint name and comment."""
@@ -179,12 +181,12 @@ class CheckpointBrowserView(ui.View):
     """
 
     def __init__(
-        self, checkpoints: list[dict[str, Any]], format_details_func, timeout: float = 300.0
+        self, checkpoints: list[CheckpointInfo], format_details_func, timeout: float = 300.0
     ):
         """Initialize the checkpoint browser view.
 
         Args:
-            checkpoints: List of checkpoint dicts with metadata
+            checkpoints: List of CheckpointInfo records
             format_details_func: Function to format checkpoint details as embed
             timeout: View timeout in seconds (default: 5 minutes)
         """
@@ -199,7 +201,7 @@ class CheckpointBrowserView(ui.View):
 
         for idx, cp in enumerate(checkpoints[:25]):  # Discord limit
             # Add separator before first auto-backup checkpoint
-            if cp.get("is_auto_backup") and not separator_added:
+            if cp.is_auto_backup and not separator_added:
                 options.append(
                     discord.SelectOption(
                         label="─────────── AUTO-BACKUPS ───────────",
@@ -210,8 +212,8 @@ class CheckpointBrowserView(ui.View):
                 )
                 separator_added = True
 
-            filename = cp["filename"]
-            campaign = cp.get("campaign", "unknown")
+            filename = cp.filename
+            campaign = cp.campaign
 
             # Build label with filename
             label = filename
@@ -219,21 +221,14 @@ class CheckpointBrowserView(ui.View):
                 label = f"{label[:97]}..."
 
             # Build description with campaign, date, size, and name/comment if present
-            timestamp_str = cp.get("timestamp", "")
-            if timestamp_str:
-                # "2024-02-14T10:30:00" -> "02-14 10:30"
-                date_part = timestamp_str[5:10] if len(timestamp_str) > 10 else ""
-                time_part = timestamp_str[11:16] if len(timestamp_str) > 16 else ""
-                display_time = f"{date_part} {time_part}"
-            else:
-                display_time = ""
+            display_time = f"{cp.created_at:%m-%d %H:%M}"
 
             # Include name and/or comment if present
             extras = []
-            if cp.get("name"):
-                extras.append(f"[{cp['name']}]")
-            if cp.get("comment"):
-                comment = cp["comment"]
+            if cp.name:
+                extras.append(f"[{cp.name}]")
+            if cp.comment:
+                comment = cp.comment
                 if len(comment) > 30:
                     comment = f"{comment[:27]}..."
                 extras.append(comment)
@@ -241,7 +236,7 @@ class CheckpointBrowserView(ui.View):
             extra_info = " - ".join(extras) if extras else ""
 
             # Build description: "campaign • date time • size • extras"
-            description_parts = [campaign, display_time, cp.get("size_human", "")]
+            description_parts = [campaign, display_time, cp.size_human]
             if extra_info:
                 description_parts.append(extra_info)
 
@@ -328,12 +323,12 @@ class CheckpointDeleteBrowserView(ui.View):
     """
 
     def __init__(
-        self, checkpoints: list[dict[str, Any]], format_details_func, timeout: float = 300.0
+        self, checkpoints: list[CheckpointInfo], format_details_func, timeout: float = 300.0
     ):
         """Initialize the checkpoint browser view.
 
         Args:
-            checkpoints: List of checkpoint dicts with metadata
+            checkpoints: List of CheckpointInfo records
             format_details_func: Function to format checkpoint details as embed
             timeout: View timeout in seconds (default: 5 minutes)
         """
@@ -349,7 +344,7 @@ class CheckpointDeleteBrowserView(ui.View):
 
         for idx, cp in enumerate(checkpoints[:25]):  # Discord limit
             # Add separator before first auto-backup checkpoint
-            if cp.get("is_auto_backup") and not separator_added:
+            if cp.is_auto_backup and not separator_added:
                 options.append(
                     discord.SelectOption(
                         label="─────────── AUTO-BACKUPS ───────────",
@@ -360,8 +355,8 @@ class CheckpointDeleteBrowserView(ui.View):
                 )
                 separator_added = True
 
-            filename = cp["filename"]
-            campaign = cp.get("campaign", "unknown")
+            filename = cp.filename
+            campaign = cp.campaign
 
             # Build label with filename
             label = filename
@@ -369,21 +364,14 @@ class CheckpointDeleteBrowserView(ui.View):
                 label = f"{label[:97]}..."
 
             # Build description with campaign, date, size, and name/comment if present
-            timestamp_str = cp.get("timestamp", "")
-            if timestamp_str:
-                # "2024-02-14T10:30:00" -> "02-14 10:30"
-                date_part = timestamp_str[5:10] if len(timestamp_str) > 10 else ""
-                time_part = timestamp_str[11:16] if len(timestamp_str) > 16 else ""
-                display_time = f"{date_part} {time_part}"
-            else:
-                display_time = ""
+            display_time = f"{cp.created_at:%m-%d %H:%M}"
 
             # Include name and/or comment if present
             extras = []
-            if cp.get("name"):
-                extras.append(f"[{cp['name']}]")
-            if cp.get("comment"):
-                comment = cp["comment"]
+            if cp.name:
+                extras.append(f"[{cp.name}]")
+            if cp.comment:
+                comment = cp.comment
                 if len(comment) > 30:
                     comment = f"{comment[:27]}..."
                 extras.append(comment)
@@ -391,7 +379,7 @@ class CheckpointDeleteBrowserView(ui.View):
             extra_info = " - ".join(extras) if extras else ""
 
             # Build description: "campaign • date time • size • extras"
-            description_parts = [campaign, display_time, cp.get("size_human", "")]
+            description_parts = [campaign, display_time, cp.size_human]
             if extra_info:
                 description_parts.append(extra_info)
 
@@ -495,15 +483,15 @@ class CheckpointSelectView(ui.View):
     Provides a dropdown menu with all available checkpoints.
     """
 
-    def __init__(self, checkpoints: list[dict[str, Any]], timeout: float = 180.0):
+    def __init__(self, checkpoints: list[CheckpointInfo], timeout: float = 180.0):
         """Initialize the checkpoint selection view.
 
         Args:
-            checkpoints: List of checkpoint dicts with name, campaign, timestamp
+            checkpoints: List of CheckpointInfo records
             timeout: View timeout in seconds (default: 3 minutes)
         """
         super().__init__(timeout=timeout)
-        self.selected_checkpoint: dict[str, Any] | None = None
+        self.selected_checkpoint: CheckpointInfo | None = None
         self.checkpoints = checkpoints
 
         # Create the dropdown (limited to 25 options by Discord)
@@ -512,7 +500,7 @@ class CheckpointSelectView(ui.View):
 
         for cp in checkpoints[:25]:  # Discord limit
             # Add separator before first auto-backup checkpoint
-            if cp.get("is_auto_backup") and not separator_added:
+            if cp.is_auto_backup and not separator_added:
                 options.append(
                     discord.SelectOption(
                         label="─────────── AUTO-BACKUPS ───────────",
@@ -523,17 +511,9 @@ class CheckpointSelectView(ui.View):
                 )
                 separator_added = True
 
-            filename = cp["filename"]
-            campaign = cp.get("campaign", "unknown")
-            # Format timestamp for display
-            timestamp_str = cp.get("timestamp", "")
-            if timestamp_str:
-                # "2024-02-14T10:30:00" -> "02-14 10:30"
-                date_part = timestamp_str[5:10] if len(timestamp_str) > 10 else ""
-                time_part = timestamp_str[11:16] if len(timestamp_str) > 16 else ""
-                display_time = f"{date_part} {time_part}"
-            else:
-                display_time = ""
+            filename = cp.filename
+            campaign = cp.campaign
+            display_time = f"{cp.created_at:%m-%d %H:%M}"
 
             label = filename
             if len(label) > 100:  # Discord label limit
@@ -541,10 +521,10 @@ class CheckpointSelectView(ui.View):
 
             # Include name and/or comment if present (helps identify auto-backups)
             extras = []
-            if cp.get("name"):
-                extras.append(f"[{cp['name']}]")
-            if cp.get("comment"):
-                comment = cp["comment"]
+            if cp.name:
+                extras.append(f"[{cp.name}]")
+            if cp.comment:
+                comment = cp.comment
                 if len(comment) > 30:
                     comment = f"{comment[:27]}..."
                 extras.append(comment)
@@ -552,7 +532,7 @@ class CheckpointSelectView(ui.View):
             extra_info = " - ".join(extras) if extras else ""
 
             # Build description: "campaign • date time • size • extras"
-            description_parts = [campaign, display_time, cp.get("size_human", "")]
+            description_parts = [campaign, display_time, cp.size_human]
             if extra_info:
                 description_parts.append(extra_info)
 
@@ -606,9 +586,9 @@ class CheckpointSelectView(ui.View):
             await interaction.response.defer()
             return
 
-        # Find the checkpoint dict
+        # Find the checkpoint record
         self.selected_checkpoint = next(
-            (cp for cp in self.checkpoints if cp["filename"] == selected_filename), None
+            (cp for cp in self.checkpoints if cp.filename == selected_filename), None
         )
 
         # Acknowledge the interaction silently
@@ -631,44 +611,52 @@ class PaginatedCheckpointSelectView(ui.View):
 
     CHECKPOINTS_PER_PAGE = 20  # Safe margin below Discord's 25-option limit
 
-    def __init__(self, checkpoints: list[dict[str, Any]], timeout: float = 180.0):
+    def __init__(self, checkpoints: list[CheckpointInfo], timeout: float = 180.0):
         """Initialize the paginated checkpoint selection view.
 
         Args:
-            checkpoints: List of checkpoint dicts with name, campaign, timestamp
+            checkpoints: List of CheckpointInfo records
             timeout: View timeout in seconds (default: 3 minutes)
         """
         super().__init__(timeout=timeout)
-        self.selected_checkpoint: dict[str, Any] | None = None
+        self.selected_checkpoint: CheckpointInfo | None = None
         self.all_checkpoints = checkpoints
         self.type_filter: str = "all"  # "all", "manual", "auto"
         self.campaign_filter: str | None = None  # None = all campaigns
         self.current_page = 0
+        # Filtered list for the current (type, campaign) filters, reused by
+        # every page, header and page count until a filter changes
+        self._filtered: tuple[tuple[str, str | None], list[CheckpointInfo]] | None = None
 
         # Build initial UI
         self._build_ui()
 
-    def _get_filtered_checkpoints(self) -> list[dict[str, Any]]:
+    def _get_filtered_checkpoints(self) -> list[CheckpointInfo]:
         """Get checkpoints filtered by type and campaign.
 
         Returns:
             Filtered checkpoint list
         """
+        filters = (self.type_filter, self.campaign_filter)
+        if self._filtered is not None and self._filtered[0] == filters:
+            return self._filtered[1]
+
         filtered = self.all_checkpoints
 
         # Apply type filter
         if self.type_filter == "manual":
-            filtered = [cp for cp in filtered if not cp.get("is_auto_backup", False)]
+            filtered = [cp for cp in filtered if not cp.is_auto_backup]
         elif self.type_filter == "auto":
-            filtered = [cp for cp in filtered if cp.get("is_auto_backup", False)]
+            filtered = [cp for cp in filtered if cp.is_auto_backup]
 
         # Apply campaign filter
         if self.campaign_filter:
-            filtered = [cp for cp in filtered if cp.get("campaign") == self.campaign_filter]
+            filtered = [cp for cp in filtered if cp.campaign == self.campaign_filter]
 
+        self._filtered = (filters, filtered)
         return filtered
 
-    def _get_page_checkpoints(self) -> list[dict[str, Any]]:
+    def _get_page_checkpoints(self) -> list[CheckpointInfo]:
         """Get checkpoints for current page.
 
         Returns:
@@ -691,7 +679,7 @@ class PaginatedCheckpointSelectView(ui.View):
         return (len(filtered) + self.CHECKPOINTS_PER_PAGE - 1) // self.CHECKPOINTS_PER_PAGE
 
     def _build_select_options(
-        self, page_checkpoints: list[dict[str, Any]]
+        self, page_checkpoints: list[CheckpointInfo]
     ) -> list[discord.SelectOption]:
         """Build checkpoint select options for current page.
 
@@ -712,32 +700,25 @@ class PaginatedCheckpointSelectView(ui.View):
 
         options = []
         for cp in page_checkpoints:
-            filename = cp["filename"]
-            campaign = cp.get("campaign", "unknown")
-
-            # Format timestamp for display
-            timestamp_str = cp.get("timestamp", "")
-            if timestamp_str:
-                date_part = timestamp_str[5:10] if len(timestamp_str) > 10 else ""
-                time_part = timestamp_str[11:16] if len(timestamp_str) > 16 else ""
-                display_time = f"{date_part} {time_part}"
-            else:
-                display_time = ""
+            filename = cp.filename
+            campaign = cp.campaign
+
+            display_time = f"{cp.created_at:%m-%d %H:%M}"
 
             label = filename
             if len(label) > 100:
                 label = f"{label[:97]}..."
 
             # Build description
-            description_parts = [campaign, display_time, cp.get("size_human", "")]
-            if cp.get("name"):
-                description_parts.append(f"[{cp['name']}]")
+            description_parts = [campaign, display_time, cp.size_human]
+            if cp.name:
+                description_parts.append(f"[{cp.name}]")
 
             description = " • ".join(filter(None, description_parts))
             if len(description) > 100:
                 description = f"{description[:97]}..."
 
-            emoji = "🔄" if cp.get("is_auto_backup") else "💾"
+            emoji = "🔄" if cp.is_auto_backup else "💾"
 
             options.append(
                 discord.SelectOption(
@@ -756,7 +737,7 @@ class PaginatedCheckpointSelectView(ui.View):
         Returns:
             List of campaign names
         """
-        campaigns = {cp.get("campaign", "unknown") for cp in self.all_checkpoints}
+        campaigns = {cp.campaign for cp in self.all_checkpoints}
         return sorted(campaigns)
 
     def _get_header_text(self) -> str:
@@ -961,7 +942,7 @@ class PaginatedCheckpointSelectView(ui.View):
 
         # Find checkpoint
         self.selected_checkpoint = next(
-            (cp for cp in self.all_checkpoints if cp["filename"] == selected_filename), None
+            (cp for cp in self.all_checkpoints if cp.filename == selected_filename), None
         )
 
         await interaction.response.defer()
@@ -1006,7 +987,7 @@ class CheckpointDeleteConfirm(ui.View):
     """
 
     def __init__(
-        self, checkpoint: dict[str, Any], restore_browser_func=None, timeout: float = 60.0
+        self, checkpoint: CheckpointInfo, restore_browser_func=None, timeout: float = 60.0
     ):
         """Initialize the confirmation view.
 
@@ -1017,7 +998,7 @@ class CheckpointDeleteConfirm(ui.View):
         """
         super().__init__(timeout=timeout)
         self.checkpoint = checkpoint
-        self.checkpoint_name = checkpoint["filename"]
+        self.checkpoint_name = checkpoint.filename
         self.confirmed: bool | None = None
         self.restore_browser_func = restore_browser_func
 
@@ -1058,7 +1039,7 @@ class CheckpointRestoreConfirm(ui.View):
     """
 
     def __init__(
-        self, checkpoint: dict[str, Any], server: str, auto_backup: bool, timeout: float = 60.0
+        self, checkpoint: CheckpointInfo, server: str, auto_backup: bool, timeout: float = 60.0
     ):
         """Initialize the confirmation view.
 
@@ -1070,7 +1051,7 @@ class CheckpointRestoreConfirm(ui.View):
         """
         super().__init__(timeout=timeout)
         self.checkpoint = checkpoint
-        self.checkpoint_name = checkpoint["filename"]
+        self.checkpoint_name = checkpoint.filename
         self.server = server
         self.auto_backup = auto_backup
         self.confirmed: bool | None = None
@@ -1112,12 +1093,12 @@ class PaginatedCheckpointBrowserView(ui.View):
     CHECKPOINTS_PER_PAGE = 20
 
     def __init__(
-        self, checkpoints: list[dict[str, Any]], format_details_func, timeout: float = 300.0
+        self, checkpoints: list[CheckpointInfo], format_details_func, timeout: float = 300.0
     ):
         """Initialize the paginated checkpoint browser.
 
         Args:
-            checkpoints: List of checkpoint dicts with metadata
+            checkpoints: List of CheckpointInfo records
             format_details_func: Function to format checkpoint details as embed
             timeout: View timeout in seconds (default: 5 minutes)
         """
@@ -1126,11 +1107,11 @@ class PaginatedCheckpointBrowserView(ui.View):
         self.format_details_func = format_details_func
 
         # Separate manual and auto-backups
-        self.manual = [cp for cp in checkpoints if not cp.get("is_auto_backup")]
-        self.auto_backups = [cp for cp in checkpoints if cp.get("is_auto_backup")]
+        self.manual = [cp for cp in checkpoints if not cp.is_auto_backup]
+        self.auto_backups = [cp for cp in checkpoints if cp.is_auto_backup]
 
         # Extract unique campaigns (sorted alphabetically)
-        campaigns_set = {cp.get("campaign", "unknown") for cp in checkpoints}
+        campaigns_set = {cp.campaign for cp in checkpoints}
         self.campaigns = sorted(campaigns_set)
 
         # State
@@ -1141,7 +1122,7 @@ class PaginatedCheckpointBrowserView(ui.View):
 
         self._build_ui()
 
-    def _get_filtered_checkpoints(self) -> list[dict[str, Any]]:
+    def _get_filtered_checkpoints(self) -> list[CheckpointInfo]:
         """Get checkpoints based on current filters."""
         # First filter by type
         if self.type_filter == "manual":
@@ -1153,11 +1134,11 @@ class PaginatedCheckpointBrowserView(ui.View):
 
         # Then filter by campaign
         if self.campaign_filter != "all":
-            filtered = [cp for cp in filtered if cp.get("campaign") == self.campaign_filter]
+            filtered = [cp for cp in filtered if cp.campaign == self.campaign_filter]
 
         return filtered
 
-    def _get_page_checkpoints(self) -> list[dict[str, Any]]:
+    def _get_page_checkpoints(self) -> list[CheckpointInfo]:
         """Get checkpoints for current page."""
         filtered = self._get_filtered_checkpoints()
         start = self.current_page * self.CHECKPOINTS_PER_PAGE
@@ -1165,7 +1146,7 @@ class PaginatedCheckpointBrowserView(ui.View):
         return filtered[start:end]
 
     def _build_select_options(
-        self, page_checkpoints: list[dict[str, Any]]
+        self, page_checkpoints: list[CheckpointInfo]
     ) -> list[discord.SelectOption]:
         """Build select options for current page checkpoints."""
         if not page_checkpoints:
@@ -1179,8 +1160,8 @@ class PaginatedCheckpointBrowserView(ui.View):
 
         options = []
         for idx, cp in enumerate(page_checkpoints):
-            filename = cp["filename"]
-            campaign = cp.get("campaign", "unknown")
+            filename = cp.filename
+            campaign = cp.campaign
 
             # Build label with filename
             label = filename
@@ -1188,21 +1169,14 @@ class PaginatedCheckpointBrowserView(ui.View):
                 label = f"{label[:97]}..."
 
             # Build description with campaign, date, size, and name/comment if present
-            timestamp_str = cp.get("timestamp", "")
-            if timestamp_str:
-                # "2024-02-14T10:30:00" -> "02-14 10:30"
-                date_part = timestamp_str[5:10] if len(timestamp_str) > 10 else ""
-                time_part = timestamp_str[11:16] if len(timestamp_str) > 16 else ""
-                display_time = f"{date_part} {time_part}"
-            else:
-                display_time = ""
+            display_time = f"{cp.created_at:%m-%d %H:%M}"
 
             # Include name and/or comment if present
             extras = []
-            if cp.get("name"):
-                extras.append(f"[{cp['name']}]")
-            if cp.get("comment"):
-                comment = cp["comment"]
+            if cp.name:
+                extras.append(f"[{cp.name}]")
+            if cp.comment:
+                comment = cp.comment
                 if len(comment) > 30:
                     comment = f"{comment[:27]}..."
                 extras.append(comment)
@@ -1210,7 +1184,7 @@ class PaginatedCheckpointBrowserView(ui.View):
             extra_info = " - ".join(extras) if extras else ""
 
             # Build description: "campaign • date time • size • extras"
-            description_parts = [campaign, display_time, cp.get("size_human", "")]
+            description_parts = [campaign, display_time, cp.size_human]
             if extra_info:
                 description_parts.append(extra_info)
 
@@ -1283,7 +1257,7 @@ class PaginatedCheckpointBrowserView(ui.View):
             ]
 
             for campaign in self.campaigns:
-                count = sum(1 for cp in self.all_checkpoints if cp.get("campaign") == campaign)
+                count = sum(1 for cp in self.all_checkpoints if cp.campaign == campaign)
                 campaign_options.append(
                     discord.SelectOption(
                         label=campaign,
@@ -1410,7 +1384,7 @@ class PaginatedCheckpointBrowserView(ui.View):
             self._build_ui()
             await self._update_message(interaction)
 
-    def _get_header_text(self, filtered: list[dict[str, Any]]) -> str:
+    def _get_header_text(self, filtered: list[CheckpointInfo]) -> str:
         """Generate header text showing filter status."""
         total = len(filtered)
         start = self.current_page * self.CHECKPOINTS_PER_PAGE + 1
@@ -1464,12 +1438,12 @@ class PaginatedCheckpointDeleteBrowserView(PaginatedCheckpointBrowserView):
     """
 
     def __init__(
-        self, checkpoints: list[dict[str, Any]], format_details_func, timeout: float = 300.0
+        self, checkpoints: list[CheckpointInfo], format_details_func, timeout: float = 300.0
     ):
         """Initialize the paginated delete browser.
 
         Args:
-            checkpoints: List of checkpoint dicts with metadata
+            checkpoints: List of CheckpointInfo records
             format_details_func: Function to format checkpoint details as embed
             timeout: View timeout in seconds (default: 5 minutes)
         """
@@ -1506,7 +1480,7 @@ class PaginatedCheckpointDeleteBrowserView(PaginatedCheckpointBrowserView):
 
         self.stop()
 
-    def _get_header_text(self, filtered: list[dict[str, Any]]) -> str:
+    def _get_header_text(self, filtered: list[CheckpointInfo]) -> str:
         """Generate header text showing filter status (with delete emoji)."""
         text = super()._get_header_text(filtered)
         # Replace 📦 with 🗑️ to indicate delete mode
@@ -0,0 +1,120 @@
+"""Tests for the open-once checkpoint archive reader."""
+
+import asyncio
+import zipfile
+from datetime import datetime, timezone
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+
+def _make_checkpoint(tmp_path: Path, storage_backend: str = "zip") -> tuple[Path, Path]:
+    """Save a checkpoint of a test campaign and return (checkpoint, saves dir)."""
+    from foothold_checkpoint.core.storage import save_checkpoint
+    from tests.conftest import make_simple_campaign, make_test_config
+
+    saves_dir = tmp_path / "saves"
+    saves_dir.mkdir()
+    (saves_dir / "foothold_test.lua").write_text("-- state 1", encoding="utf-8")
+    (saves_dir / "Foothold_Ranks.lua").write_text("-- ranks", encoding="utf-8")
+    config = make_test_config(
+        checkpoints_dir=tmp_path / "checkpoints",
+        campaigns={"test": make_simple_campaign("Test", ["foothold_test.lua"])},
+        storage_backend=storage_backend,
+    )
+    checkpoint = asyncio.run(
+        save_checkpoint(
+            campaign_name="test",
+            server_name="server",
+            source_dir=saves_dir,
+            output_dir=config.checkpoints_dir,
+            config=config,
+            created_at=datetime(2024, 2, 14, 10, 0, 0, tzinfo=timezone.utc),
+        )
+    )
+    return checkpoint, saves_dir
+
+
+class TestCheckpointArchive:
+    """Test suite for CheckpointArchive."""
+
+    def test_exposes_members_checksums_and_sizes(self, tmp_path):
+        """The archive should expose the campaign files without reopening the ZIP."""
+        from foothold_checkpoint.core.archive import CheckpointArchive
+
+        checkpoint, _ = _make_checkpoint(tmp_path)
+
+        with CheckpointArchive(checkpoint) as archive:
+            assert archive.campaign_name == "test"
+            assert sorted(archive.members) == ["Foothold_Ranks.lua", "foothold_test.lua"]
+            assert archive.checksums["foothold_test.lua"].startswith("sha256:")
+            assert archive.sizes["foothold_test.lua"] == len("-- state 1")
+            with archive.open("foothold_test.lua") as f:
+                assert f.read() == b"-- state 1"
+
+    def test_reads_dedup_members_from_blob_store(self, tmp_path):
+        """Deduplicated checkpoints should be read from the blob store."""
+        from foothold_checkpoint.core.archive import CheckpointArchive
+
+        checkpoint, _ = _make_checkpoint(tmp_path, storage_backend="dedup")
+
+        with CheckpointArchive(checkpoint) as archive:
+            assert archive.is_dedup
+            assert archive.sizes == {}
+            with archive.open("foothold_test.lua") as f:
+                assert f.read() == b"-- state 1"
+
+    def test_invalid_files_raise_on_first_access(self, tmp_path):
+        """Missing and corrupted checkpoints should fail with the usual errors."""
+        from foothold_checkpoint.core.archive import CheckpointArchive
+
+        missing = CheckpointArchive(tmp_path / "missing.zip")
+        with pytest.raises(FileNotFoundError, match="Checkpoint file not found"):
+            missing.validate()
+
+        corrupted = tmp_path / "corrupted.zip"
+        corrupted.write_text("not a zip")
+        with pytest.raises(ValueError, match="not a valid ZIP archive"):
+            CheckpointArchive(corrupted).validate()
+
+    def test_restore_opens_checkpoint_once(self, tmp_path):
+        """A restore with conflict check and auto-backup should open the ZIP only once."""
+        from foothold_checkpoint.core.archive import CheckpointArchive
+        from foothold_checkpoint.core.storage import check_restore_conflicts, restore_checkpoint
+        from tests.conftest import make_simple_campaign, make_test_config
+
+        checkpoint, saves_dir = _make_checkpoint(tmp_path)
+        (saves_dir / "foothold_test.lua").write_text("-- state 2", encoding="utf-8")
+        config = make_test_config(
+            checkpoints_dir=tmp_path / "checkpoints",
+            campaigns={"test": make_simple_campaign("Test", ["foothold_test.lua"])},
+        )
+        opened = []
+        original_init = zipfile.ZipFile.__init__
+
+        def tracking_init(self, file, mode="r", *args, **kwargs):
+            if mode == "r" and Path(file) == checkpoint:
+                opened.append(file)
+            original_init(self, file, mode, *args, **kwargs)
+
+        with (
+            patch.object(zipfile.ZipFile, "__init__", tracking_init),
+            CheckpointArchive(checkpoint) as archive,
+        ):
+            conflicts = check_restore_conflicts(archive, saves_dir)
+            restored = asyncio.run(
+                restore_checkpoint(
+                    archive,
+                    saves_dir,
+                    config=config,
+                    server_name="server",
+                    skip_overwrite_check=True,
+                )
+            )
+
+        assert conflicts == ["foothold_test.lua"]
+        assert restored == [saves_dir / "foothold_test.lua"]
+        assert len(opened) == 1
+        # The auto-backup was created from the shared archive's metadata
+        assert len(list((tmp_path / "checkpoints").glob("test_*.zip"))) == 2
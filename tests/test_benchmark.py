@@ -0,0 +1,51 @@
+"""Smoke test for the benchmark script (scripts/benchmark.py)."""
+
+import importlib.util
+import json
+import tempfile
+from pathlib import Path
+
+
+class TestBenchmarkScript:
+    """Test suite for the benchmark harness."""
+
+    def test_benchmark_writes_json_report(self):
+        """A tiny benchmark run should cover every operation and write valid JSON."""
+        script = Path(__file__).parent.parent / "scripts" / "benchmark.py"
+        spec = importlib.util.spec_from_file_location("foothold_benchmark", script)
+        assert spec is not None and spec.loader is not None
+        benchmark = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(benchmark)
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            output = Path(tmpdir) / "results.json"
+            benchmark.main(
+                [
+                    "--scales",
+                    "3",
+                    "--campaigns",
+                    "2",
+                    "--lua-mb",
+                    "0.05",
+                    "--repeat",
+                    "1",
+                    "--workers",
+                    "2",
+                    "--output",
+                    str(output),
+                ]
+            )
+
+            report = json.loads(output.read_text(encoding="utf-8"))
+
+        names = {result["name"] for result in report["results"]}
+        assert names == {
+            "save_checkpoint",
+            "save_all_campaigns[w=1]",
+            "save_all_campaigns[w=2]",
+            "restore_checkpoint",
+            "list_checkpoints[cold]",
+            "list_checkpoints[warm]",
+            "delete_checkpoint",
+        }
+        assert all(result["min_s"] >= 0 for result in report["results"])
@@ -0,0 +1,261 @@
+"""Tests for the deduplicating blob store and the dedup storage backend."""
+
+import asyncio
+import json
+import tempfile
+import zipfile
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+
+def _make_dedup_config(**kwargs):
+    """Create a test config using the dedup storage backend."""
+    from tests.conftest import make_simple_campaign, make_test_config
+
+    config = make_test_config(
+        campaigns={
+            "test": make_simple_campaign(
+                "Test", ["foothold_test.lua"], storage=["foothold_test_storage.csv"]
+            )
+        },
+        **kwargs,
+    )
+    return config.model_copy(update={"storage_backend": "dedup"})
+
+
+def _save(source_dir: Path, output_dir: Path, config, hour: int) -> Path:
+    """Save a dedup checkpoint of the test campaign."""
+    from datetime import datetime, timezone
+
+    from foothold_checkpoint.core.storage import save_checkpoint
+
+    return asyncio.run(
+        save_checkpoint(
+            campaign_name="test",
+            server_name="server",
+            source_dir=source_dir,
+            output_dir=output_dir,
+            config=config,
+            created_at=datetime(2024, 2, 14, hour, 0, 0, tzinfo=timezone.utc),
+        )
+    )
+
+
+class TestBlobStore:
+    """Test suite for BlobStore."""
+
+    def test_put_file_stores_identical_content_once(self):
+        """Files with the same content should share one blob."""
+        from foothold_checkpoint.core.blobstore import BlobStore
+        from foothold_checkpoint.core.checkpoint import compute_file_checksum
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            first = Path(tmpdir) / "a.lua"
+            second = Path(tmpdir) / "b.lua"
+            first.write_text("-- same content")
+            second.write_text("-- same content")
+            store = BlobStore(Path(tmpdir) / "checkpoints")
+
+            checksum = store.put_file(first)
+
+            assert checksum == compute_file_checksum(first)
+            assert store.put_file(second) == checksum
+            assert len([p for p in store.root.glob("*/*") if p.is_file()]) == 1
+            with store.open(checksum) as f:
+                assert f.read() == b"-- same content"
+
+    def test_collect_garbage_removes_unreferenced_blobs(self):
+        """Unreferenced blobs should be deleted, referenced ones kept."""
+        from foothold_checkpoint.core.blobstore import BlobStore
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            keep_file = Path(tmpdir) / "keep.lua"
+            drop_file = Path(tmpdir) / "drop.lua"
+            keep_file.write_text("-- keep")
+            drop_file.write_text("-- drop")
+            store = BlobStore(Path(tmpdir) / "checkpoints")
+            keep = store.put_file(keep_file)
+            drop = store.put_file(drop_file)
+
+            # Recent blobs are protected by the grace period
+            assert store.collect_garbage({keep}) == 0
+
+            assert store.collect_garbage({keep}, grace_seconds=-1) == 1
+            assert store.has(keep)
+            assert not store.has(drop)
+
+    def test_put_file_leaves_no_temporary_file_on_error(self):
+        """A failed write should not leave partial blobs behind."""
+        from foothold_checkpoint.core.blobstore import BlobStore
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            store = BlobStore(Path(tmpdir))
+
+            with pytest.raises(FileNotFoundError):
+                store.put_file(Path(tmpdir) / "missing.lua")
+
+            assert list(store.root.iterdir()) == []
+
+
+class TestDedupBackend:
+    """Test suite for checkpoints using the dedup storage backend."""
+
+    def test_dedup_checkpoint_is_manifest_only(self):
+        """A dedup checkpoint ZIP should only contain metadata.json."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            source_dir = Path(tmpdir) / "source"
+            source_dir.mkdir()
+            (source_dir / "foothold_test.lua").write_text("-- state 1")
+            (source_dir / "foothold_test_storage.csv").write_text("a,b")
+            output_dir = Path(tmpdir) / "checkpoints"
+
+            checkpoint_path = _save(source_dir, output_dir, _make_dedup_config(), 10)
+
+            with zipfile.ZipFile(checkpoint_path) as zf:
+                assert zf.namelist() == ["metadata.json"]
+                metadata = json.loads(zf.read("metadata.json"))
+            assert metadata["storage_backend"] == "dedup"
+            assert set(metadata["files"]) == {"foothold_test.lua", "foothold_test_storage.csv"}
+
+    def test_unchanged_files_are_stored_once(self):
+        """Consecutive checkpoints should share blobs for unchanged files."""
+        from foothold_checkpoint.core.blobstore import BlobStore
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            source_dir = Path(tmpdir) / "source"
+            source_dir.mkdir()
+            (source_dir / "foothold_test.lua").write_text("-- state 1")
+            (source_dir / "foothold_test_storage.csv").write_text("a,b")
+            output_dir = Path(tmpdir) / "checkpoints"
+            config = _make_dedup_config()
+
+            _save(source_dir, output_dir, config, 10)
+            (source_dir / "foothold_test.lua").write_text("-- state 2")
+            _save(source_dir, output_dir, config, 11)
+
+            blobs = [p for p in BlobStore(output_dir).root.glob("*/*") if p.is_file()]
+            assert len(blobs) == 3  # two persistence states + one shared storage CSV
+
+    def test_list_and_restore_dedup_checkpoint(self):
+        """Dedup checkpoints should list their files and restore verified content."""
+        from foothold_checkpoint.core.storage import list_checkpoints, restore_checkpoint
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            source_dir = Path(tmpdir) / "source"
+            source_dir.mkdir()
+            (source_dir / "foothold_test.lua").write_text("-- state 1")
+            (source_dir / "foothold_test_storage.csv").write_text("a,b")
+            output_dir = Path(tmpdir) / "checkpoints"
+            checkpoint_path = _save(source_dir, output_dir, _make_dedup_config(), 10)
+
+            checkpoints = asyncio.run(list_checkpoints(output_dir))
+            assert sorted(checkpoints[0]["files"]) == [
+                "foothold_test.lua",
+                "foothold_test_storage.csv",
+            ]
+
+            target_dir = Path(tmpdir) / "target"
+            target_dir.mkdir()
+            restored = asyncio.run(
+                restore_checkpoint(checkpoint_path=checkpoint_path, target_dir=target_dir)
+            )
+
+            assert sorted(p.name for p in restored) == [
+                "foothold_test.lua",
+                "foothold_test_storage.csv",
+            ]
+            assert (target_dir / "foothold_test.lua").read_text() == "-- state 1"
+
+    def test_restore_fails_when_blob_missing(self):
+        """Restoring a manifest whose blob is gone should raise ValueError."""
+        from foothold_checkpoint.core.blobstore import BlobStore
+        from foothold_checkpoint.core.storage import restore_checkpoint
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            source_dir = Path(tmpdir) / "source"
+            source_dir.mkdir()
+            (source_dir / "foothold_test.lua").write_text("-- state 1")
+            output_dir = Path(tmpdir) / "checkpoints"
+            checkpoint_path = _save(source_dir, output_dir, _make_dedup_config(), 10)
+
+            for blob in BlobStore(output_dir).root.glob("*/*"):
+                blob.unlink()
+
+            target_dir = Path(tmpdir) / "target"
+            target_dir.mkdir()
+            with pytest.raises(ValueError, match="missing from blob store"):
+                asyncio.run(
+                    restore_checkpoint(checkpoint_path=checkpoint_path, target_dir=target_dir)
+                )
+            assert list(target_dir.iterdir()) == []
+
+    def test_delete_collects_unreferenced_blobs(self):
+        """Deleting a dedup checkpoint should only remove blobs no longer referenced."""
+        from foothold_checkpoint.core.blobstore import BlobStore
+        from foothold_checkpoint.core.storage import delete_checkpoint
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            source_dir = Path(tmpdir) / "source"
+            source_dir.mkdir()
+            (source_dir / "foothold_test.lua").write_text("-- state 1")
+            (source_dir / "foothold_test_storage.csv").write_text("a,b")
+            output_dir = Path(tmpdir) / "checkpoints"
+            config = _make_dedup_config()
+
+            first = _save(source_dir, output_dir, config, 10)
+            (source_dir / "foothold_test.lua").write_text("-- state 2")
+            _save(source_dir, output_dir, config, 11)
+
+            with patch("foothold_checkpoint.core.blobstore.GC_GRACE_SECONDS", -1):
+                asyncio.run(delete_checkpoint(first, force=True))
+
+            blobs = [p for p in BlobStore(output_dir).root.glob("*/*") if p.is_file()]
+            assert len(blobs) == 2
+
+    def test_export_materializes_self_contained_zip(self):
+        """export_checkpoint should produce a classic ZIP restorable without blobs."""
+        from foothold_checkpoint.core.storage import export_checkpoint, restore_checkpoint
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            source_dir = Path(tmpdir) / "source"
+            source_dir.mkdir()
+            (source_dir / "foothold_test.lua").write_text("-- state 1")
+            (source_dir / "foothold_test_storage.csv").write_text("a,b")
+            output_dir = Path(tmpdir) / "checkpoints"
+            checkpoint_path = _save(source_dir, output_dir, _make_dedup_config(), 10)
+
+            export_dir = Path(tmpdir) / "export"
+            export_dir.mkdir()
+            exported = asyncio.run(export_checkpoint(checkpoint_path, export_dir))
+
+            assert exported == export_dir / checkpoint_path.name
+            with zipfile.ZipFile(exported) as zf:
+                assert sorted(zf.namelist()) == [
+                    "foothold_test.lua",
+                    "foothold_test_storage.csv",
+                    "metadata.json",
+                ]
+                assert json.loads(zf.read("metadata.json"))["storage_backend"] == "zip"
+
+            target_dir = Path(tmpdir) / "target"
+            target_dir.mkdir()
+            asyncio.run(restore_checkpoint(checkpoint_path=exported, target_dir=target_dir))
+            assert (target_dir / "foothold_test.lua").read_text() == "-- state 1"
+
+            with pytest.raises(FileExistsError):
+                asyncio.run(export_checkpoint(checkpoint_path, export_dir))
+
+    def test_config_rejects_unknown_storage_backend(self):
+        """Config should only accept the zip and dedup backends."""
+        from pydantic import ValidationError
+
+        from foothold_checkpoint.core.config import Config
+
+        with pytest.raises(ValidationError):
+            Config(
+                checkpoints_dir=Path("checkpoints"),
+                campaigns_file=Path("campaigns.yaml"),
+                storage_backend="tar",
+            )
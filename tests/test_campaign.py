@@ -570,3 +570,84 @@ class TestUnknownFileDetection:
         assert "display_name:" in result
         assert "files:" in result
         assert "persistence:" in result
+
+
+class TestCampaignIndex:
+    """Test suite for the compiled campaign index."""
+
+    def test_lookups_are_case_insensitive_and_canonical(self):
+        """Renamed and differently cased files should map to the current name."""
+        from tests.conftest import make_simple_campaign, make_test_config
+
+        config = make_test_config(
+            campaigns={
+                "syria": make_simple_campaign(
+                    "Syria", ["foothold_syria.lua", "foothold_syria_old.lua"]
+                )
+            }
+        )
+        index = config.campaign_index
+
+        match = index.lookup("FOOTHOLD_SYRIA_OLD.lua")
+        assert match is not None
+        assert (match.campaign, match.file_type, match.canonical_name) == (
+            "syria",
+            "persistence",
+            "foothold_syria.lua",
+        )
+        assert index.canonical_name("foothold_syria_old.lua", "syria") == "foothold_syria.lua"
+        assert index.canonical_name("other.lua", "syria") == "other.lua"
+        assert index.lookup("foothold_caucasus.lua") is None
+        assert index.is_unknown("foothold_caucasus.lua")
+        assert not index.is_unknown("Foothold_Ranks.lua")
+        assert not index.is_unknown(".foothold_hidden.lua")
+
+    def test_required_types_and_missing_files(self):
+        """Missing required file types should be reported with their canonical name."""
+        from foothold_checkpoint.core.config import (
+            CampaignConfig,
+            CampaignFileList,
+            CampaignFileType,
+        )
+        from tests.conftest import make_test_config
+
+        config = make_test_config(
+            campaigns={
+                "syria": CampaignConfig(
+                    display_name="Syria",
+                    files=CampaignFileList(
+                        persistence=CampaignFileType(files=["foothold_syria.lua"]),
+                        ctld_save=CampaignFileType(files=["foothold_syria_CTLD_Save.csv"]),
+                        ctld_farps=CampaignFileType(files=[], optional=True),
+                        storage=CampaignFileType(
+                            files=["foothold_syria_storage.csv"], optional=True
+                        ),
+                    ),
+                )
+            }
+        )
+        index = config.campaign_index
+
+        assert set(index.required_types("syria")) == {"persistence", "ctld_save"}
+        assert index.required_types("syria")["ctld_save"] == {"foothold_syria_ctld_save.csv"}
+        missing = index.missing_required_types("syria", ["FOOTHOLD_SYRIA.lua"])
+        assert [(m.file_type, m.canonical_name) for m in missing] == [
+            ("ctld_save", "foothold_syria_CTLD_Save.csv")
+        ]
+        assert index.missing_required_types("unknown", []) == []
+
+    def test_index_is_built_once_per_config(self):
+        """The index should be cached on the config and follow replaced campaigns."""
+        from tests.conftest import make_simple_campaign, make_test_config
+
+        config = make_test_config(
+            campaigns={"syria": make_simple_campaign("Syria", ["foothold_syria.lua"])}
+        )
+        index = config.campaign_index
+        assert config.campaign_index is index
+
+        copy = config.model_copy(
+            update={"campaigns": {"test": make_simple_campaign("Test", ["foothold_test.lua"])}}
+        )
+        assert copy.campaign_index.lookup("foothold_test.lua") is not None
+        assert copy == copy.model_copy()
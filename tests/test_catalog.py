@@ -0,0 +1,236 @@
+"""Tests for the persistent checkpoint catalog index."""
+
+import asyncio
+import json
+import tempfile
+import zipfile
+from datetime import datetime, timezone
+from pathlib import Path
+from unittest.mock import patch
+
+
+def _make_checkpoint(output_dir: Path, campaign: str = "afghanistan", hour: int = 10) -> Path:
+    """Create a real checkpoint in output_dir and return its path."""
+    from foothold_checkpoint.core.checkpoint import create_checkpoint
+
+    source = output_dir.parent / f"source_{campaign}_{hour}"
+    source.mkdir(exist_ok=True)
+    campaign_file = source / f"foothold_{campaign}.lua"
+    campaign_file.write_text(f"-- {campaign} {hour}")
+
+    return create_checkpoint(
+        campaign_name=campaign,
+        server_name="test-server",
+        campaign_files=[campaign_file],
+        output_dir=output_dir,
+        created_at=datetime(2024, 2, 14, hour, 0, 0, tzinfo=timezone.utc),
+    )
+
+
+class TestCheckpointCatalog:
+    """Test suite for CheckpointCatalog."""
+
+    def test_create_checkpoint_records_entry(self):
+        """create_checkpoint should add the new archive to the catalog file."""
+        from foothold_checkpoint.core.catalog import CATALOG_FILENAME
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            output_dir = Path(tmpdir) / "checkpoints"
+            zip_path = _make_checkpoint(output_dir)
+
+            lines = (output_dir / CATALOG_FILENAME).read_text(encoding="utf-8").splitlines()
+            records = [json.loads(line) for line in lines[1:]]
+
+            assert records[-1]["filename"] == zip_path.name
+            assert records[-1]["metadata"]["campaign_name"] == "afghanistan"
+            assert records[-1]["members"] == ["foothold_afghanistan.lua"]
+
+    def test_warm_refresh_does_not_open_archives(self):
+        """A refresh with unchanged archives should rely on stat() only."""
+        from foothold_checkpoint.core.catalog import CheckpointCatalog
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            output_dir = Path(tmpdir) / "checkpoints"
+            _make_checkpoint(output_dir, hour=10)
+            _make_checkpoint(output_dir, hour=11)
+
+            # A fresh instance loads the catalog file written by create_checkpoint
+            catalog = CheckpointCatalog(output_dir)
+            with patch("foothold_checkpoint.core.catalog.zipfile.ZipFile") as mock_zip:
+                entries = catalog.refresh()
+
+            mock_zip.assert_not_called()
+            assert len(entries) == 2
+
+    def test_refresh_reindexes_changed_archive(self):
+        """An archive whose size or mtime changed should be reopened."""
+        from foothold_checkpoint.core.catalog import CheckpointCatalog
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            output_dir = Path(tmpdir) / "checkpoints"
+            zip_path = _make_checkpoint(output_dir)
+            catalog = CheckpointCatalog(output_dir)
+            catalog.refresh()
+
+            # Overwrite the archive with an invalid one
+            zip_path.write_bytes(b"not a zip file")
+            entries = catalog.refresh()
+
+            assert len(entries) == 1
+            assert entries[0].metadata is None
+
+    def test_refresh_drops_removed_archives(self):
+        """Archives removed outside the tool should disappear from the catalog."""
+        from foothold_checkpoint.core.catalog import CheckpointCatalog
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            output_dir = Path(tmpdir) / "checkpoints"
+            zip_path = _make_checkpoint(output_dir)
+            catalog = CheckpointCatalog(output_dir)
+            catalog.refresh()
+
+            zip_path.unlink()
+
+            assert catalog.refresh() == []
+            # A new instance should not resurrect the removed entry
+            assert CheckpointCatalog(output_dir).refresh() == []
+
+    def test_corrupted_catalog_file_is_rebuilt(self):
+        """A corrupted catalog file should only cost a rescan."""
+        from foothold_checkpoint.core.catalog import CATALOG_FILENAME, CheckpointCatalog
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            output_dir = Path(tmpdir) / "checkpoints"
+            zip_path = _make_checkpoint(output_dir)
+            (output_dir / CATALOG_FILENAME).write_text("garbage\n{broken", encoding="utf-8")
+
+            entries = CheckpointCatalog(output_dir).refresh()
+
+            assert [e.filename for e in entries] == [zip_path.name]
+            assert entries[0].metadata is not None
+
+    def test_invalid_archives_are_cached(self):
+        """Invalid archives should not be reopened while unchanged."""
+        from foothold_checkpoint.core.catalog import CheckpointCatalog
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            output_dir = Path(tmpdir)
+            with zipfile.ZipFile(output_dir / "no_metadata.zip", "w") as zf:
+                zf.writestr("foothold_test.lua", "-- test")
+
+            catalog = CheckpointCatalog(output_dir)
+            assert catalog.refresh()[0].metadata is None
+
+            with patch("foothold_checkpoint.core.catalog.zipfile.ZipFile") as mock_zip:
+                catalog.refresh()
+            mock_zip.assert_not_called()
+
+    def test_delete_checkpoint_forgets_entry(self):
+        """delete_checkpoint should remove the entry from the catalog."""
+        from foothold_checkpoint.core.catalog import CheckpointCatalog
+        from foothold_checkpoint.core.storage import delete_checkpoint, list_checkpoints
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            output_dir = Path(tmpdir) / "checkpoints"
+            zip_path = _make_checkpoint(output_dir)
+            assert len(asyncio.run(list_checkpoints(output_dir))) == 1
+
+            asyncio.run(delete_checkpoint(zip_path, force=True))
+
+            catalog = CheckpointCatalog(output_dir)
+            catalog._load_if_changed()
+            assert catalog.get(zip_path.name) is None
+            assert asyncio.run(list_checkpoints(output_dir)) == []
+
+    def test_list_checkpoints_uses_catalog(self):
+        """list_checkpoints should return catalog data without reopening archives."""
+        from foothold_checkpoint.core.storage import list_checkpoints
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            output_dir = Path(tmpdir) / "checkpoints"
+            _make_checkpoint(output_dir, campaign="afghanistan")
+            _make_checkpoint(output_dir, campaign="syria")
+
+            with patch("foothold_checkpoint.core.catalog.zipfile.ZipFile") as mock_zip:
+                result = asyncio.run(list_checkpoints(output_dir, campaign_filter="syria"))
+
+            mock_zip.assert_not_called()
+            assert len(result) == 1
+            assert result[0]["campaign"] == "syria"
+            assert result[0]["files"] == ["foothold_syria.lua"]
+            assert result[0]["size_bytes"] > 0
+
+    def test_compaction_drops_superseded_lines(self):
+        """The catalog file should be compacted when stale lines dominate."""
+        from foothold_checkpoint.core import catalog as catalog_module
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            output_dir = Path(tmpdir) / "checkpoints"
+            zip_path = _make_checkpoint(output_dir)
+            catalog = catalog_module.CheckpointCatalog(output_dir)
+
+            with patch.object(catalog_module, "_COMPACT_THRESHOLD", 2):
+                for _ in range(5):
+                    catalog.record(zip_path)
+                catalog.refresh()
+
+            lines = catalog.catalog_path.read_text(encoding="utf-8").splitlines()
+            assert len(lines) == 2  # header + one live entry
+
+
+class TestMetadataComment:
+    """Test suite for the metadata copy stored in the archive comment."""
+
+    def test_metadata_is_stored_and_mirrored_in_comment(self, tmp_path):
+        """metadata.json should be uncompressed and mirrored in the ZIP comment."""
+        from foothold_checkpoint.core.checkpoint import read_metadata_comment
+
+        zip_path = _make_checkpoint(tmp_path / "checkpoints")
+
+        with zipfile.ZipFile(zip_path) as zf:
+            assert zf.getinfo("metadata.json").compress_type == zipfile.ZIP_STORED
+            stored = json.loads(zf.read("metadata.json"))
+
+        assert read_metadata_comment(zip_path) == stored
+
+    def test_cold_index_does_not_parse_archives_with_comment(self, tmp_path):
+        """New archives should be indexed from their comment, without zipfile."""
+        from foothold_checkpoint.core.catalog import CATALOG_FILENAME, CheckpointCatalog
+
+        output_dir = tmp_path / "checkpoints"
+        zip_path = _make_checkpoint(output_dir)
+        (output_dir / CATALOG_FILENAME).unlink()
+
+        with patch("foothold_checkpoint.core.catalog.zipfile.ZipFile") as mock_zip:
+            entries = CheckpointCatalog(output_dir).refresh()
+
+        mock_zip.assert_not_called()
+        assert entries[0].filename == zip_path.name
+        assert entries[0].metadata["campaign_name"] == "afghanistan"
+        assert entries[0].members == ["foothold_afghanistan.lua"]
+
+    def test_archives_without_comment_fall_back_to_zipfile(self, tmp_path):
+        """Old archives and long comments should still be read correctly."""
+        from foothold_checkpoint.core.catalog import CheckpointCatalog
+        from foothold_checkpoint.core.checkpoint import (
+            METADATA_COMMENT_PREFIX,
+            read_metadata_comment,
+        )
+
+        metadata = {"campaign_name": "syria", "files": {"foothold_syria.lua": "sha256:00"}}
+        old = tmp_path / "syria_old.zip"
+        with zipfile.ZipFile(old, "w", zipfile.ZIP_DEFLATED) as zf:
+            zf.writestr("foothold_syria.lua", "-- syria")
+            zf.writestr("metadata.json", json.dumps(metadata))
+        long_comment = tmp_path / "syria_long.zip"
+        with zipfile.ZipFile(long_comment, "w") as zf:
+            zf.writestr("metadata.json", "{}")
+            zf.comment = (
+                METADATA_COMMENT_PREFIX + json.dumps({**metadata, "comment": "x" * 10000}).encode()
+            )
+
+        assert read_metadata_comment(old) is None
+        assert read_metadata_comment(long_comment)["comment"] == "x" * 10000
+        entries = {e.filename: e for e in CheckpointCatalog(tmp_path).refresh()}
+        assert entries["syria_old.zip"].metadata == metadata
+        assert entries["syria_old.zip"].members == ["foothold_syria.lua"]
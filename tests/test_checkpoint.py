@@ -866,6 +866,148 @@ class TestZIPCreation:
                 output_dir=output_dir,
             )
 
+    def test_create_checkpoint_stored_compression(self, tmp_path):
+        """Should store files uncompressed and record the method when requested."""
+        import json
+        import zipfile
+
+        from foothold_checkpoint.core.checkpoint import create_checkpoint
+        from foothold_checkpoint.core.config import CompressionConfig
+
+        source_dir = tmp_path / "source"
+        source_dir.mkdir()
+        (source_dir / "foothold_afghanistan.lua").write_text("-- Lua content", encoding="utf-8")
+
+        zip_path = create_checkpoint(
+            campaign_name="afghanistan",
+            server_name="production-1",
+            campaign_files=[source_dir / "foothold_afghanistan.lua"],
+            output_dir=tmp_path / "checkpoints",
+            compression=CompressionConfig(method="stored"),
+        )
+
+        with zipfile.ZipFile(zip_path, "r") as zf:
+            info = zf.getinfo("foothold_afghanistan.lua")
+            assert info.compress_type == zipfile.ZIP_STORED
+            metadata = json.loads(zf.read("metadata.json"))
+        assert metadata["compression"] == "stored"
+        assert metadata["compression_level"] is None
+
+    def test_create_checkpoint_applies_compression_level(self, tmp_path):
+        """Should compress members at the configured level, not the zlib default."""
+        import random
+        import zipfile
+        import zlib
+
+        from foothold_checkpoint.core.checkpoint import create_checkpoint
+        from foothold_checkpoint.core.config import CompressionConfig
+
+        source_file = tmp_path / "foothold_afghanistan.lua"
+        rng = random.Random(0)
+        words = ["zone", "blue", "red", "farp", "supply", "unit", "group", "= true,", "\n"]
+        content = " ".join(rng.choice(words) for _ in range(50_000)).encode()
+        source_file.write_bytes(content)
+
+        sizes = {}
+        for level in (1, 9):
+            zip_path = create_checkpoint(
+                campaign_name="afghanistan",
+                server_name="production-1",
+                campaign_files=[source_file],
+                output_dir=tmp_path / f"level{level}",
+                compression=CompressionConfig(method="deflated", level=level),
+            )
+            with zipfile.ZipFile(zip_path, "r") as zf:
+                sizes[level] = zf.getinfo("foothold_afghanistan.lua").compress_size
+
+            compressor = zlib.compressobj(level, zlib.DEFLATED, -15)
+            expected = len(compressor.compress(content) + compressor.flush())
+            assert sizes[level] == expected
+
+        assert sizes[9] < sizes[1]
+
+    def test_create_checkpoint_defaults_to_deflated(self, tmp_path):
+        """Should keep DEFLATED at the default level when no compression is given."""
+        import zipfile
+
+        from foothold_checkpoint.core.checkpoint import create_checkpoint
+
+        source_dir = tmp_path / "source"
+        source_dir.mkdir()
+        (source_dir / "foothold_afghanistan.lua").write_text("-- Lua content", encoding="utf-8")
+
+        zip_path = create_checkpoint(
+            campaign_name="afghanistan",
+            server_name="production-1",
+            campaign_files=[source_dir / "foothold_afghanistan.lua"],
+            output_dir=tmp_path / "checkpoints",
+        )
+
+        with zipfile.ZipFile(zip_path, "r") as zf:
+            assert zf.getinfo("foothold_afghanistan.lua").compress_type == zipfile.ZIP_DEFLATED
+
+    def test_create_checkpoint_reads_each_file_once(self, tmp_path):
+        """Should hash and compress each source file from a single read."""
+        import builtins
+        import hashlib
+        import json
+        import zipfile
+        from unittest.mock import patch
+
+        from foothold_checkpoint.core.checkpoint import create_checkpoint
+
+        source_file = tmp_path / "foothold_afghanistan.lua"
+        content = b"-- Lua content\n" * 200_000
+        source_file.write_bytes(content)
+
+        opened = []
+        original_open = builtins.open
+
+        def counting_open(file, *args, **kwargs):
+            opened.append(Path(file).name if isinstance(file, str | Path) else file)
+            return original_open(file, *args, **kwargs)
+
+        with patch("builtins.open", counting_open):
+            zip_path = create_checkpoint(
+                campaign_name="afghanistan",
+                server_name="production-1",
+                campaign_files=[source_file],
+                output_dir=tmp_path / "checkpoints",
+            )
+
+        assert opened.count("foothold_afghanistan.lua") == 1
+        with zipfile.ZipFile(zip_path, "r") as zf:
+            assert zf.read("foothold_afghanistan.lua") == content
+            metadata = json.loads(zf.read("metadata.json"))
+        expected = f"sha256:{hashlib.sha256(content).hexdigest()}"
+        assert metadata["files"]["foothold_afghanistan.lua"] == expected
+
+    def test_create_checkpoint_failure_leaves_no_partial_archive(self, tmp_path):
+        """Should not leave a partial ZIP behind when reading a file fails."""
+        from unittest.mock import patch
+
+        from foothold_checkpoint.core.checkpoint import create_checkpoint
+
+        source_file = tmp_path / "foothold_afghanistan.lua"
+        source_file.write_text("-- Lua content", encoding="utf-8")
+        output_dir = tmp_path / "checkpoints"
+
+        with (
+            patch(
+                "foothold_checkpoint.core.checkpoint._write_zip_member",
+                side_effect=OSError("Read error"),
+            ),
+            pytest.raises(OSError, match="Read error"),
+        ):
+            create_checkpoint(
+                campaign_name="afghanistan",
+                server_name="production-1",
+                campaign_files=[source_file],
+                output_dir=output_dir,
+            )
+
+        assert list(output_dir.iterdir()) == []
+
 
 class TestProgressTracking:
     """Test suite for progress tracking callbacks."""
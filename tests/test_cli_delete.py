@@ -107,6 +107,7 @@ class TestDeleteCommandInteractive:
         from typer.testing import CliRunner
 
         from foothold_checkpoint.cli import app
+        from foothold_checkpoint.core.storage import CheckpointInfo
 
         runner = CliRunner()
         with (
@@ -119,16 +120,18 @@ class TestDeleteCommandInteractive:
             mock_load.return_value = mock_config
 
             mock_list.return_value = [
-                {
-                    "filename": "afghanistan_2024-02-14_10-30-00.zip",
-                    "campaign": "afghanistan",
-                    "server": "test-server",
-                    "timestamp": "2024-02-14T10:30:00",
-                    "size_bytes": 1048576,
-                    "size_human": "1.0 MB",
-                    "name": None,
-                    "comment": None,
-                },
+                CheckpointInfo.from_dict(
+                    {
+                        "filename": "afghanistan_2024-02-14_10-30-00.zip",
+                        "campaign": "afghanistan",
+                        "server": "test-server",
+                        "timestamp": "2024-02-14T10:30:00",
+                        "size_bytes": 1048576,
+                        "size_human": "1.0 MB",
+                        "name": None,
+                        "comment": None,
+                    }
+                ),
             ]
 
             mock_delete.return_value = {
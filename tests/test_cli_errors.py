@@ -59,7 +59,7 @@ def test_save_campaign_not_found_error_message() -> None:
     with (
         patch("foothold_checkpoint.cli.load_config", return_value=mock_config),
         patch("foothold_checkpoint.cli.Path.exists", return_value=True),
-        patch("foothold_checkpoint.cli.Path.iterdir", return_value=[]),
+        patch("foothold_checkpoint.cli.scan_directory", return_value={}),
         patch("foothold_checkpoint.cli.detect_campaigns", return_value=detected_campaigns),
         patch("foothold_checkpoint.cli._quiet_mode", True),
     ):
@@ -111,7 +111,7 @@ def test_save_no_campaigns_detected_error() -> None:
     with (
         patch("foothold_checkpoint.cli.load_config", return_value=mock_config),
         patch("foothold_checkpoint.cli.Path.exists", return_value=True),
-        patch("foothold_checkpoint.cli.Path.iterdir", return_value=[]),
+        patch("foothold_checkpoint.cli.scan_directory", return_value={}),
         patch("foothold_checkpoint.cli.detect_campaigns", return_value={}),
         patch("foothold_checkpoint.cli._quiet_mode", True),
     ):
@@ -282,7 +282,7 @@ def test_save_permission_error_on_checkpoint_directory() -> None:
     with (
         patch("foothold_checkpoint.cli.load_config", return_value=mock_config),
         patch("foothold_checkpoint.cli.Path.exists", return_value=True),
-        patch("foothold_checkpoint.cli.Path.iterdir", return_value=[]),
+        patch("foothold_checkpoint.cli.scan_directory", return_value={}),
         patch("foothold_checkpoint.cli.detect_campaigns", return_value=detected_campaigns),
         patch("foothold_checkpoint.cli.Path.mkdir", side_effect=PermissionError("Access denied")),
         patch("foothold_checkpoint.cli._quiet_mode", True),
@@ -340,7 +340,8 @@ def test_save_flags_validation_accepts_campaign_only() -> None:
         patch("foothold_checkpoint.cli.load_config", return_value=mock_config),
         patch("foothold_checkpoint.cli.Path.exists", return_value=True),
         patch(
-            "foothold_checkpoint.cli.Path.iterdir", return_value=[Path("Foothold_Afghan_v0.1.lua")]
+            "foothold_checkpoint.cli.scan_directory",
+            return_value=dict.fromkeys(["Foothold_Afghan_v0.1.lua"]),
         ),
         patch("foothold_checkpoint.cli.detect_campaigns", return_value=detected_campaigns),
         patch("foothold_checkpoint.cli.create_checkpoint"),
@@ -371,7 +372,8 @@ def test_save_flags_validation_accepts_all_only() -> None:
         patch("foothold_checkpoint.cli.load_config", return_value=mock_config),
         patch("foothold_checkpoint.cli.Path.exists", return_value=True),
         patch(
-            "foothold_checkpoint.cli.Path.iterdir", return_value=[Path("Foothold_Afghan_v0.1.lua")]
+            "foothold_checkpoint.cli.scan_directory",
+            return_value=dict.fromkeys(["Foothold_Afghan_v0.1.lua"]),
         ),
         patch("foothold_checkpoint.cli.detect_campaigns", return_value=detected_campaigns),
         patch("foothold_checkpoint.cli.create_checkpoint"),
@@ -11,6 +11,7 @@ class TestListCommandBasic:
         from typer.testing import CliRunner
 
         from foothold_checkpoint.cli import app
+        from foothold_checkpoint.core.storage import CheckpointInfo
 
         config_file = tmp_path / "config.yaml"
         config_file.write_text(
@@ -30,26 +31,30 @@ class TestListCommandBasic:
             mock_load.return_value = mock_config
 
             mock_list.return_value = [
-                {
-                    "filename": "afghanistan_2024-02-14_10-30-00.zip",
-                    "campaign": "afghanistan",
-                    "server": "test-server",
-                    "timestamp": "2024-02-14T10:30:00",
-                    "size_bytes": 1048576,
-                    "size_human": "1.0 MB",
-                    "name": None,
-                    "comment": None,
-                },
-                {
-                    "filename": "syria_2024-02-13_15-45-00.zip",
-                    "campaign": "syria",
-                    "server": "prod-1",
-                    "timestamp": "2024-02-13T15:45:00",
-                    "size_bytes": 2097152,
-                    "size_human": "2.0 MB",
-                    "name": "Before mission",
-                    "comment": None,
-                },
+                CheckpointInfo.from_dict(
+                    {
+                        "filename": "afghanistan_2024-02-14_10-30-00.zip",
+                        "campaign": "afghanistan",
+                        "server": "test-server",
+                        "timestamp": "2024-02-14T10:30:00",
+                        "size_bytes": 1048576,
+                        "size_human": "1.0 MB",
+                        "name": None,
+                        "comment": None,
+                    }
+                ),
+                CheckpointInfo.from_dict(
+                    {
+                        "filename": "syria_2024-02-13_15-45-00.zip",
+                        "campaign": "syria",
+                        "server": "prod-1",
+                        "timestamp": "2024-02-13T15:45:00",
+                        "size_bytes": 2097152,
+                        "size_human": "2.0 MB",
+                        "name": "Before mission",
+                        "comment": None,
+                    }
+                ),
             ]
 
             result = runner.invoke(app, ["list"])
@@ -58,7 +63,16 @@ class TestListCommandBasic:
         assert "afghanistan" in result.stdout
         assert "syria" in result.stdout
         mock_list.assert_called_once_with(
-            tmp_path / "checkpoints", server_filter=None, campaign_filter=None
+            tmp_path / "checkpoints",
+            server_filter=None,
+            campaign_filter=None,
+            kind="all",
+            since=None,
+            until=None,
+            sort="default",
+            descending=False,
+            offset=0,
+            limit=None,
         )
 
     def test_list_with_server_filter(self, tmp_path):
@@ -66,6 +80,7 @@ class TestListCommandBasic:
         from typer.testing import CliRunner
 
         from foothold_checkpoint.cli import app
+        from foothold_checkpoint.core.storage import CheckpointInfo
 
         runner = CliRunner()
         with (
@@ -77,23 +92,34 @@ class TestListCommandBasic:
             mock_load.return_value = mock_config
 
             mock_list.return_value = [
-                {
-                    "filename": "afghanistan_2024-02-14_10-30-00.zip",
-                    "campaign": "afghanistan",
-                    "server": "test-server",
-                    "timestamp": "2024-02-14T10:30:00",
-                    "size_bytes": 1048576,
-                    "size_human": "1.0 MB",
-                    "name": None,
-                    "comment": None,
-                },
+                CheckpointInfo.from_dict(
+                    {
+                        "filename": "afghanistan_2024-02-14_10-30-00.zip",
+                        "campaign": "afghanistan",
+                        "server": "test-server",
+                        "timestamp": "2024-02-14T10:30:00",
+                        "size_bytes": 1048576,
+                        "size_human": "1.0 MB",
+                        "name": None,
+                        "comment": None,
+                    }
+                ),
             ]
 
             result = runner.invoke(app, ["list", "--server", "test-server"])
 
         assert result.exit_code == 0
         mock_list.assert_called_once_with(
-            tmp_path / "checkpoints", server_filter="test-server", campaign_filter=None
+            tmp_path / "checkpoints",
+            server_filter="test-server",
+            campaign_filter=None,
+            kind="all",
+            since=None,
+            until=None,
+            sort="default",
+            descending=False,
+            offset=0,
+            limit=None,
         )
 
     def test_list_with_campaign_filter(self, tmp_path):
@@ -101,6 +127,7 @@ class TestListCommandBasic:
         from typer.testing import CliRunner
 
         from foothold_checkpoint.cli import app
+        from foothold_checkpoint.core.storage import CheckpointInfo
 
         runner = CliRunner()
         with (
@@ -112,23 +139,34 @@ class TestListCommandBasic:
             mock_load.return_value = mock_config
 
             mock_list.return_value = [
-                {
-                    "filename": "afghanistan_2024-02-14_10-30-00.zip",
-                    "campaign": "afghanistan",
-                    "server": "test-server",
-                    "timestamp": "2024-02-14T10:30:00",
-                    "size_bytes": 1048576,
-                    "size_human": "1.0 MB",
-                    "name": None,
-                    "comment": None,
-                },
+                CheckpointInfo.from_dict(
+                    {
+                        "filename": "afghanistan_2024-02-14_10-30-00.zip",
+                        "campaign": "afghanistan",
+                        "server": "test-server",
+                        "timestamp": "2024-02-14T10:30:00",
+                        "size_bytes": 1048576,
+                        "size_human": "1.0 MB",
+                        "name": None,
+                        "comment": None,
+                    }
+                ),
             ]
 
             result = runner.invoke(app, ["list", "--campaign", "afghanistan"])
 
         assert result.exit_code == 0
         mock_list.assert_called_once_with(
-            tmp_path / "checkpoints", server_filter=None, campaign_filter="afghanistan"
+            tmp_path / "checkpoints",
+            server_filter=None,
+            campaign_filter="afghanistan",
+            kind="all",
+            since=None,
+            until=None,
+            sort="default",
+            descending=False,
+            offset=0,
+            limit=None,
         )
 
     def test_list_with_both_filters(self, tmp_path):
@@ -136,6 +174,7 @@ class TestListCommandBasic:
         from typer.testing import CliRunner
 
         from foothold_checkpoint.cli import app
+        from foothold_checkpoint.core.storage import CheckpointInfo
 
         runner = CliRunner()
         with (
@@ -147,16 +186,18 @@ class TestListCommandBasic:
             mock_load.return_value = mock_config
 
             mock_list.return_value = [
-                {
-                    "filename": "afghanistan_2024-02-14_10-30-00.zip",
-                    "campaign": "afghanistan",
-                    "server": "test-server",
-                    "timestamp": "2024-02-14T10:30:00",
-                    "size_bytes": 1048576,
-                    "size_human": "1.0 MB",
-                    "name": None,
-                    "comment": None,
-                },
+                CheckpointInfo.from_dict(
+                    {
+                        "filename": "afghanistan_2024-02-14_10-30-00.zip",
+                        "campaign": "afghanistan",
+                        "server": "test-server",
+                        "timestamp": "2024-02-14T10:30:00",
+                        "size_bytes": 1048576,
+                        "size_human": "1.0 MB",
+                        "name": None,
+                        "comment": None,
+                    }
+                ),
             ]
 
             result = runner.invoke(
@@ -165,7 +206,16 @@ class TestListCommandBasic:
 
         assert result.exit_code == 0
         mock_list.assert_called_once_with(
-            tmp_path / "checkpoints", server_filter="test-server", campaign_filter="afghanistan"
+            tmp_path / "checkpoints",
+            server_filter="test-server",
+            campaign_filter="afghanistan",
+            kind="all",
+            since=None,
+            until=None,
+            sort="default",
+            descending=False,
+            offset=0,
+            limit=None,
         )
 
 
@@ -177,6 +227,7 @@ class TestListCommandTableFormatting:
         from typer.testing import CliRunner
 
         from foothold_checkpoint.cli import app
+        from foothold_checkpoint.core.storage import CheckpointInfo
 
         runner = CliRunner()
         with (
@@ -188,16 +239,18 @@ class TestListCommandTableFormatting:
             mock_load.return_value = mock_config
 
             mock_list.return_value = [
-                {
-                    "filename": "afghanistan_checkpoint.zip",
-                    "campaign": "afghanistan",
-                    "server": "test-server",
-                    "timestamp": "2024-03-15T10:30:00",
-                    "size_bytes": 1048576,
-                    "size_human": "1.0 MB",
-                    "name": "Before update",
-                    "comment": "Test checkpoint",
-                },
+                CheckpointInfo.from_dict(
+                    {
+                        "filename": "afghanistan_checkpoint.zip",
+                        "campaign": "afghanistan",
+                        "server": "test-server",
+                        "timestamp": "2024-03-15T10:30:00",
+                        "size_bytes": 1048576,
+                        "size_human": "1.0 MB",
+                        "name": "Before update",
+                        "comment": "Test checkpoint",
+                    }
+                ),
             ]
 
             result = runner.invoke(app, ["list"])
@@ -217,6 +270,7 @@ class TestListCommandTableFormatting:
         from typer.testing import CliRunner
 
         from foothold_checkpoint.cli import app
+        from foothold_checkpoint.core.storage import CheckpointInfo
 
         runner = CliRunner()
         with (
@@ -228,16 +282,18 @@ class TestListCommandTableFormatting:
             mock_load.return_value = mock_config
 
             mock_list.return_value = [
-                {
-                    "filename": "afghanistan_checkpoint.zip",
-                    "campaign": "afghanistan",
-                    "server": "test-server",
-                    "timestamp": "2024-03-15T10:30:00",
-                    "size_bytes": 1048576,
-                    "size_human": "1.0 MB",
-                    "name": None,
-                    "comment": None,
-                },
+                CheckpointInfo.from_dict(
+                    {
+                        "filename": "afghanistan_checkpoint.zip",
+                        "campaign": "afghanistan",
+                        "server": "test-server",
+                        "timestamp": "2024-03-15T10:30:00",
+                        "size_bytes": 1048576,
+                        "size_human": "1.0 MB",
+                        "name": None,
+                        "comment": None,
+                    }
+                ),
             ]
 
             result = runner.invoke(app, ["list"])
@@ -254,6 +310,7 @@ class TestListCommandTableFormatting:
         from typer.testing import CliRunner
 
         from foothold_checkpoint.cli import app
+        from foothold_checkpoint.core.storage import CheckpointInfo
 
         runner = CliRunner()
         with (
@@ -265,16 +322,18 @@ class TestListCommandTableFormatting:
             mock_load.return_value = mock_config
 
             mock_list.return_value = [
-                {
-                    "filename": "large_checkpoint.zip",
-                    "campaign": "afghanistan",
-                    "server": "test-server",
-                    "timestamp": "2024-03-15T10:30:00",
-                    "size_bytes": 10485760,  # 10 MB
-                    "size_human": "10.0 MB",
-                    "name": None,
-                    "comment": None,
-                },
+                CheckpointInfo.from_dict(
+                    {
+                        "filename": "large_checkpoint.zip",
+                        "campaign": "afghanistan",
+                        "server": "test-server",
+                        "timestamp": "2024-03-15T10:30:00",
+                        "size_bytes": 10485760,  # 10 MB
+                        "size_human": "10.0 MB",
+                        "name": None,
+                        "comment": None,
+                    }
+                ),
             ]
 
             result = runner.invoke(app, ["list"])
@@ -347,6 +406,7 @@ class TestListCommandQuietMode:
         from typer.testing import CliRunner
 
         from foothold_checkpoint.cli import app
+        from foothold_checkpoint.core.storage import CheckpointInfo
 
         runner = CliRunner()
         with (
@@ -358,26 +418,30 @@ class TestListCommandQuietMode:
             mock_load.return_value = mock_config
 
             mock_list.return_value = [
-                {
-                    "filename": "afghanistan_2024-02-14_10-30-00.zip",
-                    "campaign": "afghanistan",
-                    "server": "test-server",
-                    "timestamp": "2024-02-14T10:30:00",
-                    "size_bytes": 1048576,
-                    "size_human": "1.0 MB",
-                    "name": None,
-                    "comment": None,
-                },
-                {
-                    "filename": "syria_2024-02-13_15-45-00.zip",
-                    "campaign": "syria",
-                    "server": "prod-1",
-                    "timestamp": "2024-02-13T15:45:00",
-                    "size_bytes": 2097152,
-                    "size_human": "2.0 MB",
-                    "name": None,
-                    "comment": None,
-                },
+                CheckpointInfo.from_dict(
+                    {
+                        "filename": "afghanistan_2024-02-14_10-30-00.zip",
+                        "campaign": "afghanistan",
+                        "server": "test-server",
+                        "timestamp": "2024-02-14T10:30:00",
+                        "size_bytes": 1048576,
+                        "size_human": "1.0 MB",
+                        "name": None,
+                        "comment": None,
+                    }
+                ),
+                CheckpointInfo.from_dict(
+                    {
+                        "filename": "syria_2024-02-13_15-45-00.zip",
+                        "campaign": "syria",
+                        "server": "prod-1",
+                        "timestamp": "2024-02-13T15:45:00",
+                        "size_bytes": 2097152,
+                        "size_human": "2.0 MB",
+                        "name": None,
+                        "comment": None,
+                    }
+                ),
             ]
 
             result = runner.invoke(app, ["--quiet", "list"])
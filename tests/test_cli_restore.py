@@ -161,6 +161,7 @@ class TestCheckpointSelectionPrompt:
         from typer.testing import CliRunner
 
         from foothold_checkpoint.cli import app
+        from foothold_checkpoint.core.storage import CheckpointInfo
 
         config_file = tmp_path / "config.yaml"
         config_file.write_text(
@@ -184,15 +185,17 @@ class TestCheckpointSelectionPrompt:
             mock_config.checkpoints_dir = tmp_path / "checkpoints"
             mock_load.return_value = mock_config
 
-            # Mock list_checkpoints to return available checkpoints (as dicts)
-            mock_checkpoint = {
-                "filename": "afghanistan_2024-02-14.zip",
-                "campaign": "afghanistan",
-                "timestamp": "2024-02-14 10:30:00",
-                "server": "test-server",
-                "size_bytes": 1024,
-                "size_human": "1.0 KB",
-            }
+            # Mock list_checkpoints to return available checkpoints
+            mock_checkpoint = CheckpointInfo.from_dict(
+                {
+                    "filename": "afghanistan_2024-02-14.zip",
+                    "campaign": "afghanistan",
+                    "timestamp": "2024-02-14 10:30:00",
+                    "server": "test-server",
+                    "size_bytes": 1024,
+                    "size_human": "1.0 KB",
+                }
+            )
             mock_list.return_value = [mock_checkpoint]
 
             mock_restore.return_value = [tmp_path / "mission" / "foothold_afghanistan.lua"]
@@ -207,6 +210,7 @@ class TestCheckpointSelectionPrompt:
         from typer.testing import CliRunner
 
         from foothold_checkpoint.cli import app
+        from foothold_checkpoint.core.storage import CheckpointInfo
 
         config_file = tmp_path / "config.yaml"
         config_file.write_text(
@@ -230,23 +234,27 @@ class TestCheckpointSelectionPrompt:
             mock_config.checkpoints_dir = tmp_path / "checkpoints"
             mock_load.return_value = mock_config
 
-            mock_checkpoint1 = {
-                "filename": "afghanistan_2024-02-14.zip",
-                "campaign": "afghanistan",
-                "timestamp": "2024-02-14 10:30:00",
-                "server": "test-server",
-                "size_bytes": 2048,
-                "size_human": "2.0 KB",
-            }
+            mock_checkpoint1 = CheckpointInfo.from_dict(
+                {
+                    "filename": "afghanistan_2024-02-14.zip",
+                    "campaign": "afghanistan",
+                    "timestamp": "2024-02-14 10:30:00",
+                    "server": "test-server",
+                    "size_bytes": 2048,
+                    "size_human": "2.0 KB",
+                }
+            )
 
-            mock_checkpoint2 = {
-                "filename": "syria_2024-02-13.zip",
-                "campaign": "syria",
-                "timestamp": "2024-02-13 15:45:00",
-                "server": "prod-1",
-                "size_bytes": 1536,
-                "size_human": "1.5 KB",
-            }
+            mock_checkpoint2 = CheckpointInfo.from_dict(
+                {
+                    "filename": "syria_2024-02-13.zip",
+                    "campaign": "syria",
+                    "timestamp": "2024-02-13 15:45:00",
+                    "server": "prod-1",
+                    "size_bytes": 1536,
+                    "size_human": "1.5 KB",
+                }
+            )
 
             mock_list.return_value = [mock_checkpoint1, mock_checkpoint2]
             mock_restore.return_value = [tmp_path / "mission" / "foothold.lua"]
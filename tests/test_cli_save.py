@@ -29,11 +29,8 @@ class TestSaveCommandWithFlags:
             patch("foothold_checkpoint.cli.create_checkpoint") as mock_create,
             patch("pathlib.Path.exists", return_value=True),
             patch(
-                "pathlib.Path.iterdir",
-                return_value=[
-                    Mock(name="foothold_afghanistan.lua", is_file=lambda: True),
-                    Mock(name="foothold_afghanistan_storage.csv", is_file=lambda: True),
-                ],
+                "foothold_checkpoint.cli.scan_directory",
+                return_value=dict.fromkeys([]),
             ),
         ):
             # Setup mocks
@@ -89,11 +86,8 @@ class TestSaveCommandWithFlags:
             patch("foothold_checkpoint.cli.create_checkpoint") as mock_create,
             patch("pathlib.Path.exists", return_value=True),
             patch(
-                "pathlib.Path.iterdir",
-                return_value=[
-                    Mock(name="foothold_afghanistan.lua", is_file=lambda: True),
-                    Mock(name="foothold_syria.lua", is_file=lambda: True),
-                ],
+                "foothold_checkpoint.cli.scan_directory",
+                return_value=dict.fromkeys([]),
             ),
         ):
             mock_config = Mock()
@@ -164,7 +158,7 @@ class TestSaveCommandWithFlags:
             patch("foothold_checkpoint.cli.load_config") as mock_load,
             patch("foothold_checkpoint.cli.detect_campaigns") as mock_detect,
             patch("pathlib.Path.exists", return_value=True),
-            patch("pathlib.Path.iterdir", return_value=[]),
+            patch("foothold_checkpoint.cli.scan_directory", return_value={}),
         ):
             mock_config = Mock()
             mock_config.servers = {"test-server": Mock(path=tmp_path)}
@@ -211,8 +205,8 @@ class TestServerPrompt:
             patch("foothold_checkpoint.cli.create_checkpoint") as mock_create,
             patch("pathlib.Path.exists", return_value=True),
             patch(
-                "pathlib.Path.iterdir",
-                return_value=[Mock(name="foothold_afghanistan.lua", is_file=lambda: True)],
+                "foothold_checkpoint.cli.scan_directory",
+                return_value=dict.fromkeys([]),
             ),
         ):
             mock_config = Mock()
@@ -260,8 +254,8 @@ class TestServerPrompt:
             patch("foothold_checkpoint.cli.create_checkpoint") as mock_create,
             patch("pathlib.Path.exists", return_value=True),
             patch(
-                "pathlib.Path.iterdir",
-                return_value=[Mock(name="foothold_afghanistan.lua", is_file=lambda: True)],
+                "foothold_checkpoint.cli.scan_directory",
+                return_value=dict.fromkeys([]),
             ),
         ):
             mock_config = Mock()
@@ -302,11 +296,8 @@ class TestCampaignPrompt:
             patch("foothold_checkpoint.cli.create_checkpoint") as mock_create,
             patch("pathlib.Path.exists", return_value=True),
             patch(
-                "pathlib.Path.iterdir",
-                return_value=[
-                    Mock(name="foothold_afghanistan.lua", is_file=lambda: True),
-                    Mock(name="foothold_syria.lua", is_file=lambda: True),
-                ],
+                "foothold_checkpoint.cli.scan_directory",
+                return_value=dict.fromkeys([]),
             ),
         ):
             mock_config = Mock()
@@ -349,11 +340,8 @@ class TestCampaignPrompt:
             patch("foothold_checkpoint.cli.create_checkpoint") as mock_create,
             patch("pathlib.Path.exists", return_value=True),
             patch(
-                "pathlib.Path.iterdir",
-                return_value=[
-                    Mock(name="foothold_afghanistan.lua", is_file=lambda: True),
-                    Mock(name="foothold_syria.lua", is_file=lambda: True),
-                ],
+                "foothold_checkpoint.cli.scan_directory",
+                return_value=dict.fromkeys([]),
             ),
         ):
             mock_config = Mock()
@@ -388,7 +376,7 @@ class TestCampaignPrompt:
             patch("foothold_checkpoint.cli.load_config") as mock_load,
             patch("foothold_checkpoint.cli.detect_campaigns") as mock_detect,
             patch("pathlib.Path.exists", return_value=True),
-            patch("pathlib.Path.iterdir", return_value=[]),
+            patch("foothold_checkpoint.cli.scan_directory", return_value={}),
         ):
             mock_config = Mock()
             mock_config.servers = {"test-server": Mock(path=tmp_path)}
@@ -420,8 +408,8 @@ class TestNameCommentPrompts:
             patch("foothold_checkpoint.cli.create_checkpoint") as mock_create,
             patch("pathlib.Path.exists", return_value=True),
             patch(
-                "pathlib.Path.iterdir",
-                return_value=[Mock(name="foothold_afghanistan.lua", is_file=lambda: True)],
+                "foothold_checkpoint.cli.scan_directory",
+                return_value=dict.fromkeys([]),
             ),
         ):
             mock_config = Mock()
@@ -459,8 +447,8 @@ class TestNameCommentPrompts:
             patch("foothold_checkpoint.cli.create_checkpoint") as mock_create,
             patch("pathlib.Path.exists", return_value=True),
             patch(
-                "pathlib.Path.iterdir",
-                return_value=[Mock(name="foothold_afghanistan.lua", is_file=lambda: True)],
+                "foothold_checkpoint.cli.scan_directory",
+                return_value=dict.fromkeys([]),
             ),
         ):
             mock_config = Mock()
@@ -510,8 +498,8 @@ class TestProgressDisplay:
             patch("foothold_checkpoint.cli.create_checkpoint") as mock_create,
             patch("pathlib.Path.exists", return_value=True),
             patch(
-                "pathlib.Path.iterdir",
-                return_value=[Mock(name="foothold_afghanistan.lua", is_file=lambda: True)],
+                "foothold_checkpoint.cli.scan_directory",
+                return_value=dict.fromkeys([]),
             ),
         ):
             mock_config = Mock()
@@ -548,8 +536,8 @@ class TestProgressDisplay:
             patch("foothold_checkpoint.cli.create_checkpoint") as mock_create,
             patch("pathlib.Path.exists", return_value=True),
             patch(
-                "pathlib.Path.iterdir",
-                return_value=[Mock(name="foothold_afghanistan.lua", is_file=lambda: True)],
+                "foothold_checkpoint.cli.scan_directory",
+                return_value=dict.fromkeys([]),
             ),
         ):
             mock_config = Mock()
@@ -589,8 +577,8 @@ class TestSuccessErrorMessages:
             patch("foothold_checkpoint.cli.create_checkpoint") as mock_create,
             patch("pathlib.Path.exists", return_value=True),
             patch(
-                "pathlib.Path.iterdir",
-                return_value=[Mock(name="foothold_afghanistan.lua", is_file=lambda: True)],
+                "foothold_checkpoint.cli.scan_directory",
+                return_value=dict.fromkeys([]),
             ),
         ):
             mock_config = Mock()
@@ -662,8 +650,8 @@ class TestSuccessErrorMessages:
             patch("foothold_checkpoint.cli.create_checkpoint") as mock_create,
             patch("pathlib.Path.exists", return_value=True),
             patch(
-                "pathlib.Path.iterdir",
-                return_value=[Mock(name="foothold_afghanistan.lua", is_file=lambda: True)],
+                "foothold_checkpoint.cli.scan_directory",
+                return_value=dict.fromkeys([]),
             ),
         ):
             mock_config = Mock()
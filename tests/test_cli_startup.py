@@ -0,0 +1,107 @@
+"""Cold-start imports of the CLI, measured with ``python -X importtime``."""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import yaml
+
+# Budget for the modules a CLI run imports beyond a bare interpreter's. Cold
+# starts take ~100-200 ms; the module checks below are the precise guard and
+# the budget is generous enough for slow CI machines, catching only gross
+# regressions such as eagerly importing every core module again.
+IMPORT_TIME_BUDGET_MS = 1000
+
+
+def _import_profile(*args: str, cwd: Path, code: str | None = None) -> dict[str, int]:
+    """Run the CLI (or code) in a fresh interpreter and return the self import time (us) per module."""
+    import foothold_checkpoint
+
+    src_dir = Path(foothold_checkpoint.__file__).parent.parent
+    env = {
+        **os.environ,
+        "PYTHONPATH": os.pathsep.join([str(src_dir), os.environ.get("PYTHONPATH", "")]),
+    }
+    if code is None:
+        code = f"import sys; sys.argv = ['foothold-checkpoint', *{list(args)!r}]; from foothold_checkpoint.cli import main; main()"
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=cwd,
+        env=env,
+        capture_output=True,
+        text=True,
+        timeout=60,
+    )
+    assert result.returncode == 0, result.stdout + result.stderr
+
+    profile: dict[str, int] = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, _, name = line.removeprefix("import time:").split("|")
+        profile[name.strip()] = int(self_us)
+    return profile
+
+
+def _cli_import_ms(profile: dict[str, int], cwd: Path) -> float:
+    """Total self import time (ms) of the modules a bare interpreter does not import."""
+    baseline = _import_profile(cwd=cwd, code="pass")
+    return sum(us for name, us in profile.items() if name not in baseline) / 1000
+
+
+class TestCliStartup:
+    """Test suite for lazy CLI imports."""
+
+    def test_help_loads_no_core_modules(self, tmp_path):
+        """--help should not import checkpoint logic, pydantic models or YAML."""
+        profile = _import_profile("--help", cwd=tmp_path)
+
+        loaded = set(profile)
+        assert not {name for name in loaded if name.startswith("foothold_checkpoint.core")}
+        assert not loaded & {"pydantic", "yaml", "ruamel.yaml", "rich.progress"}
+        assert _cli_import_ms(profile, tmp_path) < IMPORT_TIME_BUDGET_MS
+
+    def test_list_with_cached_config_loads_only_what_it_needs(self, tmp_path):
+        """A quiet listing should skip YAML parsing and restore/verify machinery."""
+        checkpoints_dir = tmp_path / "checkpoints"
+        checkpoints_dir.mkdir()
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text(
+            yaml.dump(
+                {
+                    "checkpoints_dir": str(checkpoints_dir),
+                    "servers": {"test": {"path": str(tmp_path), "description": "Test"}},
+                    "campaigns": {
+                        "test": {
+                            "display_name": "Test",
+                            "files": {
+                                "persistence": ["foothold_test.lua"],
+                                "ctld_save": {"optional": True},
+                                "ctld_farps": {"optional": True},
+                                "storage": {"optional": True},
+                            },
+                        }
+                    },
+                }
+            )
+        )
+        # Old enough for the config cache
+        os.utime(config_file, ns=(1_700_000_000_000_000_000, 1_700_000_000_000_000_000))
+
+        args = ("--config", str(config_file), "--quiet", "list")
+        _import_profile(*args, cwd=tmp_path)  # populates the config cache
+        profile = _import_profile(*args, cwd=tmp_path)
+
+        loaded = set(profile)
+        assert "foothold_checkpoint.core.storage" in loaded
+        assert not loaded & {
+            "yaml",
+            "ruamel.yaml",
+            "rich.progress",
+            "foothold_checkpoint.core.archive",
+            "foothold_checkpoint.core.daemon",
+            "foothold_checkpoint.core.retention",
+            "foothold_checkpoint.core.verify",
+        }
+        assert _cli_import_ms(profile, tmp_path) < IMPORT_TIME_BUDGET_MS
@@ -296,6 +296,191 @@ class TestLoadConfig:
         finally:
             temp_path.unlink()
 
+    def test_load_config_with_campaigns_file(self, tmp_path):
+        """Campaigns should be loaded from campaigns_file, resolved next to config.yaml."""
+        from foothold_checkpoint.core.config import load_config
+
+        (tmp_path / "campaigns.yaml").write_text(
+            yaml.dump(
+                {
+                    "campaigns": {
+                        "syria": {
+                            "display_name": "Syria",
+                            "files": {
+                                "persistence": ["foothold_syria.lua"],
+                                "ctld_save": {"optional": True},
+                                "ctld_farps": {"optional": True},
+                                "storage": {"optional": True},
+                            },
+                        }
+                    }
+                }
+            )
+        )
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text(
+            yaml.dump({"checkpoints_dir": str(tmp_path), "campaigns_file": "campaigns.yaml"})
+        )
+
+        config = load_config(config_file, use_cache=False)
+
+        assert list(config.campaigns) == ["syria"]
+        assert config.campaigns["syria"].display_name == "Syria"
+
+    def test_load_config_rejects_campaigns_and_campaigns_file(self, tmp_path):
+        """Defining campaigns inline and via campaigns_file should be rejected."""
+        from foothold_checkpoint.core.config import load_config
+
+        (tmp_path / "campaigns.yaml").write_text(yaml.dump({"campaigns": {}}))
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text(
+            yaml.dump(
+                {
+                    "checkpoints_dir": str(tmp_path),
+                    "campaigns_file": "campaigns.yaml",
+                    "campaigns": {"syria": {"files": {"persistence": ["foothold_syria.lua"]}}},
+                }
+            )
+        )
+
+        with pytest.raises(ValueError, match="Cannot specify both"):
+            load_config(config_file, use_cache=False)
+
+
+class TestConfigCache:
+    """Test suite for the compiled configuration cache."""
+
+    @staticmethod
+    def _write_config(tmp_path, checkpoints_dir="$FOOTHOLD_TEST_DIR/checkpoints"):
+        """Write config.yaml and campaigns.yaml with old mtimes so they can be cached."""
+        import os
+
+        campaigns_file = tmp_path / "campaigns.yaml"
+        campaigns_file.write_text(
+            yaml.dump(
+                {
+                    "campaigns": {
+                        "syria": {
+                            "display_name": "Syria",
+                            "files": {
+                                "persistence": ["a.lua"],
+                                "ctld_save": ["a_CTLD_Save.csv"],
+                                "ctld_farps": {"optional": True},
+                                "storage": {"optional": True},
+                            },
+                        }
+                    }
+                }
+            )
+        )
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text(
+            yaml.dump({"checkpoints_dir": checkpoints_dir, "campaigns_file": "campaigns.yaml"})
+        )
+        for path in (campaigns_file, config_file):
+            os.utime(path, ns=(1_700_000_000_000_000_000, 1_700_000_000_000_000_000))
+        return config_file
+
+    def test_repeated_loads_skip_yaml_parsing(self, tmp_path, monkeypatch):
+        """A second load should be served from the cache without parsing the YAML."""
+        from unittest.mock import patch
+
+        from foothold_checkpoint.core import config as config_module
+        from foothold_checkpoint.core.configcache import config_cache_path
+
+        monkeypatch.setenv("FOOTHOLD_TEST_DIR", str(tmp_path))
+        config_file = self._write_config(tmp_path)
+
+        first = config_module.load_config(config_file)
+        assert config_cache_path(config_file).exists()
+        with patch.object(config_module, "_parse_config") as parse:
+            second = config_module.load_config(config_file)
+
+        parse.assert_not_called()
+        assert second == first
+        assert second.checkpoints_dir == tmp_path / "checkpoints"
+        assert second.campaign_index.lookup("A.LUA") is not None
+
+    def test_changed_sources_or_environment_reload_yaml(self, tmp_path, monkeypatch):
+        """Edited YAML files and changed environment variables should bypass the cache."""
+        import os
+
+        from foothold_checkpoint.core.config import load_config
+
+        monkeypatch.setenv("FOOTHOLD_TEST_DIR", str(tmp_path))
+        config_file = self._write_config(tmp_path)
+        load_config(config_file)
+
+        monkeypatch.setenv("FOOTHOLD_TEST_DIR", str(tmp_path / "other"))
+        assert load_config(config_file).checkpoints_dir == tmp_path / "other" / "checkpoints"
+
+        campaigns_file = tmp_path / "campaigns.yaml"
+        campaigns_file.write_text(campaigns_file.read_text().replace("Syria", "Syrie"))
+        os.utime(campaigns_file, ns=(1_700_000_001_000_000_000, 1_700_000_001_000_000_000))
+        assert load_config(config_file).campaigns["syria"].display_name == "Syrie"
+
+    def test_corrupted_cache_is_ignored(self, tmp_path, monkeypatch):
+        """An unreadable cache file should fall back to the YAML."""
+        from foothold_checkpoint.core.config import load_config
+        from foothold_checkpoint.core.configcache import config_cache_path
+
+        monkeypatch.setenv("FOOTHOLD_TEST_DIR", str(tmp_path))
+        config_file = self._write_config(tmp_path)
+        config_cache_path(config_file).write_bytes(b"not a pickle")
+
+        assert load_config(config_file).campaigns["syria"].display_name == "Syria"
+
+    def test_tampered_or_foreign_cache_is_ignored(self, tmp_path, monkeypatch):
+        """A cache crafted to run code or written for another file should not be used."""
+        import json
+        import os
+        import pickle
+
+        from foothold_checkpoint.core.config import load_config
+        from foothold_checkpoint.core.configcache import config_cache_path
+
+        monkeypatch.setenv("FOOTHOLD_TEST_DIR", str(tmp_path))
+        config_file = self._write_config(tmp_path)
+        marker = tmp_path / "pwned"
+
+        class Payload:
+            def __reduce__(self):
+                return (os.mkdir, (str(marker),))
+
+        cache_path = config_cache_path(config_file)
+        cache_path.write_bytes(pickle.dumps(Payload()))
+        assert load_config(config_file).campaigns["syria"].display_name == "Syria"
+        assert not marker.exists()
+
+        # A cache of another configuration file is not reused
+        data = json.loads(cache_path.read_text())
+        data["config"]["campaigns"]["syria"]["display_name"] = "Forged"
+        data["config_path"] = str(tmp_path / "other.yaml")
+        cache_path.write_text(json.dumps(data))
+        assert load_config(config_file).campaigns["syria"].display_name == "Syria"
+
+    def test_cache_owned_by_another_user_is_ignored(self, tmp_path, monkeypatch):
+        """Cache files not owned by the current user should not be trusted."""
+        import json
+        import os
+
+        from foothold_checkpoint.core.config import load_config
+        from foothold_checkpoint.core.configcache import config_cache_path
+
+        if not hasattr(os, "getuid"):
+            pytest.skip("file ownership is only checked on POSIX")
+        monkeypatch.setenv("FOOTHOLD_TEST_DIR", str(tmp_path))
+        config_file = self._write_config(tmp_path)
+        load_config(config_file)
+        cache_path = config_cache_path(config_file)
+        data = json.loads(cache_path.read_text())
+        data["config"]["campaigns"]["syria"]["display_name"] = "Forged"
+        cache_path.write_text(json.dumps(data))
+        assert load_config(config_file).campaigns["syria"].display_name == "Forged"
+
+        monkeypatch.setattr(os, "getuid", lambda: os.stat(cache_path).st_uid + 1)
+        assert load_config(config_file).campaigns["syria"].display_name == "Syria"
+
 
 class TestCreateDefaultConfig:
     """Test suite for creating default configuration files."""
@@ -542,6 +727,74 @@ class TestPathExpansion:
                 del os.environ["USERPROFILE"]
 
 
+class TestCompressionConfig:
+    """Test suite for compression settings."""
+
+    def test_profile_names_are_expanded(self):
+        """Profile names should resolve to their method and level."""
+        from foothold_checkpoint.core.config import CompressionConfig
+
+        assert CompressionConfig.model_validate("fast") == CompressionConfig(
+            method="deflated", level=1
+        )
+        assert CompressionConfig.model_validate("max").method == "lzma"
+
+    def test_invalid_settings_are_rejected(self):
+        """Unknown profiles, out-of-range levels and levels on lzma should fail."""
+        from foothold_checkpoint.core.config import CompressionConfig
+
+        with pytest.raises(ValidationError, match="Unknown compression profile"):
+            CompressionConfig.model_validate("ultra")
+        with pytest.raises(ValidationError):
+            CompressionConfig(method="deflated", level=10)
+        with pytest.raises(ValidationError, match="does not support a level"):
+            CompressionConfig(method="lzma", level=5)
+
+    def test_load_config_reads_compression(self):
+        """load_config should read global, auto-backup and per-campaign compression."""
+        from foothold_checkpoint.core.config import CompressionConfig, load_config
+
+        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
+            yaml.dump(
+                {
+                    "checkpoints_dir": "/tmp/checkpoints",
+                    "compression": {"method": "deflated", "level": 9},
+                    "campaigns": {
+                        "afghanistan": {
+                            "display_name": "Afghanistan",
+                            "compression": "max",
+                            "files": {
+                                "persistence": {"files": ["foothold_afghanistan.lua"]},
+                                "ctld_save": {"files": [], "optional": True},
+                                "ctld_farps": {"files": [], "optional": True},
+                                "storage": {"files": [], "optional": True},
+                            },
+                        },
+                        "syria": {
+                            "display_name": "Syria",
+                            "files": {
+                                "persistence": {"files": ["foothold_syria.lua"]},
+                                "ctld_save": {"files": [], "optional": True},
+                                "ctld_farps": {"files": [], "optional": True},
+                                "storage": {"files": [], "optional": True},
+                            },
+                        },
+                    },
+                },
+                f,
+            )
+            temp_path = Path(f.name)
+
+        try:
+            config = load_config(temp_path)
+
+            assert config.compression_for("Afghanistan").method == "lzma"
+            assert config.compression_for("syria") == CompressionConfig(method="deflated", level=9)
+            assert config.compression_for("syria", is_auto_backup=True).level == 1
+        finally:
+            temp_path.unlink()
+
+
 class TestErrorMessages:
     """Test suite for clear and helpful error messages."""
 
@@ -0,0 +1,185 @@
+"""Tests for the serve daemon and its CLI forwarding."""
+
+import socket
+import threading
+import time
+from contextlib import contextmanager
+from unittest.mock import patch
+
+import pytest
+import yaml
+
+
+def _write_config(tmp_path):
+    """Write a config with one server and one campaign, and the campaign's save file."""
+    saves_dir = tmp_path / "server" / "Missions" / "Saves"
+    saves_dir.mkdir(parents=True)
+    (saves_dir / "foothold_test.lua").write_text("-- state 1")
+    config_file = tmp_path / "config.yaml"
+    config_file.write_text(
+        yaml.dump(
+            {
+                "checkpoints_dir": str(tmp_path / "checkpoints"),
+                "servers": {"test": {"path": str(tmp_path / "server"), "description": "Test"}},
+                "campaigns": {
+                    "test": {
+                        "display_name": "Test",
+                        "files": {
+                            "persistence": ["foothold_test.lua"],
+                            "ctld_save": {"optional": True},
+                            "ctld_farps": {"optional": True},
+                            "storage": {"optional": True},
+                        },
+                    }
+                },
+            }
+        )
+    )
+    return config_file, saves_dir
+
+
+@contextmanager
+def _running_daemon(config_file):
+    """Run a CheckpointDaemon in a background thread."""
+    from foothold_checkpoint.core.daemon import CheckpointDaemon, connect
+
+    daemon = CheckpointDaemon(config_file)
+    thread = threading.Thread(target=daemon.serve_forever, daemon=True)
+    thread.start()
+    try:
+        # serve_forever writes the state file before serving
+        for _ in range(100):
+            if connect(config_file) is not None:
+                break
+            time.sleep(0.01)
+        yield daemon
+    finally:
+        daemon.shutdown()
+        thread.join(timeout=5)
+
+
+class TestDaemon:
+    """Test suite for CheckpointDaemon and DaemonClient."""
+
+    def test_connect_returns_none_without_a_running_daemon(self, tmp_path):
+        """No state file, or one left by a dead daemon, means in-process execution."""
+        from foothold_checkpoint.core.daemon import connect, daemon_state_path
+
+        config_file, _ = _write_config(tmp_path)
+        assert connect(config_file) is None
+
+        with socket.socket() as sock:
+            sock.bind(("127.0.0.1", 0))
+            free_port = sock.getsockname()[1]
+        daemon_state_path(config_file).write_text(
+            f'{{"host": "127.0.0.1", "port": {free_port}, "pid": 1, "token": "x"}}'
+        )
+        assert connect(config_file) is None
+
+    def test_operations_run_in_the_daemon(self, tmp_path):
+        """Save, list, restore and delete should round-trip through the daemon."""
+        from foothold_checkpoint.core.daemon import DaemonClient, connect, daemon_state_path
+
+        config_file, saves_dir = _write_config(tmp_path)
+        checkpoints_dir = tmp_path / "checkpoints"
+
+        with _running_daemon(config_file) as daemon:
+            assert daemon_state_path(config_file).exists()
+            client = connect(config_file, checkpoints_dir)
+            assert client is not None
+            assert connect(config_file, tmp_path / "elsewhere") is None
+
+            source = saves_dir / "foothold_test.lua"
+            checkpoint_path = client.create_checkpoint("test", "test", [source], name="First")
+            assert checkpoint_path.parent == checkpoints_dir
+            assert client.find_unchanged_checkpoint("test", "test", [source]) == checkpoint_path
+
+            checkpoints = client.list_checkpoints(campaign_filter="test")
+            assert checkpoints.total == 1
+            assert checkpoints[0].filename == checkpoint_path.name
+            assert checkpoints[0].name == "First"
+
+            source.write_text("-- state 2")
+            restored = client.restore_checkpoint(
+                checkpoint_path, saves_dir, server_name="test", auto_backup=False
+            )
+            assert restored == [source]
+            assert source.read_text() == "-- state 1"
+
+            assert client.delete_checkpoint(checkpoint_path)["campaign_name"] == "test"
+            assert not checkpoint_path.exists()
+            with pytest.raises(FileNotFoundError):
+                client.delete_checkpoint(checkpoint_path)
+
+            with pytest.raises(PermissionError):
+                DaemonClient(*daemon.address, token="wrong").call("ping")
+
+        assert not daemon_state_path(config_file).exists()
+
+    def test_ping_is_answered_during_a_long_operation(self, tmp_path):
+        """Clients should find a busy daemon and queue behind its running operation."""
+        from foothold_checkpoint.core.daemon import connect
+
+        config_file, _ = _write_config(tmp_path)
+        (tmp_path / "checkpoints").mkdir()
+
+        with _running_daemon(config_file) as daemon:
+            listed = []
+            # Simulate a long save or restore holding the operation lock
+            with daemon._operation_lock:
+                client = connect(config_file)
+                assert client is not None
+
+                waiting = threading.Thread(
+                    target=lambda: listed.append(client.list_checkpoints()), daemon=True
+                )
+                waiting.start()
+                waiting.join(timeout=0.3)
+                assert waiting.is_alive()
+
+            waiting.join(timeout=5)
+            assert not waiting.is_alive()
+            assert listed[0].total == 0
+
+    def test_daemon_reloads_changed_configuration(self, tmp_path):
+        """The warm configuration should be reused until its YAML file changes."""
+        import os
+
+        from foothold_checkpoint.core.daemon import CheckpointDaemon
+
+        config_file, _ = _write_config(tmp_path)
+        daemon = CheckpointDaemon(config_file)
+        try:
+            config = daemon.config()
+            assert daemon.config() is config
+
+            stat_result = config_file.stat()
+            os.utime(config_file, ns=(stat_result.st_atime_ns, stat_result.st_mtime_ns + 10**9))
+            assert daemon.config() is not config
+        finally:
+            daemon._server.server_close()
+
+    def test_cli_commands_forward_to_the_daemon(self, tmp_path):
+        """CLI save and list should not run the operations in-process while a daemon runs."""
+        from typer.testing import CliRunner
+
+        from foothold_checkpoint.cli import app
+
+        config_file, _ = _write_config(tmp_path)
+        runner = CliRunner()
+
+        with (
+            _running_daemon(config_file),
+            patch("foothold_checkpoint.cli.create_checkpoint", side_effect=AssertionError),
+            patch("foothold_checkpoint.cli.list_checkpoints", side_effect=AssertionError),
+        ):
+            saved = runner.invoke(
+                app, ["--config", str(config_file), "--quiet", "save", "-s", "test", "-c", "test"]
+            )
+            listed = runner.invoke(app, ["--config", str(config_file), "--quiet", "list"])
+
+        assert saved.exit_code == 0, saved.stdout
+        assert listed.exit_code == 0, listed.stdout
+        checkpoint_names = [p.name for p in (tmp_path / "checkpoints").glob("*.zip")]
+        assert len(checkpoint_names) == 1
+        assert checkpoint_names[0] in listed.stdout
@@ -0,0 +1,118 @@
+"""Tests for the shared blocking I/O executor."""
+
+import asyncio
+import tempfile
+import threading
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+
+class TestExecutor:
+    """Test suite for the executor module."""
+
+    def test_run_blocking_runs_in_worker_thread(self):
+        """run_blocking should execute the function outside the event loop thread."""
+        from foothold_checkpoint.core.executor import run_blocking
+
+        async def run() -> tuple[str, str]:
+            worker = await run_blocking(lambda: threading.current_thread().name)
+            return threading.current_thread().name, worker
+
+        loop_thread, worker_thread = asyncio.run(run())
+
+        assert worker_thread != loop_thread
+        assert worker_thread.startswith("foothold-io")
+
+    def test_run_blocking_propagates_exceptions(self):
+        """Exceptions raised in the pool should propagate to the caller."""
+        from foothold_checkpoint.core.executor import run_blocking
+
+        def fail() -> None:
+            raise OSError("No space left on device")
+
+        with pytest.raises(OSError, match="No space left on device"):
+            asyncio.run(run_blocking(fail))
+
+    def test_run_blocking_all_fails_fast_and_discards_results(self):
+        """A failing job should cancel the others and discard finished results."""
+        from foothold_checkpoint.core.executor import JobCancelled, run_blocking_all
+
+        discarded = []
+
+        def succeed(cancelled: threading.Event) -> str:
+            return "done"
+
+        def fail(cancelled: threading.Event) -> str:
+            raise ValueError("Checksum mismatch")
+
+        def wait_for_cancel(cancelled: threading.Event) -> str:
+            if not cancelled.wait(timeout=5):
+                return "not cancelled"
+            raise JobCancelled("cancelled")
+
+        with pytest.raises(ValueError, match="Checksum mismatch"):
+            asyncio.run(run_blocking_all([succeed, fail, wait_for_cancel], discarded.append))
+
+        assert discarded == ["done"]
+        assert asyncio.run(run_blocking_all([succeed, succeed])) == ["done", "done"]
+
+    def test_configure_executor_rejects_invalid_size(self):
+        """configure_executor should reject a pool size lower than 1."""
+        from foothold_checkpoint.core.executor import configure_executor
+
+        with pytest.raises(ValueError, match="max_workers"):
+            configure_executor(0)
+
+    def test_configure_executor_bounds_pool(self):
+        """configure_executor should recreate the pool with the requested size."""
+        from foothold_checkpoint.core import executor
+
+        original = executor._max_workers
+        try:
+            executor.configure_executor(original + 1)
+            assert executor.get_executor()._max_workers == original + 1
+        finally:
+            executor.configure_executor(original)
+
+    def test_save_checkpoint_offloads_and_forwards_progress(self):
+        """save_checkpoint should create the ZIP off the loop and report progress on it."""
+        from foothold_checkpoint.core import checkpoint
+        from foothold_checkpoint.core.storage import save_checkpoint
+        from tests.conftest import make_simple_campaign, make_test_config
+
+        original_create = checkpoint.create_checkpoint
+        create_threads = []
+        progress_threads = []
+
+        def tracking_create(*args, **kwargs):
+            create_threads.append(threading.current_thread().name)
+            return original_create(*args, **kwargs)
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            source_dir = Path(tmpdir) / "source"
+            source_dir.mkdir()
+            (source_dir / "foothold_test.lua").write_text("-- test")
+            config = make_test_config(
+                campaigns={"test": make_simple_campaign("Test", ["foothold_test.lua"])}
+            )
+
+            async def run() -> str:
+                await save_checkpoint(
+                    campaign_name="test",
+                    server_name="server",
+                    source_dir=source_dir,
+                    output_dir=Path(tmpdir) / "checkpoints",
+                    config=config,
+                    progress_callback=lambda *_: progress_threads.append(
+                        threading.current_thread().name
+                    ),
+                )
+                return threading.current_thread().name
+
+            with patch("foothold_checkpoint.core.storage.create_checkpoint", tracking_create):
+                loop_thread = asyncio.run(run())
+
+        assert create_threads and create_threads[0] != loop_thread
+        assert progress_threads and set(progress_threads) == {loop_thread}
@@ -0,0 +1,319 @@
+"""Tests for the file checksum cache and incremental saves."""
+
+import asyncio
+import os
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from unittest.mock import patch
+
+
+def _age(path: Path, seconds: int = 60) -> None:
+    """Move a file's mtime into the past so the cache accepts it."""
+    past = time.time() - seconds
+    os.utime(path, (past, past))
+
+
+def _save(source_dir: Path, output_dir: Path, hour: int) -> Path:
+    """Save a checkpoint of the test campaign, skipping it if unchanged."""
+    from foothold_checkpoint.core.storage import save_checkpoint
+    from tests.conftest import make_simple_campaign, make_test_config
+
+    config = make_test_config(
+        campaigns={"test": make_simple_campaign("Test", ["foothold_test.lua"])}
+    )
+    return asyncio.run(
+        save_checkpoint(
+            campaign_name="test",
+            server_name="server",
+            source_dir=source_dir,
+            output_dir=output_dir,
+            config=config,
+            created_at=datetime(2024, 2, 14, hour, 0, 0, tzinfo=timezone.utc),
+            skip_unchanged=True,
+        )
+    )
+
+
+class TestHashCache:
+    """Test suite for HashCache."""
+
+    def test_unchanged_file_is_not_rehashed(self):
+        """A cached checksum should be reused while size and mtime are unchanged."""
+        from foothold_checkpoint.core.hashcache import HashCache
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            file_path = Path(tmpdir) / "foothold_test.lua"
+            file_path.write_text("-- state 1")
+            _age(file_path)
+            cache = HashCache(tmpdir)
+            checksum = cache.checksum(file_path)
+            cache.save()
+
+            reloaded = HashCache(tmpdir)
+            with patch("foothold_checkpoint.core.hashcache.compute_file_checksum") as compute:
+                assert reloaded.checksum(file_path) == checksum
+            compute.assert_not_called()
+
+    def test_modified_file_is_rehashed(self):
+        """A change in size or mtime should invalidate the cached checksum."""
+        from foothold_checkpoint.core.checkpoint import compute_file_checksum
+        from foothold_checkpoint.core.hashcache import HashCache
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            file_path = Path(tmpdir) / "foothold_test.lua"
+            file_path.write_text("-- state 1")
+            _age(file_path)
+            cache = HashCache(tmpdir)
+            first = cache.checksum(file_path)
+
+            file_path.write_text("-- state 2")
+            _age(file_path, seconds=30)
+
+            assert cache.checksum(file_path) != first
+            assert cache.checksum(file_path) == compute_file_checksum(file_path)
+
+    def test_replaced_file_is_rehashed(self):
+        """A file replaced with the same size and mtime should not reuse its checksum."""
+        from foothold_checkpoint.core.checkpoint import compute_file_checksum
+        from foothold_checkpoint.core.hashcache import HashCache
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            file_path = Path(tmpdir) / "foothold_test.lua"
+            file_path.write_text("-- state 1")
+            _age(file_path)
+            cache = HashCache(tmpdir)
+            cache.checksum(file_path)
+
+            # Keep the first file alive so the replacement gets a new inode
+            kept = Path(tmpdir) / "kept.lua"
+            os.link(file_path, kept)
+            replacement = Path(tmpdir) / "replacement.tmp"
+            replacement.write_text("-- state 2")
+            stat_result = file_path.stat()
+            os.utime(replacement, ns=(stat_result.st_atime_ns, stat_result.st_mtime_ns))
+            os.replace(replacement, file_path)
+
+            assert cache.checksum(file_path) == compute_file_checksum(file_path)
+
+    def test_least_recently_used_entries_are_evicted(self):
+        """The cache should not grow beyond HASH_CACHE_MAX_ENTRIES."""
+        from foothold_checkpoint.core.hashcache import HashCache
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            files = []
+            for index in range(3):
+                file_path = Path(tmpdir) / f"file_{index}.lua"
+                file_path.write_text(f"-- {index}")
+                _age(file_path)
+                files.append(file_path)
+            cache = HashCache(tmpdir)
+
+            with patch("foothold_checkpoint.core.hashcache.HASH_CACHE_MAX_ENTRIES", 2):
+                cache.checksum(files[0])
+                cache.checksum(files[1])
+                cache.checksum(files[0])
+                cache.checksum(files[2])
+
+            assert sorted(Path(key).name for key in cache._entries) == ["file_0.lua", "file_2.lua"]
+
+    def test_create_checkpoint_records_checksums_in_cache(self):
+        """create_checkpoint should record the checksums it computes in the cache."""
+        from foothold_checkpoint.core.checkpoint import create_checkpoint
+        from foothold_checkpoint.core.hashcache import get_hash_cache
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            file_path = Path(tmpdir) / "foothold_test.lua"
+            file_path.write_text("-- state 1")
+            _age(file_path)
+            output_dir = Path(tmpdir) / "checkpoints"
+            cache = get_hash_cache(output_dir)
+
+            def create(hour: int) -> Path:
+                return create_checkpoint(
+                    campaign_name="test",
+                    server_name="server",
+                    campaign_files=[file_path],
+                    output_dir=output_dir,
+                    created_at=datetime(2024, 2, 14, hour, 0, 0, tzinfo=timezone.utc),
+                    hash_cache=cache,
+                )
+
+            create(10)
+            with patch("foothold_checkpoint.core.hashcache.compute_file_checksum") as compute:
+                create(11)
+                # Checksums computed while writing the archive are remembered
+                cache.checksum(file_path)
+            compute.assert_not_called()
+
+    def test_invalid_cache_file_is_ignored(self):
+        """A corrupted cache file should only cost a rehash."""
+        from foothold_checkpoint.core.checkpoint import compute_file_checksum
+        from foothold_checkpoint.core.hashcache import HASH_CACHE_FILENAME, HashCache
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            (Path(tmpdir) / HASH_CACHE_FILENAME).write_text("{not json")
+            file_path = Path(tmpdir) / "foothold_test.lua"
+            file_path.write_text("-- state 1")
+
+            assert HashCache(tmpdir).checksum(file_path) == compute_file_checksum(file_path)
+
+
+class TestSkipUnchanged:
+    """Test suite for saves with skip_unchanged=True."""
+
+    def test_unchanged_campaign_returns_existing_checkpoint(self):
+        """A second save without changes should not create a new checkpoint."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            source_dir = Path(tmpdir) / "source"
+            source_dir.mkdir()
+            (source_dir / "foothold_test.lua").write_text("-- state 1")
+            output_dir = Path(tmpdir) / "checkpoints"
+
+            first = _save(source_dir, output_dir, 10)
+            second = _save(source_dir, output_dir, 11)
+
+            assert second == first
+            assert list(output_dir.glob("*.zip")) == [first]
+
+    def test_changed_campaign_creates_checkpoint(self):
+        """A save after a file changed should create a new checkpoint."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            source_dir = Path(tmpdir) / "source"
+            source_dir.mkdir()
+            (source_dir / "foothold_test.lua").write_text("-- state 1")
+            output_dir = Path(tmpdir) / "checkpoints"
+
+            first = _save(source_dir, output_dir, 10)
+            (source_dir / "foothold_test.lua").write_text("-- state 2")
+            second = _save(source_dir, output_dir, 11)
+
+            assert second != first
+            assert len(list(output_dir.glob("*.zip"))) == 2
+
+    def test_newest_auto_backup_does_not_count_as_saved(self, tmp_path):
+        """An auto-backup of the current state should not make a manual save skip."""
+        from foothold_checkpoint.core.checkpoint import create_checkpoint
+
+        source_dir = tmp_path / "source"
+        source_dir.mkdir()
+        lua_file = source_dir / "foothold_test.lua"
+        lua_file.write_text("-- state 1")
+        output_dir = tmp_path / "checkpoints"
+        auto_backup = create_checkpoint(
+            campaign_name="test",
+            server_name="server",
+            campaign_files=[lua_file],
+            output_dir=output_dir,
+            created_at=datetime(2024, 2, 14, 10, 0, 0, tzinfo=timezone.utc),
+            is_auto_backup=True,
+        )
+
+        saved = _save(source_dir, output_dir, 11)
+
+        assert saved != auto_backup
+        assert sorted(output_dir.glob("*.zip")) == sorted([auto_backup, saved])
+        assert _save(source_dir, output_dir, 12) == saved
+
+    def test_save_all_skips_only_unchanged_campaigns(self):
+        """save_all_campaigns should only create checkpoints for changed campaigns."""
+        from foothold_checkpoint.core.storage import save_all_campaigns
+        from tests.conftest import make_simple_campaign, make_test_config
+
+        config = make_test_config(
+            campaigns={
+                "alpha": make_simple_campaign("Alpha", ["foothold_alpha.lua"]),
+                "bravo": make_simple_campaign("Bravo", ["foothold_bravo.lua"]),
+            }
+        )
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            source_dir = Path(tmpdir) / "source"
+            source_dir.mkdir()
+            (source_dir / "foothold_alpha.lua").write_text("-- alpha 1")
+            (source_dir / "foothold_bravo.lua").write_text("-- bravo 1")
+            output_dir = Path(tmpdir) / "checkpoints"
+
+            def save_all(hour: int) -> dict:
+                return asyncio.run(
+                    save_all_campaigns(
+                        server_name="server",
+                        source_dir=source_dir,
+                        output_dir=output_dir,
+                        config=config,
+                        created_at=datetime(2024, 2, 14, hour, 0, 0, tzinfo=timezone.utc),
+                        skip_unchanged=True,
+                    )
+                )
+
+            first = save_all(10)
+            (source_dir / "foothold_bravo.lua").write_text("-- bravo 2")
+            second = save_all(11)
+
+            assert second["alpha"] == first["alpha"]
+            assert second["bravo"] != first["bravo"]
+            assert len(list(output_dir.glob("*.zip"))) == 3
+
+
+class TestAutoBackupReuse:
+    """Test suite for pre-restore auto-backups of an already saved state."""
+
+    def test_restoring_twice_creates_a_single_auto_backup(self, tmp_path):
+        """A restore over a state held by a checkpoint should not duplicate it."""
+        from foothold_checkpoint.core.storage import restore_checkpoint
+        from tests.conftest import make_simple_campaign, make_test_config
+
+        source_dir = tmp_path / "source"
+        source_dir.mkdir()
+        lua_file = source_dir / "foothold_test.lua"
+        lua_file.write_text("-- state 1")
+        output_dir = tmp_path / "checkpoints"
+        config = make_test_config(
+            checkpoints_dir=output_dir,
+            campaigns={"test": make_simple_campaign("Test", ["foothold_test.lua"])},
+        )
+        checkpoint = _save(source_dir, output_dir, 10)
+        lua_file.write_text("-- state 2")
+
+        def restore() -> list[str]:
+            messages: list[str] = []
+            asyncio.run(
+                restore_checkpoint(
+                    checkpoint,
+                    source_dir,
+                    config=config,
+                    server_name="server",
+                    skip_overwrite_check=True,
+                    progress_callback=lambda message, current, total: messages.append(message),
+                )
+            )
+            return messages
+
+        restore()
+        assert len(list(output_dir.glob("*.zip"))) == 2
+
+        messages = restore()
+
+        assert len(list(output_dir.glob("*.zip"))) == 2
+        assert f"Current state already saved in {checkpoint.name}" in messages
+        assert lua_file.read_text() == "-- state 1"
+
+    def test_older_checkpoint_can_match(self, tmp_path):
+        """Not only the newest checkpoint of the campaign should be considered."""
+        from foothold_checkpoint.core.storage import find_matching_checkpoint
+
+        source_dir = tmp_path / "source"
+        source_dir.mkdir()
+        lua_file = source_dir / "foothold_test.lua"
+        lua_file.write_text("-- state 1")
+        output_dir = tmp_path / "checkpoints"
+        first = _save(source_dir, output_dir, 10)
+        lua_file.write_text("-- state 2")
+        _save(source_dir, output_dir, 11)
+        lua_file.write_text("-- state 1")
+
+        assert find_matching_checkpoint("TEST", [lua_file], output_dir) == first
+        assert find_matching_checkpoint("other", [lua_file], output_dir) is None
+        lua_file.write_text("-- state 3")
+        assert find_matching_checkpoint("test", [lua_file], output_dir) is None
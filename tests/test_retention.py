@@ -0,0 +1,293 @@
+"""Tests for checkpoint retention policies and pruning."""
+
+import asyncio
+import json
+import time
+import zipfile
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from unittest.mock import patch
+
+BASE_TIME = datetime(2024, 2, 14, 0, 0, 0, tzinfo=timezone.utc)
+
+
+def _entry(index: int, hours: float, campaign: str = "syria", auto: bool = False, size: int = 100):
+    """Build a catalog entry for a checkpoint created hours after BASE_TIME."""
+    from foothold_checkpoint.core.catalog import CatalogEntry
+
+    created_at = BASE_TIME + timedelta(hours=hours)
+    return CatalogEntry(
+        filename=f"{campaign}_{index:05d}.zip",
+        size=size,
+        mtime_ns=0,
+        metadata={
+            "campaign_name": campaign,
+            "server_name": "server",
+            "created_at": created_at.isoformat(),
+            "is_auto_backup": auto,
+            "files": {},
+        },
+    )
+
+
+def _write_checkpoint(directory: Path, index: int, hours: float, auto: bool = False) -> Path:
+    """Write a minimal valid checkpoint archive."""
+    created_at = BASE_TIME + timedelta(hours=hours)
+    path = directory / f"syria_{index:05d}.zip"
+    with zipfile.ZipFile(path, "w") as zf:
+        zf.writestr("foothold_syria.lua", "-- state " * 50)
+        zf.writestr(
+            "metadata.json",
+            json.dumps(
+                {
+                    "campaign_name": "syria",
+                    "server_name": "server",
+                    "created_at": created_at.isoformat(),
+                    "is_auto_backup": auto,
+                    "files": {},
+                }
+            ),
+        )
+    return path
+
+
+class TestPlanPrune:
+    """Test suite for retention policy evaluation."""
+
+    def test_keep_last_is_applied_per_campaign(self):
+        """keep_last should keep the newest N checkpoints of each campaign."""
+        from foothold_checkpoint.core.config import RetentionPolicy, RetentionRule
+        from foothold_checkpoint.core.retention import plan_prune
+
+        entries = [_entry(i, i, "syria") for i in range(5)]
+        entries += [_entry(i, i, "caucasus") for i in range(2)]
+        policy = RetentionPolicy(checkpoints=RetentionRule(keep_last=2))
+
+        plan = plan_prune(entries, policy)
+
+        assert sorted(e.filename for e in plan.delete) == [
+            "syria_00000.zip",
+            "syria_00001.zip",
+            "syria_00002.zip",
+        ]
+        assert len(plan.keep) == 4
+        assert plan.bytes_freed == 300
+
+    def test_daily_buckets_keep_newest_of_each_day(self):
+        """keep_daily should keep the newest checkpoint of each of the last N days."""
+        from foothold_checkpoint.core.config import RetentionPolicy, RetentionRule
+        from foothold_checkpoint.core.retention import plan_prune
+
+        # Four checkpoints a day (every 6 hours) for four days
+        entries = [_entry(i, i * 6) for i in range(16)]
+        policy = RetentionPolicy(checkpoints=RetentionRule(keep_daily=3))
+
+        plan = plan_prune(entries, policy)
+
+        assert sorted(e.filename for e in plan.keep) == [
+            "syria_00007.zip",
+            "syria_00011.zip",
+            "syria_00015.zip",
+        ]
+
+    def test_auto_backups_use_their_own_rule(self):
+        """Auto-backups should be pruned by the auto_backups rule only."""
+        from foothold_checkpoint.core.config import RetentionPolicy, RetentionRule
+        from foothold_checkpoint.core.retention import plan_prune
+
+        entries = [_entry(i, i) for i in range(3)]
+        entries += [_entry(i, i, campaign="auto", auto=True) for i in range(3)]
+        policy = RetentionPolicy(auto_backups=RetentionRule(keep_last=1))
+
+        plan = plan_prune(entries, policy)
+
+        assert [e.filename for e in plan.delete] == ["auto_00000.zip", "auto_00001.zip"]
+
+    def test_max_total_bytes_drops_oldest_but_keeps_newest_per_campaign(self):
+        """The size cap should drop the oldest checkpoints, never a campaign's newest."""
+        from foothold_checkpoint.core.config import RetentionPolicy, RetentionRule
+        from foothold_checkpoint.core.retention import plan_prune
+
+        entries = [_entry(i, i, "syria", size=100) for i in range(4)]
+        entries.append(_entry(0, 0, "caucasus", size=1000))
+        policy = RetentionPolicy(checkpoints=RetentionRule(max_total_bytes=1250))
+
+        plan = plan_prune(entries, policy)
+
+        assert sorted(e.filename for e in plan.keep) == [
+            "caucasus_00000.zip",
+            "syria_00002.zip",
+            "syria_00003.zip",
+        ]
+
+    def test_invalid_and_filtered_checkpoints_are_kept(self):
+        """Checkpoints without metadata or outside the filters should never be pruned."""
+        from foothold_checkpoint.core.catalog import CatalogEntry
+        from foothold_checkpoint.core.config import RetentionPolicy, RetentionRule
+        from foothold_checkpoint.core.retention import plan_prune
+
+        entries = [_entry(i, i, "syria") for i in range(3)]
+        entries += [_entry(i, i, "caucasus") for i in range(3)]
+        entries.append(CatalogEntry(filename="broken.zip", size=1, mtime_ns=0, metadata=None))
+        policy = RetentionPolicy(checkpoints=RetentionRule(keep_last=1))
+
+        plan = plan_prune(entries, policy, campaign_filter="Caucasus")
+
+        assert [e.filename for e in plan.delete] == ["caucasus_00000.zip", "caucasus_00001.zip"]
+
+    def test_evaluates_thousands_of_checkpoints_quickly(self):
+        """Evaluating 10,000 checkpoints should plan each once, well within seconds."""
+        from foothold_checkpoint.core.config import RetentionPolicy, RetentionRule
+        from foothold_checkpoint.core.retention import plan_prune
+
+        entries = [_entry(i, i / 4, f"campaign{i % 10}") for i in range(10_000)]
+        policy = RetentionPolicy(
+            checkpoints=RetentionRule(
+                keep_last=5, keep_hourly=24, keep_daily=7, keep_weekly=4, max_total_bytes=50_000
+            )
+        )
+
+        start = time.perf_counter()
+        plan = plan_prune(entries, policy)
+        elapsed = time.perf_counter() - start
+
+        assert len(plan.keep) + len(plan.delete) == 10_000
+        assert {e.filename for e in plan.keep}.isdisjoint(e.filename for e in plan.delete)
+        # Typically ~0.1 s; the bound is generous for slow CI machines
+        assert elapsed < 5.0
+
+
+class TestPruneCheckpoints:
+    """Test suite for prune_checkpoints."""
+
+    def test_prune_deletes_and_reports_bytes_freed(self, tmp_path):
+        """prune_checkpoints should delete unkept checkpoints and update the catalog."""
+        from foothold_checkpoint.core.config import RetentionPolicy, RetentionRule
+        from foothold_checkpoint.core.retention import prune_checkpoints
+        from foothold_checkpoint.core.storage import list_checkpoints
+
+        paths = [_write_checkpoint(tmp_path, i, i) for i in range(4)]
+        expected_bytes = sum(p.stat().st_size for p in paths[:2])
+        policy = RetentionPolicy(checkpoints=RetentionRule(keep_last=2))
+
+        preview = asyncio.run(prune_checkpoints(tmp_path, policy, dry_run=True))
+        assert preview.deleted == paths[:2]
+        assert all(p.exists() for p in paths)
+
+        result = asyncio.run(prune_checkpoints(tmp_path, policy))
+
+        assert result.deleted == paths[:2]
+        assert result.bytes_freed == expected_bytes
+        assert result.kept == 2
+        assert sorted(cp["filename"] for cp in asyncio.run(list_checkpoints(tmp_path))) == [
+            p.name for p in paths[2:]
+        ]
+
+    def test_prune_reports_blobs_freed_by_the_dedup_backend(self, tmp_path):
+        """bytes_freed should include the blobs released with deduplicated checkpoints."""
+        from foothold_checkpoint.core.blobstore import BlobStore
+        from foothold_checkpoint.core.checkpoint import create_checkpoint
+        from foothold_checkpoint.core.config import RetentionPolicy, RetentionRule
+        from foothold_checkpoint.core.retention import prune_checkpoints
+
+        source = tmp_path / "foothold_syria.lua"
+        checkpoints_dir = tmp_path / "checkpoints"
+        paths = []
+        for i in range(3):
+            source.write_text(f"-- state {i}\n" * 1000)
+            paths.append(
+                create_checkpoint(
+                    campaign_name="syria",
+                    server_name="server",
+                    campaign_files=[source],
+                    output_dir=checkpoints_dir,
+                    created_at=BASE_TIME + timedelta(hours=i),
+                    storage_backend="dedup",
+                )
+            )
+        store = BlobStore(checkpoints_dir)
+        blobs = list(store.root.glob("*/*"))
+        assert len(blobs) == 3
+        with zipfile.ZipFile(paths[2]) as zf:
+            kept_checksum = json.loads(zf.read("metadata.json"))["files"]["foothold_syria.lua"]
+        kept_blob = store.blob_path(kept_checksum)
+        expected_bytes = sum(p.stat().st_size for p in paths[:2]) + sum(
+            b.stat().st_size for b in blobs if b != kept_blob
+        )
+        policy = RetentionPolicy(checkpoints=RetentionRule(keep_last=1))
+
+        with patch("foothold_checkpoint.core.blobstore.GC_GRACE_SECONDS", -1):
+            preview = asyncio.run(prune_checkpoints(checkpoints_dir, policy, dry_run=True))
+            result = asyncio.run(prune_checkpoints(checkpoints_dir, policy))
+
+        assert preview.bytes_freed == expected_bytes
+        assert result.bytes_freed == expected_bytes
+        assert list(store.root.glob("*/*")) == [kept_blob]
+
+    def test_prune_reports_undeletable_checkpoints(self, tmp_path):
+        """A checkpoint that cannot be deleted should be reported, not abort the prune."""
+        from foothold_checkpoint.core.config import RetentionPolicy, RetentionRule
+        from foothold_checkpoint.core.retention import prune_checkpoints
+
+        paths = [_write_checkpoint(tmp_path, i, i) for i in range(3)]
+        policy = RetentionPolicy(checkpoints=RetentionRule(keep_last=1))
+        original_unlink = Path.unlink
+
+        def failing_unlink(self, *args, **kwargs):
+            if self.name == paths[0].name:
+                raise PermissionError("File in use")
+            return original_unlink(self, *args, **kwargs)
+
+        with patch.object(Path, "unlink", failing_unlink):
+            result = asyncio.run(prune_checkpoints(tmp_path, policy))
+
+        assert result.deleted == [paths[1]]
+        assert list(result.errors) == [paths[0].name]
+        assert paths[0].exists()
+
+
+class TestPruneCommand:
+    """Tests for the CLI prune command."""
+
+    def test_prune_requires_retention_policy(self, tmp_path):
+        """prune should fail when no retention policy is configured."""
+        from typer.testing import CliRunner
+
+        from foothold_checkpoint.cli import app
+        from tests.conftest import make_simple_campaign, make_test_config
+
+        config = make_test_config(
+            checkpoints_dir=tmp_path,
+            campaigns={"syria": make_simple_campaign("Syria", ["foothold_syria.lua"])},
+        )
+
+        with patch("foothold_checkpoint.cli.load_config", return_value=config):
+            result = CliRunner().invoke(app, ["prune", "--force"])
+
+        assert result.exit_code == 1
+        assert "No retention policy" in result.stdout
+
+    def test_prune_force_deletes_checkpoints(self, tmp_path):
+        """prune --force should delete the checkpoints outside the policy."""
+        from typer.testing import CliRunner
+
+        from foothold_checkpoint.cli import app
+        from foothold_checkpoint.core.config import RetentionPolicy, RetentionRule
+        from tests.conftest import make_simple_campaign, make_test_config
+
+        paths = [_write_checkpoint(tmp_path, i, i) for i in range(3)]
+        config = make_test_config(
+            checkpoints_dir=tmp_path,
+            campaigns={"syria": make_simple_campaign("Syria", ["foothold_syria.lua"])},
+        ).model_copy(update={"retention": RetentionPolicy(checkpoints=RetentionRule(keep_last=1))})
+
+        with patch("foothold_checkpoint.cli.load_config", return_value=config):
+            dry = CliRunner().invoke(app, ["prune", "--dry-run"])
+            assert dry.exit_code == 0
+            assert all(p.exists() for p in paths)
+
+            result = CliRunner().invoke(app, ["prune", "--force"])
+
+        assert result.exit_code == 0
+        assert "Deleted 2 checkpoint(s)" in result.stdout
+        assert [p.exists() for p in paths] == [False, False, True]
@@ -0,0 +1,68 @@
+"""Tests for single-pass source directory scanning."""
+
+import os
+from unittest.mock import patch
+
+
+class TestScanDirectory:
+    """Test suite for scan_directory and campaign_file_filter."""
+
+    def test_scan_returns_stat_data_of_regular_files(self, tmp_path):
+        """Scanned files should carry the same stat data as os.stat."""
+        from foothold_checkpoint.core.scan import scan_directory
+
+        (tmp_path / "foothold_test.lua").write_text("-- state 1")
+        (tmp_path / "subdir").mkdir()
+
+        scanned = scan_directory(tmp_path)
+
+        assert list(scanned) == ["foothold_test.lua"]
+        record = scanned["foothold_test.lua"]
+        stat_result = os.stat(tmp_path / "foothold_test.lua")
+        assert record.path == tmp_path / "foothold_test.lua"
+        assert record.signature == (
+            stat_result.st_size,
+            stat_result.st_mtime_ns,
+            stat_result.st_ino,
+        )
+
+    def test_campaign_filter_skips_unrelated_files_by_name(self, tmp_path):
+        """Only campaign files, the ranks file and (optionally) foothold-like names are kept."""
+        from foothold_checkpoint.core.scan import campaign_file_filter, scan_directory
+        from tests.conftest import make_simple_campaign, make_test_config
+
+        for name in ("foothold_test.lua", "Foothold_Ranks.lua", "foothold_new.lua", "other.miz"):
+            (tmp_path / name).write_text("--")
+        config = make_test_config(
+            checkpoints_dir=tmp_path / "checkpoints",
+            campaigns={"test": make_simple_campaign("Test", ["foothold_test.lua"])},
+        )
+
+        assert sorted(scan_directory(tmp_path, campaign_file_filter(config))) == [
+            "Foothold_Ranks.lua",
+            "foothold_test.lua",
+        ]
+        assert sorted(
+            scan_directory(tmp_path, campaign_file_filter(config, include_foothold_like=True))
+        ) == ["Foothold_Ranks.lua", "foothold_new.lua", "foothold_test.lua"]
+
+    def test_hash_cache_reuses_scanned_stat_data(self, tmp_path):
+        """The hash cache should not stat a file again when given its scan record."""
+        from foothold_checkpoint.core.hashcache import HashCache
+        from foothold_checkpoint.core.scan import scan_directory
+
+        source = tmp_path / "foothold_test.lua"
+        source.write_text("-- state 1")
+        # Old enough to be cached (outside the racy window)
+        os.utime(source, ns=(1_700_000_000_000_000_000, 1_700_000_000_000_000_000))
+        cache = HashCache(tmp_path)
+        expected = cache.checksum(source)
+
+        record = scan_directory(tmp_path)["foothold_test.lua"]
+        with (
+            patch("foothold_checkpoint.core.hashcache.os.stat", wraps=os.stat) as stat,
+            patch("foothold_checkpoint.core.hashcache.compute_file_checksum") as compute,
+        ):
+            assert cache.checksum(source, record) == expected
+        assert str(source.resolve()) not in [call.args[0] for call in stat.call_args_list]
+        compute.assert_not_called()
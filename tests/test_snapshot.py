@@ -0,0 +1,206 @@
+"""Tests for snapshot-based pre-restore auto-backups."""
+
+import asyncio
+import json
+import zipfile
+from datetime import datetime, timezone
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+
+def _snapshot_setup(tmp_path):
+    """Save a checkpoint of state 1, then change the campaign file to state 2."""
+    from foothold_checkpoint.core.storage import save_checkpoint
+    from tests.conftest import make_simple_campaign, make_test_config
+
+    saves_dir = tmp_path / "saves"
+    saves_dir.mkdir()
+    lua_file = saves_dir / "foothold_test.lua"
+    lua_file.write_text("-- state 1")
+    checkpoints_dir = tmp_path / "checkpoints"
+    config = make_test_config(
+        checkpoints_dir=checkpoints_dir,
+        campaigns={"test": make_simple_campaign("Test", ["foothold_test.lua"])},
+        auto_backup_mode="snapshot",
+    )
+    checkpoint = asyncio.run(
+        save_checkpoint(
+            campaign_name="test",
+            server_name="server",
+            source_dir=saves_dir,
+            output_dir=checkpoints_dir,
+            config=config,
+            created_at=datetime(2024, 2, 14, 10, 0, 0, tzinfo=timezone.utc),
+        )
+    )
+    lua_file.write_text("-- state 2")
+    return config, checkpoint, saves_dir, lua_file
+
+
+class TestCloneFile:
+    """Test suite for clone_file."""
+
+    def test_hardlinks_replaced_files_when_reflink_is_unsupported(self, tmp_path):
+        """Files about to be replaced may be hardlinked instead of copied."""
+        from foothold_checkpoint.core.snapshot import clone_file
+
+        source = tmp_path / "foothold_test.lua"
+        source.write_text("-- state 1")
+
+        with patch("foothold_checkpoint.core.snapshot._reflink", return_value=False):
+            linked = clone_file(source, tmp_path / "linked.lua", allow_hardlink=True)
+            copied = clone_file(source, tmp_path / "copied.lua")
+
+        assert linked == "hardlink"
+        assert (tmp_path / "linked.lua").stat().st_ino == source.stat().st_ino
+        assert copied == "copy"
+        assert (tmp_path / "copied.lua").stat().st_ino != source.stat().st_ino
+        assert (tmp_path / "copied.lua").read_text() == "-- state 1"
+
+
+class TestSnapshotAutoBackup:
+    """Test suite for restores with auto_backup_mode="snapshot"."""
+
+    def test_restore_snapshots_and_compacts_auto_backup(self, tmp_path):
+        """The auto-backup should hold the pre-restore files once compacted."""
+        from foothold_checkpoint.core.snapshot import compact_pending_snapshots, pending_snapshots
+        from foothold_checkpoint.core.storage import restore_checkpoint, save_checkpoint
+        from tests.conftest import make_simple_campaign, make_test_config
+
+        saves_dir = tmp_path / "saves"
+        saves_dir.mkdir()
+        lua_file = saves_dir / "foothold_test.lua"
+        lua_file.write_text("-- state 1")
+        (saves_dir / "Foothold_Ranks.lua").write_text("-- ranks 1")
+        checkpoints_dir = tmp_path / "checkpoints"
+        config = make_test_config(
+            checkpoints_dir=checkpoints_dir,
+            campaigns={"test": make_simple_campaign("Test", ["foothold_test.lua"])},
+            auto_backup_mode="snapshot",
+        )
+
+        checkpoint = asyncio.run(
+            save_checkpoint(
+                campaign_name="test",
+                server_name="server",
+                source_dir=saves_dir,
+                output_dir=checkpoints_dir,
+                config=config,
+                created_at=datetime(2024, 2, 14, 10, 0, 0, tzinfo=timezone.utc),
+            )
+        )
+        lua_file.write_text("-- state 2")
+
+        def schedule_compaction(*args):
+            # Compaction must not compete with the restore for the I/O pool
+            assert lua_file.read_text() == "-- state 1"
+
+        with patch(
+            "foothold_checkpoint.core.snapshot.schedule_compaction",
+            side_effect=schedule_compaction,
+        ) as schedule:
+            asyncio.run(
+                restore_checkpoint(
+                    checkpoint,
+                    saves_dir,
+                    config=config,
+                    server_name="server",
+                    skip_overwrite_check=True,
+                )
+            )
+
+        schedule.assert_called_once()
+        assert lua_file.read_text() == "-- state 1"
+        assert len(pending_snapshots(checkpoints_dir)) == 1
+
+        created = compact_pending_snapshots(checkpoints_dir, config)
+
+        assert len(created) == 1
+        assert pending_snapshots(checkpoints_dir) == []
+        with zipfile.ZipFile(created[0]) as zf:
+            assert zf.read("foothold_test.lua") == b"-- state 2"
+            metadata = json.loads(zf.read("metadata.json"))
+        assert metadata["is_auto_backup"] is True
+        assert metadata["name"].startswith("auto-backup-")
+
+    def test_failed_restore_still_schedules_compaction(self, tmp_path):
+        """The snapshot taken before a failed restore should still be compacted."""
+        from foothold_checkpoint.core.snapshot import pending_snapshots
+        from foothold_checkpoint.core.storage import restore_checkpoint
+
+        config, checkpoint, saves_dir, lua_file = _snapshot_setup(tmp_path)
+
+        with (
+            patch("foothold_checkpoint.core.snapshot.schedule_compaction") as schedule,
+            patch(
+                "foothold_checkpoint.core.storage._stage_verified_member",
+                side_effect=ValueError("Checksum mismatch"),
+            ),
+            pytest.raises(ValueError, match="Checksum mismatch"),
+        ):
+            asyncio.run(
+                restore_checkpoint(
+                    checkpoint,
+                    saves_dir,
+                    config=config,
+                    server_name="server",
+                    skip_overwrite_check=True,
+                )
+            )
+
+        schedule.assert_called_once()
+        assert lua_file.read_text() == "-- state 2"
+        assert len(pending_snapshots(config.checkpoints_dir)) == 1
+
+    def test_backup_hook_receives_the_compacted_checkpoint(self, tmp_path):
+        """on_backup_complete should get the auto-backup ZIP once it exists."""
+        from foothold_checkpoint.core.events import EventHooks
+        from foothold_checkpoint.core.storage import restore_checkpoint
+
+        config, checkpoint, saves_dir, _ = _snapshot_setup(tmp_path)
+
+        async def restore_and_wait_for_backup() -> Path:
+            backups: asyncio.Queue[Path] = asyncio.Queue()
+
+            async def on_backup_complete(path: Path) -> None:
+                await backups.put(path)
+
+            await restore_checkpoint(
+                checkpoint,
+                saves_dir,
+                config=config,
+                server_name="server",
+                skip_overwrite_check=True,
+                hooks=EventHooks(on_backup_complete=on_backup_complete),
+            )
+            return await asyncio.wait_for(backups.get(), timeout=10)
+
+        backup_path = asyncio.run(restore_and_wait_for_backup())
+
+        assert backup_path.suffix == ".zip"
+        with zipfile.ZipFile(backup_path) as zf:
+            assert zf.read("foothold_test.lua") == b"-- state 2"
+
+    def test_invalid_snapshot_is_left_for_next_run(self, tmp_path):
+        """A snapshot that cannot be compacted should be kept, not lost."""
+        from foothold_checkpoint.core.snapshot import (
+            SNAPSHOT_MANIFEST,
+            SNAPSHOTS_DIRNAME,
+            compact_pending_snapshots,
+            pending_snapshots,
+        )
+        from tests.conftest import make_simple_campaign, make_test_config
+
+        snapshot_dir = tmp_path / SNAPSHOTS_DIRNAME / "test_2024-02-14_10-00-00"
+        snapshot_dir.mkdir(parents=True)
+        (snapshot_dir / SNAPSHOT_MANIFEST).write_text("{}")
+        config = make_test_config(
+            checkpoints_dir=tmp_path,
+            campaigns={"test": make_simple_campaign("Test", ["foothold_test.lua"])},
+        )
+
+        assert compact_pending_snapshots(tmp_path, config) == []
+        assert pending_snapshots(tmp_path) == [snapshot_dir]
+        assert not list(Path(tmp_path).glob("*.zip"))
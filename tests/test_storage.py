@@ -435,6 +435,55 @@ class TestSaveCheckpoint:
                 # Restore permissions for cleanup
                 os.chmod(source_dir, stat.S_IRWXU)
 
+    def test_save_checkpoint_uses_configured_compression(self):
+        """Campaign and auto-backup compression settings should be applied and recorded."""
+        import json
+        import zipfile
+
+        from foothold_checkpoint.core.config import CampaignConfig, CompressionConfig
+        from foothold_checkpoint.core.storage import save_checkpoint
+        from tests.conftest import make_simple_campaign, make_test_config
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            source_dir = Path(tmpdir) / "source"
+            source_dir.mkdir()
+            (source_dir / "foothold_test.lua").write_text("-- test " * 100)
+            output_dir = Path(tmpdir) / "checkpoints"
+
+            campaign = make_simple_campaign("Test", ["foothold_test.lua"])
+            config = make_test_config(
+                campaigns={
+                    "test": CampaignConfig(
+                        display_name=campaign.display_name,
+                        files=campaign.files,
+                        compression=CompressionConfig(method="bzip2", level=9),
+                    )
+                }
+            )
+
+            def save(hour: int, is_auto_backup: bool) -> Path:
+                return asyncio.run(
+                    save_checkpoint(
+                        campaign_name="test",
+                        server_name="server",
+                        source_dir=source_dir,
+                        output_dir=output_dir,
+                        config=config,
+                        created_at=datetime(2024, 2, 14, hour, 0, 0, tzinfo=timezone.utc),
+                        is_auto_backup=is_auto_backup,
+                    )
+                )
+
+            for path, method, level, compress_type in [
+                (save(10, False), "bzip2", 9, zipfile.ZIP_BZIP2),
+                (save(11, True), "deflated", 1, zipfile.ZIP_DEFLATED),
+            ]:
+                with zipfile.ZipFile(path) as zf:
+                    assert zf.getinfo("foothold_test.lua").compress_type == compress_type
+                    metadata = json.loads(zf.read("metadata.json"))
+                assert metadata["compression"] == method
+                assert metadata["compression_level"] == level
+
 
 class TestSaveAllCampaigns:
     """Test suite for save_all_campaigns function."""
@@ -696,6 +745,201 @@ class TestSaveAllCampaigns:
             for path in results.values():
                 assert "2024-01-15_10-30-00" in path.name
 
+    def test_save_all_campaigns_parallel_matches_sequential_results(self):
+        """save_all_campaigns with max_workers > 1 should create the same checkpoints."""
+        import zipfile
+
+        from foothold_checkpoint.core.storage import save_all_campaigns
+        from tests.conftest import make_simple_campaign, make_test_config
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            source_dir = Path(tmpdir) / "source"
+            source_dir.mkdir()
+            campaigns = {}
+            for campaign in ["afghanistan", "syria", "caucasus", "germany"]:
+                (source_dir / f"foothold_{campaign}.lua").write_text(f"-- {campaign}")
+                campaigns[campaign] = make_simple_campaign(
+                    campaign.title(), [f"foothold_{campaign}.lua"]
+                )
+            (source_dir / "Foothold_Ranks.lua").write_text("-- ranks")
+            config = make_test_config(campaigns=campaigns)
+
+            progress_calls = []
+            results = asyncio.run(
+                save_all_campaigns(
+                    server_name="server",
+                    source_dir=source_dir,
+                    output_dir=Path(tmpdir) / "checkpoints",
+                    config=config,
+                    progress_callback=lambda msg, cur, tot: progress_calls.append(msg),
+                    max_workers=3,
+                )
+            )
+
+            assert sorted(results) == sorted(campaigns)
+            for campaign, path in results.items():
+                with zipfile.ZipFile(path) as zf:
+                    assert sorted(zf.namelist()) == sorted(
+                        [f"foothold_{campaign}.lua", "Foothold_Ranks.lua", "metadata.json"]
+                    )
+            assert sum(msg.startswith("Saving campaign") for msg in progress_calls) == 4
+
+    def test_save_all_campaigns_scans_source_dir_once(self):
+        """save_all_campaigns should group campaign files once for the whole batch."""
+        from unittest.mock import patch
+
+        from foothold_checkpoint.core import storage
+        from tests.conftest import make_simple_campaign, make_test_config
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            source_dir = Path(tmpdir) / "source"
+            source_dir.mkdir()
+            (source_dir / "foothold_test1.lua").write_text("-- test1")
+            (source_dir / "foothold_test2.lua").write_text("-- test2")
+
+            config = make_test_config(
+                campaigns={
+                    "test1": make_simple_campaign("Test1", ["foothold_test1.lua"]),
+                    "test2": make_simple_campaign("Test2", ["foothold_test2.lua"]),
+                }
+            )
+
+            with patch.object(
+                storage, "detect_campaigns", wraps=storage.detect_campaigns
+            ) as mock_detect:
+                results = asyncio.run(
+                    storage.save_all_campaigns(
+                        server_name="server",
+                        source_dir=source_dir,
+                        output_dir=Path(tmpdir) / "checkpoints",
+                        config=config,
+                        max_workers=2,
+                    )
+                )
+
+            assert len(results) == 2
+            assert mock_detect.call_count == 1
+
+    def test_save_all_campaigns_parallel_raises_when_continue_on_error_false(self):
+        """Parallel save should propagate the first failure when continue_on_error=False."""
+        from foothold_checkpoint.core.storage import save_all_campaigns
+        from tests.conftest import make_simple_campaign, make_test_config
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            source_dir = Path(tmpdir) / "source"
+            source_dir.mkdir()
+            (source_dir / "foothold_test1.lua").write_text("-- test1")
+            (source_dir / "foothold_test2.lua").write_text("-- test2")
+            output_path = Path(tmpdir) / "not_a_directory.txt"
+            output_path.write_text("this is a file, not a directory")
+
+            config = make_test_config(
+                campaigns={
+                    "test1": make_simple_campaign("Test1", ["foothold_test1.lua"]),
+                    "test2": make_simple_campaign("Test2", ["foothold_test2.lua"]),
+                }
+            )
+
+            with pytest.raises(OSError):
+                asyncio.run(
+                    save_all_campaigns(
+                        server_name="server",
+                        source_dir=source_dir,
+                        output_dir=output_path,
+                        config=config,
+                        continue_on_error=False,
+                        max_workers=2,
+                    )
+                )
+
+            # With continue_on_error=True, failures are omitted from the results
+            results = asyncio.run(
+                save_all_campaigns(
+                    server_name="server",
+                    source_dir=source_dir,
+                    output_dir=output_path,
+                    config=config,
+                    max_workers=2,
+                )
+            )
+            assert results == {}
+
+    def test_save_all_campaigns_parallel_failure_keeps_sequential_results(self, tmp_path):
+        """A parallel batch aborted by a failure should keep what the sequential save keeps."""
+        import time
+        from unittest.mock import patch
+
+        from foothold_checkpoint.core import storage
+        from tests.conftest import make_simple_campaign, make_test_config
+
+        source_dir = tmp_path / "source"
+        source_dir.mkdir()
+        for campaign in ("alpha", "bravo", "charlie"):
+            (source_dir / f"foothold_{campaign}.lua").write_text(f"-- {campaign}")
+        output_dir = tmp_path / "checkpoints"
+        config = make_test_config(
+            checkpoints_dir=output_dir,
+            campaigns={
+                campaign: make_simple_campaign(campaign.title(), [f"foothold_{campaign}.lua"])
+                for campaign in ("alpha", "bravo", "charlie")
+            },
+        )
+        # Batch order follows the directory scan; the middle campaign fails
+        first, failing, last = storage._scan_source_campaigns(source_dir, config)[0]
+        real_create = storage.create_checkpoint
+        written = {}
+
+        def create(**kwargs):
+            if kwargs["campaign_name"] == failing:
+                raise OSError("disk full")
+            # Both other campaigns finish after the failure
+            time.sleep(0.2)
+            path = real_create(**kwargs)
+            written[kwargs["campaign_name"]] = path
+            return path
+
+        with (
+            patch.object(storage, "create_checkpoint", side_effect=create),
+            pytest.raises(OSError, match="disk full"),
+        ):
+            asyncio.run(
+                storage.save_all_campaigns(
+                    server_name="server",
+                    source_dir=source_dir,
+                    output_dir=output_dir,
+                    config=config,
+                    continue_on_error=False,
+                    max_workers=3,
+                )
+            )
+
+        # The campaign before the failure is kept; the one after it was written, then removed
+        assert set(written) == {first, last}
+        assert list(output_dir.glob("*.zip")) == [written[first]]
+
+    def test_save_all_campaigns_rejects_invalid_max_workers(self):
+        """save_all_campaigns should reject a worker count lower than 1."""
+        from foothold_checkpoint.core.storage import save_all_campaigns
+        from tests.conftest import make_simple_campaign, make_test_config
+
+        config = make_test_config(
+            campaigns={"test": make_simple_campaign("Test", ["foothold_test.lua"])}
+        )
+
+        with (
+            tempfile.TemporaryDirectory() as tmpdir,
+            pytest.raises(ValueError, match="max_workers"),
+        ):
+            asyncio.run(
+                save_all_campaigns(
+                    server_name="server",
+                    source_dir=tmpdir,
+                    output_dir=tmpdir,
+                    config=config,
+                    max_workers=0,
+                )
+            )
+
 
 class TestStorageDirectoryCreation:
     """Test suite for automatic storage directory creation."""
@@ -1469,24 +1713,22 @@ class TestRestoreCheckpoint:
             target_dir = Path(tmpdir) / "target"
             target_dir.mkdir()
 
-            # Mock disk full error on write_bytes
+            # Mock disk full error while streaming a member to disk
             import unittest.mock
 
-            def mock_write_bytes_raises(*args, **kwargs):
-                raise OSError("No space left on device")
-
-            # Patch write_bytes on Path instances
-            with unittest.mock.patch.object(
-                Path, "write_bytes", side_effect=mock_write_bytes_raises, autospec=False
+            with (
+                unittest.mock.patch(
+                    "foothold_checkpoint.core.storage._stage_checkpoint_member",
+                    side_effect=OSError("No space left on device"),
+                ),
+                pytest.raises(OSError, match="No space left on device"),
             ):
-                # Need to re-create target_dir Path instance after patching
-                target_dir_patched = Path(tmpdir) / "target"
-                with pytest.raises(OSError, match="No space left on device"):
-                    asyncio.run(
-                        restore_checkpoint(
-                            checkpoint_path=checkpoint_path, target_dir=target_dir_patched
-                        )
-                    )
+                asyncio.run(
+                    restore_checkpoint(checkpoint_path=checkpoint_path, target_dir=target_dir)
+                )
+
+            # Nothing should be left behind in the target directory
+            assert list(target_dir.iterdir()) == []
         """restore_checkpoint should rename files when campaign name has evolved."""
         import hashlib
         import json
@@ -1668,6 +1910,129 @@ class TestRestoreCheckpoint:
             # Original filename should be preserved
             assert (target_dir / "FootHold_GCW_Modern.lua").exists()
 
+    def test_restore_checkpoint_decompresses_each_file_once(self):
+        """restore_checkpoint should stream each member once instead of reading it twice."""
+        import zipfile
+        from unittest.mock import patch
+
+        from foothold_checkpoint.core.storage import restore_checkpoint, save_checkpoint
+        from tests.conftest import make_simple_campaign, make_test_config
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            source_dir = Path(tmpdir) / "source"
+            source_dir.mkdir()
+            content = "-- large persistence file\n" * 100000
+            (source_dir / "foothold_test.lua").write_text(content)
+
+            config = make_test_config(
+                campaigns={"test": make_simple_campaign("Test", ["foothold_test.lua"])}
+            )
+            checkpoint_dir = Path(tmpdir) / "checkpoints"
+            checkpoint_path = asyncio.run(
+                save_checkpoint(
+                    campaign_name="test",
+                    server_name="server",
+                    source_dir=source_dir,
+                    output_dir=checkpoint_dir,
+                    config=config,
+                )
+            )
+
+            target_dir = Path(tmpdir) / "target"
+            target_dir.mkdir()
+
+            original_read = zipfile.ZipFile.read
+            with patch.object(
+                zipfile.ZipFile, "read", autospec=True, side_effect=original_read
+            ) as mock_read:
+                asyncio.run(
+                    restore_checkpoint(checkpoint_path=checkpoint_path, target_dir=target_dir)
+                )
+
+            read_members = [call.args[1] for call in mock_read.call_args_list]
+            assert "foothold_test.lua" not in read_members
+            assert (target_dir / "foothold_test.lua").read_text() == content
+            assert [p.name for p in target_dir.iterdir()] == ["foothold_test.lua"]
+
+    def test_restore_checkpoint_checksum_mismatch_keeps_existing_files(self):
+        """A checksum mismatch should leave existing target files and no temporary files."""
+        import json
+        import zipfile
+
+        from foothold_checkpoint.core.storage import restore_checkpoint
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            checkpoint_path = Path(tmpdir) / "test_2024-02-14_10-00-00.zip"
+            metadata = {
+                "campaign_name": "test",
+                "server_name": "server",
+                "created_at": "2024-02-14T10:00:00+00:00",
+                "files": {
+                    "foothold_test.lua": "sha256:" + "0" * 64,
+                    "foothold_test_storage.csv": "sha256:" + "0" * 64,
+                },
+            }
+            with zipfile.ZipFile(checkpoint_path, "w") as zf:
+                zf.writestr("foothold_test.lua", "-- tampered")
+                zf.writestr("foothold_test_storage.csv", "a,b")
+                zf.writestr("metadata.json", json.dumps(metadata))
+
+            target_dir = Path(tmpdir) / "target"
+            target_dir.mkdir()
+            (target_dir / "foothold_test.lua").write_text("-- current state")
+
+            with pytest.raises(ValueError, match="Checksum mismatch"):
+                asyncio.run(
+                    restore_checkpoint(
+                        checkpoint_path=checkpoint_path,
+                        target_dir=target_dir,
+                        skip_overwrite_check=True,
+                    )
+                )
+
+            assert (target_dir / "foothold_test.lua").read_text() == "-- current state"
+            assert [p.name for p in target_dir.iterdir()] == ["foothold_test.lua"]
+
+    def test_restore_checkpoint_cancelled_leaves_no_temporary_files(self):
+        """Cancelling the overwrite confirmation should clean up staged files."""
+        from unittest.mock import patch
+
+        from foothold_checkpoint.core.storage import restore_checkpoint, save_checkpoint
+        from tests.conftest import make_simple_campaign, make_test_config
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            source_dir = Path(tmpdir) / "source"
+            source_dir.mkdir()
+            (source_dir / "foothold_test.lua").write_text("-- checkpoint state")
+
+            config = make_test_config(
+                campaigns={"test": make_simple_campaign("Test", ["foothold_test.lua"])}
+            )
+            checkpoint_path = asyncio.run(
+                save_checkpoint(
+                    campaign_name="test",
+                    server_name="server",
+                    source_dir=source_dir,
+                    output_dir=Path(tmpdir) / "checkpoints",
+                    config=config,
+                )
+            )
+
+            target_dir = Path(tmpdir) / "target"
+            target_dir.mkdir()
+            (target_dir / "foothold_test.lua").write_text("-- current state")
+
+            with (
+                patch("builtins.input", return_value="n"),
+                pytest.raises(RuntimeError, match="cancelled"),
+            ):
+                asyncio.run(
+                    restore_checkpoint(checkpoint_path=checkpoint_path, target_dir=target_dir)
+                )
+
+            assert (target_dir / "foothold_test.lua").read_text() == "-- current state"
+            assert [p.name for p in target_dir.iterdir()] == ["foothold_test.lua"]
+
 
 class TestListCheckpoints:
     """Test suite for list_checkpoints function."""
@@ -1685,8 +2050,12 @@ class TestListCheckpoints:
             assert result == []
 
     def test_list_checkpoints_returns_list_of_checkpoint_info(self):
-        """list_checkpoints should return a list of checkpoint metadata dictionaries."""
-        from foothold_checkpoint.core.storage import list_checkpoints, save_checkpoint
+        """list_checkpoints should return a list of CheckpointInfo records."""
+        from foothold_checkpoint.core.storage import (
+            CheckpointInfo,
+            list_checkpoints,
+            save_checkpoint,
+        )
         from tests.conftest import make_simple_campaign, make_test_config
 
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -1723,7 +2092,9 @@ class TestListCheckpoints:
             result = asyncio.run(list_checkpoints(checkpoint_dir))
 
             assert len(result) == 1
-            assert isinstance(result[0], dict)
+            assert isinstance(result[0], CheckpointInfo)
+            assert isinstance(result[0].created_at, datetime)
+            assert result[0].files == ["foothold_test.lua", "foothold_test_storage.csv"]
             assert "filename" in result[0]
             assert "campaign" in result[0]
             assert "server" in result[0]
@@ -2045,9 +2416,8 @@ class TestListCheckpoints:
 
             assert len(result) == 3
             # Should be sorted oldest first (chronologically within group)
-            assert result[0]["timestamp"] == "2024-02-10T10:00:00Z"
-            assert result[1]["timestamp"] == "2024-02-11T10:00:00Z"
-            assert result[2]["timestamp"] == "2024-02-12T10:00:00Z"
+            assert [cp.created_at.day for cp in result] == [10, 11, 12]
+            assert result[0].created_at.tzinfo is not None
 
     def test_list_checkpoints_includes_file_size(self):
         """list_checkpoints should include the file size for each checkpoint."""
@@ -3478,3 +3848,188 @@ class TestImportCheckpoint:
             assert result.exists()
             assert output_dir.exists()
             assert output_dir.is_dir()
+
+
+class TestDifferentialRestore:
+    """Test suite for restore_checkpoint with differential=True."""
+
+    @staticmethod
+    def _setup(tmp_path: Path):
+        """Save a two-file checkpoint and return (checkpoint, saves dir, config)."""
+        from foothold_checkpoint.core.storage import save_checkpoint
+        from tests.conftest import make_simple_campaign, make_test_config
+
+        saves_dir = tmp_path / "saves"
+        saves_dir.mkdir()
+        (saves_dir / "foothold_test.lua").write_text("-- state 1")
+        (saves_dir / "foothold_test_CTLD_Save.csv").write_text("crates 1")
+        config = make_test_config(
+            checkpoints_dir=tmp_path / "checkpoints",
+            campaigns={
+                "test": make_simple_campaign(
+                    "Test", ["foothold_test.lua"], ctld_save=["foothold_test_CTLD_Save.csv"]
+                )
+            },
+        )
+        checkpoint = asyncio.run(
+            save_checkpoint(
+                campaign_name="test",
+                server_name="server",
+                source_dir=saves_dir,
+                output_dir=config.checkpoints_dir,
+                config=config,
+                created_at=datetime(2024, 2, 14, 10, 0, 0, tzinfo=timezone.utc),
+            )
+        )
+        return checkpoint, saves_dir, config
+
+    def test_only_changed_files_are_rewritten(self, tmp_path):
+        """Files that already match the checkpoint should be skipped."""
+        from foothold_checkpoint.core.storage import restore_checkpoint
+
+        checkpoint, saves_dir, config = self._setup(tmp_path)
+        (saves_dir / "foothold_test.lua").write_text("-- state 2")
+        csv_inode = (saves_dir / "foothold_test_CTLD_Save.csv").stat().st_ino
+
+        result = asyncio.run(
+            restore_checkpoint(
+                checkpoint,
+                saves_dir,
+                config=config,
+                skip_overwrite_check=True,
+                auto_backup=False,
+                differential=True,
+            )
+        )
+
+        assert result == [saves_dir / "foothold_test.lua"]
+        assert result.skipped == [saves_dir / "foothold_test_CTLD_Save.csv"]
+        assert (saves_dir / "foothold_test.lua").read_text() == "-- state 1"
+        assert (saves_dir / "foothold_test_CTLD_Save.csv").stat().st_ino == csv_inode
+
+    def test_full_restore_rewrites_every_file(self, tmp_path):
+        """Without differential, every file should be rewritten and none skipped."""
+        from foothold_checkpoint.core.storage import restore_checkpoint
+
+        checkpoint, saves_dir, config = self._setup(tmp_path)
+
+        result = asyncio.run(
+            restore_checkpoint(
+                checkpoint, saves_dir, config=config, skip_overwrite_check=True, auto_backup=False
+            )
+        )
+
+        assert sorted(result) == [
+            saves_dir / "foothold_test.lua",
+            saves_dir / "foothold_test_CTLD_Save.csv",
+        ]
+        assert result.skipped == []
+
+
+class TestCheckpointQueries:
+    """Test suite for filtered, sorted and paged checkpoint listings."""
+
+    def _setup(self, tmp_path):
+        """Create four manual checkpoints and two auto-backups over six days."""
+        from foothold_checkpoint.core.checkpoint import create_checkpoint
+
+        source = tmp_path / "foothold_test.lua"
+        source.write_text("-- state")
+        checkpoints_dir = tmp_path / "checkpoints"
+        for day in range(1, 7):
+            create_checkpoint(
+                campaign_name="test" if day % 2 else "other",
+                server_name="server",
+                campaign_files=[source],
+                output_dir=checkpoints_dir,
+                created_at=datetime(2024, 2, day, 10, 0, 0, tzinfo=timezone.utc),
+                is_auto_backup=day > 4,
+            )
+        return checkpoints_dir
+
+    def test_filters_sorts_and_pages_with_total(self, tmp_path):
+        """Only the requested page should be returned, with the matching total."""
+        from foothold_checkpoint.core.storage import list_checkpoints
+
+        checkpoints_dir = self._setup(tmp_path)
+
+        page = asyncio.run(
+            list_checkpoints(
+                checkpoints_dir,
+                kind="manual",
+                since=datetime(2024, 2, 2),
+                sort="timestamp",
+                descending=True,
+                offset=1,
+                limit=2,
+            )
+        )
+
+        assert [cp["timestamp"][:10] for cp in page] == ["2024-02-03", "2024-02-02"]
+        assert page.total == 3
+        assert not any(cp["is_auto_backup"] for cp in page)
+
+        auto = asyncio.run(list_checkpoints(checkpoints_dir, kind="auto", campaign_filter="TEST"))
+        assert [cp["timestamp"][:10] for cp in auto] == ["2024-02-05"]
+        assert auto.total == 1
+
+    def test_iter_checkpoints_streams_the_same_page(self, tmp_path):
+        """iter_checkpoints should yield the records list_checkpoints returns."""
+        from foothold_checkpoint.core.storage import iter_checkpoints, list_checkpoints
+
+        checkpoints_dir = self._setup(tmp_path)
+
+        async def collect():
+            return [cp async for cp in iter_checkpoints(checkpoints_dir, offset=3, limit=2)]
+
+        streamed = asyncio.run(collect())
+
+        assert streamed == asyncio.run(list_checkpoints(checkpoints_dir))[3:5]
+        # Default order: manual checkpoints first, then auto-backups
+        assert [cp["is_auto_backup"] for cp in streamed] == [False, True]
+        with pytest.raises(ValueError, match="Invalid sort key"):
+            asyncio.run(list_checkpoints(checkpoints_dir, sort="newest"))
+
+
+class TestCheckpointInfo:
+    """Test suite for CheckpointInfo listing records."""
+
+    def test_slotted_record_round_trips_through_dict(self):
+        """Records should have no per-instance dict and serialize losslessly."""
+        from foothold_checkpoint.core.storage import CheckpointInfo
+
+        files = ["foothold_test.lua", "Foothold_Ranks.lua"]
+        info = CheckpointInfo(
+            filename="test_2024-02-14_10-30-00.zip",
+            campaign="test",
+            server="server",
+            created_at=datetime(2024, 2, 14, 10, 30, tzinfo=timezone.utc),
+            size_bytes=1536,
+            name="Before mission",
+            files=files,
+        )
+
+        assert not hasattr(info, "__dict__")
+        assert info.size_human == "1.5 KB"
+        assert info.files == files and info.files is not files
+        assert CheckpointInfo.from_dict(info.to_dict()) == info
+
+    def test_item_access_matches_former_dictionaries(self):
+        """Item access should keep working for dictionary-style callers."""
+        from foothold_checkpoint.core.storage import CheckpointInfo
+
+        info = CheckpointInfo.from_dict(
+            {
+                "filename": "test.zip",
+                "campaign": "test",
+                "server": "server",
+                "timestamp": "2024-02-14T10:30:00Z",
+            }
+        )
+
+        assert info["timestamp"] == "2024-02-14T10:30:00+00:00"
+        assert info.get("name") is None
+        assert info.get("unknown", "default") == "default"
+        assert "size_human" in info
+        with pytest.raises(KeyError):
+            info["unknown"]
@@ -0,0 +1,211 @@
+"""Tests for checkpoint integrity verification."""
+
+import asyncio
+import json
+import zipfile
+from datetime import datetime, timezone
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+
+def _make_checkpoint(tmp_path: Path, hour: int = 10) -> Path:
+    """Save a two-file checkpoint of a test campaign."""
+    from foothold_checkpoint.core.storage import save_checkpoint
+    from tests.conftest import make_simple_campaign, make_test_config
+
+    saves_dir = tmp_path / f"saves-{hour}"
+    saves_dir.mkdir()
+    (saves_dir / "foothold_test.lua").write_text(f"-- state {hour}")
+    (saves_dir / "Foothold_Ranks.lua").write_text("-- ranks")
+    config = make_test_config(
+        checkpoints_dir=tmp_path / "checkpoints",
+        campaigns={"test": make_simple_campaign("Test", ["foothold_test.lua"])},
+    )
+    return asyncio.run(
+        save_checkpoint(
+            campaign_name="test",
+            server_name="server",
+            source_dir=saves_dir,
+            output_dir=config.checkpoints_dir,
+            config=config,
+            created_at=datetime(2024, 2, 14, hour, 0, 0, tzinfo=timezone.utc),
+        )
+    )
+
+
+def _corrupt(checkpoint: Path, member: str) -> None:
+    """Rewrite a checkpoint with different content for one member."""
+    with zipfile.ZipFile(checkpoint) as zf:
+        contents = {name: zf.read(name) for name in zf.namelist()}
+    contents[member] = b"-- tampered"
+    with zipfile.ZipFile(checkpoint, "w", zipfile.ZIP_DEFLATED) as zf:
+        for name, data in contents.items():
+            zf.writestr(name, data)
+
+
+class TestVerifyCheckpoint:
+    """Test suite for verify_checkpoint and verify_checkpoints."""
+
+    def test_intact_checkpoint_passes(self, tmp_path):
+        """A freshly saved checkpoint should verify without error."""
+        from foothold_checkpoint.core.verify import verify_checkpoint
+
+        checkpoint = _make_checkpoint(tmp_path)
+
+        asyncio.run(verify_checkpoint(checkpoint))
+
+    def test_mismatch_is_reported(self, tmp_path):
+        """A member whose content changed should fail verification."""
+        from foothold_checkpoint.core.verify import verify_checkpoint
+
+        checkpoint = _make_checkpoint(tmp_path)
+        _corrupt(checkpoint, "foothold_test.lua")
+
+        with pytest.raises(ValueError, match="Checksum mismatch for file foothold_test.lua"):
+            asyncio.run(verify_checkpoint(checkpoint))
+
+    def test_batch_reports_every_checkpoint(self, tmp_path):
+        """A broken checkpoint should not prevent the others from being verified."""
+        from foothold_checkpoint.core.verify import verify_checkpoints
+
+        intact = _make_checkpoint(tmp_path, 10)
+        tampered = _make_checkpoint(tmp_path, 11)
+        _corrupt(tampered, "Foothold_Ranks.lua")
+        invalid = tmp_path / "checkpoints" / "invalid.zip"
+        invalid.write_text("not a zip")
+
+        report = asyncio.run(verify_checkpoints([intact, tampered, invalid], max_parallel=2))
+
+        assert report[intact] is None
+        assert "Checksum mismatch for file Foothold_Ranks.lua" in str(report[tampered])
+        assert "not a valid ZIP archive" in str(report[invalid])
+
+
+class TestScrubCheckpoints:
+    """Test suite for incremental verification of a checkpoints directory."""
+
+    def test_rerun_only_verifies_new_or_modified_archives(self, tmp_path):
+        """Unchanged archives should be skipped, keeping their previous result."""
+        from foothold_checkpoint.core.verify import VERIFY_STATE_FILENAME, scrub_checkpoints
+
+        first = _make_checkpoint(tmp_path, 10)
+        checkpoints_dir = first.parent
+
+        report = asyncio.run(scrub_checkpoints(checkpoints_dir))
+        assert report.verified == [first.name]
+        assert report.healthy
+        assert (checkpoints_dir / VERIFY_STATE_FILENAME).exists()
+
+        second = _make_checkpoint(tmp_path, 11)
+        _corrupt(first, "foothold_test.lua")
+        report = asyncio.run(scrub_checkpoints(checkpoints_dir))
+
+        assert sorted(report.verified) == [first.name, second.name]
+        assert list(report.errors) == [first.name]
+
+        second.unlink()
+        report = asyncio.run(scrub_checkpoints(checkpoints_dir))
+
+        assert report.verified == []
+        assert report.skipped == [first.name]
+        assert list(report.errors) == [first.name]
+        health = report.to_dict()
+        assert health["healthy"] is False
+        assert health["total"] == 1
+        assert health["checkpoints"][0]["status"] == "failed"
+
+    def test_archive_deleted_while_listing_is_skipped(self, tmp_path):
+        """An archive pruned between the directory listing and its stat should be ignored."""
+        import contextlib
+        import os
+
+        from foothold_checkpoint.core.verify import scrub_checkpoints
+
+        kept = _make_checkpoint(tmp_path, 10)
+        pruned = _make_checkpoint(tmp_path, 11)
+        real_scandir = os.scandir
+
+        @contextlib.contextmanager
+        def scandir_then_prune(path):
+            with real_scandir(path) as entries:
+                listed = list(entries)
+            pruned.unlink()
+            yield iter(listed)
+
+        with patch("foothold_checkpoint.core.verify.os.scandir", scandir_then_prune):
+            report = asyncio.run(scrub_checkpoints(kept.parent))
+
+        assert report.verified == [kept.name]
+        assert report.healthy
+
+    def test_throttled_scrub_verifies_one_checkpoint_at_a_time(self, tmp_path):
+        """A throttled scrub should hold a single I/O worker whatever max_parallel says."""
+        from foothold_checkpoint.core.verify import Throttle, scrub_checkpoints
+
+        for hour in (10, 11, 12):
+            checkpoints_dir = _make_checkpoint(tmp_path, hour).parent
+        running = 0
+        peak = 0
+
+        async def fake_verify(path, throttle=None):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+
+        with patch("foothold_checkpoint.core.verify.verify_checkpoint", fake_verify):
+            report = asyncio.run(
+                scrub_checkpoints(checkpoints_dir, Throttle(cpu_share=0.5), max_parallel=4)
+            )
+            assert len(report.verified) == 3
+            assert peak == 1
+
+            asyncio.run(scrub_checkpoints(checkpoints_dir, force=True, max_parallel=4))
+            assert peak == 3
+
+    def test_throttle_limits_bandwidth_and_cpu(self):
+        """consume() should sleep for the longest of both limits."""
+        from foothold_checkpoint.core.verify import Throttle
+
+        throttle = Throttle(max_bytes_per_second=1024 * 1024, cpu_share=0.5)
+
+        with patch("foothold_checkpoint.core.verify.time.sleep") as sleep:
+            throttle.consume(512 * 1024, busy_seconds=0.1)
+            throttle.consume(0, busy_seconds=1.0)
+
+        assert sleep.call_args_list[0].args[0] == pytest.approx(0.5, abs=0.05)
+        assert sleep.call_args_list[1].args[0] == pytest.approx(1.0, abs=0.05)
+        with pytest.raises(ValueError, match="cpu_share"):
+            Throttle(cpu_share=0)
+
+
+class TestVerifyCommand:
+    """Tests for the CLI verify command."""
+
+    def test_verify_json_reports_corrupted_checkpoints(self, tmp_path):
+        """verify --json should print the health report and exit with 1 on errors."""
+        from typer.testing import CliRunner
+
+        from foothold_checkpoint.cli import app
+        from tests.conftest import make_simple_campaign, make_test_config
+
+        intact = _make_checkpoint(tmp_path, 10)
+        tampered = _make_checkpoint(tmp_path, 11)
+        _corrupt(tampered, "foothold_test.lua")
+        config = make_test_config(
+            checkpoints_dir=intact.parent,
+            campaigns={"test": make_simple_campaign("Test", ["foothold_test.lua"])},
+        )
+
+        with patch("foothold_checkpoint.cli.load_config", return_value=config):
+            result = CliRunner().invoke(app, ["verify", "--json", "--cpu-share", "0.9"])
+
+        assert result.exit_code == 1
+        health = json.loads(result.stdout)
+        assert health["total"] == 2
+        assert health["failed"] == 1
+        statuses = {cp["filename"]: cp["status"] for cp in health["checkpoints"]}
+        assert statuses == {intact.name: "ok", tampered.name: "failed"}